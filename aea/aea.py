@@ -20,6 +20,7 @@
 """This module contains the implementation of an autonomous economic agent (AEA)."""
 import datetime
 from asyncio import AbstractEventLoop
+from functools import partial
 from logging import Logger
 from multiprocessing.pool import AsyncResult
 from typing import (
@@ -37,6 +38,7 @@ from typing import (
 
 from aea.agent import Agent
 from aea.agent_loop import AsyncAgentLoop, BaseAgentLoop, SyncAgentLoop
+from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.configurations.constants import (
     DEFAULT_BUILD_DIR_NAME,
@@ -96,6 +98,9 @@ class AEA(Agent):
         search_service_address: str = DEFAULT_SEARCH_SERVICE_ADDRESS,
         storage_uri: Optional[str] = None,
         task_manager_mode: Optional[str] = None,
+        multiplexer_config: Optional[Dict[str, Any]] = None,
+        agent_loop_config: Optional[Dict[str, Any]] = None,
+        task_manager_config: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -125,6 +130,9 @@ class AEA(Agent):
         :param search_service_address: the address of the search service used.
         :param storage_uri: optional uri to set generic storage
         :param task_manager_mode: task manager mode (threaded) to run tasks with.
+        :param multiplexer_config: multiplexer options (batch size, routing helper bounds, queue bounds).
+        :param agent_loop_config: agent loop options (skill to skill queue bounds).
+        :param task_manager_config: task manager options (result time to live).
         :param kwargs: keyword arguments to be attached in the agent context namespace.
         """
 
@@ -175,7 +183,10 @@ class AEA(Agent):
                 default_routing=default_routing,
                 default_connection=default_connection,
                 protocols=self.resources.get_all_protocols(),
+                **(multiplexer_config or {}),
             ),
+            agent_loop_options=agent_loop_config,
+            task_manager_options=task_manager_config,
         )
 
         self.max_reactions = max_reactions
@@ -198,6 +209,8 @@ class AEA(Agent):
         if error_handler_config is None:
             error_handler_config = {}
         self._error_handler = error_handler_class(**error_handler_config)
+        self.runtime.multiplexer.set_rejection_callback(self._handle_rejected_envelope)
+        self.runtime.agent_loop.set_rejection_callback(self._handle_rejected_envelope)
         default_ledger_id = (
             default_ledger
             if default_ledger is not None
@@ -276,21 +289,57 @@ class AEA(Agent):
         """
         Perform actions.
 
-        Adds new handlers and behaviours for use/execution by the runtime.
+        Adds new handlers and behaviours for use/execution by the runtime,
+        and notifies the agent loop if the active behaviours changed.
         """
         self.filter.handle_new_handlers_and_behaviours()
+        if self.filter.behaviours_changed():
+            self.runtime.agent_loop.notify_periodic_tasks_changed()
 
     def _get_error_handler(self) -> AbstractErrorHandler:
         """Get error handler."""
         return self._error_handler
 
+    def _handle_rejected_envelope(self, envelope: Envelope, queue_name: str) -> None:
+        """
+        Handle an envelope rejected by a full queue.
+
+        :param envelope: the rejected envelope.
+        :param queue_name: the name of the full queue.
+        """
+        self._get_error_handler().send_queue_overflow(envelope, queue_name, self.logger)
+
     def _get_msg_and_handlers_for_envelope(
-        self, envelope: Envelope
+        self,
+        envelope: Envelope,
+        lookups: Optional[
+            Dict[Tuple[str, Address], Tuple[Optional[Protocol], List[Handler]]]
+        ] = None,
     ) -> Tuple[Optional[Message], List[Handler]]:
-        """Get the msg and its handlers."""
-        protocol = self.resources.get_protocol_by_specification_id(
-            envelope.protocol_specification_id
-        )
+        """
+        Get the msg and its handlers.
+
+        :param envelope: the envelope.
+        :param lookups: optional protocol and active handlers already resolved, by protocol specification id and recipient.
+            It is updated with the ones resolved for the envelope.
+        :return: the message and the handlers
+        """
+        key = (envelope.protocol_specification_id, envelope.to)
+        if lookups is not None and key in lookups:
+            protocol, handlers = lookups[key]
+        else:
+            protocol = self.resources.get_protocol_by_specification_id(
+                envelope.protocol_specification_id
+            )
+            handlers = (
+                self.filter.get_active_handlers(
+                    protocol.public_id, envelope.to_as_public_id
+                )
+                if protocol is not None
+                else []
+            )
+            if lookups is not None:
+                lookups[key] = (protocol, handlers)
 
         error_handler = self._get_error_handler()
 
@@ -298,7 +347,9 @@ class AEA(Agent):
             error_handler.send_unsupported_protocol(envelope, self.logger)
             return None, []
 
-        msg, handlers = self._handle_decoding(envelope, protocol, error_handler)
+        msg, handlers = self._handle_decoding(
+            envelope, protocol, error_handler, handlers
+        )
 
         return msg, handlers
 
@@ -307,10 +358,12 @@ class AEA(Agent):
         envelope: Envelope,
         protocol: Protocol,
         error_handler: AbstractErrorHandler,
+        handlers: Optional[List[Handler]] = None,
     ) -> Tuple[Optional[Message], List[Handler]]:
-        handlers = self.filter.get_active_handlers(
-            protocol.public_id, envelope.to_as_public_id
-        )
+        if handlers is None:
+            handlers = self.filter.get_active_handlers(
+                protocol.public_id, envelope.to_as_public_id
+            )
 
         if len(handlers) == 0:
             reason = (
@@ -359,6 +412,34 @@ class AEA(Agent):
         for handler in handlers:
             handler.handle_wrapper(msg)
 
+    def handle_envelopes(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Handle a batch of envelopes.
+
+        Same as `handle_envelope` for every envelope, but the protocol and the active handlers
+        are resolved once per protocol specification id and recipient in the batch.
+        The skill exception policy is applied to every envelope, and the execution timeout
+        to the handlers of every envelope.
+
+        :param envelopes: the envelopes to handle.
+        """
+        lookups: Dict[
+            Tuple[str, Address], Tuple[Optional[Protocol], List[Handler]]
+        ] = {}
+
+        def _handle_envelope(envelope: Envelope) -> None:
+            self.logger.debug("Handling envelope: {}".format(envelope))
+            msg, handlers = self._get_msg_and_handlers_for_envelope(envelope, lookups)
+
+            if msg is None:
+                return
+
+            with self._execution_timeout_guard():
+                for handler in handlers:
+                    handler.handle_wrapper(msg)
+
+        self._handle_batch(_handle_envelope, envelopes, is_guarded=False)
+
     def _setup_loggers(self) -> None:
         """Set up logger with agent name."""
         for element in [
@@ -388,6 +469,17 @@ class AEA(Agent):
         tasks.update(self._get_behaviours_tasks())
         return tasks
 
+    @staticmethod
+    def is_periodic_task_completed(task: Callable) -> bool:
+        """
+        Check whether a periodic task is completed, i.e. it is the act of a behaviour which is done.
+
+        :param task: the periodic task.
+        :return: True if the periodic task is completed, False otherwise.
+        """
+        behaviour = getattr(task, "__self__", None)
+        return isinstance(behaviour, Behaviour) and behaviour.is_done()
+
     def _get_behaviours_tasks(
         self,
     ) -> Dict[Callable, Tuple[float, Optional[datetime.datetime]]]:
@@ -417,6 +509,28 @@ class AEA(Agent):
             (self.handle_envelope, self.runtime.agent_loop.skill2skill_queue.get),
         ]
 
+    def get_message_batch_handlers(
+        self,
+    ) -> List[Tuple[Callable[[List[Any]], None], Callable, Callable]]:
+        """
+        Get batch handlers with message getters, used by the agent loop in batched mode.
+
+        :return: List of tuples of callables: batch handler, coroutine to get a message and function to get a message without waiting
+        """
+        skill2skill_queue = self.runtime.agent_loop.skill2skill_queue
+        return super().get_message_batch_handlers() + [
+            (
+                partial(self._handle_batch, self.filter.handle_internal_message),
+                self.filter.get_internal_message,
+                self.filter.decision_maker_out_queue.get_nowait,
+            ),
+            (
+                self.handle_envelopes,
+                skill2skill_queue.get,
+                skill2skill_queue.get_nowait,
+            ),
+        ]
+
     def exception_handler(self, exception: Exception, function: Callable) -> bool:
         """
         Handle exception raised during agent main loop execution.
@@ -407,6 +407,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._task_manager_mode: Optional[str] = None
         self._search_service_address: Optional[str] = None
         self._storage_uri: Optional[str] = None
+        self._multiplexer_config: Optional[Dict[str, Any]] = None
+        self._agent_loop_config: Optional[Dict[str, Any]] = None
+        self._task_manager_config: Optional[Dict[str, Any]] = None
         self._data_dir: Optional[str] = None
         self._logging_config: Dict = DEFAULT_LOGGING_CONFIG
 
@@ -689,6 +692,42 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._storage_uri = storage_uri
         return self
 
+    def set_multiplexer_config(
+        self, multiplexer_config: Optional[Dict[str, Any]]
+    ) -> "AEABuilder":  # pragma: nocover
+        """
+        Set the multiplexer configuration.
+
+        :param multiplexer_config: the multiplexer configuration
+        :return: self
+        """
+        self._multiplexer_config = multiplexer_config
+        return self
+
+    def set_agent_loop_config(
+        self, agent_loop_config: Optional[Dict[str, Any]]
+    ) -> "AEABuilder":  # pragma: nocover
+        """
+        Set the agent loop configuration.
+
+        :param agent_loop_config: the agent loop configuration
+        :return: self
+        """
+        self._agent_loop_config = agent_loop_config
+        return self
+
+    def set_task_manager_config(
+        self, task_manager_config: Optional[Dict[str, Any]]
+    ) -> "AEABuilder":  # pragma: nocover
+        """
+        Set the task manager configuration.
+
+        :param task_manager_config: the task manager configuration
+        :return: self
+        """
+        self._task_manager_config = task_manager_config
+        return self
+
     def set_data_dir(self, data_dir: Optional[str]) -> "AEABuilder":  # pragma: nocover
         """
         Set the data directory.
@@ -1371,6 +1410,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             connection_ids=connection_ids,
             search_service_address=self._get_search_service_address(),
             storage_uri=self._get_storage_uri(),
+            multiplexer_config=self._get_multiplexer_config(),
+            agent_loop_config=self._get_agent_loop_config(),
+            task_manager_config=self._get_task_manager_config(),
             **deepcopy(self._context_namespace),
         )
         self._load_and_add_components(
@@ -1563,6 +1605,42 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         """
         return self._storage_uri
 
+    def _get_multiplexer_config(self) -> Dict[str, Any]:
+        """
+        Return the multiplexer configuration.
+
+        :return: the multiplexer configuration
+        """
+        return (
+            deepcopy(self._multiplexer_config)
+            if self._multiplexer_config is not None
+            else {}
+        )
+
+    def _get_agent_loop_config(self) -> Dict[str, Any]:
+        """
+        Return the agent loop configuration.
+
+        :return: the agent loop configuration
+        """
+        return (
+            deepcopy(self._agent_loop_config)
+            if self._agent_loop_config is not None
+            else {}
+        )
+
+    def _get_task_manager_config(self) -> Dict[str, Any]:
+        """
+        Return the task manager configuration.
+
+        :return: the task manager configuration
+        """
+        return (
+            deepcopy(self._task_manager_config)
+            if self._task_manager_config is not None
+            else {}
+        )
+
     def _get_data_dir(self) -> str:
         """
         Return the data directory.
@@ -1785,6 +1863,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self.set_runtime_mode(agent_configuration.runtime_mode)
         self.set_task_manager_mode(agent_configuration.task_manager_mode)
         self.set_storage_uri(agent_configuration.storage_uri)
+        self.set_multiplexer_config(agent_configuration.multiplexer_config)
+        self.set_agent_loop_config(agent_configuration.agent_loop_config)
+        self.set_task_manager_config(agent_configuration.task_manager_config)
         self.set_data_dir(agent_configuration.data_dir)
         self.set_logging_config(agent_configuration.logging_config)
 
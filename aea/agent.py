@@ -23,11 +23,12 @@ import datetime
 import logging
 from asyncio import AbstractEventLoop
 from logging import Logger
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 
 from aea.abstract_agent import AbstractAgent
 from aea.connections.base import Connection
 from aea.exceptions import AEAException
+from aea.helpers.exec_timeout import ExecTimeoutThreadGuard, TimeoutException
 from aea.helpers.logging import WithLogger
 from aea.identity.base import Identity
 from aea.mail.base import Envelope
@@ -100,6 +101,8 @@ class Agent(AbstractAgent, WithLogger):
         multiplexer_options: Dict,
         loop_mode: Optional[str] = None,
         loop: Optional[AbstractEventLoop] = None,
+        agent_loop_options: Optional[Dict] = None,
+        task_manager_options: Optional[Dict] = None,
     ) -> None:
         """Set the runtime and inbox and outbox."""
         self._runtime = runtime_class(
@@ -107,7 +110,9 @@ class Agent(AbstractAgent, WithLogger):
             loop_mode=loop_mode,
             loop=loop,
             multiplexer_options=multiplexer_options,
+            agent_loop_options=agent_loop_options,
             task_manager_mode=self._task_manager_mode,
+            task_manager_options=task_manager_options,
         )
         self._inbox = InBox(self.runtime.multiplexer)
         self._outbox = OutBox(self.runtime.multiplexer)
@@ -267,6 +272,67 @@ class Agent(AbstractAgent, WithLogger):
             (self.handle_envelope, self.inbox.async_get),
         ]
 
+    def get_message_batch_handlers(
+        self,
+    ) -> List[Tuple[Callable[[List[Any]], None], Callable, Callable]]:
+        """
+        Get batch handlers with message getters, used by the agent loop in batched mode.
+
+        :return: List of tuples of callables: batch handler, coroutine to get a message and function to get a message without waiting
+        """
+        return [
+            (self.handle_envelopes, self.inbox.async_get, self.inbox.get_nowait),
+        ]
+
+    def handle_envelopes(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Handle a batch of envelopes.
+
+        :param envelopes: the envelopes to handle.
+        """
+        self._handle_batch(self.handle_envelope, envelopes)
+
+    def _handle_batch(
+        self,
+        handler: Callable[[Any], None],
+        messages: Sequence[Any],
+        is_guarded: bool = True,
+    ) -> None:
+        """
+        Handle a batch of messages one by one, applying the exception handler to each of them.
+
+        If an execution timeout is set, a timeout terminates the handling of one message only.
+
+        :param handler: the function handling a message.
+        :param messages: the messages to handle.
+        :param is_guarded: whether every handler call is guarded by the execution timeout,
+            False if the handler guards the calls to time out itself, with _execution_timeout_guard.
+        """
+        for message in messages:
+            try:
+                if is_guarded:
+                    with self._execution_timeout_guard():
+                        handler(message)
+                else:
+                    handler(message)
+            except TimeoutException:
+                self.logger.warning(
+                    "`{}` was terminated as its execution exceeded the timeout of {} seconds. Please refactor your code!".format(
+                        handler, getattr(self, "_execution_timeout", 0)
+                    )
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                if self.exception_handler(e, handler) is True:
+                    raise
+
+    def _execution_timeout_guard(self) -> ExecTimeoutThreadGuard:
+        """
+        Get a guard terminating the code it wraps once the execution timeout of the agent expires.
+
+        :return: the guard, doing nothing if no execution timeout is set.
+        """
+        return ExecTimeoutThreadGuard(getattr(self, "_execution_timeout", 0))
+
     def exception_handler(
         self, exception: Exception, function: Callable
     ) -> bool:  # pragma: nocover
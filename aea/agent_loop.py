@@ -20,6 +20,7 @@
 """This module contains the implementation of an agent loop using asyncio."""
 import asyncio
 import datetime
+import queue
 from abc import ABC, abstractmethod
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
@@ -32,10 +33,17 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union,
 
 from aea.abstract_agent import AbstractAgent
 from aea.configurations.constants import LAUNCH_SUCCEED_MESSAGE
-from aea.exceptions import AEAException
-from aea.helpers.async_utils import AsyncState, PeriodicCaller, Runnable
+from aea.exceptions import AEAException, enforce
+from aea.helpers.async_utils import (
+    AsyncState,
+    CoalescingScheduler,
+    PeriodicCaller,
+    Runnable,
+    ScheduledPeriodicCall,
+)
 from aea.helpers.exec_timeout import ExecTimeoutThreadGuard, TimeoutException
 from aea.helpers.logging import WithLogger, get_logger
+from aea.helpers.overflow_policy import OverflowPolicyEnum, QueueOverflowControl
 from aea.mail.base import Envelope, EnvelopeContext
 from aea.protocols.base import Message
 
@@ -78,6 +86,7 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
         self._tasks: List[asyncio.Task] = []
         self._state: AsyncState = AsyncState(AgentLoopStates.initial)
         self._exceptions: List[Exception] = []
+        self._rejection_callback: Optional[Callable[[Envelope, str], None]] = None
 
     @property
     def agent(self) -> AbstractAgent:  # pragma: nocover
@@ -178,17 +187,37 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
     def skill2skill_queue(self) -> Queue:
         """Get skill to skill message queue."""
 
+    def set_rejection_callback(
+        self, callback: Optional[Callable[[Envelope, str], None]]
+    ) -> None:
+        """
+        Set the callback called with the envelopes rejected by a full queue.
+
+        :param callback: callback taking the envelope and the name of the queue.
+        """
+        self._rejection_callback = callback
+
+    def notify_periodic_tasks_changed(self) -> None:
+        """Notify the loop that the periodic tasks of the agent changed."""
+
 
 class AsyncAgentLoop(BaseAgentLoop):
     """Asyncio based agent loop suitable only for AEA."""
 
-    NEW_BEHAVIOURS_PROCESS_SLEEP = 1  # check new behaviours registered every second.
+    DEFAULT_BATCH_SIZE = 1
 
     def __init__(
         self,
         agent: AbstractAgent,
         loop: Optional[AbstractEventLoop] = None,
         threaded: bool = False,
+        skill2skill_queue_max_size: int = 0,
+        skill2skill_queue_overflow_policy: Union[
+            str, OverflowPolicyEnum
+        ] = OverflowPolicyEnum.block,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        periodic_tasks_resolution: Optional[float] = None,
+        periodic_tasks_jitter: float = 0.0,
     ) -> None:
         """
         Init agent loop.
@@ -196,17 +225,92 @@ class AsyncAgentLoop(BaseAgentLoop):
         :param agent: AEA instance
         :param loop: asyncio loop to use. optional
         :param threaded: is a new thread to be started for the agent loop
+        :param skill2skill_queue_max_size: maximum number of skill to skill envelopes waiting to be processed. 0 means unbounded.
+        :param skill2skill_queue_overflow_policy: policy applied to skill to skill envelopes when the queue is full.
+            Skills send from within the agent loop, so they cannot wait: with `block` the envelope is rejected.
+        :param batch_size: maximum number of messages handled per wake-up of a message processor.
+            If greater than 1 and the agent provides batch handlers, the batched mode is enabled: all the messages
+            available are handled at once, under a single execution timeout guard.
+        :param periodic_tasks_resolution: if set, the periodic tasks are run by a single coalescing scheduler,
+            with call times rounded up to this resolution in seconds, instead of one event loop timer each.
+        :param periodic_tasks_jitter: the maximum random delay of the first call of a periodic task, as a fraction of its period.
+            Only used by the coalescing scheduler.
         """
+        enforce(batch_size >= 1, "Batch size must be a positive integer.")
+        enforce(
+            periodic_tasks_resolution is None or periodic_tasks_resolution > 0,
+            "Periodic tasks resolution must be positive.",
+        )
+        enforce(
+            0 <= periodic_tasks_jitter <= 1,
+            "Periodic tasks jitter must be between 0 and 1.",
+        )
         super().__init__(agent=agent, loop=loop, threaded=threaded)
         self._agent: AbstractAgent = self._agent
 
-        self._periodic_tasks: Dict[Callable, PeriodicCaller] = {}
+        self._periodic_tasks: Dict[
+            Callable, Union[PeriodicCaller, ScheduledPeriodicCall]
+        ] = {}
+        self._periodic_tasks_resolution = periodic_tasks_resolution
+        self._periodic_tasks_jitter = periodic_tasks_jitter
+        self._periodic_tasks_scheduler: Optional[CoalescingScheduler] = None
+        self._periodic_tasks_changed: Optional[asyncio.Event] = None
         self._skill2skill_message_queue: Optional[asyncio.Queue] = None
+        self._skill2skill_queue_max_size = skill2skill_queue_max_size
+        self._skill2skill_queue_overflow_policy = OverflowPolicyEnum(
+            skill2skill_queue_overflow_policy
+        )
+        self._skill2skill_queue_control: Optional[QueueOverflowControl] = None
+        self._batch_size = batch_size
+
+    @property
+    def batch_size(self) -> int:
+        """Get the maximum number of messages handled per wake-up of a message processor."""
+        return self._batch_size
+
+    @property
+    def is_batched(self) -> bool:
+        """Check whether the batched mode is enabled."""
+        return self._batch_size > 1
 
     def _setup(self) -> None:
         """Set up agent loop before started."""
         super()._setup()
-        self._skill2skill_message_queue = asyncio.Queue()
+        if self._periodic_tasks_resolution is not None:
+            self._periodic_tasks_scheduler = CoalescingScheduler(
+                loop=self._loop,
+                resolution=self._periodic_tasks_resolution,
+                jitter=self._periodic_tasks_jitter,
+            )
+        self._skill2skill_message_queue = asyncio.Queue(
+            maxsize=self._skill2skill_queue_max_size
+        )
+        self._skill2skill_queue_control = QueueOverflowControl(
+            self._skill2skill_message_queue,
+            self._skill2skill_queue_overflow_policy,
+            on_reject=self._on_envelope_rejected,
+        )
+
+    @property
+    def skill2skill_queue_stats(self) -> Dict[str, int]:
+        """Get depth, max size, dropped and rejected envelopes of the skill to skill queue."""
+        if self._skill2skill_queue_control is None:
+            return {
+                "depth": 0,
+                "max_size": self._skill2skill_queue_max_size,
+                "dropped": 0,
+                "rejected": 0,
+            }
+        return self._skill2skill_queue_control.stats
+
+    def _on_envelope_rejected(self, envelope: Envelope) -> None:
+        """Handle an envelope rejected by the full skill to skill queue."""
+        if self._rejection_callback is not None:
+            self._rejection_callback(envelope, "skill2skill_queue")
+            return
+        self.logger.warning(
+            f"Envelope rejected, skill2skill_queue is full: to={envelope.to}, sender={envelope.sender}, protocol_specification_id={envelope.protocol_specification_id}"
+        )
 
     @property
     def skill2skill_queue(self) -> Queue:
@@ -249,7 +353,9 @@ class AsyncAgentLoop(BaseAgentLoop):
         if not message.has_sender:  # pragma: nocover
             raise ValueError("Provided message has message.sender not set.")
 
-        self.skill2skill_queue.put_nowait(envelope)
+        if self._skill2skill_queue_control is None:  # pragma: nocover
+            raise ValueError("_skill2skill_message_queue is not set!")
+        self._skill2skill_queue_control.put_nowait(envelope)
 
     def _periodic_task_exception_callback(  # pylint: disable=unused-argument
         self, task_callable: Callable, exc: Exception
@@ -300,6 +406,25 @@ class AsyncAgentLoop(BaseAgentLoop):
                 self._exceptions.append(e_)
                 raise
 
+    def _execution_control_batch(
+        self, batch_handler: Callable[[List[Any]], None], messages: List[Any]
+    ) -> None:
+        """
+        Execute a batch handler in exception handling environment.
+
+        The batch handler applies the agent exception handler and execution timeout to every message,
+        so an exception raised here has to stop the loop.
+
+        :param batch_handler: function to call with the messages
+        :param messages: the messages to handle
+        """
+        try:
+            batch_handler(messages)
+        except Exception as e:
+            self._state.set(AgentLoopStates.error)
+            self._exceptions.append(e)
+            raise
+
     def _register_periodic_task(
         self,
         task_callable: Callable,
@@ -315,29 +440,65 @@ class AsyncAgentLoop(BaseAgentLoop):
 
         :return: None
         """
-        if task_callable in self._periodic_tasks:  # pragma: nocover
+        if task_callable in self._periodic_tasks:
             # already registered
             return
 
-        periodic_caller = PeriodicCaller(
-            partial(self._execution_control, task_callable),
-            period=period,
-            start_at=start_at,
-            exception_callback=self._periodic_task_exception_callback,
-            loop=self._loop,
-        )
+        periodic_caller: Union[PeriodicCaller, ScheduledPeriodicCall]
+        if self._periodic_tasks_scheduler is not None:
+            periodic_caller = self._periodic_tasks_scheduler.periodic_caller(
+                partial(self._run_periodic_task, task_callable),
+                period=period,
+                start_at=start_at,
+                exception_callback=self._periodic_task_exception_callback,
+            )
+        else:
+            periodic_caller = PeriodicCaller(
+                partial(self._run_periodic_task, task_callable),
+                period=period,
+                start_at=start_at,
+                exception_callback=self._periodic_task_exception_callback,
+                loop=self._loop,
+            )
         self._periodic_tasks[task_callable] = periodic_caller
         periodic_caller.start()
         self.logger.debug(f"Periodic task {task_callable} registered.")
 
+    def _run_periodic_task(self, task_callable: Callable) -> None:
+        """
+        Run a periodic task, and unregister it if it is completed.
+
+        :param task_callable: function to be called
+        """
+        self._execution_control(task_callable)
+        is_periodic_task_completed = getattr(
+            self._agent, "is_periodic_task_completed", None
+        )
+        if is_periodic_task_completed is not None and is_periodic_task_completed(
+            task_callable
+        ):
+            self._unregister_periodic_task(task_callable)
+            self.logger.debug(f"Periodic task {task_callable} completed.")
+
     def _register_periodic_tasks(self) -> None:
-        """Register all AEA related periodic tasks."""
-        for (
-            task_callable,
-            (period, start_at),
-        ) in self._agent.get_periodic_tasks().items():
+        """Register the new periodic tasks of the agent, and unregister the ones removed."""
+        tasks = self._agent.get_periodic_tasks()
+        for task_callable in list(self._periodic_tasks.keys()):
+            if task_callable not in tasks:
+                self._unregister_periodic_task(task_callable)
+        for task_callable, (period, start_at) in tasks.items():
             self._register_periodic_task(task_callable, period, start_at)
 
+    def notify_periodic_tasks_changed(self) -> None:
+        """
+        Notify the loop that the periodic tasks of the agent changed.
+
+        The periodic tasks are registered again as soon as possible. It is safe to call it from another thread.
+        """
+        if self._periodic_tasks_changed is None or not self.is_running:
+            return
+        self._loop.call_soon_threadsafe(self._periodic_tasks_changed.set)
+
     def _unregister_periodic_task(self, task_callable: Callable) -> None:
         """
         Unregister periodic execution of the task.
@@ -399,15 +560,75 @@ class AsyncAgentLoop(BaseAgentLoop):
             )
             raise
 
+    async def _message_batch_processor(
+        self,
+        batch_handler: Callable[[List[Any]], None],
+        message_getter: Callable,
+        message_getter_nowait: Callable,
+    ) -> None:
+        """Fetch all the messages available, up to the batch size, and process them with the batch handler."""
+        try:
+            while self.is_running:
+                messages = [await message_getter()]
+                messages.extend(
+                    self._drain_messages(message_getter_nowait, self._batch_size - 1)
+                )
+                self._execution_control_batch(batch_handler, messages)
+        except CancelledError:  # pylint: disable=try-except-raise
+            raise
+        except Exception:  # pragma: nocover
+            self.logger.exception(
+                f"Exception in message batch processor ({batch_handler, message_getter})"
+            )
+            raise
+
+    @staticmethod
+    def _drain_messages(message_getter_nowait: Callable, limit: int) -> List[Any]:
+        """
+        Get up to `limit` messages without waiting.
+
+        :param message_getter_nowait: function returning a message, None or raising an empty queue exception if there is none.
+        :param limit: the maximum number of messages to get.
+        :return: the messages
+        """
+        messages: List[Any] = []
+        while len(messages) < limit:
+            try:
+                message = message_getter_nowait()
+            except (queue.Empty, asyncio.QueueEmpty):
+                break
+            if message is None:
+                break
+            messages.append(message)
+        return messages
+
     def _message_handlers(self) -> List[Tuple[Callable[[Any], None], Callable]]:
         """Get all agent's message handlers."""
         return self._agent.get_message_handlers()
 
+    def _message_batch_handlers(
+        self,
+    ) -> Optional[List[Tuple[Callable[[List[Any]], None], Callable, Callable]]]:
+        """Get all agent's message batch handlers, None if the agent does not provide them."""
+        get_message_batch_handlers = getattr(
+            self._agent, "get_message_batch_handlers", None
+        )
+        if get_message_batch_handlers is None:
+            return None
+        return get_message_batch_handlers()
+
     async def _process_messages(self) -> None:
         """Start tasks for messages handlers and sources."""
         coros = []
-        for handler, getter in self._message_handlers():
-            coros.append(self._message_processor(handler, getter))
+        batch_handlers = self._message_batch_handlers() if self.is_batched else None
+        if batch_handlers is not None:
+            for batch_handler, getter, getter_nowait in batch_handlers:
+                coros.append(
+                    self._message_batch_processor(batch_handler, getter, getter_nowait)
+                )
+        else:
+            for handler, getter in self._message_handlers():
+                coros.append(self._message_processor(handler, getter))
 
         self.logger.info(LAUNCH_SUCCEED_MESSAGE)
         self._state.set(AgentLoopStates.started)
@@ -415,10 +636,13 @@ class AsyncAgentLoop(BaseAgentLoop):
         await asyncio.gather(*coros)
 
     async def _task_register_periodic_tasks(self) -> None:
-        """Process new behaviours added to skills in runtime."""
-        while self.is_running:
-            self._register_periodic_tasks()  # re register, cause new may appear
-            await asyncio.sleep(self.NEW_BEHAVIOURS_PROCESS_SLEEP)
+        """Register the periodic tasks every time the agent notifies they changed."""
+        self._periodic_tasks_changed = asyncio.Event()
+        self._register_periodic_tasks()
+        while True:
+            await self._periodic_tasks_changed.wait()
+            self._periodic_tasks_changed.clear()
+            self._register_periodic_tasks()
 
 
 SyncAgentLoop = AsyncAgentLoop  # temporary solution!
@@ -71,6 +71,7 @@ from aea.cli.utils.click_utils import registry_path_option
 from aea.cli.utils.config import get_registry_path_from_cli_config
 from aea.cli.utils.context import Context
 from aea.cli.utils.loggers import logger, simple_verbosity_option
+from aea.helpers.ipfs.cache import set_default_cache_enabled
 from aea.helpers.win32 import enable_ctrl_c_support
 
 
@@ -87,11 +88,20 @@ from aea.helpers.win32 import enable_ctrl_c_support
     default=False,
     help="Skip consistency checks of agent during command execution.",
 )
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Hash all the package files, instead of only the ones changed since they were last hashed.",
+)
 @registry_path_option
 @click.pass_context
 def cli(
     click_context: click.Context,
     skip_consistency_check: bool,
+    no_cache: bool,
     registry_path: Optional[str],
 ) -> None:
     """Command-line tool for setting up an Autonomous Economic Agent (AEA)."""
@@ -102,6 +112,7 @@ def cli(
         cwd=".", verbosity=verbosity_option, registry_path=registry_path
     )
     click_context.obj.set_config("skip_consistency_check", skip_consistency_check)
+    set_default_cache_enabled(not no_cache)
 
     # enables CTRL+C support on windows!
     enable_ctrl_c_support()
@@ -27,8 +27,9 @@ This script requires that you have IPFS installed:
 
 import sys
 import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple, cast
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, cast
 from warnings import warn
 
 import click
@@ -46,6 +47,7 @@ from aea.helpers.cid import DEFAULT_ENCODING, to_v0, to_v1
 from aea.helpers.dependency_tree import DependencyTree, dump_yaml, load_yaml, to_plural
 from aea.helpers.fingerprint import update_fingerprint
 from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.ipfs.cache import FileHashCache, get_default_cache
 from aea.helpers.yaml_utils import yaml_dump, yaml_dump_all
 
 
@@ -100,6 +102,8 @@ def hash_package(
     configuration: PackageConfiguration,
     package_type: PackageType,
     no_wrap: bool = False,
+    executor: Optional[Executor] = None,
+    cache: Optional[FileHashCache] = None,
 ) -> Tuple[str, str]:
     """
     Hashes a package and its components.
@@ -107,28 +111,58 @@ def hash_package(
     :param configuration: the package configuration.
     :param package_type: the package type.
     :param no_wrap: Whether to use the wrapper node or not.
+    :param executor: the executor hashing the files in parallel, if any.
+    :param cache: the cache of the file hashes, if any.
     :return: the identifier of the hash (e.g. 'fetchai/protocols/default')
            | and the hash of the whole package.
     """
+    return hash_packages(
+        [(configuration, package_type)], no_wrap=no_wrap, executor=executor, cache=cache
+    )[0]
+
+
+def hash_packages(
+    packages: Sequence[Tuple[PackageConfiguration, PackageType]],
+    no_wrap: bool = False,
+    executor: Optional[Executor] = None,
+    cache: Optional[FileHashCache] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Hashes packages and their components, hashing the files of all the packages at once.
+
+    :param packages: the package configurations and types.
+    :param no_wrap: Whether to use the wrapper node or not.
+    :param executor: the executor hashing the files in parallel, if any.
+    :param cache: the cache of the file hashes, if any.
+    :return: the identifiers of the hashes (e.g. 'fetchai/protocols/default')
+           | and the hashes of the whole packages.
+    """
     # hash again to get outer hash (this time all files)
     # we still need to ignore some files
     #      use ignore patterns somehow
     # ignore_patterns = configuration.fingerprint_ignore_patterns # noqa: E800
-    if configuration.directory is None:
-        raise ValueError("configuration.directory cannot be None.")
-
-    key = "/".join(
-        [
-            configuration.author,
-            package_type.to_plural(),
-            configuration.directory.name,
-        ]
-    )
-    package_hash = IPFSHashOnly.hash_directory(
-        str(configuration.directory), wrap=(not no_wrap)
+    keys = []
+    for configuration, package_type in packages:
+        if configuration.directory is None:
+            raise ValueError("configuration.directory cannot be None.")
+
+        keys.append(
+            "/".join(
+                [
+                    configuration.author,
+                    package_type.to_plural(),
+                    configuration.directory.name,
+                ]
+            )
+        )
+    package_hashes = IPFSHashOnly.hash_directories(
+        [str(configuration.directory) for configuration, _ in packages],
+        wrap=(not no_wrap),
+        executor=executor,
+        cache=cache,
     )
 
-    return key, package_hash
+    return list(zip(keys, package_hashes))
 
 
 def load_configuration(
@@ -187,11 +221,14 @@ def update_hashes(
     config_loader: Callable[
         [PackageType, Path], PackageConfiguration
     ] = load_configuration,
+    jobs: int = 1,
+    cache: Optional[FileHashCache] = None,
 ) -> int:
     """Process all AEA packages and update fingerprint."""
     return_code = 0
     package_hashes: Dict[str, str] = {}
 
+    executor = ProcessPoolExecutor(jobs) if jobs > 1 else None
     try:
         public_id_to_hash_mappings: Dict = {}
         dependency_tree = DependencyTree.generate(packages_dir)
@@ -204,6 +241,7 @@ def update_hashes(
         ]
         packages[0] = packages[0] + list(map(to_package_id, SCAFFOLD_PACKAGES))
         for tree_level in packages:
+            configurations = []
             for package_id, package_path in tree_level:
                 click.echo(
                     "Processing package {} of type {}".format(
@@ -221,9 +259,15 @@ def update_hashes(
                 configuration_obj = config_loader(package_id.package_type, package_path)
                 sort_configuration_file(configuration_obj)
                 update_fingerprint(configuration_obj)
-                key, package_hash = hash_package(
-                    configuration_obj, package_id.package_type, no_wrap=no_wrap
-                )
+                configurations.append((configuration_obj, package_id.package_type))
+
+            # the packages of a level do not depend on each other
+            level_hashes = hash_packages(
+                configurations, no_wrap=no_wrap, executor=executor, cache=cache
+            )
+            for (package_id, package_path), (key, package_hash) in zip(
+                tree_level, level_hashes
+            ):
                 public_id_to_hash_mappings[package_id] = package_hash
 
                 if vendor is not None and package_id.author != vendor:
@@ -238,6 +282,9 @@ def update_hashes(
     except Exception:  # pylint: disable=broad-except
         traceback.print_exc()
         return_code = 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     return return_code
 
@@ -255,10 +302,18 @@ def hash_group() -> None:
 )
 @click.option("--vendor", type=str)
 @click.option("--no-wrap", is_flag=True)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes hashing the package files.",
+)
 def generate_all(
     packages_dir: Path,
     vendor: Optional[str],
     no_wrap: bool,
+    jobs: int,
 ) -> None:
     """Generate IPFS hashes."""
     message = (
@@ -272,7 +327,9 @@ def generate_all(
     )
     click.echo(message=message)
     packages_dir = Path(packages_dir).absolute()
-    return_code = update_hashes(packages_dir, no_wrap, vendor=vendor)
+    return_code = update_hashes(
+        packages_dir, no_wrap, vendor=vendor, jobs=jobs, cache=get_default_cache()
+    )
     sys.exit(return_code)
 
 
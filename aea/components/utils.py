@@ -25,7 +25,13 @@ from pathlib import Path
 from typing import Dict, List
 
 from aea.components.base import perform_load_aea_package
-from aea.configurations.constants import CONNECTIONS, CONTRACTS, PROTOCOLS, SKILLS
+from aea.configurations.constants import (
+    CONNECTIONS,
+    CONTRACTS,
+    PACKAGES,
+    PROTOCOLS,
+    SKILLS,
+)
 
 
 PACKAGES_RE = re.compile(r"^packages\.(\w+)\.(\w+)\.(\w+)$", re.I)
@@ -57,8 +63,12 @@ def _populate_packages(packages: dict) -> None:  # pragma: nocover
     """Load packages as python modules."""
     for package_type in [PROTOCOLS, CONTRACTS, CONNECTIONS, SKILLS]:
         for package in packages.get(package_type, []):
-            # load package
-            print(11, package)
+            module_name = ".".join(
+                [PACKAGES, package["author"], package_type, package["package_name"]]
+            )
+            if module_name in sys.modules:
+                # inherited by a forked process
+                continue
             perform_load_aea_package(
                 dir_=Path(package["dir"]),
                 author=package["author"],
@@ -85,6 +85,7 @@ from aea.helpers.base import (
     recursive_update,
 )
 from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.ipfs.cache import get_default_cache
 
 
 # for tests
@@ -1184,6 +1185,9 @@ class AgentConfig(PackageConfiguration):
             "required_ledgers",
             "default_routing",
             "storage_uri",
+            "multiplexer_config",
+            "agent_loop_config",
+            "task_manager_config",
         ]
     )
 
@@ -1222,6 +1226,9 @@ class AgentConfig(PackageConfiguration):
         "loop_mode",
         "runtime_mode",
         "storage_uri",
+        "multiplexer_config",
+        "agent_loop_config",
+        "task_manager_config",
         "data_dir",
         "_component_configurations",
         "dependencies",
@@ -1255,6 +1262,9 @@ class AgentConfig(PackageConfiguration):
         runtime_mode: Optional[str] = None,
         task_manager_mode: Optional[str] = None,
         storage_uri: Optional[str] = None,
+        multiplexer_config: Optional[Dict] = None,
+        agent_loop_config: Optional[Dict] = None,
+        task_manager_config: Optional[Dict] = None,
         data_dir: Optional[str] = None,
         component_configurations: Optional[Dict[ComponentId, Dict]] = None,
         dependencies: Optional[Dependencies] = None,
@@ -1321,6 +1331,9 @@ class AgentConfig(PackageConfiguration):
         self.runtime_mode = runtime_mode
         self.task_manager_mode = task_manager_mode
         self.storage_uri = storage_uri
+        self.multiplexer_config = multiplexer_config
+        self.agent_loop_config = agent_loop_config
+        self.task_manager_config = task_manager_config
         self.data_dir = data_dir
         # this attribute will be set through the setter below
         self._component_configurations: Dict[ComponentId, Dict] = {}
@@ -1463,6 +1476,12 @@ class AgentConfig(PackageConfiguration):
             config["task_manager_mode"] = self.task_manager_mode
         if self.storage_uri is not None:
             config["storage_uri"] = self.storage_uri
+        if self.multiplexer_config is not None:
+            config["multiplexer_config"] = self.multiplexer_config
+        if self.agent_loop_config is not None:
+            config["agent_loop_config"] = self.agent_loop_config
+        if self.task_manager_config is not None:
+            config["task_manager_config"] = self.task_manager_config
         if self.data_dir is not None:
             config["data_dir"] = self.data_dir
         if self.currency_denominations != {}:
@@ -1507,6 +1526,9 @@ class AgentConfig(PackageConfiguration):
             runtime_mode=cast(str, obj.get("runtime_mode")),
             task_manager_mode=cast(str, obj.get("task_manager_mode")),
             storage_uri=cast(str, obj.get("storage_uri")),
+            multiplexer_config=cast(Dict, obj.get("multiplexer_config")),
+            agent_loop_config=cast(Dict, obj.get("agent_loop_config")),
+            task_manager_config=cast(Dict, obj.get("task_manager_config")),
             data_dir=cast(str, obj.get("data_dir")),
             component_configurations=None,
             dependencies=cast(
@@ -1892,6 +1914,8 @@ def _compute_fingerprint(  # pylint: disable=unsubscriptable-object
     ignore_directories = ignore_directories if ignore_directories is not None else []
     ignore_patterns = set(ignore_patterns).union(DEFAULT_FINGERPRINT_IGNORE_PATTERNS)
     hasher = IPFSHashOnly()
+    # the files unchanged since they were last hashed are not read
+    cache = get_default_cache()
     fingerprints = {}  # type: Dict[str, str]
     # find all valid files of the package
     all_files = [
@@ -1903,7 +1927,7 @@ def _compute_fingerprint(  # pylint: disable=unsubscriptable-object
     ]
 
     for file in all_files:
-        file_hash = hasher.get(str(file), wrap=False)
+        file_hash = hasher.get(str(file), wrap=False, cache=cache)
         key = str(file.relative_to(package_directory))
         enforce(key not in fingerprints, "Key in fingerprints!")  # nosec
         # use '/' as path separator
@@ -218,6 +218,9 @@ class ComponentType(Enum):
 
 PackageIdPrefix = Tuple[ComponentType, str, str]
 
+# max number of parsed public id strings kept by PublicId.from_str
+PUBLIC_ID_CACHE_SIZE = 1024
+
 
 @functools.total_ordering
 class PublicId(JSONSerializable):
@@ -260,6 +263,7 @@ class PublicId(JSONSerializable):
         rf"^({AUTHOR_REGEX})/({PACKAGE_NAME_REGEX})/({VERSION_REGEX})$"
     )
     PUBLIC_ID_REGEX = rf"^({AUTHOR_REGEX})/({PACKAGE_NAME_REGEX})(:{VERSION_REGEX})?(:{IPFS_HASH_REGEX})?$"
+    _PUBLIC_ID_PATTERN = re.compile(PUBLIC_ID_REGEX)
 
     ANY_VERSION = "any"
     LATEST_VERSION = "latest"
@@ -358,8 +362,33 @@ class PublicId(JSONSerializable):
         :param public_id_string: the public id in string format.
         :return: bool indicating validity
         """
-        match = re.match(cls.PUBLIC_ID_REGEX, public_id_string)
-        return match is not None
+        return cls.try_from_str(public_id_string) is not None
+
+    @classmethod
+    @functools.lru_cache(maxsize=PUBLIC_ID_CACHE_SIZE)
+    def _from_str_cached(cls, public_id_string: str) -> Optional["PublicId"]:
+        """
+        Parse a public id string, interning the result.
+
+        Public ids are immutable, so the same object is returned for the same string.
+
+        :param public_id_string: the public id in string format.
+        :return: the public id object, or None if the string is not well formatted.
+        """
+        match = cls._PUBLIC_ID_PATTERN.match(public_id_string)
+        if match is None:
+            return None
+
+        username = match.group(1)
+        package_name = match.group(2)
+        version = match.group(3)
+        if version is not None:
+            version = version.replace(":", "")
+        package_hash = match.group(13)
+        if package_hash is not None:
+            package_hash = package_hash.replace(":", "")
+
+        return PublicId(username, package_name, version, package_hash)
 
     @classmethod
     def from_str(cls, public_id_string: str) -> "PublicId":
@@ -386,22 +415,12 @@ class PublicId(JSONSerializable):
         :return: the public id object.
         :raises ValueError: if the string in input is not well formatted.
         """
-        match = re.match(cls.PUBLIC_ID_REGEX, public_id_string)
-        if match is None:
+        public_id = cls._from_str_cached(public_id_string)
+        if public_id is None:
             raise ValueError(
                 "Input '{}' is not well formatted.".format(public_id_string)
             )
-
-        username = match.group(1)
-        package_name = match.group(2)
-        version = match.group(3)
-        if version is not None:
-            version = version.replace(":", "")
-        package_hash = match.group(13)
-        if package_hash is not None:
-            package_hash = package_hash.replace(":", "")
-
-        return PublicId(username, package_name, version, package_hash)
+        return public_id
 
     @classmethod
     def try_from_str(cls, public_id_string: str) -> Optional["PublicId"]:
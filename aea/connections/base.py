@@ -26,7 +26,17 @@ from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Generator, Optional, Set, TYPE_CHECKING, cast
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TYPE_CHECKING,
+    cast,
+)
 
 from aea.components.base import Component, load_aea_package
 from aea.configurations.base import ComponentType, ConnectionConfig
@@ -230,6 +240,36 @@ class Connection(Component, ABC):
         :return: the received envelope, or None if an error occurred.
         """
 
+    async def send_batch(self, envelopes: Sequence["Envelope"]) -> None:
+        """
+        Send a batch of envelopes.
+
+        The default implementation sends the envelopes one by one, in order.
+        Connections able to write several envelopes at once should override it.
+
+        :param envelopes: the envelopes to send.
+        """
+        for envelope in envelopes:
+            await self.send(envelope)
+
+    async def receive_batch(
+        self, *args: Any, **kwargs: Any
+    ) -> Optional[List["Envelope"]]:
+        """
+        Receive a batch of envelopes.
+
+        The default implementation wraps a single call to `receive`.
+        Connections able to read several envelopes at once should override it.
+
+        :param args: positional arguments
+        :param kwargs: keyword arguments
+        :return: the received envelopes, or None if an error occurred.
+        """
+        envelope = await self.receive(*args, **kwargs)
+        if envelope is None:
+            return None
+        return [envelope]
+
     @classmethod
     def from_dir(
         cls,
@@ -74,3 +74,18 @@ class AbstractErrorHandler(ABC):
         :param logger: the logger
         :return: None
         """
+
+    def send_queue_overflow(
+        self, envelope: Envelope, queue_name: str, logger: Logger
+    ) -> None:
+        """
+        Handle an envelope rejected because the queue it was put in is full.
+
+        :param envelope: the envelope
+        :param queue_name: the name of the full queue
+        :param logger: the logger
+        :return: None
+        """
+        logger.warning(
+            f"Envelope rejected, {queue_name} is full. Sender={envelope.sender}, to={envelope.to}."
+        )
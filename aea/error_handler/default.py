@@ -34,6 +34,7 @@ class ErrorHandler(AbstractErrorHandler):
         "unsupported_protocol_count",
         "no_active_handler_count",
         "decoding_error_count",
+        "queue_overflow_count",
     )
 
     def __init__(self, **kwargs: Any):
@@ -42,6 +43,7 @@ class ErrorHandler(AbstractErrorHandler):
         self.unsupported_protocol_count = 0
         self.no_active_handler_count = 0
         self.decoding_error_count = 0
+        self.queue_overflow_count = 0
 
     def send_unsupported_protocol(self, envelope: Envelope, logger: Logger) -> None:
         """
@@ -84,3 +86,18 @@ class ErrorHandler(AbstractErrorHandler):
         logger.warning(
             f"Cannot handle envelope: {reason}. Sender={envelope.sender}, to={envelope.sender}."
         )
+
+    def send_queue_overflow(
+        self, envelope: Envelope, queue_name: str, logger: Logger
+    ) -> None:
+        """
+        Handle an envelope rejected because the queue it was put in is full.
+
+        :param envelope: the envelope
+        :param queue_name: the name of the full queue
+        :param logger: the logger
+        """
+        self.queue_overflow_count += 1
+        logger.warning(
+            f"Envelope rejected, {queue_name} is full: protocol_specification_id={envelope.protocol_specification_id}. Sender={envelope.sender}, to={envelope.to}."
+        )
@@ -24,16 +24,24 @@ import queue
 import threading
 from collections import deque
 from contextlib import suppress
-from typing import Any, Deque
+from typing import Any, Deque, Iterable, List, Optional
+
+from aea.exceptions import enforce
 
 
 class AsyncFriendlyQueue(queue.Queue):
-    """queue.Queue with async_get method."""
+    """
+    queue.Queue with async_get and async_put methods.
+
+    Waiters on the event loop running in the calling thread are woken up directly,
+    the others through their loop, in a thread safe way.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Init queue."""
         super().__init__(*args, **kwargs)
         self._non_empty_waiters: Deque = deque()
+        self._non_full_waiters: Deque = deque()
         self._lock = threading.Lock()
 
     def put(  # pylint: disable=signature-differs
@@ -47,12 +55,25 @@ class AsyncFriendlyQueue(queue.Queue):
         :param kwargs: similar to queue.Queue.put
         """
         super().put(item, *args, **kwargs)
-        with self._lock:
-            if self._non_empty_waiters:
-                waiter = self._non_empty_waiters.popleft()
-                waiter._loop.call_soon_threadsafe(  # pylint: disable=protected-access
-                    self._set_waiter, waiter
-                )
+        self._wake_up_waiters(self._non_empty_waiters)
+
+    def put_many(
+        self, items: Iterable[Any], block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """
+        Put items into the queue, waking up the waiters once.
+
+        :param items: items to put in the queue
+        :param block: similar to queue.Queue.put
+        :param timeout: similar to queue.Queue.put
+        """
+        count = 0
+        try:
+            for item in items:
+                super().put(item, block, timeout)
+                count += 1
+        finally:
+            self._wake_up_waiters(self._non_empty_waiters, count)
 
     @staticmethod
     def _set_waiter(waiter: Any) -> None:
@@ -61,6 +82,34 @@ class AsyncFriendlyQueue(queue.Queue):
             return
         waiter.set_result(True)
 
+    def _wake_up_waiters(self, waiters: Deque, count: int = 1) -> None:
+        """
+        Wake up waiters.
+
+        :param waiters: the waiters
+        :param count: the maximum number of waiters to wake up
+        """
+        if count <= 0:
+            return
+        try:
+            running_loop: Optional[
+                asyncio.AbstractEventLoop
+            ] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        with self._lock:
+            while count > 0 and waiters:
+                waiter = waiters.popleft()
+                if waiter.done():
+                    # cancelled, it would not consume the item
+                    continue
+                loop = waiter.get_loop()
+                if loop is running_loop:
+                    waiter.set_result(True)
+                else:
+                    loop.call_soon_threadsafe(self._set_waiter, waiter)
+                count -= 1
+
     def get(  # pylint: disable=signature-differs
         self, *args: Any, **kwargs: Any
     ) -> Any:
@@ -71,7 +120,29 @@ class AsyncFriendlyQueue(queue.Queue):
         :param kwargs: similar to queue.Queue.get
         :return: similar to queue.Queue.get
         """
-        return super().get(*args, **kwargs)
+        item = super().get(*args, **kwargs)
+        if self.maxsize > 0:
+            self._wake_up_waiters(self._non_full_waiters)
+        return item
+
+    def get_many(self, max_items: Optional[int] = None) -> List[Any]:
+        """
+        Get the items in the queue without waiting.
+
+        :param max_items: the maximum number of items to get, all of them if None
+        :return: the items, an empty list if the queue is empty
+        """
+        enforce(max_items is None or max_items > 0, "Max items must be positive.")
+        with self.mutex:
+            count = self._qsize()
+            if max_items is not None:
+                count = min(count, max_items)
+            items = [self._get() for _ in range(count)]
+            if count > 0:
+                self.not_full.notify(count)
+        if self.maxsize > 0:
+            self._wake_up_waiters(self._non_full_waiters, count)
+        return items
 
     async def async_wait(self) -> None:
         """
@@ -92,6 +163,38 @@ class AsyncFriendlyQueue(queue.Queue):
             except ValueError:
                 pass
 
+    async def async_wait_not_full(self) -> None:
+        """
+        Wait the queue has room for an item.
+
+        :return: None
+        """
+        with self._lock:
+            if not self.full():
+                return
+            waiter = asyncio.Future()  # type: ignore
+            self._non_full_waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            try:
+                self._non_full_waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    async def async_put(self, item: Any) -> None:
+        """
+        Wait for room in the queue and put an item into it.
+
+        :param item: item to put in the queue
+        """
+        while True:
+            await self.async_wait_not_full()
+
+            with suppress(queue.Full):
+                self.put_nowait(item)
+                return
+
     async def async_get(self) -> Any:
         """
         Wait and get an item from the queue.
@@ -104,3 +207,17 @@ class AsyncFriendlyQueue(queue.Queue):
             with suppress(queue.Empty):
                 item = self.get_nowait()
                 return item
+
+    async def async_get_many(self, max_items: Optional[int] = None) -> List[Any]:
+        """
+        Wait for items and get them from the queue.
+
+        :param max_items: the maximum number of items to get, all of them if None
+        :return: the items, at least one
+        """
+        while True:
+            await self.async_wait()
+
+            items = self.get_many(max_items)
+            if items:
+                return items
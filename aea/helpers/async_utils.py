@@ -20,7 +20,10 @@
 """This module contains the misc utils for async code."""
 import asyncio
 import datetime
+import heapq
 import logging
+import math
+import random
 import time
 from abc import ABC, abstractmethod
 from asyncio.events import AbstractEventLoop, TimerHandle
@@ -34,6 +37,7 @@ from typing import (
     Callable,
     Container,
     Coroutine,
+    Dict,
     Generator,
     List,
     Optional,
@@ -250,6 +254,249 @@ class PeriodicCaller:
         self._timerhandle = None
 
 
+class ScheduledPeriodicCall:
+    """
+    A periodic call scheduled by a CoalescingScheduler.
+
+    It has the same interface of PeriodicCaller, so it can be used in its place.
+    """
+
+    def __init__(
+        self,
+        scheduler: "CoalescingScheduler",
+        callback: Callable,
+        period: float,
+        start_at: Optional[datetime.datetime] = None,
+        exception_callback: Optional[Callable[[Callable, Exception], None]] = None,
+    ) -> None:
+        """
+        Init the periodic call.
+
+        :param scheduler: the scheduler running the call.
+        :param callback: function to call periodically
+        :param period: period in seconds.
+        :param start_at: optional first call datetime
+        :param exception_callback: optional handler to call on exception raised.
+        """
+        if period <= 0:
+            raise ValueError("Period must be positive.")
+        self._scheduler = scheduler
+        self._periodic_callable = callback
+        self._period = period
+        self._start_at = start_at
+        self._exception_callback = exception_callback
+        self._next_call_time: Optional[float] = None
+
+    @property
+    def period(self) -> float:
+        """Get the period."""
+        return self._period
+
+    @property
+    def next_call_time(self) -> Optional[float]:
+        """Get the event loop time of the next call, None if not started."""
+        return self._next_call_time
+
+    @property
+    def is_started(self) -> bool:
+        """Check whether the call is scheduled."""
+        return self._next_call_time is not None
+
+    def start(self) -> None:
+        """Activate period calls."""
+        if self.is_started:  # pragma: nocover
+            return
+        self._scheduler.schedule(self)
+
+    def stop(self) -> None:
+        """Remove from schedule."""
+        if not self.is_started:  # pragma: nocover
+            return
+        self._scheduler.unschedule(self)
+
+    def _call(self) -> None:
+        """Call the callback, stopping the call if it raises."""
+        try:
+            self._periodic_callable()
+        except Exception as exception:  # pylint: disable=broad-except
+            self.stop()
+            if not self._exception_callback:  # pragma: nocover
+                raise
+            self._exception_callback(self._periodic_callable, exception)
+
+
+class CoalescingScheduler:
+    """
+    Schedule periodic calls on an event loop using a single timer.
+
+    Call times are rounded up to a multiple of the resolution, and calls falling in the same slot run in one timer callback,
+    so thousands of periodic calls cost a handful of event loop timers.
+
+    Calls are drift-free: the n-th call of a call started at t0 is due at t0 + n * period,
+    whatever the time spent in the callbacks. Calls missed because the loop was busy are skipped, not run in a burst.
+    The first call can be delayed by a random jitter, to spread calls with the same period and start time over the period.
+    """
+
+    DEFAULT_RESOLUTION = 0.01
+
+    def __init__(
+        self,
+        loop: Optional[AbstractEventLoop] = None,
+        resolution: float = DEFAULT_RESOLUTION,
+        jitter: float = 0.0,
+    ) -> None:
+        """
+        Init the scheduler.
+
+        :param loop: optional asyncio event loop
+        :param resolution: the time slot, in seconds, calls are rounded up to.
+        :param jitter: the maximum random delay of the first call, as a fraction of the period, from 0 to 1.
+        """
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("Jitter must be between 0 and 1.")
+        self._loop = loop or asyncio.get_event_loop()
+        self._resolution = resolution
+        self._jitter = jitter
+        self._slots_heap: List[int] = []
+        self._calls_by_slot: Dict[int, Dict[ScheduledPeriodicCall, None]] = {}
+        self._call_slots: Dict[ScheduledPeriodicCall, int] = {}
+        self._timerhandle: Optional[TimerHandle] = None
+        self._timer_slot: Optional[int] = None
+
+    @property
+    def resolution(self) -> float:
+        """Get the resolution."""
+        return self._resolution
+
+    @property
+    def jitter(self) -> float:
+        """Get the jitter."""
+        return self._jitter
+
+    def __len__(self) -> int:
+        """Get the number of calls scheduled."""
+        return len(self._call_slots)
+
+    def periodic_caller(
+        self,
+        callback: Callable,
+        period: float,
+        start_at: Optional[datetime.datetime] = None,
+        exception_callback: Optional[Callable[[Callable, Exception], None]] = None,
+    ) -> ScheduledPeriodicCall:
+        """
+        Create a periodic call run by this scheduler, to be started.
+
+        :param callback: function to call periodically
+        :param period: period in seconds.
+        :param start_at: optional first call datetime
+        :param exception_callback: optional handler to call on exception raised.
+        :return: the periodic call
+        """
+        return ScheduledPeriodicCall(
+            self, callback, period, start_at, exception_callback
+        )
+
+    def schedule(self, call: ScheduledPeriodicCall) -> None:
+        """
+        Schedule the first call of a periodic call.
+
+        :param call: the periodic call.
+        """
+        delay = 0.0
+        start_at = call._start_at  # pylint: disable=protected-access
+        if start_at is not None:
+            delay = max(0.0, start_at.timestamp() - time.time())
+        if self._jitter:
+            delay += random.uniform(0, self._jitter * call.period)  # nosec
+        self._add(call, self._loop.time() + delay)
+
+    def unschedule(self, call: ScheduledPeriodicCall) -> None:
+        """
+        Remove a periodic call from the schedule.
+
+        :param call: the periodic call.
+        """
+        slot = self._call_slots.pop(call, None)
+        call._next_call_time = None  # pylint: disable=protected-access
+        if slot is None:  # pragma: nocover
+            return
+        calls = self._calls_by_slot[slot]
+        calls.pop(call, None)
+        if not calls:
+            del self._calls_by_slot[slot]
+        if not self._call_slots:
+            self.stop()
+
+    def stop(self) -> None:
+        """Remove all the calls from the schedule."""
+        for call in list(self._call_slots):
+            call._next_call_time = None  # pylint: disable=protected-access
+        self._call_slots.clear()
+        self._calls_by_slot.clear()
+        self._slots_heap.clear()
+        if self._timerhandle is not None:
+            self._timerhandle.cancel()
+        self._timerhandle = None
+        self._timer_slot = None
+
+    def _add(self, call: ScheduledPeriodicCall, call_time: float) -> None:
+        """Add a call to the slot of the call time, and set the timer if it is the earliest slot."""
+        slot = math.ceil(call_time / self._resolution)
+        call._next_call_time = call_time  # pylint: disable=protected-access
+        self._call_slots[call] = slot
+        calls = self._calls_by_slot.get(slot)
+        if calls is None:
+            calls = self._calls_by_slot[slot] = {}
+            heapq.heappush(self._slots_heap, slot)
+        calls[call] = None
+        if self._timer_slot is None or slot < self._timer_slot:
+            self._set_timer(slot)
+
+    def _set_timer(self, slot: int) -> None:
+        """Set the timer to fire at the time of the slot."""
+        if self._timerhandle is not None:
+            self._timerhandle.cancel()
+        self._timer_slot = slot
+        self._timerhandle = self._loop.call_at(slot * self._resolution, self._run)
+
+    def _run(self) -> None:
+        """Run the calls of all the slots due, schedule their next calls and set the timer for the next slot."""
+        # the slot of the timer is due, even if the loop fired it slightly before its time
+        due_slot = max(
+            cast(int, self._timer_slot),
+            math.floor(self._loop.time() / self._resolution),
+        )
+        now = max(self._loop.time(), due_slot * self._resolution)
+        self._timerhandle = None
+        self._timer_slot = None
+        due_calls: List[ScheduledPeriodicCall] = []
+        while self._slots_heap and self._slots_heap[0] <= due_slot:
+            slot = heapq.heappop(self._slots_heap)
+            due_calls.extend(self._calls_by_slot.pop(slot, {}))
+
+        for call in due_calls:
+            next_call_time = cast(float, call.next_call_time) + call.period
+            if next_call_time <= now:
+                # skip the calls missed
+                missed = math.floor((now - next_call_time) / call.period) + 1
+                next_call_time += missed * call.period
+            self._add(call, next_call_time)
+
+        for call in due_calls:
+            if call in self._call_slots:  # not stopped by a previous call
+                call._call()  # pylint: disable=protected-access
+
+        if self._timer_slot is None:
+            # drop the slots emptied by the calls stopped
+            while self._slots_heap and self._slots_heap[0] not in self._calls_by_slot:
+                heapq.heappop(self._slots_heap)
+            if self._slots_heap:
+                self._set_timer(self._slots_heap[0])
+
+
 class AnotherThreadTask:
     """
     Schedule a task to run on the loop in another thread.
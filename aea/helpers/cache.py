@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains a bounded mapping with LRU and TTL eviction."""
+import time
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from aea.exceptions import enforce
+
+
+KT = TypeVar("KT")
+VT = TypeVar("VT")
+
+
+class LRUCache(MutableMapping, Generic[KT, VT]):  # pylint: disable=too-many-ancestors
+    """
+    A mapping bounded in size and in the age of its entries.
+
+    Entries are evicted in least recently used order when the max size is reached,
+    and when they have not been accessed for longer than the time to live.
+    Both bounds are disabled when set to None.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[KT, VT], None]] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param max_size: the maximum number of entries.
+        :param ttl: the time to live of an entry since its last access, in seconds.
+        :param on_evict: callback called with the key and the value of every evicted entry.
+        """
+        enforce(max_size is None or max_size > 0, "Max size must be positive.")
+        enforce(ttl is None or ttl > 0, "Time to live must be positive.")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._on_evict = on_evict
+        self._data: "OrderedDict[KT, Tuple[VT, float]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """Get the maximum number of entries."""
+        return self._max_size
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Get the time to live of an entry."""
+        return self._ttl
+
+    @property
+    def hits(self) -> int:
+        """Get the number of successful lookups."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of failed lookups."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Get the number of evicted entries."""
+        return self._evictions
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the cache statistics."""
+        return {
+            "size": len(self._data),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def _is_expired(self, timestamp: float, now: float) -> bool:
+        """Check whether an entry accessed at timestamp is expired."""
+        return self._ttl is not None and now - timestamp > self._ttl
+
+    def _evict(self, key: KT) -> None:
+        """Evict an entry."""
+        value, _ = self._data.pop(key)
+        self._evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+
+    def expire(self) -> None:
+        """Evict the expired entries."""
+        if self._ttl is None:
+            return
+        now = time.monotonic()
+        # entries are kept in access order, so the expired ones are at the beginning
+        while self._data:
+            key, (_, timestamp) = next(iter(self._data.items()))
+            if not self._is_expired(timestamp, now):
+                break
+            self._evict(key)
+
+    def __getitem__(self, key: KT) -> VT:
+        """Get an entry, and mark it as the most recently used."""
+        item = self._data.get(key)
+        if item is None:
+            self._misses += 1
+            raise KeyError(key)
+        value, timestamp = item
+        now = time.monotonic()
+        if self._is_expired(timestamp, now):
+            self._misses += 1
+            self._evict(key)
+            raise KeyError(key)
+        self._hits += 1
+        self._data[key] = (value, now)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        """Set an entry, and mark it as the most recently used."""
+        self._data[key] = (value, time.monotonic())
+        self._data.move_to_end(key)
+        self.expire()
+        if self._max_size is not None:
+            while len(self._data) > self._max_size:
+                self._evict(next(iter(self._data)))
+
+    def __delitem__(self, key: KT) -> None:
+        """Delete an entry."""
+        del self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is present and not expired, without marking it as used."""
+        item = self._data.get(key)  # type: ignore
+        if item is None:
+            return False
+        return not self._is_expired(item[1], time.monotonic())
+
+    def __iter__(self) -> Iterator[KT]:
+        """Iterate over the keys, from the least to the most recently used."""
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all the entries, without counting them as evicted."""
+        self._data.clear()
@@ -21,16 +21,33 @@
 import codecs
 import hashlib
 import io
+import locale
 import os
 import re
+from concurrent.futures import Executor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional, Sized, Tuple, cast
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Sized,
+    Tuple,
+    Type,
+    cast,
+)
 
 import base58
 
 from aea.helpers.cid import to_v1
 from aea.helpers.io import open_file
+from aea.helpers.ipfs.cache import FileHashCache, FileNode
 from aea.helpers.ipfs.utils import _protobuf_python_implementation
+from aea.helpers.serializers import encode_varint
 
 
 # https://github.com/multiformats/multicodec/blob/master/table.csv
@@ -80,6 +97,102 @@ def chunks(data: Sized, size: int) -> Generator:
         yield data[i : i + size]  # type: ignore
 
 
+def _hash_file_node(hasher: Type["IPFSHashOnly"], file_path: str) -> FileNode:
+    """Get the multihash and the cumulative size of the node of a file, in a picklable function for process pools."""
+    (
+        file_pb,
+        file_length,
+    ) = hasher._pb_serialize_file(  # pylint: disable=protected-access
+        file_path
+    )
+    return (
+        hasher._generate_multihash_bytes(file_pb),  # pylint: disable=protected-access
+        file_length,
+    )
+
+
+class _ChunkedContent:
+    """
+    Serialize a content fed piece by piece, like IPFSHashOnly._pb_serialize_bytes does with the whole content.
+
+    Only the data of the block being filled is kept in memory.
+    """
+
+    def __init__(self, hasher: Type["IPFSHashOnly"]) -> None:
+        """Initialize the content."""
+        self._hasher = hasher
+        self._buffer = bytearray()
+        # multihash, serialization length and data length of the blocks
+        self._blocks: List[Tuple[bytes, int, int]] = []
+
+    def copy(self) -> "_ChunkedContent":
+        """Copy the content fed so far."""
+        content = _ChunkedContent(self._hasher)
+        content._buffer = bytearray(self._buffer)
+        content._blocks = list(self._blocks)
+        return content
+
+    def update(self, data: bytes) -> None:
+        """Feed data, serializing the blocks filled."""
+        self._buffer += data
+        chunk_size = self._hasher.DEFAULT_CHUNK_SIZE
+        # a full block is kept until more data comes, as a content of one block is not chunked
+        while len(self._buffer) > chunk_size:
+            self._add_block(bytes(self._buffer[:chunk_size]))
+            del self._buffer[:chunk_size]
+
+    def _add_block(self, chunk: bytes) -> None:
+        """Serialize a block."""
+        block = self._hasher._pb_serialize_data(  # pylint: disable=protected-access
+            chunk
+        )
+        self._blocks.append(
+            (
+                self._hasher._generate_multihash_bytes(  # pylint: disable=protected-access
+                    block
+                ),
+                len(block),
+                len(chunk),
+            )
+        )
+
+    def digest(self) -> Tuple[bytes, int]:
+        """
+        Get the serialization of the content.
+
+        :return: a bytes string in protobuf serialization, content size
+        """
+        if not self._blocks:
+            file_pb = (
+                self._hasher._pb_serialize_data(  # pylint: disable=protected-access
+                    bytes(self._buffer)
+                )
+            )
+            return file_pb, len(file_pb)
+
+        content = self.copy()
+        if content._buffer:
+            content._add_block(bytes(content._buffer))
+        outer_node = PBNode()  # type: ignore
+        data_pb = unixfs_pb2.Data()  # type: ignore
+        data_pb.Type = unixfs_pb2.Data.File  # type: ignore # pylint: disable=no-member
+        data_pb.filesize = sum(chunk_length for _, _, chunk_length in content._blocks)
+        content_size = 0
+        for block_hash, block_length, chunk_length in content._blocks:
+            content_size += block_length
+            outer_node.Links.append(  # type: ignore # pylint: disable=no-member
+                self._hasher.create_link(block_hash, block_length, "")
+            )
+            # type: ignore # pylint: disable=no-member
+            data_pb.blocksizes.append(chunk_length)
+        outer_node.Data = data_pb.SerializeToString(deterministic=True)
+        file_pb = self._hasher._serialize(  # pylint: disable=protected-access
+            outer_node
+        )
+        content_size += len(file_pb)
+        return file_pb, content_size
+
+
 class IPFSHashOnly:
     """A helper class which allows construction of an IPFS hash without interacting with an IPFS daemon."""
 
@@ -87,27 +200,39 @@ class IPFSHashOnly:
     # according to https://pkg.go.dev/github.com/ipfs/go-ipfs-chunker#pkg-constants
 
     @classmethod
-    def get(cls, file_path: str, wrap: bool = True, cid_v1: bool = True) -> str:
+    def get(
+        cls,
+        file_path: str,
+        wrap: bool = True,
+        cid_v1: bool = True,
+        cache: Optional[FileHashCache] = None,
+    ) -> str:
         """Get the IPFS hash."""
         if os.path.isdir(file_path):
-            return cls.hash_directory(file_path, wrap=wrap, cid_v1=cid_v1)
+            return cls.hash_directory(file_path, wrap=wrap, cid_v1=cid_v1, cache=cache)
 
-        return cls.hash_file(file_path, wrap=wrap, cid_v1=cid_v1)
+        return cls.hash_file(file_path, wrap=wrap, cid_v1=cid_v1, cache=cache)
 
     @classmethod
-    def hash_file(cls, file_path: str, wrap: bool = True, cid_v1: bool = True) -> str:
+    def hash_file(
+        cls,
+        file_path: str,
+        wrap: bool = True,
+        cid_v1: bool = True,
+        cache: Optional[FileHashCache] = None,
+    ) -> str:
         """
         Get the IPFS hash for a single file.
 
         :param file_path: the file path
         :param wrap: whether to wrap the content in wrapper node or not
         :param cid_v1: whether to use CID v1 hashes
+        :param cache: the cache of the file nodes, if any
         :return: the ipfs hash
         """
-        data = _read(file_path)
-        return cls.hash_bytes(
-            data=data, wrap=wrap, cid_v1=cid_v1, file_name_if_wrap=Path(file_path).name
-        )
+        path = Path(file_path)
+        link_hash, file_length = cls._hash_files([path], cache=cache)[path]
+        return cls._hash_file_node(link_hash, file_length, wrap, cid_v1, path.name)
 
     @classmethod
     def hash_bytes(
@@ -126,18 +251,27 @@ class IPFSHashOnly:
         :param file_name_if_wrap: optional str with filename applied if wrap is True
         :return: the ipfs hash
         """
+        if wrap and not file_name_if_wrap:
+            raise ValueError("`file_name_if_wrap` is required if wrap option is True")
         file_pb, file_length = cls._pb_serialize_bytes(data)
+        return cls._hash_file_node(
+            cls._generate_multihash_bytes(file_pb),
+            file_length,
+            wrap,
+            cid_v1,
+            cast(str, file_name_if_wrap),
+        )
 
+    @classmethod
+    def _hash_file_node(
+        cls, link_hash: bytes, file_length: int, wrap: bool, cid_v1: bool, name: str
+    ) -> str:
+        """Get the IPFS hash for a file, given the multihash and the cumulative size of its node."""
         if wrap:
-            if not file_name_if_wrap:
-                raise ValueError(
-                    "`file_name_if_wrap` is required if wrap option is True"
-                )
-            link_hash = cls._generate_multihash_bytes(file_pb)
-            link = cls.create_link(link_hash, file_length, file_name_if_wrap)
+            link = cls.create_link(link_hash, file_length, name)
             file_hash = cls.wrap_in_a_node(link)
         else:
-            file_hash = cls._generate_multihash(file_pb)
+            file_hash = base58.b58encode(link_hash).decode()
 
         if cid_v1:
             return to_v1(file_hash)
@@ -146,7 +280,12 @@ class IPFSHashOnly:
 
     @classmethod
     def hash_directory(
-        cls, dir_path: str, wrap: bool = True, cid_v1: bool = True
+        cls,
+        dir_path: str,
+        wrap: bool = True,
+        cid_v1: bool = True,
+        executor: Optional[Executor] = None,
+        cache: Optional[FileHashCache] = None,
     ) -> str:
         """
         Get the IPFS hash for a directory.
@@ -154,11 +293,49 @@ class IPFSHashOnly:
         :param dir_path: the directory path
         :param wrap: whether to wrap the content in wrapper node or not
         :param cid_v1: whether to use CID v1 hashes
+        :param executor: the executor hashing the files in parallel, if any
+        :param cache: the cache of the file nodes, if any
         :return: the ipfs hash
         """
+        return cls.hash_directories(
+            [dir_path], wrap=wrap, cid_v1=cid_v1, executor=executor, cache=cache
+        )[0]
+
+    @classmethod
+    def hash_directories(
+        cls,
+        dir_paths: Sequence[str],
+        wrap: bool = True,
+        cid_v1: bool = True,
+        executor: Optional[Executor] = None,
+        cache: Optional[FileHashCache] = None,
+    ) -> List[str]:
+        """
+        Get the IPFS hashes for several directories, hashing all their files at once.
 
-        path = Path(dir_path)
-        hashed_dir = cls._hash_directory_recursively(path)
+        :param dir_paths: the directory paths
+        :param wrap: whether to wrap the content in wrapper node or not
+        :param cid_v1: whether to use CID v1 hashes
+        :param executor: the executor hashing the files in parallel, if any
+        :param cache: the cache of the file nodes, if any
+        :return: the ipfs hashes
+        """
+        paths = [Path(dir_path) for dir_path in dir_paths]
+        file_nodes = cls._hash_files(
+            [file_path for path in paths for file_path in cls._list_files(path)],
+            executor=executor,
+            cache=cache,
+        )
+        return [
+            cls._hash_directory_node(path, wrap, cid_v1, file_nodes) for path in paths
+        ]
+
+    @classmethod
+    def _hash_directory_node(
+        cls, path: Path, wrap: bool, cid_v1: bool, file_nodes: Dict[Path, FileNode]
+    ) -> str:
+        """Get the IPFS hash for a directory, given the nodes of its files."""
+        hashed_dir = cls._hash_directory_recursively(path, file_nodes)
 
         if wrap:
             link = cls.create_link(
@@ -206,18 +383,73 @@ class IPFSHashOnly:
 
         return base58.b58encode(wrapper_node_hash_bytes).decode()
 
+    @staticmethod
+    def _iter_children(root: Path) -> Iterator[Tuple[Path, bool]]:
+        """Iterate over the children of a directory which are hashed, and whether they are directories."""
+        for child_path in sorted(root.iterdir(), key=lambda x: x.name):
+            if child_path.is_dir():
+                if child_path.name != "__pycache__":
+                    yield child_path, True
+            elif not child_path.name.endswith(".pyc"):
+                yield child_path, False
+
+    @classmethod
+    def _list_files(cls, root: Path) -> List[Path]:
+        """List the files of a directory which are hashed, recursively."""
+        files = []
+        for child_path, is_dir in cls._iter_children(root):
+            if is_dir:
+                files.extend(cls._list_files(child_path))
+            else:
+                files.append(child_path)
+        return files
+
+    @classmethod
+    def _hash_files(
+        cls,
+        file_paths: List[Path],
+        executor: Optional[Executor] = None,
+        cache: Optional[FileHashCache] = None,
+    ) -> Dict[Path, FileNode]:
+        """Get the nodes of files, from the cache or hashing them."""
+        file_nodes: Dict[Path, FileNode] = {}
+        missing_files = []
+        for file_path in file_paths:
+            # the status is taken before reading the file, so a change while hashing invalidates the entry
+            stat = file_path.stat() if cache is not None else None
+            node = cache.get(str(file_path), stat) if cache is not None else None
+            if node is None:
+                missing_files.append((file_path, stat))
+            else:
+                file_nodes[file_path] = node
+
+        hash_file_node = partial(_hash_file_node, cls)
+        file_paths_to_hash = [str(file_path) for file_path, _ in missing_files]
+        nodes = (
+            executor.map(hash_file_node, file_paths_to_hash, chunksize=16)
+            if executor is not None
+            else map(hash_file_node, file_paths_to_hash)
+        )
+        for (file_path, stat), node in zip(missing_files, nodes):
+            file_nodes[file_path] = node
+            if cache is not None:
+                cache.set(str(file_path), cast(os.stat_result, stat), node)
+        return file_nodes
+
     @classmethod
-    def _hash_directory_recursively(cls, root: Path) -> Dict:
+    def _hash_directory_recursively(
+        cls, root: Path, file_nodes: Optional[Dict[Path, FileNode]] = None
+    ) -> Dict:
         """Hash directories recursively, starting from provided root directory."""
+        if file_nodes is None:
+            file_nodes = cls._hash_files(cls._list_files(root))
 
         root_node = PBNode()
         content_size = 0
 
-        for child_path in sorted(root.iterdir(), key=lambda x: x.name):
-            if child_path.is_dir():
-                if child_path.name == "__pycache__":
-                    continue
-                metadata = cls._hash_directory_recursively(child_path)
+        for child_path, is_dir in cls._iter_children(root):
+            if is_dir:
+                metadata = cls._hash_directory_recursively(child_path, file_nodes)
                 content_size_child = len(
                     cast(bytes, metadata.get("serialization"))
                 ) + cast(int, metadata.get("content_size"))
@@ -231,11 +463,7 @@ class IPFSHashOnly:
                 content_size += content_size_child
 
             else:
-                if child_path.name.endswith(".pyc"):
-                    continue
-                data = _read(str(child_path))
-                file_pb, file_length = cls._pb_serialize_bytes(data)
-                child_hash = cls._generate_multihash_bytes(file_pb)
+                child_hash, file_length = file_nodes[child_path]
                 content_size += file_length
                 root_node.Links.append(  # type: ignore # pylint: disable=no-member
                     cls.create_link(child_hash, file_length, child_path.name)
@@ -263,19 +491,16 @@ class IPFSHashOnly:
     def _make_unixfs_pb2(cls, data: bytes) -> bytes:
         if len(data) > cls.DEFAULT_CHUNK_SIZE:  # pragma: nocover
             raise ValueError("Data is too big! use chunks!")
-        data_pb = unixfs_pb2.Data()  # type: ignore
-        data_pb.Type = unixfs_pb2.Data.File  # type: ignore # pylint: disable=no-member
-        data_pb.Data = data
-        data_pb.filesize = len(data)
-        serialized_data = data_pb.SerializeToString(deterministic=True)
-        return serialized_data
+        # encoded by hand, as it is serialized for every file and block,
+        # with the fields Type (File), Data and filesize
+        size = encode_varint(len(data))
+        return b"".join((b"\x08\x02\x12", size, data, b"\x18", size))
 
     @classmethod
     def _pb_serialize_data(cls, data: bytes) -> bytes:
-        outer_node = PBNode()  # type: ignore
-        outer_node.Data = cls._make_unixfs_pb2(data)
-        result = cls._serialize(outer_node)
-        return result
+        # a PBNode with only Data set
+        unixfs_data = cls._make_unixfs_pb2(data)
+        return b"".join((b"\x0a", encode_varint(len(unixfs_data)), unixfs_data))
 
     @classmethod
     def _serialize(cls, pb_node: PBNode) -> bytes:  # type: ignore
@@ -297,30 +522,59 @@ class IPFSHashOnly:
         :return: a bytes string in protobuf serialization, content size
         """
         if len(data) > cls.DEFAULT_CHUNK_SIZE:
-            content_size = 0
-            outer_node = PBNode()  # type: ignore
-            data_pb = unixfs_pb2.Data()  # type: ignore
-            data_pb.Type = unixfs_pb2.Data.File  # type: ignore # pylint: disable=no-member
-            data_pb.filesize = len(data)
-            for chunk in chunks(data, cls.DEFAULT_CHUNK_SIZE):
-                block = cls._pb_serialize_data(chunk)
-                block_length = len(block)
-                content_size += block_length
-                outer_node.Links.append(  # type: ignore # pylint: disable=no-member
-                    cls.create_link(
-                        cls._generate_multihash_bytes(block), block_length, ""
-                    )
-                )
-                # type: ignore # pylint: disable=no-member
-                data_pb.blocksizes.append(len(chunk))
-            outer_node.Data = data_pb.SerializeToString(deterministic=True)
-            file_pb = cls._serialize(outer_node)
-            content_size += len(file_pb)
-            return file_pb, content_size
+            content = _ChunkedContent(cls)
+            content.update(data)
+            return content.digest()
 
         file_pb = cls._pb_serialize_data(data)
         return file_pb, len(file_pb)
 
+    @classmethod
+    def _pb_serialize_file(cls, file_path: str) -> Tuple[bytes, int]:
+        """
+        Serialize a file, reading it once, chunk by chunk.
+
+        Like `_read`, the Windows line endings are replaced if the file is text.
+        The content with the line endings replaced is only kept apart from the first
+        carriage return on, and is dropped as soon as the file turns out to be binary.
+
+        :param file_path: the file path
+        :return: a bytes string in protobuf serialization, content size
+        """
+        content = _ChunkedContent(cls)
+        unix_content: Optional[_ChunkedContent] = None
+        decoder: Optional[codecs.IncrementalDecoder] = codecs.getincrementaldecoder(
+            locale.getpreferredencoding(False)
+        )()
+        carriage_return = b""
+        with open(file_path, "rb") as file:
+            for data in iter(partial(file.read, cls.DEFAULT_CHUNK_SIZE), b""):
+                if decoder is not None:
+                    try:
+                        decoder.decode(data)
+                    except UnicodeDecodeError:
+                        decoder, unix_content = None, None
+                if decoder is not None and unix_content is None and b"\r" in data:
+                    unix_content = content.copy()
+                content.update(data)
+                if unix_content is not None:
+                    # a line ending may be split between two chunks
+                    data = carriage_return + data
+                    carriage_return = b"\r" if data.endswith(b"\r") else b""
+                    unix_content.update(
+                        _dos2unix(data[: len(data) - len(carriage_return)])
+                    )
+
+        if decoder is not None:
+            try:
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                decoder = None
+        if decoder is None or unix_content is None:
+            return content.digest()
+        unix_content.update(carriage_return)
+        return unix_content.digest()
+
     @staticmethod
     def _generate_multihash_bytes(pb_data: bytes) -> bytes:
         sha256_hash = hashlib.sha256(pb_data).hexdigest()
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains an on-disk cache of the IPFS nodes of files."""
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_FILE = Path.home() / ".aea" / "cache" / "ipfs_hashes.json"
+# files modified or with their metadata changed more recently are not cached,
+# as a later change within the same time tick would go unnoticed.
+# the change time also covers the files copied or touched with an older modification time.
+RACY_INTERVAL = 2.0
+
+_default_logger = logging.getLogger(__name__)
+
+FileNode = Tuple[bytes, int]  # the multihash of the node and its cumulative size
+
+
+def _signature(stat: os.stat_result) -> List[int]:
+    """Get the metadata of a file which changes whenever its content changes."""
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino]
+
+
+class FileHashCache:
+    """
+    An on-disk cache of the IPFS nodes of files.
+
+    Entries are keyed by the absolute path of the file, and are valid as long as
+    the size, the modification and change times and the inode of the file are unchanged.
+    """
+
+    def __init__(self, cache_file: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize the cache, loading the cache file if it exists.
+
+        :param cache_file: the path to the cache file.
+        """
+        self._cache_file = Path(cache_file or DEFAULT_CACHE_FILE)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, list] = {}
+        self._is_dirty = False
+        self._hits = 0
+        self._misses = 0
+        self._load()
+
+    @property
+    def cache_file(self) -> Path:
+        """Get the path to the cache file."""
+        return self._cache_file
+
+    @property
+    def hits(self) -> int:
+        """Get the number of files found in the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of files not found in the cache."""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._entries)
+
+    def _load(self) -> None:
+        """Load the cache file, ignoring it if it is missing, corrupted or of another version."""
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as file:
+                content = json.load(file)
+        except (OSError, ValueError):
+            return
+        if isinstance(content, dict) and content.get("version") == CACHE_VERSION:
+            self._entries = content.get("entries", {})
+
+    def get(self, file_path: str, stat: os.stat_result) -> Optional[FileNode]:
+        """
+        Get the node of a file.
+
+        :param file_path: the path to the file.
+        :param stat: the status of the file.
+        :return: the node, or None if the file is not cached or changed since.
+        """
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(file_path))
+            if entry is None or entry[:-2] != _signature(stat):
+                self._misses += 1
+                return None
+            self._hits += 1
+        return bytes.fromhex(entry[-2]), entry[-1]
+
+    def set(self, file_path: str, stat: os.stat_result, node: FileNode) -> None:
+        """
+        Set the node of a file.
+
+        :param file_path: the path to the file.
+        :param stat: the status of the file, taken before reading it.
+        :param node: the node.
+        """
+        if time.time() - max(stat.st_mtime, stat.st_ctime) < RACY_INTERVAL:
+            return
+        with self._lock:
+            self._entries[os.path.abspath(file_path)] = [
+                *_signature(stat),
+                node[0].hex(),
+                node[1],
+            ]
+            self._is_dirty = True
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+            self._is_dirty = True
+
+    def save(self) -> None:
+        """Write the cache file atomically, dropping the entries of files removed since."""
+        with self._lock:
+            if not self._is_dirty:
+                return
+            self._entries = {
+                path: entry
+                for path, entry in self._entries.items()
+                if os.path.exists(path)
+            }
+            content = {"version": CACHE_VERSION, "entries": dict(self._entries)}
+            self._is_dirty = False
+
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._cache_file.parent, prefix=self._cache_file.name
+            )
+        except OSError as e:
+            # e.g. a read-only home directory, the cache is an optimization only
+            _default_logger.debug(f"Cannot write the hash cache file: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(content, file)
+            os.replace(tmp_path, self._cache_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def __enter__(self) -> "FileHashCache":
+        """Enter the context, nothing to do."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Exit the context, saving the cache."""
+        self.save()
+
+
+_default_cache: Optional[FileHashCache] = None
+_is_default_cache_enabled = True
+
+
+def get_default_cache() -> Optional[FileHashCache]:
+    """
+    Get the cache shared by the process, stored in the default cache file and saved on exit.
+
+    :return: the cache, or None if it is disabled.
+    """
+    global _default_cache  # pylint: disable=global-statement
+    if not _is_default_cache_enabled:
+        return None
+    if _default_cache is None:
+        _default_cache = FileHashCache()
+        atexit.register(_default_cache.save)
+    return _default_cache
+
+
+def set_default_cache_enabled(is_enabled: bool) -> None:
+    """
+    Enable or disable the cache shared by the process.
+
+    :param is_enabled: whether the cache is enabled.
+    """
+    global _is_default_cache_enabled  # pylint: disable=global-statement
+    _is_default_cache_enabled = is_enabled
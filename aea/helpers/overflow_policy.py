@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the overflow policies of bounded queues."""
+import asyncio
+import queue
+from contextlib import suppress
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Union
+
+from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
+
+
+QUEUE_FULL_EXCEPTIONS = (queue.Full, asyncio.QueueFull)
+QUEUE_EMPTY_EXCEPTIONS = (queue.Empty, asyncio.QueueEmpty)
+
+
+class OverflowPolicyEnum(Enum):
+    """Policies applied when an item is put in a full queue."""
+
+    block = "block"  # the producer waits for room in the queue. producers which cannot wait get the item rejected.
+    drop_oldest = "drop_oldest"  # the oldest item in the queue is dropped to make room.
+    drop_newest = "drop_newest"  # the item put is dropped.
+    reject = "reject"  # the item put is dropped and the rejection callback is called.
+
+
+class QueueOverflowControl:
+    """Put items in a queue applying an overflow policy when it is full."""
+
+    def __init__(
+        self,
+        queue_: Union[queue.Queue, asyncio.Queue],
+        policy: Union[str, OverflowPolicyEnum] = OverflowPolicyEnum.block,
+        on_reject: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Initialize the overflow control.
+
+        :param queue_: the queue, either a queue.Queue or an asyncio.Queue. Its maxsize bounds it.
+        :param policy: the overflow policy.
+        :param on_reject: callback called with every rejected item.
+        """
+        self._queue = queue_
+        self._policy = OverflowPolicyEnum(policy)
+        self._on_reject = on_reject
+        self._dropped = 0
+        self._rejected = 0
+
+    @property
+    def queue(self) -> Union[queue.Queue, asyncio.Queue]:
+        """Get the queue."""
+        return self._queue
+
+    @property
+    def policy(self) -> OverflowPolicyEnum:
+        """Get the overflow policy."""
+        return self._policy
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum size of the queue, 0 if not bounded."""
+        return self._queue.maxsize
+
+    @property
+    def depth(self) -> int:
+        """Get the number of items in the queue."""
+        return self._queue.qsize()
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of items dropped."""
+        return self._dropped
+
+    @property
+    def rejected(self) -> int:
+        """Get the number of items rejected."""
+        return self._rejected
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the queue statistics."""
+        return {
+            "depth": self.depth,
+            "max_size": self.max_size,
+            "dropped": self._dropped,
+            "rejected": self._rejected,
+        }
+
+    def _reject(self, item: Any) -> None:
+        """Reject an item."""
+        self._rejected += 1
+        if self._on_reject is not None:
+            self._on_reject(item)
+
+    def put_nowait(self, item: Any) -> bool:
+        """
+        Put an item in the queue without waiting.
+
+        :param item: the item to put.
+        :return: whether the item was put in the queue.
+        """
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except QUEUE_FULL_EXCEPTIONS:
+            pass
+
+        if self._policy == OverflowPolicyEnum.drop_oldest:
+            while True:
+                with suppress(*QUEUE_EMPTY_EXCEPTIONS):
+                    self._queue.get_nowait()
+                    self._dropped += 1
+                with suppress(*QUEUE_FULL_EXCEPTIONS):
+                    self._queue.put_nowait(item)
+                    return True
+
+        if self._policy == OverflowPolicyEnum.drop_newest:
+            self._dropped += 1
+            return False
+
+        self._reject(item)
+        return False
+
+    async def put(self, item: Any) -> bool:
+        """
+        Put an item in the queue, waiting for room if the policy is to block.
+
+        :param item: the item to put.
+        :return: whether the item was put in the queue.
+        """
+        if self._policy != OverflowPolicyEnum.block:
+            return self.put_nowait(item)
+        if isinstance(self._queue, AsyncFriendlyQueue):
+            await self._queue.async_put(item)
+        elif isinstance(self._queue, asyncio.Queue):
+            await self._queue.put(item)
+        else:  # pragma: nocover
+            raise ValueError(f"Cannot wait on queue of type {type(self._queue)}")
+        return True
@@ -28,8 +28,10 @@ import tempfile
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop
 from asyncio.streams import StreamWriter
+from collections import deque
+from itertools import islice
 from shutil import rmtree
-from typing import IO, Optional
+from typing import Deque, Dict, IO, List, Optional, Tuple
 
 from aea.exceptions import enforce
 
@@ -41,6 +43,15 @@ PIPE_CONN_ATTEMPTS = 10
 
 TCP_SOCKET_PIPE_CLIENT_CONN_ATTEMPTS = 5
 
+# size of the buffered frames above which writers wait for the pipe to be drained
+PIPE_WRITE_HIGH_WATER = 256 * 1024
+PIPE_CLOSE_TIMEOUT = 1.0
+
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):  # pragma: nocover
+    IOV_MAX = 16
+
 
 class IPCChannelClient(ABC):
     """Multi-platform interprocess communication channel for the client side."""
@@ -101,6 +112,155 @@ class IPCChannel(IPCChannelClient):
         """
 
 
+class PipeWriter:
+    """
+    Non-blocking writer of size prefixed frames to a pipe.
+
+    Frames are written right away when the pipe has room. Otherwise, they are buffered
+    and written as soon as the pipe is writable, coalescing all the buffered frames
+    in one vectored write. Frames are never copied.
+    """
+
+    def __init__(
+        self,
+        fd: int,
+        loop: AbstractEventLoop,
+        high_water: int = PIPE_WRITE_HIGH_WATER,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        :param fd: the file descriptor of the pipe, set to non-blocking.
+        :param loop: the event loop
+        :param high_water: the size of the buffered frames above which drain waits.
+        """
+        os.set_blocking(fd, False)
+        self._fd = fd
+        self._loop = loop
+        self._high_water = high_water
+        self._buffers: Deque[memoryview] = deque()
+        self._buffered_size = 0
+        self._waiters: List[Tuple[int, asyncio.Future]] = []
+        self._is_writer_added = False
+        self._exception: Optional[Exception] = None
+        self._frames = 0
+        self._writes = 0
+
+    @property
+    def buffered_size(self) -> int:
+        """Get the size of the frames not written to the pipe yet."""
+        return self._buffered_size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the number of frames written, of write system calls and of bytes buffered."""
+        return {
+            "frames": self._frames,
+            "writes": self._writes,
+            "buffered_size": self._buffered_size,
+        }
+
+    def write_frame(self, data: bytes) -> None:
+        """
+        Write a frame, the size of the data followed by the data, without blocking.
+
+        :param data: the data of the frame.
+        """
+        if self._exception is not None:
+            raise self._exception
+        self._buffers.append(memoryview(struct.pack("!I", len(data))))
+        if data:
+            self._buffers.append(memoryview(data))
+        self._buffered_size += 4 + len(data)
+        self._frames += 1
+        if not self._is_writer_added:
+            self._write_buffers()
+
+    def _write_buffers(self) -> None:
+        """Write as much of the buffered frames as the pipe accepts."""
+        while self._buffers:
+            try:
+                written = os.writev(self._fd, list(islice(self._buffers, IOV_MAX)))
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                self._set_exception(e)
+                return
+            self._writes += 1
+            self._consume(written)
+
+        if self._buffers and not self._is_writer_added:
+            self._loop.add_writer(self._fd, self._write_buffers)
+            self._is_writer_added = True
+        elif not self._buffers and self._is_writer_added:
+            self._loop.remove_writer(self._fd)
+            self._is_writer_added = False
+        self._wake_up_waiters()
+
+    def _consume(self, written: int) -> None:
+        """Remove the written bytes from the buffers."""
+        self._buffered_size -= written
+        while written > 0:
+            buffer = self._buffers[0]
+            if len(buffer) > written:
+                self._buffers[0] = buffer[written:]
+                break
+            written -= len(buffer)
+            self._buffers.popleft()
+
+    def _set_exception(self, exception: Exception) -> None:
+        """Fail the pending and the next writes."""
+        self._exception = exception
+        self._buffers.clear()
+        self._buffered_size = 0
+        if self._is_writer_added:
+            self._loop.remove_writer(self._fd)
+            self._is_writer_added = False
+        for _, waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_exception(exception)
+        self._waiters.clear()
+
+    def _wake_up_waiters(self) -> None:
+        """Wake up the waiters for the buffered size to get below their limit."""
+        waiters = []
+        for limit, waiter in self._waiters:
+            if waiter.done():
+                continue
+            if self._buffered_size <= limit:
+                waiter.set_result(None)
+            else:
+                waiters.append((limit, waiter))
+        self._waiters = waiters
+
+    async def _wait_for_buffered_size(self, limit: int) -> None:
+        """Wait for the size of the buffered frames to get below a limit."""
+        if self._exception is not None:
+            raise self._exception
+        if self._buffered_size <= limit:
+            return
+        waiter = self._loop.create_future()
+        self._waiters.append((limit, waiter))
+        await waiter
+
+    async def drain(self) -> None:
+        """Wait for the buffered frames to get below the high water mark."""
+        await self._wait_for_buffered_size(self._high_water)
+
+    async def flush(self) -> None:
+        """Wait for all the buffered frames to be written."""
+        await self._wait_for_buffered_size(0)
+
+    def close(self) -> None:
+        """Close the pipe, dropping the buffered frames."""
+        if self._is_writer_added:
+            self._loop.remove_writer(self._fd)
+            self._is_writer_added = False
+        self._buffers.clear()
+        self._buffered_size = 0
+        os.close(self._fd)
+
+
 class PosixNamedPipeProtocol:
     """Posix named pipes async wrapper communication protocol."""
 
@@ -127,6 +287,7 @@ class PosixNamedPipeProtocol:
         self._in = -1
         self._out = -1
 
+        self._writer = None  # type: Optional[PipeWriter]
         self._stream_reader = None  # type: Optional[asyncio.StreamReader]
         self._reader_protocol = None  # type: Optional[asyncio.StreamReaderProtocol]
         self._fileobj = None  # type: Optional[IO[str]]
@@ -178,6 +339,7 @@ class PosixNamedPipeProtocol:
         await self._loop.connect_read_pipe(
             lambda: self.__reader_protocol, self._fileobj
         )
+        self._writer = PipeWriter(self._out, self._loop)
 
         return True
 
@@ -194,10 +356,13 @@ class PosixNamedPipeProtocol:
 
         :param data: bytes to write to pipe
         """
+        if self._writer is None:
+            raise ValueError(
+                "Pipe writer not set, call connect first!"
+            )  # pragma: nocover
         self.logger.debug("writing {}...".format(len(data)))
-        size = struct.pack("!I", len(data))
-        os.write(self._out, size + data)
-        await asyncio.sleep(0.0)
+        self._writer.write_frame(data)
+        await self._writer.drain()
 
     async def read(self) -> Optional[bytes]:
         """
@@ -232,14 +397,16 @@ class PosixNamedPipeProtocol:
     async def close(self) -> None:
         """Disconnect pipe."""
         self.logger.debug("closing pipe (in={})...".format(self._in_path))
-        if self._fileobj is None:
+        if self._fileobj is None or self._writer is None:
             raise ValueError("Pipe not connected")  # pragma: nocover
         try:
             # hack for MacOSX
-            size = struct.pack("!I", 0)
-            os.write(self._out, size)
-
-            os.close(self._out)
+            self._writer.write_frame(b"")
+            await asyncio.wait_for(self._writer.flush(), PIPE_CLOSE_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):  # pragma: no cover
+            pass
+        try:
+            self._writer.close()
             self._fileobj.close()
         except OSError:  # pragma: no cover
             pass
@@ -285,7 +452,8 @@ class TCPSocketProtocol:
             raise ValueError("writer not set!")  # pragma: nocover
         self.logger.debug("writing {}...".format(len(data)))
         size = struct.pack("!I", len(data))
-        self._writer.write(size + data)
+        # the socket transports of python >= 3.12 send both with one vectored send, without copy
+        self._writer.writelines((size, data))
         await self._writer.drain()
 
     async def read(self) -> Optional[bytes]:
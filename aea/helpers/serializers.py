@@ -28,6 +28,9 @@ from google.protobuf.struct_pb2 import (  # pylint: disable=no-name-in-module
 )
 
 
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+
+
 class DictProtobufStructSerializer:
     """
     Serialize python dictionaries of type DictType = Dict[str, ValueType] recursively conserving their dynamic type, using google.protobuf.Struct
@@ -162,3 +165,36 @@ class DictProtobufStructSerializer:
             elif isinstance(value, (list, ListValue)):
                 # fix list of elementes not needed to be restored
                 dictionary[key] = list(value)  # type: ignore
+
+
+def encode_varint(value: int) -> bytes:
+    """
+    Encode a non-negative integer as a protobuf varint.
+
+    :param value: the integer.
+    :return: the encoded integer.
+    """
+    if value < 0:
+        raise ValueError(f"Cannot encode negative value {value} as varint.")
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def length_delimited_field_header(field_number: int, length: int) -> bytes:
+    """
+    Get the header of a protobuf length delimited field (string, bytes or message).
+
+    Writing the header followed by the value gives the same bytes as protobuf,
+    without copying the value into a protobuf message first.
+
+    :param field_number: the number of the field.
+    :param length: the length of the value.
+    :return: the key and the length of the field.
+    """
+    return encode_varint(
+        (field_number << 3) | _WIRE_TYPE_LENGTH_DELIMITED
+    ) + encode_varint(length)
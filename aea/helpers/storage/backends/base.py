@@ -27,12 +27,15 @@ from aea.helpers.constants import JSON_TYPES
 
 EQUALS_TYPE = Union[int, float, str, bool]
 OBJECT_ID_AND_BODY = Tuple[str, JSON_TYPES]
+# collection name, objects to put and ids of the objects to remove
+COLLECTION_CHANGES = Tuple[str, List[OBJECT_ID_AND_BODY], List[str]]
 
 
 class AbstractStorageBackend(ABC):
     """Abstract base class for storage backend."""
 
     VALID_COL_NAME = re.compile("^[a-zA-Z0-9_]+$")
+    VALID_FIELD_NAME = re.compile(r"^(\$\.)?[a-zA-Z0-9_]+(\.[a-zA-Z0-9_]+)*$")
 
     def __init__(self, uri: str) -> None:
         """Init backend."""
@@ -50,6 +53,18 @@ class AbstractStorageBackend(ABC):
                 f"Invalid collection name: {collection_name}, should contain only alpha-numeric characters and _"
             )
 
+    def _check_field_name(self, field: str) -> None:
+        """
+        Check field name is valid.
+
+        :param field: the field name.
+        :raises ValueError: if bad field name provided.
+        """
+        if not self.VALID_FIELD_NAME.match(field):
+            raise ValueError(
+                f"Invalid field name: {field}, should contain only alpha-numeric characters, _ and ."
+            )
+
     @abstractmethod
     async def connect(self) -> None:
         """Connect to backend."""
@@ -67,6 +82,19 @@ class AbstractStorageBackend(ABC):
         :return: None
         """
 
+    async def ensure_indexes(  # noqa: B027
+        self, collection_name: str, indexes: List[str]
+    ) -> None:
+        """
+        Index fields of a collection, to speed up the find on them.
+
+        The backends without indexes ignore them.
+
+        :param collection_name: str.
+        :param indexes: list of the fields to index: example "parent.field"
+        :return: None
+        """
+
     @abstractmethod
     async def put(
         self, collection_name: str, object_id: str, object_body: JSON_TYPES
@@ -80,6 +108,21 @@ class AbstractStorageBackend(ABC):
         :return: None
         """
 
+    async def put_many(
+        self, collection_name: str, objects: List[OBJECT_ID_AND_BODY]
+    ) -> None:
+        """
+        Put objects into collection.
+
+        Backends supporting transactions should override it to put all the objects at once.
+
+        :param collection_name: str.
+        :param objects: list of object ids and bodies.
+        :return: None
+        """
+        for object_id, object_body in objects:
+            await self.put(collection_name, object_id, object_body)
+
     @abstractmethod
     async def get(self, collection_name: str, object_id: str) -> Optional[JSON_TYPES]:
         """
@@ -91,6 +134,26 @@ class AbstractStorageBackend(ABC):
         :return: dict if object exists in collection otherwise None
         """
 
+    async def get_many(
+        self, collection_name: str, object_ids: List[str]
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        Backends supporting it should override it to get all the objects at once.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+
+        :return: list of object ids and bodies of the objects existing in the collection
+        """
+        result = []
+        for object_id in object_ids:
+            object_body = await self.get(collection_name, object_id)
+            if object_body is not None:
+                result.append((object_id, object_body))
+        return result
+
     @abstractmethod
     async def remove(self, collection_name: str, object_id: str) -> None:
         """
@@ -102,6 +165,32 @@ class AbstractStorageBackend(ABC):
         :return: None
         """
 
+    async def remove_many(self, collection_name: str, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection.
+
+        Backends supporting transactions should override it to remove all the objects at once.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+        :return: None
+        """
+        for object_id in object_ids:
+            await self.remove(collection_name, object_id)
+
+    async def apply_changes(self, changes: List[COLLECTION_CHANGES]) -> None:
+        """
+        Put and remove objects in several collections.
+
+        Backends supporting transactions should override it to apply all the changes at once.
+
+        :param changes: list of collection names, objects to put and ids of the objects to remove.
+        :return: None
+        """
+        for collection_name, objects, object_ids in changes:
+            await self.put_many(collection_name, objects)
+            await self.remove_many(collection_name, object_ids)
+
     @abstractmethod
     async def find(
         self, collection_name: str, field: str, equals: EQUALS_TYPE
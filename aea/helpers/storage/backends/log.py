@@ -0,0 +1,680 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains append-only log storage backend implementation."""
+import asyncio
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures.thread import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from aea.helpers.storage.backends.base import (
+    AbstractStorageBackend,
+    COLLECTION_CHANGES,
+    EQUALS_TYPE,
+    JSON_TYPES,
+    OBJECT_ID_AND_BODY,
+)
+
+
+# crc32 of the rest of the record, object id length, object body length, operation
+RECORD_HEADER = struct.Struct("<IIIB")
+OPERATION_PUT = 0
+OPERATION_REMOVE = 1
+SEGMENT_FILE_SUFFIX = ".seg"
+
+# segment id, object body offset, object body length, record length
+RECORD_LOCATION = Tuple[int, int, int, int]
+
+
+def _encode_record(operation: int, object_id: str, object_body: bytes = b"") -> bytes:
+    """Encode a log record."""
+    key = object_id.encode("utf-8")
+    payload = (
+        RECORD_HEADER.pack(0, len(key), len(object_body), operation)[4:]
+        + key
+        + object_body
+    )
+    return struct.pack("<I", zlib.crc32(payload)) + payload
+
+
+def _get_field(object_body: JSON_TYPES, field_path: List[str]) -> Any:
+    """Get the value of a field of an object body, None if it has not the field."""
+    value: Any = object_body
+    for part in field_path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+class _Segment:
+    """A segment file of a collection log, appended by the writes and memory-mapped for the reads."""
+
+    def __init__(self, path: Path, segment_id: int) -> None:
+        """
+        Open the segment file, create it if not exists.
+
+        :param path: path of the segment file.
+        :param segment_id: id of the segment, the segments are replayed in the order of their ids.
+        """
+        self.path = path
+        self.segment_id = segment_id
+        self._file = open(path, "ab+")  # pylint: disable=consider-using-with
+        self._file.seek(0, os.SEEK_END)
+        self.size = self._file.tell()
+        self._mmap: Optional[mmap.mmap] = None
+
+    def append(self, data: bytes) -> int:
+        """
+        Append data to the segment.
+
+        :param data: the data to append.
+        :return: the offset of the data in the segment.
+        """
+        offset = self.size
+        self._file.write(data)
+        self.size += len(data)
+        return offset
+
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Flush the appended data to the operating system.
+
+        :param fsync: also force the data on the disk.
+        """
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+
+    def read(self, offset: int, length: int) -> bytes:
+        """
+        Read data from the segment.
+
+        :param offset: the offset of the data.
+        :param length: the length of the data.
+        :return: the data.
+        """
+        if self._mmap is None or offset + length > len(self._mmap):
+            # the segment grew since it was mapped
+            self._remap()
+        return self._mmap[offset : offset + length]  # type: ignore
+
+    def _remap(self) -> None:
+        """Map the whole segment file in memory."""
+        self._file.flush()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def records(self) -> Iterator[Tuple[int, str, int, int, int]]:
+        """
+        Iterate over the valid records of the segment, and truncate the segment at the first invalid one.
+
+        :return: generator of operations, object ids, object body offsets, object body lengths and record lengths.
+        """
+        offset = 0
+        while offset + RECORD_HEADER.size <= self.size:
+            crc, key_length, body_length, operation = RECORD_HEADER.unpack(
+                self.read(offset, RECORD_HEADER.size)
+            )
+            key_offset = offset + RECORD_HEADER.size
+            body_offset = key_offset + key_length
+            end = body_offset + body_length
+            if (
+                end > self.size
+                or zlib.crc32(self.read(offset + 4, end - offset - 4)) != crc
+            ):
+                break
+            object_id = self.read(key_offset, key_length).decode("utf-8")
+            yield operation, object_id, body_offset, body_length, end - offset
+            offset = end
+        if offset < self.size:
+            # a record was partially written on a crash
+            self.truncate(offset)
+
+    def truncate(self, size: int) -> None:
+        """
+        Truncate the segment.
+
+        :param size: the new size of the segment.
+        """
+        self._close_mmap()
+        self._file.truncate(size)
+        self._file.flush()
+        self.size = size
+
+    def _close_mmap(self) -> None:
+        """Unmap the segment file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self) -> None:
+        """Close the segment file."""
+        self._close_mmap()
+        self._file.close()
+
+    def delete(self) -> None:
+        """Close and delete the segment file."""
+        self.close()
+        self.path.unlink()
+
+
+class _CollectionLog:
+    """The segments and the in-memory indexes of a collection."""
+
+    # the collection is compacted once the garbage exceeds the live data by this ratio
+    COMPACTION_RATIO = 1.0
+
+    def __init__(self, path: Path, segment_size: int, fsync: bool) -> None:
+        """
+        Open the collection log and replay it to build the indexes.
+
+        :param path: path of the directory of the collection segments.
+        :param segment_size: size of the segments, in bytes, once exceeded the writes go to a new segment.
+        :param fsync: force the writes on the disk.
+        """
+        self._path = path
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._segments: Dict[int, _Segment] = {}
+        self._index: Dict[str, RECORD_LOCATION] = {}
+        # field path -> field value -> object ids, in the order they were indexed
+        self._field_indexes: Dict[str, Dict[Any, Dict[str, None]]] = {}
+        self._live_bytes = 0
+        self._garbage_bytes = 0
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @property
+    def garbage_bytes(self) -> int:
+        """Get the size of the records overwritten or removed."""
+        return self._garbage_bytes
+
+    @property
+    def size(self) -> int:
+        """Get the size of the segments."""
+        return self._live_bytes + self._garbage_bytes
+
+    def _load(self) -> None:
+        """Replay the segments, in the order of their ids."""
+        segment_ids = sorted(
+            int(path.stem)
+            for path in self._path.iterdir()
+            if path.suffix == SEGMENT_FILE_SUFFIX and path.stem.isdigit()
+        )
+        for segment_id in segment_ids:
+            segment = self._open_segment(segment_id)
+            for operation, object_id, body_offset, body_length, record_length in list(
+                segment.records()
+            ):
+                if operation == OPERATION_PUT:
+                    self._set_location(
+                        object_id,
+                        (segment_id, body_offset, body_length, record_length),
+                    )
+                else:
+                    self._remove_location(object_id)
+                    self._garbage_bytes += record_length
+        if not self._segments:
+            self._open_segment(0)
+
+    def _open_segment(self, segment_id: int) -> _Segment:
+        """Open a segment."""
+        segment = _Segment(
+            self._path / f"{segment_id:010d}{SEGMENT_FILE_SUFFIX}", segment_id
+        )
+        self._segments[segment_id] = segment
+        return segment
+
+    @property
+    def _active_segment(self) -> _Segment:
+        """Get the segment appended."""
+        return self._segments[next(reversed(self._segments))]
+
+    def _set_location(self, object_id: str, location: RECORD_LOCATION) -> None:
+        """Set the location of the last put record of an object."""
+        self._remove_location(object_id)
+        self._index[object_id] = location
+        self._live_bytes += location[3]
+
+    def _remove_location(self, object_id: str) -> None:
+        """Remove the location of an object, if any, its record becomes garbage."""
+        location = self._index.pop(object_id, None)
+        if location is not None:
+            self._live_bytes -= location[3]
+            self._garbage_bytes += location[3]
+
+    def _append(self, record: bytes) -> Tuple[int, int]:
+        """Append a record to the active segment, start a new segment if it is full."""
+        segment = self._active_segment
+        if segment.size and segment.size + len(record) > self._segment_size:
+            segment.flush(self._fsync)
+            segment = self._open_segment(segment.segment_id + 1)
+        return segment.segment_id, segment.append(record)
+
+    def _read_body(self, location: RECORD_LOCATION) -> bytes:
+        """Read the encoded object body of a record."""
+        segment_id, body_offset, body_length, _ = location
+        return self._segments[segment_id].read(body_offset, body_length)
+
+    def add_index(self, field: str) -> None:
+        """
+        Index the objects by the value of a field.
+
+        :param field: the field path, example "parent.field"
+        """
+        if field in self._field_indexes:
+            return
+        self._field_indexes[field] = {}
+        for object_id, object_body in self.list():
+            self._index_fields(object_id, object_body)
+
+    def _index_fields(self, object_id: str, object_body: JSON_TYPES) -> None:
+        """Add an object to the field indexes."""
+        for field, index in self._field_indexes.items():
+            value = _get_field(object_body, field.split("."))
+            if value is not None and not isinstance(value, (dict, list)):
+                index.setdefault(value, {})[object_id] = None
+
+    def _unindex_fields(self, object_id: str) -> None:
+        """Remove an object from the field indexes."""
+        if not self._field_indexes or object_id not in self._index:
+            return
+        object_body = json.loads(self._read_body(self._index[object_id]))
+        for field, index in self._field_indexes.items():
+            value = _get_field(object_body, field.split("."))
+            object_ids = (
+                index.get(value)
+                if value is not None and not isinstance(value, (dict, list))
+                else None
+            )
+            if object_ids is not None:
+                object_ids.pop(object_id, None)
+                if not object_ids:
+                    del index[value]
+
+    def write(self, objects: List[OBJECT_ID_AND_BODY], object_ids: List[str]) -> None:
+        """
+        Put and remove objects.
+
+        :param objects: list of object ids and bodies to put.
+        :param object_ids: list of ids of the objects to remove.
+        """
+        for object_id, object_body in objects:
+            encoded_body = json.dumps(object_body).encode("utf-8")
+            record = _encode_record(OPERATION_PUT, object_id, encoded_body)
+            segment_id, offset = self._append(record)
+            self._unindex_fields(object_id)
+            body_offset = offset + len(record) - len(encoded_body)
+            self._set_location(
+                object_id, (segment_id, body_offset, len(encoded_body), len(record))
+            )
+            self._index_fields(object_id, object_body)
+        for object_id in object_ids:
+            if object_id not in self._index:
+                continue
+            record = _encode_record(OPERATION_REMOVE, object_id)
+            self._append(record)
+            self._unindex_fields(object_id)
+            self._remove_location(object_id)
+            self._garbage_bytes += len(record)
+        self._active_segment.flush(self._fsync)
+        if self._garbage_bytes > max(
+            self._segment_size, self._live_bytes * self.COMPACTION_RATIO
+        ):
+            self.compact()
+
+    def get(self, object_id: str) -> Optional[JSON_TYPES]:
+        """
+        Get an object.
+
+        :param object_id: the object id.
+        :return: the object body if the object exists, otherwise None
+        """
+        location = self._index.get(object_id)
+        if location is None:
+            return None
+        return json.loads(self._read_body(location))
+
+    def list(self) -> List[OBJECT_ID_AND_BODY]:
+        """
+        List the objects, in the order they were last put.
+
+        :return: list of object ids and bodies.
+        """
+        return [
+            (object_id, json.loads(self._read_body(location)))
+            for object_id, location in self._index.items()
+        ]
+
+    def find(self, field: str, equals: EQUALS_TYPE) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get the objects by the value of a field.
+
+        :param field: the field path, example "parent.field"
+        :param equals: the value the field is equal to.
+        :return: list of object ids and bodies.
+        """
+        index = self._field_indexes.get(field)
+        if index is not None:
+            return [
+                (object_id, json.loads(self._read_body(self._index[object_id])))
+                for object_id in index.get(equals, {})
+            ]
+        field_path = field.split(".")
+        result = []
+        for object_id, object_body in self.list():
+            value = _get_field(object_body, field_path)
+            if value is not None and value == equals:
+                result.append((object_id, object_body))
+        return result
+
+    def compact(self) -> None:
+        """
+        Rewrite the live records in new segments, and delete the old ones.
+
+        The old segments are deleted from the oldest, so a crash at any point leaves a log replayed to the same objects.
+        """
+        old_segments = self._segments
+        self._segments = {}
+        segment = self._open_segment(next(reversed(old_segments)) + 1)
+        index: Dict[str, RECORD_LOCATION] = {}
+        for object_id, (segment_id, body_offset, body_length, _) in self._index.items():
+            encoded_body = old_segments[segment_id].read(body_offset, body_length)
+            record = _encode_record(OPERATION_PUT, object_id, encoded_body)
+            if segment.size and segment.size + len(record) > self._segment_size:
+                segment.flush(fsync=True)
+                segment = self._open_segment(segment.segment_id + 1)
+            offset = segment.append(record)
+            index[object_id] = (
+                segment.segment_id,
+                offset + len(record) - len(encoded_body),
+                len(encoded_body),
+                len(record),
+            )
+        segment.flush(fsync=True)
+        for old_segment in old_segments.values():
+            old_segment.delete()
+        self._index = index
+        self._garbage_bytes = 0
+
+    def close(self) -> None:
+        """Close the segments."""
+        for segment in self._segments.values():
+            segment.flush(self._fsync)
+            segment.close()
+        self._segments = {}
+
+
+class LogStorageBackend(AbstractStorageBackend):
+    """
+    Append-only log storage backend.
+
+    Every collection is a directory of segment files, the puts and the removals are appended to the last one.
+    The location of the last record of every object is kept in an in-memory index, built on connect
+    by replaying the segments, the records partially written on a crash are truncated.
+    The object bodies are read from the memory-mapped segments.
+    The collections are compacted once their garbage, the records overwritten or removed,
+    exceeds both their live data and the segment size.
+
+    The storage uri is `log://<directory>`, with the optional parameters `segment_size`, in bytes,
+    and `fsync`, to force every write on the disk.
+    """
+
+    DEFAULT_SEGMENT_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, uri: str) -> None:
+        """Init backend."""
+        super().__init__(uri)
+        parsed = urlparse(self._uri)
+        self._path = Path(parsed.netloc + parsed.path)
+        parameters = parse_qs(parsed.query)
+        try:
+            self._segment_size = int(
+                parameters.get("segment_size", [self.DEFAULT_SEGMENT_SIZE])[-1]
+            )
+        except ValueError:
+            raise ValueError(
+                f"Invalid segment_size in storage uri: {parameters['segment_size'][-1]}"
+            )
+        if self._segment_size <= 0:
+            raise ValueError("Segment size must be positive.")
+        self._fsync = parameters.get("fsync", ["0"])[-1].lower() in ("1", "true")
+        self._collections: Dict[str, _CollectionLog] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def _execute_sync(self, fn: Callable, *args: Any) -> Any:
+        """Execute a collections operation."""
+        with self._lock:
+            return fn(*args)
+
+    async def _execute(self, fn: Callable, *args: Any) -> Any:
+        """
+        Execute a collections operation.
+
+        The writes only reach the page cache unless they are forced on the disk,
+        so the operations are executed in the event loop, and in the executor otherwise.
+
+        :param fn: the operation.
+        :param args: the arguments of the operation.
+        :return: the result of the operation.
+        """
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Not connected")
+        if self._fsync:
+            return await self._loop.run_in_executor(
+                self._executor, self._execute_sync, fn, *args
+            )
+        return self._execute_sync(fn, *args)
+
+    def _get_collection(self, collection_name: str) -> _CollectionLog:
+        """Get a collection log, open it if not opened."""
+        self._check_collection_name(collection_name)
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = _CollectionLog(
+                self._path / collection_name, self._segment_size, self._fsync
+            )
+            self._collections[collection_name] = collection
+        return collection
+
+    async def connect(self) -> None:
+        """Connect to backend."""
+        self._loop = asyncio.get_event_loop()
+        # the executor of a previous connection is shut down
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    async def disconnect(self) -> None:
+        """Disconnect the backend."""
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Not connected")
+        await self._execute(self._close)
+        self._executor.shutdown(wait=True)
+        self._loop = None
+
+    def _close(self) -> None:
+        """Close the collection logs."""
+        for collection in self._collections.values():
+            collection.close()
+        self._collections = {}
+
+    async def ensure_collection(self, collection_name: str) -> None:
+        """
+        Create collection if not exits.
+
+        :param collection_name: name of the collection.
+        """
+        await self._execute(self._get_collection, collection_name)
+
+    async def ensure_indexes(self, collection_name: str, indexes: List[str]) -> None:
+        """
+        Index fields of a collection, to speed up the find on them.
+
+        :param collection_name: name of the collection.
+        :param indexes: list of the fields to index: example "parent.field"
+        """
+        for field in indexes:
+            self._check_field_name(field)
+        await self._execute(self._ensure_indexes, collection_name, indexes)
+
+    def _ensure_indexes(self, collection_name: str, indexes: List[str]) -> None:
+        """Index a collection log."""
+        collection = self._get_collection(collection_name)
+        for field in indexes:
+            collection.add_index(self._get_field_path(field))
+
+    @staticmethod
+    def _get_field_path(field: str) -> str:
+        """Get the path of a field, without the json root."""
+        return field[2:] if field.startswith("$.") else field
+
+    async def put(
+        self, collection_name: str, object_id: str, object_body: JSON_TYPES
+    ) -> None:
+        """
+        Put object into collection.
+
+        :param collection_name: str.
+        :param object_id: str object id
+        :param object_body: python dict, json compatible.
+        """
+        await self.put_many(collection_name, [(object_id, object_body)])
+
+    async def put_many(
+        self, collection_name: str, objects: List[OBJECT_ID_AND_BODY]
+    ) -> None:
+        """
+        Put objects into collection.
+
+        :param collection_name: str.
+        :param objects: list of object ids and bodies.
+        """
+        await self.apply_changes([(collection_name, objects, [])])
+
+    async def get(self, collection_name: str, object_id: str) -> Optional[JSON_TYPES]:
+        """
+        Get object from the collection.
+
+        :param collection_name: str.
+        :param object_id: str object id
+
+        :return: dict if object exists in collection otherwise None
+        """
+        return await self._execute(
+            lambda: self._get_collection(collection_name).get(object_id)
+        )
+
+    async def get_many(
+        self, collection_name: str, object_ids: List[str]
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+
+        :return: list of object ids and bodies of the objects existing in the collection
+        """
+
+        def _get_many() -> List[OBJECT_ID_AND_BODY]:
+            collection = self._get_collection(collection_name)
+            result = []
+            for object_id in object_ids:
+                object_body = collection.get(object_id)
+                if object_body is not None:
+                    result.append((object_id, object_body))
+            return result
+
+        return await self._execute(_get_many)
+
+    async def remove(self, collection_name: str, object_id: str) -> None:
+        """
+        Remove object from the collection.
+
+        :param collection_name: str.
+        :param object_id: str object id
+        """
+        await self.remove_many(collection_name, [object_id])
+
+    async def remove_many(self, collection_name: str, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+        """
+        await self.apply_changes([(collection_name, [], object_ids)])
+
+    async def apply_changes(self, changes: List[COLLECTION_CHANGES]) -> None:
+        """
+        Put and remove objects in several collections.
+
+        :param changes: list of collection names, objects to put and ids of the objects to remove.
+        """
+
+        def _apply_changes() -> None:
+            for collection_name, objects, object_ids in changes:
+                if objects or object_ids:
+                    self._get_collection(collection_name).write(objects, object_ids)
+
+        await self._execute(_apply_changes)
+
+    async def find(
+        self, collection_name: str, field: str, equals: EQUALS_TYPE
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection by filtering by field value.
+
+        :param collection_name: str.
+        :param field: field name to search: example "parent.field"
+        :param equals: value field should be equal to
+        :return: list of object ids and body
+        """
+        return await self._execute(
+            lambda: self._get_collection(collection_name).find(
+                self._get_field_path(field), equals
+            )
+        )
+
+    async def list(self, collection_name: str) -> List[OBJECT_ID_AND_BODY]:
+        """
+        List all objects with keys from the collection.
+
+        :param collection_name: str.
+        :return: Tuple of objects keys, bodies.
+        """
+        return await self._execute(lambda: self._get_collection(collection_name).list())
+
+    async def compact(self, collection_name: str) -> None:
+        """
+        Compact a collection, rewriting its live objects in new segments.
+
+        :param collection_name: str.
+        """
+        await self._execute(lambda: self._get_collection(collection_name).compact())
@@ -27,11 +27,12 @@ import sys
 import threading
 from concurrent.futures.thread import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from aea.helpers.storage.backends.base import (
     AbstractStorageBackend,
+    COLLECTION_CHANGES,
     EQUALS_TYPE,
     JSON_TYPES,
     OBJECT_ID_AND_BODY,
@@ -39,7 +40,16 @@ from aea.helpers.storage.backends.base import (
 
 
 class SqliteStorageBackend(AbstractStorageBackend):
-    """Sqlite storage backend."""
+    """
+    Sqlite storage backend.
+
+    The database is opened in write-ahead log mode, so readers do not block the writer.
+    The indexes on the object fields are expression indexes on their json path,
+    used by the find queries on the same path.
+    """
+
+    # max number of the variables of a query, the sqlite default before 3.32
+    MAX_QUERY_VARIABLES = 999
 
     def __init__(self, uri: str) -> None:
         """Init backend."""
@@ -67,6 +77,23 @@ class SqliteStorageBackend(AbstractStorageBackend):
             self._connection.commit()
             return result
 
+    def _execute_many_sql_sync(self, queries: List[Tuple[str, List[List]]]) -> None:
+        """
+        Execute sql commands for every set of their arguments in a single transaction.
+
+        :param queries: list of sql query strings and list of arguments to set into them.
+        """
+        if not self._connection:  # pragma: nocover
+            raise ValueError("Not connected")
+        with self._lock:
+            try:
+                for query, args in queries:
+                    self._connection.executemany(query, args)
+            except Exception:
+                self._connection.rollback()
+                raise
+            self._connection.commit()
+
     async def _executute_sql(
         self, query: str, args: Optional[List] = None
     ) -> Optional[JSON_TYPES]:
@@ -84,6 +111,18 @@ class SqliteStorageBackend(AbstractStorageBackend):
             self._executor, self._execute_sql_sync, query, args
         )
 
+    async def _executute_many_sql(self, queries: List[Tuple[str, List[List]]]) -> None:
+        """
+        Execute sql commands for every set of their arguments in async executor.
+
+        :param queries: list of sql query strings and list of arguments to set into them.
+        """
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Not connected")
+        await self._loop.run_in_executor(
+            self._executor, self._execute_many_sql_sync, queries
+        )
+
     async def connect(self) -> None:
         """Connect to backend."""
         self._loop = asyncio.get_event_loop()
@@ -94,6 +133,10 @@ class SqliteStorageBackend(AbstractStorageBackend):
     @staticmethod
     def _do_connect(fname: str) -> sqlite3.Connection:
         con = sqlite3.connect(fname)
+        # in-memory databases keep the memory journal mode
+        con.execute("PRAGMA journal_mode=WAL;")
+        # with the write-ahead log, the database can not be corrupted without full sync
+        con.execute("PRAGMA synchronous=NORMAL;")
         if (
             platform.system() == "Windows"
             and sys.version_info.major == 3
@@ -127,6 +170,28 @@ class SqliteStorageBackend(AbstractStorageBackend):
         """  # nosec
         await self._executute_sql(sql)
 
+    async def ensure_indexes(self, collection_name: str, indexes: List[str]) -> None:
+        """
+        Index fields of a collection, to speed up the find on them.
+
+        :param collection_name: name of the collection.
+        :param indexes: list of the fields to index: example "parent.field"
+        """
+        self._check_collection_name(collection_name)
+        for field in indexes:
+            self._check_field_name(field)
+            path = self._get_json_path(field)
+            index_name = "_".join([collection_name, *path[2:].split("."), "idx"])
+            sql = f"""CREATE INDEX IF NOT EXISTS {index_name}
+                ON {collection_name} (json_extract(object_body, '{path}'));
+            """  # nosec
+            await self._executute_sql(sql)
+
+    @staticmethod
+    def _get_json_path(field: str) -> str:
+        """Get the json path of a field."""
+        return field if field.startswith("$.") else f"$.{field}"
+
     async def put(
         self, collection_name: str, object_id: str, object_body: JSON_TYPES
     ) -> None:
@@ -143,6 +208,33 @@ class SqliteStorageBackend(AbstractStorageBackend):
         """  # nosec
         await self._executute_sql(sql, [object_id, json.dumps(object_body)])
 
+    async def put_many(
+        self, collection_name: str, objects: List[OBJECT_ID_AND_BODY]
+    ) -> None:
+        """
+        Put objects into collection in a single transaction.
+
+        :param collection_name: str.
+        :param objects: list of object ids and bodies.
+        """
+        self._check_collection_name(collection_name)
+        if not objects:
+            return
+        sql = f"""INSERT OR REPLACE INTO {collection_name} (object_id, object_body)
+            VALUES (?, ?);
+        """  # nosec
+        await self._executute_many_sql(
+            [
+                (
+                    sql,
+                    [
+                        [object_id, json.dumps(object_body)]
+                        for object_id, object_body in objects
+                    ],
+                )
+            ]
+        )
+
     async def get(self, collection_name: str, object_id: str) -> Optional[JSON_TYPES]:
         """
         Get object from the collection.
@@ -165,6 +257,31 @@ class SqliteStorageBackend(AbstractStorageBackend):
             return json.loads(result[0][0])
         return None
 
+    async def get_many(
+        self, collection_name: str, object_ids: List[str]
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+
+        :return: list of object ids and bodies of the objects existing in the collection
+        """
+        self._check_collection_name(collection_name)
+        bodies: Dict[str, JSON_TYPES] = {}
+        for i in range(0, len(object_ids), self.MAX_QUERY_VARIABLES):
+            chunk = object_ids[i : i + self.MAX_QUERY_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE object_id IN ({placeholders});"""  # nosec
+            for object_id, object_body in await self._executute_sql(sql, chunk):  # type: ignore
+                bodies[object_id] = json.loads(object_body)
+        return [
+            (object_id, bodies[object_id])
+            for object_id in object_ids
+            if object_id in bodies
+        ]
+
     async def remove(self, collection_name: str, object_id: str) -> None:
         """
         Remove object from the collection.
@@ -176,6 +293,50 @@ class SqliteStorageBackend(AbstractStorageBackend):
         sql = f"""DELETE FROM {collection_name} WHERE object_id = ?;"""  # nosec
         await self._executute_sql(sql, [object_id])
 
+    async def remove_many(self, collection_name: str, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection in a single transaction.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+        """
+        self._check_collection_name(collection_name)
+        if not object_ids:
+            return
+        sql = f"""DELETE FROM {collection_name} WHERE object_id = ?;"""  # nosec
+        await self._executute_many_sql(
+            [(sql, [[object_id] for object_id in object_ids])]
+        )
+
+    async def apply_changes(self, changes: List[COLLECTION_CHANGES]) -> None:
+        """
+        Put and remove objects in several collections in a single transaction.
+
+        :param changes: list of collection names, objects to put and ids of the objects to remove.
+        """
+        queries = []
+        for collection_name, objects, object_ids in changes:
+            self._check_collection_name(collection_name)
+            if objects:
+                sql = f"""INSERT OR REPLACE INTO {collection_name} (object_id, object_body)
+                    VALUES (?, ?);
+                """  # nosec
+                queries.append(
+                    (
+                        sql,
+                        [
+                            [object_id, json.dumps(object_body)]
+                            for object_id, object_body in objects
+                        ],
+                    )
+                )
+            if object_ids:
+                sql = f"""DELETE FROM {collection_name} WHERE object_id = ?;"""  # nosec
+                queries.append((sql, [[object_id] for object_id in object_ids]))
+        if not queries:
+            return
+        await self._executute_many_sql(queries)
+
     async def find(
         self, collection_name: str, field: str, equals: EQUALS_TYPE
     ) -> List[OBJECT_ID_AND_BODY]:
@@ -188,12 +349,17 @@ class SqliteStorageBackend(AbstractStorageBackend):
         :return: list of object ids and body
         """
         self._check_collection_name(collection_name)
-        sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE json_extract(object_body, ?) = ?;"""  # nosec
-        if not field.startswith("$."):
-            field = f"$.{field}"
+        path = self._get_json_path(field)
+        if self.VALID_FIELD_NAME.match(field):
+            # the path is part of the query to use the index on it, if any
+            sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE json_extract(object_body, '{path}') = ?;"""  # nosec
+            args = [equals]
+        else:
+            sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE json_extract(object_body, ?) = ?;"""  # nosec
+            args = [path, equals]
         return [
             (i[0], json.loads(i[1]))
-            for i in await self._executute_sql(sql, [field, equals])  # type: ignore
+            for i in await self._executute_sql(sql, args)  # type: ignore
         ]
 
     async def list(self, collection_name: str) -> List[OBJECT_ID_AND_BODY]:
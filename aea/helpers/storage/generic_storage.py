@@ -19,36 +19,135 @@
 # ------------------------------------------------------------------------------
 """This module contains the storage implementation."""
 import asyncio
-from typing import Any, Coroutine, List, Optional
-from urllib.parse import urlparse
+import json
+import threading
+from typing import Any, Coroutine, Dict, List, Optional, cast
+from urllib.parse import parse_qs, urlparse
 
+from aea.exceptions import enforce
 from aea.helpers.async_utils import AsyncState, Runnable
+from aea.helpers.cache import LRUCache
 from aea.helpers.storage.backends.base import (
     AbstractStorageBackend,
+    COLLECTION_CHANGES,
     EQUALS_TYPE,
     JSON_TYPES,
     OBJECT_ID_AND_BODY,
 )
+from aea.helpers.storage.backends.log import LogStorageBackend
 from aea.helpers.storage.backends.sqlite import SqliteStorageBackend
 
 
-BACKENDS = {"sqlite": SqliteStorageBackend}
+BACKENDS = {"sqlite": SqliteStorageBackend, "log": LogStorageBackend}
+CACHE_SIZE_URI_PARAMETER = "cache_size"
+
+_MISSING = object()
+
+
+class CollectionCache:
+    """
+    Write-through cache of the objects of a collection, bounded in size.
+
+    It is thread safe, to be used by the sync and async collections.
+    The object bodies are cached as json, so each reader gets its own copy,
+    and the changes made by the callers to the bodies are not cached.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Init cache.
+
+        :param max_size: the maximum number of objects cached.
+        """
+        self._cache: LRUCache[str, str] = LRUCache(max_size=max_size)
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of objects cached."""
+        return cast(int, self._cache.max_size)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the cache statistics."""
+        with self._lock:
+            return self._cache.stats
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the ratio of the lookups found in the cache."""
+        with self._lock:
+            lookups = self._cache.hits + self._cache.misses
+            return self._cache.hits / lookups if lookups else 0.0
+
+    def get(self, object_id: str) -> Any:
+        """
+        Get an object body.
+
+        :param object_id: str object id
+        :return: the object body if cached, otherwise a sentinel object
+        """
+        with self._lock:
+            object_json = self._cache.get(object_id, None)
+        if object_json is None:
+            return _MISSING
+        return json.loads(object_json)
+
+    def put_many(self, objects: List[OBJECT_ID_AND_BODY]) -> None:
+        """
+        Cache object bodies.
+
+        :param objects: list of object ids and bodies.
+        """
+        objects_json = [
+            (object_id, json.dumps(object_body)) for object_id, object_body in objects
+        ]
+        with self._lock:
+            for object_id, object_json in objects_json:
+                self._cache[object_id] = object_json
+
+    def remove_many(self, object_ids: List[str]) -> None:
+        """
+        Remove object bodies.
+
+        :param object_ids: list of object ids.
+        """
+        with self._lock:
+            for object_id in object_ids:
+                # not popped, that would count the removal as a hit
+                if object_id in self._cache:
+                    del self._cache[object_id]
 
 
 class AsyncCollection:
     """Async collection."""
 
     def __init__(
-        self, storage_backend: AbstractStorageBackend, collection_name: str
+        self,
+        storage_backend: AbstractStorageBackend,
+        collection_name: str,
+        cache: Optional[CollectionCache] = None,
     ) -> None:
         """
         Init collection object.
 
         :param storage_backend: storage backed to use.
         :param collection_name: str
+        :param cache: optional cache of the collection objects.
         """
         self._storage_backend = storage_backend
         self._collection_name = collection_name
+        self._cache = cache
+
+    @property
+    def name(self) -> str:
+        """Get the collection name."""
+        return self._collection_name
+
+    @property
+    def cache(self) -> Optional[CollectionCache]:
+        """Get the cache of the collection objects."""
+        return self._cache
 
     async def put(self, object_id: str, object_body: JSON_TYPES) -> None:
         """
@@ -59,9 +158,9 @@ class AsyncCollection:
         :return: None
         """
 
-        return await self._storage_backend.put(
-            self._collection_name, object_id, object_body
-        )
+        await self._storage_backend.put(self._collection_name, object_id, object_body)
+        if self._cache is not None:
+            self._cache.put_many([(object_id, object_body)])
 
     async def get(self, object_id: str) -> Optional[JSON_TYPES]:
         """
@@ -71,7 +170,58 @@ class AsyncCollection:
 
         :return: dict if object exists in collection otherwise None
         """
-        return await self._storage_backend.get(self._collection_name, object_id)
+        if self._cache is not None:
+            object_body = self._cache.get(object_id)
+            if object_body is not _MISSING:
+                return object_body
+        return await self._get(object_id)
+
+    async def _get(self, object_id: str) -> Optional[JSON_TYPES]:
+        """Get object from the storage backend, and cache it."""
+        object_body = await self._storage_backend.get(self._collection_name, object_id)
+        if self._cache is not None and object_body is not None:
+            self._cache.put_many([(object_id, object_body)])
+        return object_body
+
+    async def get_many(self, object_ids: List[str]) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param object_ids: list of object ids
+
+        :return: list of object ids and bodies of the objects existing in the collection
+        """
+        if self._cache is None:
+            return await self._storage_backend.get_many(
+                self._collection_name, object_ids
+            )
+        cached = self._get_many_cached(object_ids)
+        missing = [object_id for object_id in object_ids if object_id not in cached]
+        if missing:
+            cached.update(await self._get_many(missing))
+        return [
+            (object_id, cached[object_id])
+            for object_id in object_ids
+            if object_id in cached
+        ]
+
+    def _get_many_cached(self, object_ids: List[str]) -> Dict[str, JSON_TYPES]:
+        """Get the cached objects by id."""
+        result = {}
+        for object_id in object_ids:
+            object_body = cast(CollectionCache, self._cache).get(object_id)
+            if object_body is not _MISSING:
+                result[object_id] = object_body
+        return result
+
+    async def _get_many(self, object_ids: List[str]) -> Dict[str, JSON_TYPES]:
+        """Get objects from the storage backend by id, and cache them."""
+        objects = await self._storage_backend.get_many(
+            self._collection_name, object_ids
+        )
+        if self._cache is not None:
+            self._cache.put_many(objects)
+        return dict(objects)
 
     async def remove(self, object_id: str) -> None:
         """
@@ -81,7 +231,31 @@ class AsyncCollection:
 
         :return: None
         """
-        return await self._storage_backend.remove(self._collection_name, object_id)
+        await self._storage_backend.remove(self._collection_name, object_id)
+        if self._cache is not None:
+            self._cache.remove_many([object_id])
+
+    async def put_many(self, objects: List[OBJECT_ID_AND_BODY]) -> None:
+        """
+        Put objects into collection.
+
+        :param objects: list of object ids and bodies.
+        :return: None
+        """
+        await self._storage_backend.put_many(self._collection_name, objects)
+        if self._cache is not None:
+            self._cache.put_many(objects)
+
+    async def remove_many(self, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection.
+
+        :param object_ids: list of object ids.
+        :return: None
+        """
+        await self._storage_backend.remove_many(self._collection_name, object_ids)
+        if self._cache is not None:
+            self._cache.remove_many(object_ids)
 
     async def find(self, field: str, equals: EQUALS_TYPE) -> List[OBJECT_ID_AND_BODY]:
         """
@@ -121,6 +295,42 @@ class SyncCollection:
     def _run_sync(self, coro: Coroutine) -> Any:
         return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
+    @property
+    def name(self) -> str:
+        """Get the collection name."""
+        return self._async_collection.name
+
+    @property
+    def cache(self) -> Optional[CollectionCache]:
+        """Get the cache of the collection objects."""
+        return self._async_collection.cache
+
+    # the cached objects are got from the calling thread, without a round trip to the storage loop
+    # pylint: disable=protected-access
+
+    def _get(self, object_id: str) -> Optional[JSON_TYPES]:
+        """Get object from the cache or the collection."""
+        cache = self._async_collection.cache
+        if cache is not None:
+            object_body = cache.get(object_id)
+            if object_body is not _MISSING:
+                return object_body
+        return self._run_sync(self._async_collection._get(object_id))
+
+    def _get_many(self, object_ids: List[str]) -> List[OBJECT_ID_AND_BODY]:
+        """Get objects from the cache or the collection."""
+        if self._async_collection.cache is None:
+            return self._run_sync(self._async_collection.get_many(object_ids))
+        cached = self._async_collection._get_many_cached(object_ids)
+        missing = [object_id for object_id in object_ids if object_id not in cached]
+        if missing:
+            cached.update(self._run_sync(self._async_collection._get_many(missing)))
+        return [
+            (object_id, cached[object_id])
+            for object_id in object_ids
+            if object_id in cached
+        ]
+
     def put(self, object_id: str, object_body: JSON_TYPES) -> None:
         """
         Put object into collection.
@@ -139,7 +349,17 @@ class SyncCollection:
 
         :return: dict if object exists in collection otherwise None
         """
-        return self._run_sync(self._async_collection.get(object_id))
+        return self._get(object_id)
+
+    def get_many(self, object_ids: List[str]) -> List[OBJECT_ID_AND_BODY]:
+        """
+        Get objects from the collection.
+
+        :param object_ids: list of object ids
+
+        :return: list of object ids and bodies of the objects existing in the collection
+        """
+        return self._get_many(object_ids)
 
     def remove(self, object_id: str) -> None:
         """
@@ -151,6 +371,24 @@ class SyncCollection:
         """
         return self._run_sync(self._async_collection.remove(object_id))
 
+    def put_many(self, objects: List[OBJECT_ID_AND_BODY]) -> None:
+        """
+        Put objects into collection.
+
+        :param objects: list of object ids and bodies.
+        :return: None
+        """
+        return self._run_sync(self._async_collection.put_many(objects))
+
+    def remove_many(self, object_ids: List[str]) -> None:
+        """
+        Remove objects from the collection.
+
+        :param object_ids: list of object ids.
+        :return: None
+        """
+        return self._run_sync(self._async_collection.remove_many(object_ids))
+
     def find(self, field: str, equals: EQUALS_TYPE) -> List[OBJECT_ID_AND_BODY]:
         """
         Get objects from the collection by filtering by field value.
@@ -190,6 +428,8 @@ class Storage(Runnable):
         super().__init__(loop=loop, threaded=threaded)
         self._storage_uri = storage_uri
         self._backend: AbstractStorageBackend = self._get_backend_instance(storage_uri)
+        self._cache_size = self._get_cache_size(storage_uri)
+        self._caches: Dict[str, CollectionCache] = {}
         self._is_connected = False
         self._connected_state = AsyncState(False)
 
@@ -225,18 +465,107 @@ class Storage(Runnable):
             )
         return backend_class(uri)
 
-    async def get_collection(self, collection_name: str) -> AsyncCollection:
-        """Get async collection."""
+    @staticmethod
+    def _get_cache_size(uri: str) -> Optional[int]:
+        """Get the size of the collections cache set in the storage uri."""
+        values = parse_qs(urlparse(uri).query).get(CACHE_SIZE_URI_PARAMETER)
+        if not values:
+            return None
+        try:
+            cache_size = int(values[-1])
+        except ValueError:
+            raise ValueError(
+                f"Invalid {CACHE_SIZE_URI_PARAMETER} in storage uri: {values[-1]}"
+            )
+        return cache_size or None
+
+    def _get_cache(
+        self, collection_name: str, cache_size: Optional[int]
+    ) -> Optional[CollectionCache]:
+        """Get the cache of a collection, create it on first access."""
+        cache = self._caches.get(collection_name)
+        if cache is None:
+            cache_size = self._cache_size if cache_size is None else cache_size
+            if not cache_size:
+                return None
+            enforce(cache_size > 0, "Cache size must be positive.")
+            cache = self._caches.setdefault(
+                collection_name, CollectionCache(cache_size)
+            )
+        return cache
+
+    @property
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get the cache statistics by collection name."""
+        return {name: cache.stats for name, cache in self._caches.items()}
+
+    async def get_collection(
+        self,
+        collection_name: str,
+        indexes: Optional[List[str]] = None,
+        cache_size: Optional[int] = None,
+    ) -> AsyncCollection:
+        """
+        Get async collection.
+
+        :param collection_name: str
+        :param indexes: optional list of the fields to index, to speed up the find on them: example "parent.field"
+        :param cache_size: max number of the objects of the collection cached, the storage uri one if None, 0 to disable the cache. Ignored if the collection is cached already.
+        :return: async collection
+        """
         await self._backend.ensure_collection(collection_name)
+        if indexes:
+            await self._backend.ensure_indexes(collection_name, indexes)
         return AsyncCollection(
-            collection_name=collection_name, storage_backend=self._backend
+            collection_name=collection_name,
+            storage_backend=self._backend,
+            cache=self._get_cache(collection_name, cache_size),
         )
 
-    def get_sync_collection(self, collection_name: str) -> SyncCollection:
-        """Get sync collection."""
+    def get_sync_collection(
+        self,
+        collection_name: str,
+        indexes: Optional[List[str]] = None,
+        cache_size: Optional[int] = None,
+    ) -> SyncCollection:
+        """
+        Get sync collection.
+
+        :param collection_name: str
+        :param indexes: optional list of the fields to index, to speed up the find on them: example "parent.field"
+        :param cache_size: max number of the objects of the collection cached, the storage uri one if None, 0 to disable the cache. Ignored if the collection is cached already.
+        :return: sync collection
+        """
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Storage not started!")
+        return SyncCollection(
+            self.get_collection(collection_name, indexes, cache_size), self._loop
+        )
+
+    async def apply_changes(self, changes: List[COLLECTION_CHANGES]) -> None:
+        """
+        Put and remove objects in several collections at once.
+
+        :param changes: list of collection names, objects to put and ids of the objects to remove.
+        """
+        await self._backend.apply_changes(changes)
+        for collection_name, objects, object_ids in changes:
+            cache = self._caches.get(collection_name)
+            if cache is not None:
+                cache.put_many(objects)
+                cache.remove_many(object_ids)
+
+    def apply_changes_sync(self, changes: List[COLLECTION_CHANGES]) -> None:
+        """
+        Put and remove objects in several collections at once, from a thread other than the storage one.
+
+        :param changes: list of collection names, objects to put and ids of the objects to remove.
+        """
         if not self._loop:  # pragma: nocover
             raise ValueError("Storage not started!")
-        return SyncCollection(self.get_collection(collection_name), self._loop)
+        asyncio.run_coroutine_threadsafe(
+            self.apply_changes(changes), self._loop
+        ).result()
 
     def __repr__(self) -> str:
         """Get string representation of the storage."""
@@ -21,12 +21,13 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Union
+from typing import Any, List, Optional, Union
 from urllib.parse import urlparse
 
 from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.exceptions import enforce
+from aea.helpers.serializers import length_delimited_field_header
 from aea.mail import base_pb2
 from aea.protocols.base import Message
 
@@ -196,6 +197,17 @@ class EnvelopeSerializer(ABC):
         :return: the envelope
         """
 
+    def encode_parts(self, envelope: "Envelope") -> List[bytes]:
+        """
+        Encode the envelope in parts, which joined give the encoded envelope.
+
+        It lets callers frame the encoded envelope without copying the message.
+
+        :param envelope: the envelope to encode
+        :return: the parts of the encoded envelope
+        """
+        return [self.encode(envelope)]
+
 
 class ProtobufEnvelopeSerializer(EnvelopeSerializer):
     """Envelope serializer using Protobuf."""
@@ -207,16 +219,35 @@ class ProtobufEnvelopeSerializer(EnvelopeSerializer):
         :param envelope: the envelope to encode
         :return: the encoded envelope
         """
-        envelope_pb = base_pb2.Envelope()
-        envelope_pb.to = envelope.to
-        envelope_pb.sender = envelope.sender
-        envelope_pb.protocol_id = str(envelope.protocol_specification_id)
-        envelope_pb.message = envelope.message_bytes
-        if envelope.context is not None and envelope.context.uri is not None:
-            envelope_pb.uri = str(envelope.context.uri)
+        return b"".join(self.encode_parts(envelope))
 
-        envelope_bytes = envelope_pb.SerializeToString()
-        return envelope_bytes
+    def encode_parts(self, envelope: "Envelope") -> List[bytes]:
+        """
+        Encode the envelope in parts, writing the protobuf fields directly.
+
+        The bytes are the same as the ones of base_pb2.Envelope.SerializeToString,
+        but the message is not copied in a protobuf message first.
+
+        :param envelope: the envelope to encode
+        :return: the parts of the encoded envelope
+        """
+        uri = None
+        if envelope.context is not None and envelope.context.uri is not None:
+            uri = str(envelope.context.uri)
+        fields = (
+            envelope.to.encode("utf-8"),
+            envelope.sender.encode("utf-8"),
+            str(envelope.protocol_specification_id).encode("utf-8"),
+            envelope.message_bytes,
+            uri.encode("utf-8") if uri is not None else b"",
+        )
+        parts = []
+        for field_number, value in enumerate(fields, start=1):
+            # proto3 does not write the fields set to the default value
+            if value:
+                parts.append(length_delimited_field_header(field_number, len(value)))
+                parts.append(value)
+        return parts
 
     def decode(self, envelope_bytes: bytes) -> "Envelope":
         """
@@ -266,7 +297,16 @@ class Envelope:
 
     default_serializer = DefaultEnvelopeSerializer()
 
-    __slots__ = ("_to", "_sender", "_protocol_specification_id", "_message", "_context")
+    __slots__ = (
+        "_to",
+        "_sender",
+        "_to_as_public_id",
+        "_is_sender_public_id",
+        "_protocol_specification_id",
+        "_message",
+        "_message_bytes",
+        "_context",
+    )
 
     def __init__(
         self,
@@ -299,6 +339,9 @@ class Envelope:
 
         self._to = to
         self._sender = sender
+        # the addresses are classified once, as envelopes are routed on them at every hop
+        self._to_as_public_id = PublicId.try_from_str(to)
+        self._is_sender_public_id = PublicId.try_from_str(sender) is not None
 
         enforce(
             self.is_to_public_id == self.is_sender_public_id,
@@ -327,6 +370,7 @@ class Envelope:
 
         self._protocol_specification_id: PublicId = protocol_specification_id
         self._message = message
+        self._message_bytes: Optional[bytes] = None
         if self.is_component_to_component_message:
             enforce(
                 context is None,
@@ -344,6 +388,7 @@ class Envelope:
         """Set address of receiver."""
         enforce(isinstance(to, str), f"To must be string. Found '{type(to)}'")
         self._to = to
+        self._to_as_public_id = PublicId.try_from_str(to)
 
     @property
     def sender(self) -> Address:
@@ -357,6 +402,7 @@ class Envelope:
             isinstance(sender, str), f"Sender must be string. Found '{type(sender)}'"
         )
         self._sender = sender
+        self._is_sender_public_id = PublicId.try_from_str(sender) is not None
 
     @property
     def protocol_specification_id(self) -> PublicId:
@@ -372,12 +418,22 @@ class Envelope:
     def message(self, message: Union[Message, bytes]) -> None:
         """Set the protocol-specific message."""
         self._message = message
+        self._message_bytes = None
 
     @property
     def message_bytes(self) -> bytes:
-        """Get the protocol-specific message."""
+        """
+        Get the protocol-specific message, encoded.
+
+        The message is considered frozen once in an envelope, so it is encoded once
+        and the bytes are cached until the message of the envelope is replaced.
+
+        :return: the encoded message
+        """
         if isinstance(self._message, Message):
-            return self._message.encode()
+            if self._message_bytes is None:
+                self._message_bytes = self._message.encode()
+            return self._message_bytes
         return self._message
 
     @property
@@ -388,17 +444,17 @@ class Envelope:
     @property
     def to_as_public_id(self) -> Optional[PublicId]:
         """Get to as public id."""
-        return PublicId.try_from_str(self.to)
+        return self._to_as_public_id
 
     @property
     def is_sender_public_id(self) -> bool:
         """Check if sender is a public id."""
-        return PublicId.is_valid_str(self.sender)
+        return self._is_sender_public_id
 
     @property
     def is_to_public_id(self) -> bool:
         """Check if to is a public id."""
-        return PublicId.is_valid_str(self.to)
+        return self._to_as_public_id is not None
 
     @property
     def is_component_to_component_message(self) -> bool:
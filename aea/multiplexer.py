@@ -19,12 +19,14 @@
 # ------------------------------------------------------------------------------
 """Module for the multiplexer class and related classes."""
 import asyncio
+import logging
 import queue
 import threading
 from asyncio.events import AbstractEventLoop
 from concurrent.futures._base import CancelledError
 from concurrent.futures._base import TimeoutError as FuturesTimeoutError
 from contextlib import suppress
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -44,8 +46,10 @@ from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.async_utils import AsyncState, Runnable, ThreadedAsyncRunner
+from aea.helpers.cache import LRUCache
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import WithLogger, get_logger
+from aea.helpers.overflow_policy import OverflowPolicyEnum, QueueOverflowControl
 from aea.mail.base import AEAConnectionError, Empty, Envelope, EnvelopeContext
 from aea.protocols.base import Message, Protocol
 
@@ -86,6 +90,8 @@ class AsyncMultiplexer(Runnable, WithLogger):
     DISCONNECT_TIMEOUT = 5
     CONNECT_TIMEOUT = 60
     SEND_TIMEOUT = 60
+    DEFAULT_BATCH_SIZE = 1
+    ROUTING_TABLE_MAX_SIZE = 10000
 
     _lock: asyncio.Lock
 
@@ -100,6 +106,17 @@ class AsyncMultiplexer(Runnable, WithLogger):
         default_routing: Optional[Dict[PublicId, PublicId]] = None,
         default_connection: Optional[PublicId] = None,
         protocols: Optional[List[Union[Protocol, Message]]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        routing_helper_max_size: Optional[int] = None,
+        routing_helper_ttl: Optional[float] = None,
+        in_queue_max_size: int = 0,
+        in_queue_overflow_policy: Union[
+            str, OverflowPolicyEnum
+        ] = OverflowPolicyEnum.block,
+        out_queue_max_size: int = 0,
+        out_queue_overflow_policy: Union[
+            str, OverflowPolicyEnum
+        ] = OverflowPolicyEnum.block,
     ) -> None:
         """
         Initialize the connection multiplexer.
@@ -115,7 +132,23 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param default_routing: default routing map
         :param default_connection: default connection
         :param protocols: protocols used
+        :param batch_size: maximum number of envelopes processed per wake-up of the send and receive loops.
+            If greater than 1, the batched mode is enabled: outgoing envelopes are grouped per connection
+            and sent with `Connection.send_batch`, incoming ones are read with `Connection.receive_batch`.
+        :param routing_helper_max_size: maximum number of sender addresses remembered by the routing helper.
+            If None, the routing helper is not bounded in size.
+        :param routing_helper_ttl: time in seconds after which a sender address not seen is forgotten
+            by the routing helper. If None, the entries do not expire.
+        :param in_queue_max_size: maximum number of incoming envelopes waiting to be processed. 0 means unbounded.
+        :param in_queue_overflow_policy: policy applied to incoming envelopes when the in queue is full.
+            With `block`, the receiving loop stops reading from the connections until there is room.
+        :param out_queue_max_size: maximum number of outgoing envelopes waiting to be sent. 0 means unbounded.
+        :param out_queue_overflow_policy: policy applied to outgoing envelopes when the out queue is full.
+            With `block`, producers running in another thread wait for room, the others get the envelope rejected.
         """
+        enforce(batch_size >= 1, "Batch size must be a positive integer.")
+        enforce(in_queue_max_size >= 0, "Queue max size must not be negative.")
+        enforce(out_queue_max_size >= 0, "Queue max size must not be negative.")
         self._exception_policy: ExceptionPolicyEnum = exception_policy
         logger = get_logger(__name__, agent_name)
         WithLogger.__init__(self, logger=logger)
@@ -145,6 +178,13 @@ class AsyncMultiplexer(Runnable, WithLogger):
             )
 
         self._default_routing = {}  # type: Dict[PublicId, PublicId]
+        self._batch_size = batch_size
+        # compiled routes: to -> (protocol specification id, sender) -> connection
+        self._routing_table: LRUCache[
+            Address, Dict[Tuple[PublicId, Address], Connection]
+        ] = LRUCache(max_size=self.ROUTING_TABLE_MAX_SIZE)
+        self._routing_table_hits = 0
+        self._routing_table_misses = 0
 
         self._setup(connections or [], default_routing, default_connection)
 
@@ -152,10 +192,24 @@ class AsyncMultiplexer(Runnable, WithLogger):
         self._specification_id_to_protocol_id = {
             p.protocol_specification_id: p.protocol_id for p in protocols or []
         }
-        self._routing_helper: Dict[Address, PublicId] = {}
+        self._routing_helper: LRUCache[Address, PublicId] = LRUCache(
+            max_size=routing_helper_max_size,
+            ttl=routing_helper_ttl,
+            on_evict=self._on_routing_helper_eviction,
+        )
 
-        self._in_queue = AsyncFriendlyQueue()  # type: AsyncFriendlyQueue
+        self._in_queue = AsyncFriendlyQueue(
+            maxsize=in_queue_max_size
+        )  # type: AsyncFriendlyQueue
+        self._in_queue_overflow_policy = OverflowPolicyEnum(in_queue_overflow_policy)
+        self._in_queue_control = None  # type: Optional[QueueOverflowControl]
         self._out_queue = None  # type: Optional[asyncio.Queue]
+        self._out_queue_max_size = out_queue_max_size
+        self._out_queue_overflow_policy = OverflowPolicyEnum(out_queue_overflow_policy)
+        self._out_queue_control = None  # type: Optional[QueueOverflowControl]
+        self._rejection_callback = (
+            None
+        )  # type: Optional[Callable[[Envelope, str], None]]
 
         self._recv_loop_task = None  # type: Optional[asyncio.Task]
         self._send_loop_task = None  # type: Optional[asyncio.Task]
@@ -182,6 +236,67 @@ class AsyncMultiplexer(Runnable, WithLogger):
             raise ValueError("Accessing out queue before loop is started.")
         return self._out_queue
 
+    @property
+    def in_queue_depth(self) -> int:
+        """Get the number of incoming envelopes waiting to be processed."""
+        return self._in_queue.qsize()
+
+    @property
+    def out_queue_depth(self) -> int:
+        """Get the number of outgoing envelopes waiting to be sent."""
+        return self._out_queue.qsize() if self._out_queue is not None else 0
+
+    @property
+    def queue_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get depth, max size, dropped and rejected envelopes of the in and out queues."""
+        in_queue_stats = (
+            self._in_queue_control.stats
+            if self._in_queue_control is not None
+            else {
+                "depth": self.in_queue_depth,
+                "max_size": self._in_queue.maxsize,
+                "dropped": 0,
+                "rejected": 0,
+            }
+        )
+        out_queue_stats = (
+            self._out_queue_control.stats
+            if self._out_queue_control is not None
+            else {
+                "depth": self.out_queue_depth,
+                "max_size": self._out_queue_max_size,
+                "dropped": 0,
+                "rejected": 0,
+            }
+        )
+        return {"in_queue": in_queue_stats, "out_queue": out_queue_stats}
+
+    def set_rejection_callback(
+        self, callback: Optional[Callable[[Envelope, str], None]]
+    ) -> None:
+        """
+        Set the callback called with the envelopes rejected by a full queue.
+
+        :param callback: callback taking the envelope and the name of the queue.
+        """
+        self._rejection_callback = callback
+
+    def _on_envelope_rejected(self, queue_name: str, envelope: Envelope) -> None:
+        """Handle an envelope rejected by a full queue."""
+        if self._rejection_callback is not None:
+            self._rejection_callback(envelope, queue_name)
+            return
+        self.logger.warning(
+            f"Envelope rejected, {queue_name} is full: to={envelope.to}, sender={envelope.sender}, protocol_specification_id={envelope.protocol_specification_id}"
+        )
+
+    def _is_loop_thread(self) -> bool:
+        """Check whether the caller runs in the thread of the multiplexer event loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
     @property
     def connections(self) -> Tuple[Connection, ...]:
         """Get the connections."""
@@ -201,6 +316,66 @@ class AsyncMultiplexer(Runnable, WithLogger):
     def default_routing(self, default_routing: Dict[PublicId, PublicId]) -> None:
         """Set the default routing."""
         self._default_routing = default_routing
+        self._invalidate_routing_table()
+
+    @property
+    def routing_helper_size(self) -> int:
+        """Get the number of sender addresses in the routing helper."""
+        return len(self._routing_helper)
+
+    @property
+    def routing_helper_evictions(self) -> int:
+        """Get the number of sender addresses evicted from the routing helper."""
+        return self._routing_helper.evictions
+
+    def _on_routing_helper_eviction(self, address: Address, _: PublicId) -> None:
+        """Forget the compiled routes to an address evicted from the routing helper."""
+        self._invalidate_routing_table(address)
+
+    @property
+    def routing_table_hits(self) -> int:
+        """Get the number of envelopes routed with the compiled routing table."""
+        return self._routing_table_hits
+
+    @property
+    def routing_table_misses(self) -> int:
+        """Get the number of envelopes routed by applying the routing rules."""
+        return self._routing_table_misses
+
+    def _invalidate_routing_table(self, address: Optional[Address] = None) -> None:
+        """
+        Invalidate the compiled routing table.
+
+        :param address: if set, only invalidate the routes to this address.
+        """
+        if address is None:
+            self._routing_table.clear()
+        else:
+            self._routing_table.pop(address, None)
+
+    def _add_route(self, envelope: Envelope, connection: Connection) -> None:
+        """
+        Compile the route of an envelope into the routing table.
+
+        :param envelope: the envelope routed.
+        :param connection: the connection the envelope is routed to.
+        """
+        routes = self._routing_table.get(envelope.to)
+        if routes is None:
+            # the least recently used address is evicted to keep the table bounded
+            routes = {}
+            self._routing_table[envelope.to] = routes
+        routes[(envelope.protocol_specification_id, envelope.sender)] = connection
+
+    @property
+    def batch_size(self) -> int:
+        """Get the maximum number of envelopes processed per loop wake-up."""
+        return self._batch_size
+
+    @property
+    def is_batched(self) -> bool:
+        """Check whether the batched mode is enabled."""
+        return self._batch_size > 1
 
     @property
     def connection_status(self) -> MultiplexerStatus:
@@ -277,6 +452,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
         self._id_to_connection[connection.connection_id] = connection
         if is_default:
             self._default_connection = connection
+        self._invalidate_routing_table()
 
     def _connection_consistency_checks(self) -> None:
         """
@@ -297,6 +473,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
         """Set the default connection if it is none."""
         if self._default_connection is None and bool(self.connections):
             self._default_connection = self.connections[0]
+            self._invalidate_routing_table()
 
     async def connect(self) -> None:
         """Connect the multiplexer."""
@@ -304,7 +481,17 @@ class AsyncMultiplexer(Runnable, WithLogger):
         self.logger.debug("Multiplexer connecting...")
         self._connection_consistency_checks()
         self._set_default_connection_if_none()
-        self._out_queue = asyncio.Queue()
+        self._in_queue_control = QueueOverflowControl(
+            self._in_queue,
+            self._in_queue_overflow_policy,
+            on_reject=partial(self._on_envelope_rejected, "in_queue"),
+        )
+        self._out_queue = asyncio.Queue(maxsize=self._out_queue_max_size)
+        self._out_queue_control = QueueOverflowControl(
+            self._out_queue,
+            self._out_queue_overflow_policy,
+            on_reject=partial(self._on_envelope_rejected, "out_queue"),
+        )
 
         async with self._lock:
             if self.connection_status.is_connected:
@@ -319,8 +506,18 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 else:  # pragma: nocover
                     raise AEAConnectionError("Failed to connect the multiplexer.")
 
-                self._recv_loop_task = self._loop.create_task(self._receiving_loop())
-                self._send_loop_task = self._loop.create_task(self._send_loop())
+                if self.is_batched:
+                    self._recv_loop_task = self._loop.create_task(
+                        self._receiving_batch_loop()
+                    )
+                    self._send_loop_task = self._loop.create_task(
+                        self._send_batch_loop()
+                    )
+                else:
+                    self._recv_loop_task = self._loop.create_task(
+                        self._receiving_loop()
+                    )
+                    self._send_loop_task = self._loop.create_task(self._send_loop())
                 self.logger.debug("Multiplexer connected and running.")
             except (CancelledError, asyncio.CancelledError):  # pragma: nocover
                 await self._stop()
@@ -371,7 +568,9 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         if self._send_loop_task:
             # send a 'stop' token (a None value) to wake up the coroutine waiting for outgoing envelopes.
-            await self.out_queue.put(None)
+            # the loop is cancelled anyway, so do not wait if the queue is full.
+            with suppress(asyncio.QueueFull):
+                self.out_queue.put_nowait(None)
             self._send_loop_task.cancel()
             with suppress(Exception, asyncio.CancelledError):
                 await self._send_loop_task
@@ -512,6 +711,58 @@ class AsyncMultiplexer(Runnable, WithLogger):
             self.logger.exception("Error in the sending loop: {}".format(str(e)))
             raise
 
+    async def _send_batch_loop(self) -> None:
+        """Process the outgoing envelopes in batches."""
+        if not self.is_connected:
+            self.logger.debug(
+                "Sending loop not started. The multiplexer is not connected."
+            )
+            return
+
+        try:
+            while self.is_connected:
+                self.logger.debug("Waiting for outgoing envelopes...")
+                envelope = await self.out_queue.get()
+                if envelope is None:  # pragma: nocover
+                    self.logger.debug(
+                        "Received empty envelope. Quitting the sending loop..."
+                    )
+                    return None
+                envelopes, stop = self._drain_out_queue(envelope)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Sending batch of {len(envelopes)} envelopes")
+                await self._send_batch(envelopes)
+                if stop:
+                    self.logger.debug(
+                        "Received empty envelope. Quitting the sending loop..."
+                    )
+                    return None
+
+        except asyncio.CancelledError:
+            self.logger.debug("Sending loop cancelled.")
+            raise
+        except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
+            self.logger.exception("Error in the sending loop: {}".format(str(e)))
+            raise
+
+    def _drain_out_queue(self, first: Envelope) -> Tuple[List[Envelope], bool]:
+        """
+        Drain up to `batch_size` envelopes from the out queue without waiting.
+
+        :param first: the envelope already taken from the queue.
+        :return: the envelopes drained, and whether a stop token was found.
+        """
+        envelopes = [first]
+        while len(envelopes) < self._batch_size:
+            try:
+                envelope = self.out_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if envelope is None:
+                return envelopes, True
+            envelopes.append(envelope)
+        return envelopes, False
+
     async def _receiving_loop(self) -> None:
         """Process incoming envelopes."""
         self.logger.debug("Starting receving loop...")
@@ -531,7 +782,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
                     envelope = task.result()
                     if envelope is not None:
                         self._update_routing_helper(envelope, connection)
-                        self.in_queue.put_nowait(envelope)
+                        await self._get_in_queue_control().put(envelope)
 
                     # reinstantiate receiving task, but only if the connection is still up.
                     if connection.is_connected:
@@ -550,12 +801,127 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 t.cancel()
             self.logger.debug("Receiving loop terminated.")
 
+    async def _receiving_batch_loop(self) -> None:
+        """Process incoming envelopes in batches."""
+        self.logger.debug("Starting receving loop...")
+        task_to_connection = {
+            asyncio.ensure_future(conn.receive_batch()): conn
+            for conn in self.connections
+        }
+
+        try:
+            while self.connection_status.is_connected and len(task_to_connection) > 0:
+                done, _pending = await asyncio.wait(
+                    task_to_connection.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                # process completed receiving tasks.
+                for task in done:
+                    connection = task_to_connection.pop(task)
+                    envelopes = task.result()
+                    for envelope in envelopes or []:
+                        self._update_routing_helper(envelope, connection)
+                        await self._get_in_queue_control().put(envelope)
+
+                    # reinstantiate receiving task, but only if the connection is still up.
+                    if connection.is_connected:
+                        new_task = asyncio.ensure_future(connection.receive_batch())
+                        task_to_connection[new_task] = connection
+
+        except asyncio.CancelledError:  # pragma: nocover
+            self.logger.debug("Receiving loop cancelled.")
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.exception("Error in the receiving loop: {}".format(str(e)))
+            raise
+        finally:
+            # cancel all the receiving tasks.
+            for t in task_to_connection.keys():
+                t.cancel()
+            self.logger.debug("Receiving loop terminated.")
+
     async def _send(self, envelope: Envelope) -> None:
         """
         Send an envelope.
 
         :param envelope: the envelope to send.
         """
+        connection = self._get_connection_for_envelope(envelope)
+        if connection is None:
+            return
+
+        try:
+            await asyncio.wait_for(connection.send(envelope), timeout=self.SEND_TIMEOUT)
+        except Exception as e:  # pylint: disable=broad-except
+            self._handle_exception(self._send, e)
+
+    async def _send_batch(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Send a batch of envelopes, grouped per target connection.
+
+        The order of the envelopes is preserved within each connection.
+
+        :param envelopes: the envelopes to send.
+        """
+        batches: Dict[PublicId, Tuple[Connection, List[Envelope]]] = {}
+        for envelope in envelopes:
+            connection = self._get_connection_for_envelope(envelope)
+            if connection is None:
+                continue
+            batch = batches.get(connection.connection_id)
+            if batch is None:
+                batch = (connection, [])
+                batches[connection.connection_id] = batch
+            batch[1].append(envelope)
+
+        for connection, batch_envelopes in batches.values():
+            try:
+                await asyncio.wait_for(
+                    connection.send_batch(batch_envelopes), timeout=self.SEND_TIMEOUT
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                self._handle_exception(self._send_batch, e)
+
+    def _get_connection_for_envelope(self, envelope: Envelope) -> Optional[Connection]:
+        """
+        Get the connection to send an envelope with.
+
+        Envelopes without a connection id in their context are routed with a single
+        lookup in the compiled routing table, kept in least recently used order. On a miss,
+        the routing rules are applied and the result is added to the table.
+
+        :param envelope: the envelope to send.
+        :return: the connection, or None if the envelope has to be dropped.
+        """
+        is_cacheable = (
+            envelope.context is None or envelope.context.connection_id is None
+        )
+        if is_cacheable:
+            # keep the routing helper entry of the address alive, as routing by the rules does,
+            # an expired one invalidates the routes to the address.
+            self._routing_helper.get(envelope.to)
+            routes = self._routing_table.get(envelope.to)
+            if routes is not None:
+                connection = routes.get(
+                    (envelope.protocol_specification_id, envelope.sender)
+                )
+                if connection is not None:
+                    self._routing_table_hits += 1
+                    return connection
+            self._routing_table_misses += 1
+
+        connection = self._route_envelope(envelope)
+        if connection is not None and is_cacheable:
+            self._add_route(envelope, connection)
+        return connection
+
+    def _route_envelope(self, envelope: Envelope) -> Optional[Connection]:
+        """
+        Apply the routing rules to an envelope.
+
+        :param envelope: the envelope to send.
+        :return: the connection, or None if the envelope has to be dropped.
+        """
         envelope_protocol_id = self._get_protocol_id_for_envelope(envelope)
         connection_id = self._get_connection_id_from_envelope(
             envelope, envelope_protocol_id
@@ -570,15 +936,12 @@ class AsyncMultiplexer(Runnable, WithLogger):
             self.logger.warning(
                 f"Dropping envelope, no connection available for sending: {envelope}"
             )
-            return
+            return None
 
         if not self._is_connection_supported_protocol(connection, envelope_protocol_id):
-            return
+            return None
 
-        try:
-            await asyncio.wait_for(connection.send(envelope), timeout=self.SEND_TIMEOUT)
-        except Exception as e:  # pylint: disable=broad-except
-            self._handle_exception(self._send, e)
+        return connection
 
     def _get_connection_id_from_envelope(
         self, envelope: Envelope, envelope_protocol_id: PublicId
@@ -621,8 +984,8 @@ class AsyncMultiplexer(Runnable, WithLogger):
             return connection_id
 
         # second, try to route by routing helper
-        if envelope.to in self._routing_helper:
-            connection_id = self._routing_helper[envelope.to]
+        connection_id = self._routing_helper.get(envelope.to)
+        if connection_id is not None:
             self.logger.debug(
                 "Using routing helper with connection_id: {}".format(connection_id)
             )
@@ -718,7 +1081,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         :param envelope: the envelope to be sent.
         """
-        await self.out_queue.put(envelope)
+        await self._get_out_queue_control().put(envelope)
 
     def put(self, envelope: Envelope) -> None:
         """
@@ -729,10 +1092,34 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         :param envelope: the envelope to be sent.
         """
-        if self._threaded:
-            self._loop.call_soon_threadsafe(self.out_queue.put_nowait, envelope)
+        control = self._get_out_queue_control()
+        if self._out_queue_max_size == 0:
+            if self._threaded:
+                self._loop.call_soon_threadsafe(self.out_queue.put_nowait, envelope)
+            else:
+                self.out_queue.put_nowait(envelope)
+        elif (
+            self._threaded
+            and control.policy == OverflowPolicyEnum.block
+            and not self._is_loop_thread()
+        ):
+            asyncio.run_coroutine_threadsafe(control.put(envelope), self._loop).result()
+        elif self._threaded:
+            self._loop.call_soon_threadsafe(control.put_nowait, envelope)
         else:
-            self.out_queue.put_nowait(envelope)
+            control.put_nowait(envelope)
+
+    def _get_in_queue_control(self) -> QueueOverflowControl:
+        """Get the overflow control of the in queue."""
+        if self._in_queue_control is None:  # pragma: nocover
+            raise ValueError("Accessing in queue before loop is started.")
+        return self._in_queue_control
+
+    def _get_out_queue_control(self) -> QueueOverflowControl:
+        """Get the overflow control of the out queue."""
+        if self._out_queue_control is None:  # pragma: nocover
+            raise ValueError("Accessing out queue before loop is started.")
+        return self._out_queue_control
 
     def _setup(
         self,
@@ -769,6 +1156,8 @@ class AsyncMultiplexer(Runnable, WithLogger):
         """
         if envelope.is_component_to_component_message:
             return
+        if self._routing_helper.get(envelope.sender) != connection.public_id:
+            self._invalidate_routing_table(envelope.sender)
         self._routing_helper[envelope.sender] = connection.public_id
 
 
@@ -852,7 +1241,14 @@ class Multiplexer(AsyncMultiplexer):
 
         :param envelope: the envelope to be sent.
         """
-        self._thread_runner.call(super()._put(envelope))  # .result(240)
+        future = self._thread_runner.call(super()._put(envelope))
+        if (
+            self._out_queue_max_size > 0
+            and self._out_queue_overflow_policy == OverflowPolicyEnum.block
+            and not self._is_loop_thread()
+        ):
+            # back-pressure: wait for room in the out queue
+            future.result()
 
 
 class InBox:
@@ -40,6 +40,7 @@ from aea.helpers.dependency_tree import DependencyTree, dump_yaml, load_yaml
 from aea.helpers.fingerprint import update_fingerprint
 from aea.helpers.io import open_file
 from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.ipfs.cache import get_default_cache
 
 
 try:
@@ -122,7 +123,9 @@ class BasePackageManager(ABC):
         for package_id in packages:
             package_path = self.package_path_from_package_id(package_id)
             if package_path.exists():
-                package_hash = IPFSHashOnly.get(str(package_path))
+                package_hash = IPFSHashOnly.get(
+                    str(package_path), cache=get_default_cache()
+                )
                 expected_hash = packages[package_id]
 
                 if package_hash == expected_hash:
@@ -406,7 +409,7 @@ class BasePackageManager(ABC):
         """Calculate package hash from package id."""
 
         package_path = self.package_path_from_package_id(package_id=package_id)
-        return IPFSHashOnly.get(file_path=str(package_path))
+        return IPFSHashOnly.get(file_path=str(package_path), cache=get_default_cache())
 
     def update_package(
         self,
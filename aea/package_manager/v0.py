@@ -30,6 +30,7 @@ from aea.configurations.data_types import PackageId, PackageType
 from aea.helpers.fingerprint import check_fingerprint
 from aea.helpers.io import open_file
 from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.ipfs.cache import get_default_cache
 from aea.package_manager.base import (
     BasePackageManager,
     ConfigLoaderCallableType,
@@ -76,7 +77,7 @@ class PackageManagerV0(BasePackageManager):
         package_type = package_type or PackageType(package_path.parent.name[:-1])
         package_config = self.config_loader(package_type, package_path)
         self._packages[package_config.package_id] = IPFSHashOnly.hash_directory(
-            dir_path=str(package_path)
+            dir_path=str(package_path), cache=get_default_cache()
         )
         return self
 
@@ -36,6 +36,7 @@ from aea.configurations.constants import PACKAGES
 from aea.configurations.data_types import PackageId, PackageType
 from aea.helpers.fingerprint import check_fingerprint
 from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.ipfs.cache import get_default_cache
 from aea.package_manager.base import (
     BasePackageManager,
     ConfigLoaderCallableType,
@@ -206,7 +207,7 @@ class PackageManagerV1(BasePackageManager):
         package_config = self.config_loader(package_type, package_path)
         self.update_fingerprints(package_id=package_config.package_id)
         self._dev_packages[package_config.package_id] = IPFSHashOnly.hash_directory(
-            dir_path=str(package_path)
+            dir_path=str(package_path), cache=get_default_cache()
         )
         return self
 
@@ -344,7 +345,7 @@ class PackageManagerV1(BasePackageManager):
     @staticmethod
     def _calculate_hash(package_path: Union[Path, str]) -> str:
         """Calculate hash for path."""
-        return IPFSHashOnly.get(str(package_path))
+        return IPFSHashOnly.get(str(package_path), cache=get_default_cache())
 
     def verify(
         self,
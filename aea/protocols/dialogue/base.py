@@ -27,6 +27,9 @@ This module contains the classes required for dialogue management.
 import inspect
 import secrets
 import sys
+import threading
+import time
+from base64 import b64decode, b64encode
 from collections import defaultdict, namedtuple
 from enum import Enum
 from inspect import signature
@@ -41,6 +44,7 @@ from typing import (
     Set,
     Tuple,
     Type,
+    Union,
     cast,
 )
 
@@ -70,6 +74,10 @@ else:
     )
 
 
+# a message of the dialogue history kept encoded to save memory
+EncodedMessage = namedtuple("EncodedMessage", ["sender", "to", "body"])
+
+
 class InvalidDialogueMessage(Exception):
     """Exception for adding invalid message to a dialogue."""
 
@@ -263,8 +271,10 @@ class Dialogue(
         "_outgoing_messages",
         "_incoming_messages",
         "_terminal_state_callbacks",
+        "_update_callbacks",
         "_last_message_id",
         "_ordered_message_ids",
+        "_message_history_size",
     )
 
     class Rules:
@@ -366,8 +376,8 @@ class Dialogue(
         self._dialogue_label = dialogue_label
         self._role = role
 
-        self._outgoing_messages = []  # type: List[Message]
-        self._incoming_messages = []  # type: List[Message]
+        self._outgoing_messages = []  # type: List[Union[Message, EncodedMessage]]
+        self._incoming_messages = []  # type: List[Union[Message, EncodedMessage]]
 
         enforce(
             issubclass(message_class, Message),
@@ -375,8 +385,10 @@ class Dialogue(
         )
         self._message_class = message_class
         self._terminal_state_callbacks: Set[Callable[["Dialogue"], None]] = set()
+        self._update_callbacks: Set[Callable[["Dialogue"], None]] = set()
         self._last_message_id: Optional[int] = None
         self._ordered_message_ids: List[int] = []
+        self._message_history_size: Optional[int] = None
 
     def add_terminal_state_callback(self, fn: Callable[["Dialogue"], None]) -> None:
         """
@@ -386,14 +398,99 @@ class Dialogue(
         """
         self._terminal_state_callbacks.add(fn)
 
+    def add_update_callback(self, fn: Callable[["Dialogue"], None]) -> None:
+        """
+        Add callback to be called on every message added to the dialogue.
+
+        :param fn: callable to be called with one argument: Dialogue
+        """
+        self._update_callbacks.add(fn)
+
+    @property
+    def message_history_size(self) -> Optional[int]:
+        """
+        Get the number of the last incoming and outgoing messages kept decoded.
+
+        The older messages are kept encoded, and decoded on access.
+
+        :return: the message history size, None if all the messages are kept decoded
+        """
+        return self._message_history_size
+
+    @message_history_size.setter
+    def message_history_size(self, message_history_size: Optional[int]) -> None:
+        """Set the number of the last incoming and outgoing messages kept decoded."""
+        enforce(
+            message_history_size is None or message_history_size > 0,
+            "Message history size must be positive.",
+        )
+        self._message_history_size = message_history_size
+        self._compact_messages(self._incoming_messages)
+        self._compact_messages(self._outgoing_messages)
+
+    def _compact_messages(self, messages: List[Union[Message, EncodedMessage]]) -> None:
+        """Encode the messages older than the message history size."""
+        if self._message_history_size is None:
+            return
+        # the messages older than an encoded one are encoded already
+        for index in range(len(messages) - self._message_history_size - 1, -1, -1):
+            message = messages[index]
+            if isinstance(message, EncodedMessage):
+                break
+            messages[index] = EncodedMessage(
+                message._sender,  # pylint: disable=protected-access
+                message._to,  # pylint: disable=protected-access
+                message.encode(),
+            )
+
+    def _decode_message(self, message: Union[Message, EncodedMessage]) -> Message:
+        """Get a message of the history, decoding it if encoded."""
+        if not isinstance(message, EncodedMessage):
+            return message
+        decoded = self._message_class.decode(message.body)
+        if message.sender:
+            decoded.sender = message.sender
+        if message.to:
+            decoded.to = message.to
+        return decoded
+
+    @staticmethod
+    def _message_to_json(message: Union[Message, EncodedMessage]) -> Dict:
+        """Get json representation of a message of the history."""
+        if not isinstance(message, EncodedMessage):
+            return message.json()
+        return {
+            "to": message.to,
+            "sender": message.sender,
+            "body": b64encode(message.body).decode("utf-8"),
+        }
+
+    def _messages_from_json(
+        self, data: List[Dict]
+    ) -> List[Union[Message, EncodedMessage]]:
+        """Get messages of the history from json data, the ones older than the message history size are not decoded."""
+        first_decoded = (
+            0
+            if self._message_history_size is None
+            else len(data) - self._message_history_size
+        )
+        return [
+            EncodedMessage(i["sender"], i["to"], b64decode(i["body"]))
+            if index < first_decoded
+            else self._message_class.from_json(i)
+            for index, i in enumerate(data)
+        ]
+
     def __eq__(self, other: Any) -> bool:
         """Compare two dialogues."""
         return (
             type(self) == type(other)  # pylint: disable=unidiomatic-typecheck
             and self.dialogue_label == other.dialogue_label
             and self.message_class == other.message_class
-            and self._incoming_messages == other._incoming_messages
-            and self._outgoing_messages == other._outgoing_messages
+            and list(map(self._decode_message, self._incoming_messages))
+            == list(map(other._decode_message, other._incoming_messages))
+            and list(map(self._decode_message, self._outgoing_messages))
+            == list(map(other._decode_message, other._outgoing_messages))
             and self._ordered_message_ids == other._ordered_message_ids
             and self.role == other.role
             and self.self_address == other.self_address
@@ -405,20 +502,30 @@ class Dialogue(
             "dialogue_label": self._dialogue_label.json,
             "self_address": self.self_address,
             "role": self._role.value,
-            "incoming_messages": [i.json() for i in self._incoming_messages],
-            "outgoing_messages": [i.json() for i in self._outgoing_messages],
+            "incoming_messages": [
+                self._message_to_json(i) for i in self._incoming_messages
+            ],
+            "outgoing_messages": [
+                self._message_to_json(i) for i in self._outgoing_messages
+            ],
             "last_message_id": self._last_message_id,
-            "ordered_message_ids": self._ordered_message_ids,
+            "ordered_message_ids": list(self._ordered_message_ids),
         }
         return data
 
     @classmethod
-    def from_json(cls, message_class: Type[Message], data: dict) -> "Dialogue":
+    def from_json(
+        cls,
+        message_class: Type[Message],
+        data: dict,
+        message_history_size: Optional[int] = None,
+    ) -> "Dialogue":
         """
         Create a dialogue instance with all messages from json data.
 
         :param message_class: type of message used with this dialogue
         :param data: dict with data exported with Dialogue.to_json() method
+        :param message_history_size: the number of the last incoming and outgoing messages to decode, None for all
 
         :return: Dialogue instance
         """
@@ -429,12 +536,17 @@ class Dialogue(
                 self_address=Address(data["self_address"]),
                 role=cls.Role(data["role"]),
             )
-            obj._incoming_messages = [  # pylint: disable=protected-access
-                message_class.from_json(i) for i in data["incoming_messages"]
-            ]
-            obj._outgoing_messages = [  # pylint: disable=protected-access
-                message_class.from_json(i) for i in data["outgoing_messages"]
-            ]
+            obj.message_history_size = message_history_size
+            obj._incoming_messages = (  # pylint: disable=protected-access
+                obj._messages_from_json(  # pylint: disable=protected-access
+                    data["incoming_messages"]
+                )
+            )
+            obj._outgoing_messages = (  # pylint: disable=protected-access
+                obj._messages_from_json(  # pylint: disable=protected-access
+                    data["outgoing_messages"]
+                )
+            )
             last_message_id = int(data["last_message_id"])
             obj._last_message_id = last_message_id  # pylint: disable=protected-access
             obj._ordered_message_ids = [  # pylint: disable=protected-access
@@ -532,7 +644,11 @@ class Dialogue(
 
         :return: the last incoming message if it exists, None otherwise
         """
-        return self._incoming_messages[-1] if len(self._incoming_messages) > 0 else None
+        return (
+            self._decode_message(self._incoming_messages[-1])
+            if len(self._incoming_messages) > 0
+            else None
+        )
 
     @property
     def last_outgoing_message(self) -> Optional[Message]:
@@ -541,7 +657,11 @@ class Dialogue(
 
         :return: the last outgoing message if it exists, None otherwise
         """
-        return self._outgoing_messages[-1] if len(self._outgoing_messages) > 0 else None
+        return (
+            self._decode_message(self._outgoing_messages[-1])
+            if len(self._outgoing_messages) > 0
+            else None
+        )
 
     @property
     def last_message(self) -> Optional[Message]:
@@ -640,12 +760,17 @@ class Dialogue(
 
         if self._is_message_by_self(message):
             self._outgoing_messages.append(message)
+            self._compact_messages(self._outgoing_messages)
         else:
             self._incoming_messages.append(message)
+            self._compact_messages(self._incoming_messages)
 
         self._last_message_id = message.message_id
         self._ordered_message_ids.append(message.message_id)
 
+        for fn in self._update_callbacks:
+            fn(self)
+
         if message.performative in self.rules.terminal_performatives:
             for fn in self._terminal_state_callbacks:
                 fn(self)
@@ -938,10 +1063,10 @@ class Dialogue(
         if len(messages_list) == 0:
             return None
 
-        if abs(message_id) > abs(messages_list[-1].message_id):
+        if abs(message_id) > len(messages_list):
             return None
 
-        return messages_list[abs(message_id) - 1]
+        return self._decode_message(messages_list[abs(message_id) - 1])
 
     def get_outgoing_next_message_id(self) -> int:
         """Get next outgoing message id."""
@@ -1075,50 +1200,45 @@ class BasicDialoguesStorage:
         """Init dialogues storage."""
         # used for both storing via complete and incomplete dialogue labels
         self._dialogues_by_dialogue_label = {}  # type: Dict[DialogueLabel, Dialogue]
-        # used for retrieving dialogue by opponent address
+        # used for retrieving dialogue by opponent address, keyed by dialogue label for constant time removal
         self._dialogue_by_address = defaultdict(
-            list
-        )  # type: Dict[Address, List[Dialogue]]
+            dict
+        )  # type: Dict[Address, Dict[DialogueLabel, Dialogue]]
         self._incomplete_to_complete_dialogue_labels = (
             {}
         )  # type: Dict[DialogueLabel, Optional[DialogueLabel]]
         self._dialogues = dialogues
         # used for both storing complete and incomplete dialogue labels
         self._terminal_state_dialogues_labels: Set[DialogueLabel] = set()
+        # labels of the stored dialogues not in terminal state
+        self._active_state_dialogues_labels: Set[DialogueLabel] = set()
 
     def cleanup(self) -> None:
         """Clean up the dialogue storage"""
         self._dialogues_by_dialogue_label = {}
-        self._dialogue_by_address = defaultdict(list)
+        self._dialogue_by_address = defaultdict(dict)
         self._incomplete_to_complete_dialogue_labels = {}
         self._terminal_state_dialogues_labels = set()
+        self._active_state_dialogues_labels = set()
 
-    @property
-    def dialogues_in_terminal_state(self) -> List["Dialogue"]:
-        """Get all dialogues in terminal state."""
+    def _get_dialogues(self, dialogue_labels: Set[DialogueLabel]) -> List["Dialogue"]:
+        """Get the stored dialogues with the labels specified."""
         return list(
             filter(
                 None,
-                [
-                    self._dialogues_by_dialogue_label.get(i)
-                    for i in self._terminal_state_dialogues_labels
-                ],
+                [self._dialogues_by_dialogue_label.get(i) for i in dialogue_labels],
             )
         )
 
+    @property
+    def dialogues_in_terminal_state(self) -> List["Dialogue"]:
+        """Get all dialogues in terminal state."""
+        return self._get_dialogues(self._terminal_state_dialogues_labels)
+
     @property
     def dialogues_in_active_state(self) -> List["Dialogue"]:
         """Get all dialogues in active state."""
-        active_dialogues = (
-            set(self._dialogues_by_dialogue_label.keys())
-            - self._terminal_state_dialogues_labels
-        )
-        return list(
-            filter(
-                None,
-                [self._dialogues_by_dialogue_label.get(i) for i in active_dialogues],
-            )
-        )
+        return self._get_dialogues(self._active_state_dialogues_labels)
 
     @property
     def is_terminal_dialogues_kept(self) -> bool:
@@ -1129,6 +1249,7 @@ class BasicDialoguesStorage:
         """Method to be called on dialogue terminal state reached."""
         if self.is_terminal_dialogues_kept:
             self._terminal_state_dialogues_labels.add(dialogue.dialogue_label)
+            self._active_state_dialogues_labels.discard(dialogue.dialogue_label)
         else:
             self.remove(dialogue.dialogue_label)
 
@@ -1149,9 +1270,11 @@ class BasicDialoguesStorage:
         """
         dialogue.add_terminal_state_callback(self.dialogue_terminal_state_callback)
         self._dialogues_by_dialogue_label[dialogue.dialogue_label] = dialogue
-        self._dialogue_by_address[
-            dialogue.dialogue_label.dialogue_opponent_addr
-        ].append(dialogue)
+        self._dialogue_by_address[dialogue.dialogue_label.dialogue_opponent_addr][
+            dialogue.dialogue_label
+        ] = dialogue
+        if dialogue.dialogue_label not in self._terminal_state_dialogues_labels:
+            self._active_state_dialogues_labels.add(dialogue.dialogue_label)
 
         (
             incomplete_dialogue_label,
@@ -1170,6 +1293,7 @@ class BasicDialoguesStorage:
         """
         self.add(dialogue)
         self._terminal_state_dialogues_labels.add(dialogue.dialogue_label)
+        self._active_state_dialogues_labels.discard(dialogue.dialogue_label)
 
     def remove(self, dialogue_label: DialogueLabel) -> None:
         """
@@ -1186,14 +1310,11 @@ class BasicDialoguesStorage:
 
         self._incomplete_to_complete_dialogue_labels.pop(incomplete_dialogue_label)
 
-        if incomplete_dialogue_label in self._terminal_state_dialogues_labels:
-            self._terminal_state_dialogues_labels.remove(incomplete_dialogue_label)
-
-        if (
-            complete_dialogue_label is not None
-            and complete_dialogue_label in self._terminal_state_dialogues_labels
-        ):
-            self._terminal_state_dialogues_labels.remove(complete_dialogue_label)
+        self._terminal_state_dialogues_labels.discard(incomplete_dialogue_label)
+        self._active_state_dialogues_labels.discard(incomplete_dialogue_label)
+        if complete_dialogue_label is not None:
+            self._terminal_state_dialogues_labels.discard(complete_dialogue_label)
+            self._active_state_dialogues_labels.discard(complete_dialogue_label)
 
         dialogue = self._dialogues_by_dialogue_label.pop(
             incomplete_dialogue_label, None
@@ -1205,7 +1326,7 @@ class BasicDialoguesStorage:
             )
 
         if (
-            dialogue is not None and dialogue_ is not None and dialogue != dialogue_
+            dialogue is not None and dialogue_ is not None and dialogue is not dialogue_
         ):  # pragma: nocover
             raise ValueError(
                 f"Incomplete dialogue label {incomplete_dialogue_label} and complete dialogue label {complete_dialogue_label} yield different dialogues: {dialogue} vs {dialogue_}"
@@ -1214,9 +1335,11 @@ class BasicDialoguesStorage:
         dialogue = dialogue or dialogue_
 
         # by design the dialogue must be present
-        self._dialogue_by_address[
-            incomplete_dialogue_label.dialogue_opponent_addr
-        ].remove(cast(Dialogue, dialogue))
+        address = incomplete_dialogue_label.dialogue_opponent_addr
+        dialogues_with_address = self._dialogue_by_address[address]
+        del dialogues_with_address[cast(Dialogue, dialogue).dialogue_label]
+        if not dialogues_with_address:
+            del self._dialogue_by_address[address]
 
     def get(self, dialogue_label: DialogueLabel) -> Optional[Dialogue]:
         """
@@ -1234,7 +1357,7 @@ class BasicDialoguesStorage:
         :param counterparty: the counterparty
         :return: The dialogues with the counterparty.
         """
-        return self._dialogue_by_address.get(counterparty, [])
+        return list(self._dialogue_by_address.get(counterparty, {}).values())
 
     def is_in_incomplete(self, dialogue_label: DialogueLabel) -> bool:
         """Check dialogue label presents in list of incomplete."""
@@ -1267,10 +1390,17 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
     Persist dialogues storage.
 
     Uses generic storage to load/save dialogues data on setup/teardown.
+
+    If the dialogues flush interval is set, the dialogues changed are also written
+    to the generic storage in the background every flush interval,
+    so only the dialogues changed since the last flush are written on teardown.
+    The dialogues changed are snapshotted on the agent thread at most once per flush interval,
+    on the first change after the interval elapsed, and on teardown.
     """
 
     INCOMPLETE_DIALOGUES_OBJECT_NAME = "incomplete_dialogues"
     TERMINAL_STATE_DIALOGUES_COLLECTTION_SUFFIX = "_terminal"
+    DIALOGUE_OPPONENT_ADDR_FIELD = "dialogue_label.dialogue_opponent_addr"
 
     def __init__(self, dialogues: "Dialogues") -> None:
         """Init dialogues storage."""
@@ -1278,6 +1408,25 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
 
         self._skill_component: Optional[SkillComponent] = self.get_skill_component()
 
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._is_write_behind_enabled = False
+        # labels of the dialogues changed since the last snapshot, and whether the incomplete dialogues labels changed.
+        # Only accessed on the agent thread.
+        self._changed_labels: Set[DialogueLabel] = set()
+        self._is_incomplete_labels_changed = False
+        self._snapshot_interval = 0.0
+        self._next_snapshot_time = 0.0
+        # snapshots of the dialogues changed since the last flush, by the string of their label,
+        # with whether they are in terminal state. They are taken on the agent thread, as the dialogues are not thread safe.
+        self._pending_puts: Dict[str, Tuple[bool, Dict]] = {}
+        # dialogues removed since the last flush, by the string of their label, with whether they were in terminal state
+        self._pending_removals: Dict[str, bool] = {}
+        # snapshot of the incomplete dialogues labels, if changed since the last flush
+        self._pending_incomplete_labels: Optional[List] = None
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stopped = threading.Event()
+
     @staticmethod
     def get_skill_component() -> Optional[SkillComponent]:
         """Get skill component dialogues storage constructed for."""
@@ -1306,7 +1455,9 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
             not self._skill_component or not self._skill_component.context.storage
         ):  # pragma: nocover
             return None
-        return self._skill_component.context.storage.get_sync_collection(col_name)
+        return self._skill_component.context.storage.get_sync_collection(
+            col_name, indexes=[self.DIALOGUE_OPPONENT_ADDR_FIELD]
+        )
 
     @cached_property
     def _terminal_dialogues_collection(self) -> Optional[SyncCollection]:
@@ -1367,7 +1518,9 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
 
     def _dialogue_from_json(self, dialogue_data: dict) -> "Dialogue":
         return self._dialogues.dialogue_class.from_json(
-            self._dialogues.message_class, dialogue_data
+            self._dialogues.message_class,
+            dialogue_data,
+            message_history_size=self._dialogues.message_history_size,
         )
 
     @staticmethod
@@ -1414,28 +1567,267 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
             for k, v in data
         }
 
+    @property
+    def is_write_behind_enabled(self) -> bool:
+        """Check whether the dialogues changed are written to the generic storage in the background."""
+        return self._is_write_behind_enabled
+
+    def add(self, dialogue: Dialogue) -> None:
+        """
+        Add dialogue to storage.
+
+        :param dialogue: dialogue to add.
+        """
+        self._add(dialogue, is_changed=True)
+
+    def _add(self, dialogue: Dialogue, is_changed: bool) -> None:
+        """
+        Add dialogue to storage, tracking its changes.
+
+        :param dialogue: dialogue to add.
+        :param is_changed: whether the dialogue is to be written to the generic storage, False if loaded from it.
+        """
+        super().add(dialogue)
+        dialogue.add_update_callback(self._on_dialogue_update)
+        if is_changed:
+            self._mark_changed(dialogue)
+            self._mark_incomplete_labels_changed()
+
+    def _add_terminal_state_dialogue(self, dialogue: Dialogue) -> None:
+        """
+        Add terminal state dialogue loaded from the generic storage.
+
+        :param dialogue: dialogue to add.
+        """
+        self._add(dialogue, is_changed=False)
+        self._terminal_state_dialogues_labels.add(dialogue.dialogue_label)
+        self._active_state_dialogues_labels.discard(dialogue.dialogue_label)
+
+    def set_incomplete_dialogue(
+        self,
+        incomplete_dialogue_label: DialogueLabel,
+        complete_dialogue_label: DialogueLabel,
+    ) -> None:
+        """Set incomplete dialogue label."""
+        super().set_incomplete_dialogue(
+            incomplete_dialogue_label, complete_dialogue_label
+        )
+        self._mark_incomplete_labels_changed()
+
+    def dialogue_terminal_state_callback(self, dialogue: "Dialogue") -> None:
+        """Method to be called on dialogue terminal state reached."""
+        super().dialogue_terminal_state_callback(dialogue)
+        if dialogue.dialogue_label in self._terminal_state_dialogues_labels:
+            self._mark_changed(dialogue)
+
+    def _on_dialogue_update(self, dialogue: Dialogue) -> None:
+        """Call on a message added to a dialogue."""
+        self._mark_changed(dialogue)
+        self._snapshot_changed_if_due()
+
+    def _mark_changed(self, dialogue: Dialogue) -> None:
+        """Schedule the dialogue to be snapshotted and written to the generic storage."""
+        if not self._is_write_behind_enabled:
+            return
+        self._changed_labels.add(dialogue.dialogue_label)
+
+    def _mark_removed(self, dialogue_label: DialogueLabel, is_terminal: bool) -> None:
+        """Schedule the dialogue to be removed from the generic storage on the next flush."""
+        self._changed_labels.discard(dialogue_label)
+        key = str(dialogue_label)
+        with self._pending_lock:
+            self._pending_puts.pop(key, None)
+            self._pending_removals[key] = is_terminal
+
+    def _mark_incomplete_labels_changed(self) -> None:
+        """Schedule the incomplete dialogues labels to be snapshotted and written to the generic storage."""
+        if not self._is_write_behind_enabled:
+            return
+        self._is_incomplete_labels_changed = True
+
+    def _snapshot_changed_if_due(self) -> None:
+        """Snapshot the dialogues changed, if the flush interval elapsed since the last snapshot."""
+        if (
+            self._is_write_behind_enabled
+            and time.monotonic() >= self._next_snapshot_time
+        ):
+            self._snapshot_changed()
+
+    def _snapshot_changed(self) -> None:
+        """Snapshot the dialogues changed since the last snapshot, to be written on the next flush. Called on the agent thread."""
+        self._next_snapshot_time = time.monotonic() + self._snapshot_interval
+        snapshots = {}
+        for dialogue_label in self._changed_labels:
+            dialogue = self._dialogues_by_dialogue_label.get(dialogue_label)
+            if dialogue is None:  # pragma: nocover
+                continue
+            is_terminal = dialogue_label in self._terminal_state_dialogues_labels
+            snapshots[str(dialogue_label)] = (is_terminal, dialogue.json())
+        self._changed_labels = set()
+        incomplete_labels = None
+        if self._is_incomplete_labels_changed:
+            incomplete_labels = self._incomplete_dialogues_labels_to_json()
+            self._is_incomplete_labels_changed = False
+
+        with self._pending_lock:
+            for key, snapshot in snapshots.items():
+                self._pending_removals.pop(key, None)
+                self._pending_puts[key] = snapshot
+            if incomplete_labels is not None:
+                self._pending_incomplete_labels = incomplete_labels
+
+    def _restore_pending(
+        self,
+        pending_puts: Dict[str, Tuple[bool, Dict]],
+        pending_removals: Dict[str, bool],
+        pending_incomplete_labels: Optional[List],
+    ) -> None:
+        """Schedule again the changes of a failed flush, unless superseded by the changes made since."""
+        with self._pending_lock:
+            for key, snapshot in pending_puts.items():
+                if key not in self._pending_puts and key not in self._pending_removals:
+                    self._pending_puts[key] = snapshot
+            for key, is_terminal in pending_removals.items():
+                if key not in self._pending_puts and key not in self._pending_removals:
+                    self._pending_removals[key] = is_terminal
+            if self._pending_incomplete_labels is None:
+                self._pending_incomplete_labels = pending_incomplete_labels
+
+    def flush(self) -> None:
+        """
+        Write the dialogues snapshotted or removed since the last flush to the generic storage.
+
+        Only the snapshots taken on the agent thread are read, so it is safe to call from another thread.
+        The changes are scheduled again if the write fails.
+        """
+        if (
+            not self._skill_component
+            or not self._skill_component.context.storage
+            or not self._active_dialogues_collection
+            or not self._terminal_dialogues_collection
+        ):
+            return  # pragma: nocover
+        storage = self._skill_component.context.storage
+
+        with self._flush_lock:
+            with self._pending_lock:
+                pending_puts, self._pending_puts = self._pending_puts, {}
+                pending_removals, self._pending_removals = self._pending_removals, {}
+                pending_incomplete_labels, self._pending_incomplete_labels = (
+                    self._pending_incomplete_labels,
+                    None,
+                )
+
+            active_puts = []
+            terminal_puts = []
+            active_removals = []
+            terminal_removals = []
+            for key, (is_terminal, data) in pending_puts.items():
+                if is_terminal:
+                    terminal_puts.append((key, data))
+                    active_removals.append(key)
+                else:
+                    active_puts.append((key, data))
+            for key, is_terminal in pending_removals.items():
+                if is_terminal:
+                    terminal_removals.append(key)
+                else:
+                    active_removals.append(key)
+            if pending_incomplete_labels is not None:
+                active_puts.append(
+                    (self.INCOMPLETE_DIALOGUES_OBJECT_NAME, pending_incomplete_labels)
+                )
+
+            try:
+                storage.apply_changes_sync(
+                    [
+                        (
+                            self._terminal_dialogues_collection.name,
+                            terminal_puts,
+                            terminal_removals,
+                        ),
+                        (
+                            self._active_dialogues_collection.name,
+                            active_puts,
+                            active_removals,
+                        ),
+                    ]
+                )
+            except Exception:
+                self._restore_pending(
+                    pending_puts, pending_removals, pending_incomplete_labels
+                )
+                raise
+
+    def _start_write_behind(self, flush_interval: float) -> None:
+        """Start writing the dialogues changed to the generic storage every flush interval."""
+        self._is_write_behind_enabled = True
+        self._snapshot_interval = flush_interval
+        self._next_snapshot_time = 0.0
+        self._flush_stopped.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name=f"{self.__class__.__name__}-flush",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def _stop_write_behind(self) -> None:
+        """Stop writing the dialogues changed in the background."""
+        self._flush_stopped.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join()
+            self._flush_thread = None
+
+    def _flush_periodically(self, flush_interval: float) -> None:
+        """Flush the dialogues changed every flush interval, until stopped."""
+        while not self._flush_stopped.wait(flush_interval):
+            try:
+                self.flush()
+            except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
+                if self._skill_component:
+                    self._skill_component.context.logger.exception(
+                        f"Error on dialogues flush: {e}"
+                    )
+
     def setup(self) -> None:
         """Set up dialogue storage."""
         if not self._skill_component:  # pragma: nocover
             return
         self._load()
+        flush_interval = self._dialogues.dialogues_flush_interval
+        if flush_interval is not None and self._active_dialogues_collection:
+            self._start_write_behind(flush_interval)
 
     def teardown(self) -> None:
         """Tear down dialogue storage."""
         if not self._skill_component:  # pragma: nocover
             return
+        if self._is_write_behind_enabled:
+            self._stop_write_behind()
+            self._snapshot_changed()
+            self.flush()
+            self._is_write_behind_enabled = False
+            return
         self._dump()
 
     def remove(self, dialogue_label: DialogueLabel) -> None:
         """Remove dialogue from memory and persistent storage."""
-        if dialogue_label in self._terminal_state_dialogues_labels:
+        is_terminal = dialogue_label in self._terminal_state_dialogues_labels
+        if is_terminal:
             collection = self._terminal_dialogues_collection
         else:
             collection = self._active_dialogues_collection
 
         super().remove(dialogue_label)
 
-        if collection:
+        if not collection:
+            return
+        if self._is_write_behind_enabled:
+            self._mark_removed(dialogue_label, is_terminal)
+            self._mark_incomplete_labels_changed()
+        else:
             collection.remove(str(dialogue_label))
 
 
@@ -1509,9 +1901,18 @@ class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
         if not collection:
             return []
 
+        # the dialogues removed but not flushed yet are still in the collection they were removed from
+        is_terminal = collection is self._terminal_dialogues_collection
+        with self._pending_lock:
+            removed = {
+                key
+                for key, is_terminal_removal in self._pending_removals.items()
+                if is_terminal_removal == is_terminal
+            }
         return [
             self._dialogue_from_json(cast(Dict, i[1]))
-            for i in collection.find("dialogue_label.dialogue_opponent_addr", address)
+            for i in collection.find(self.DIALOGUE_OPPONENT_ADDR_FIELD, address)
+            if i[0] not in removed
         ]
 
     def get_dialogues_with_counterparty(self, counterparty: Address) -> List[Dialogue]:
@@ -1552,6 +1953,8 @@ class Dialogues:
     """The dialogues class keeps track of all dialogues for an agent."""
 
     _keep_terminal_state_dialogues = False
+    _dialogues_flush_interval: Optional[float] = None
+    _message_history_size: Optional[int] = None
 
     def __init__(
         self,
@@ -1561,6 +1964,8 @@ class Dialogues:
         dialogue_class: Type[Dialogue],
         role_from_first_message: Callable[[Message, Address], Dialogue.Role],
         keep_terminal_state_dialogues: Optional[bool] = None,
+        dialogues_flush_interval: Optional[float] = None,
+        message_history_size: Optional[int] = None,
     ) -> None:
         """
         Initialize dialogues.
@@ -1571,6 +1976,8 @@ class Dialogues:
         :param dialogue_class: the dialogue class used
         :param role_from_first_message: the callable determining role from first message
         :param keep_terminal_state_dialogues: specify do dialogues in terminal state should stay or not
+        :param dialogues_flush_interval: interval in seconds to write the dialogues changed to the generic storage, if None they are written on teardown only
+        :param message_history_size: number of the last incoming and outgoing messages of a dialogue kept decoded, if None all the messages are kept decoded
         """
 
         self._dialogues_storage = PersistDialoguesStorageWithOffloading(self)
@@ -1580,6 +1987,21 @@ class Dialogues:
         if keep_terminal_state_dialogues is not None:
             self._keep_terminal_state_dialogues = keep_terminal_state_dialogues
 
+        if dialogues_flush_interval is not None:
+            self._dialogues_flush_interval = dialogues_flush_interval
+        enforce(
+            self._dialogues_flush_interval is None
+            or self._dialogues_flush_interval > 0,
+            "Dialogues flush interval must be positive.",
+        )
+
+        if message_history_size is not None:
+            self._message_history_size = message_history_size
+        enforce(
+            self._message_history_size is None or self._message_history_size > 0,
+            "Message history size must be positive.",
+        )
+
         enforce(
             issubclass(message_class, Message),
             "message_class is not a subclass of Message.",
@@ -1635,6 +2057,16 @@ class Dialogues:
         """Is required to keep dialogues in terminal state."""
         return self._keep_terminal_state_dialogues
 
+    @property
+    def dialogues_flush_interval(self) -> Optional[float]:
+        """Get the interval to write the dialogues changed to the generic storage."""
+        return self._dialogues_flush_interval
+
+    @property
+    def message_history_size(self) -> Optional[int]:
+        """Get the number of the last incoming and outgoing messages of a dialogue kept decoded."""
+        return self._message_history_size
+
     @property
     def self_address(self) -> Address:
         """Get the address of the agent for whom dialogues are maintained."""
@@ -2064,6 +2496,8 @@ class Dialogues:
             self_address=self.self_address,
             role=role,
         )
+        if self._message_history_size is not None:
+            dialogue.message_history_size = self._message_history_size
         self._dialogues_storage.add(dialogue)
         return dialogue
 
@@ -321,7 +321,7 @@ class ComponentRegistry(
 ):
     """This class implements a generic registry for skill components."""
 
-    __slots__ = ("_items", "_dynamically_added")
+    __slots__ = ("_items", "_dynamically_added", "_version")
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -334,6 +334,12 @@ class ComponentRegistry(
             Dict[str, SkillComponentType]
         ] = PublicIdRegistry()
         self._dynamically_added: Dict[PublicId, Set[str]] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Get the version of the registry, incremented every time an item is registered or unregistered."""
+        return self._version
 
     def register(
         self,
@@ -363,6 +369,7 @@ class ComponentRegistry(
             skill_items = {}
         skill_items[item_name] = item
         self._items.register(skill_id, skill_items)
+        self._version += 1
 
         if is_dynamically_added:
             self._dynamically_added.setdefault(skill_id, set()).add(item_name)
@@ -395,6 +402,7 @@ class ComponentRegistry(
             )
         self.logger.debug("Unregistering item with id {}".format(item_id))
         item = name_to_item.pop(item_name)
+        self._version += 1
         if len(name_to_item) == 0:
             self._items.unregister(skill_id)
         else:
@@ -440,6 +448,7 @@ class ComponentRegistry(
             )
         self._items.unregister(skill_id)
         self._dynamically_added.pop(skill_id, None)
+        self._version += 1
 
     def ids(self) -> Set[Tuple[PublicId, str]]:
         """Get the item ids."""
@@ -589,6 +598,7 @@ class HandlerRegistry(ComponentRegistry[Handler]):
 
         handlers = cast(Dict[str, Handler], self._items.fetch(skill_id)).values()
         self._items.unregister(skill_id)
+        self._version += 1
 
         # unregister from the protocol-skill index
         for handler in handlers:
@@ -19,7 +19,7 @@
 # ------------------------------------------------------------------------------
 """This module contains registries."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, cast
 
 from aea.configurations.base import PublicId
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
@@ -46,6 +46,17 @@ class Filter(WithLogger):
         self._resources = resources
         self._decision_maker_out_queue = decision_maker_out_queue
 
+        # indexes of the components of active skills, rebuilt when the
+        # registries or the skills activity change.
+        self._handlers_index_version: Optional[Tuple[int, int]] = None
+        self._active_handlers_by_protocol: Dict[PublicId, List[Handler]] = {}
+        self._active_handlers_by_protocol_and_skill: Dict[
+            Tuple[PublicId, PublicId], Handler
+        ] = {}
+        self._behaviours_index_version: Optional[Tuple[int, int]] = None
+        self._active_skills_behaviours: List[Behaviour] = []
+        self._checked_behaviours_version: Optional[Tuple[int, int]] = None
+
     @property
     def resources(self) -> Resources:
         """Get resources."""
@@ -66,17 +77,13 @@ class Filter(WithLogger):
         :param skill_id: the skill id
         :return: the list of handlers currently active
         """
+        self._update_handlers_index()
         if skill_id is not None:
-            handler = self.resources.get_handler(protocol_id, skill_id)
-            active_handlers = (
-                [] if handler is None or not handler.context.is_active else [handler]
-            )
-        else:
-            handlers = self.resources.get_handlers(protocol_id)
-            active_handlers = list(
-                filter(lambda handler: handler.context.is_active, handlers)
+            handler = self._active_handlers_by_protocol_and_skill.get(
+                (protocol_id, skill_id)
             )
-        return active_handlers
+            return [] if handler is None else [handler]
+        return list(self._active_handlers_by_protocol.get(protocol_id, []))
 
     def get_active_behaviours(self) -> List[Behaviour]:
         """
@@ -84,11 +91,63 @@ class Filter(WithLogger):
 
         :return: the list of behaviours currently active
         """
-        behaviours = self.resources.get_all_behaviours()
-        active_behaviour = list(
-            filter(lambda b: b.context.is_active and not b.is_done(), behaviours)
+        self._update_behaviours_index()
+        return [b for b in self._active_skills_behaviours if not b.is_done()]
+
+    def _update_handlers_index(self) -> None:
+        """Rebuild the index of the active handlers, if the handlers or the skills activity changed."""
+        handler_registry = self.resources.handler_registry
+        version = (handler_registry.version, self.resources.skills_activity_version)
+        if version == self._handlers_index_version:
+            return
+
+        self._active_handlers_by_protocol = {}
+        self._active_handlers_by_protocol_and_skill = {}
+        for skill_id, handler_name in handler_registry.ids():
+            handler = handler_registry.fetch((skill_id, handler_name))
+            if handler is None or not handler.context.is_active:
+                continue
+            protocol_id = cast(PublicId, handler.SUPPORTED_PROTOCOL)
+            self._active_handlers_by_protocol.setdefault(protocol_id, []).append(
+                handler
+            )
+            self._active_handlers_by_protocol_and_skill[
+                (protocol_id, skill_id)
+            ] = handler
+        self._handlers_index_version = version
+
+    @property
+    def behaviours_version(self) -> Tuple[int, int]:
+        """Get the version of the behaviours, which changes every time behaviours are (un)registered or skills are (de)activated."""
+        return (
+            self.resources.behaviour_registry.version,
+            self.resources.skills_activity_version,
         )
-        return active_behaviour
+
+    def behaviours_changed(self) -> bool:
+        """
+        Check whether the active behaviours may have changed since the last check.
+
+        :return: True on the first check, and whenever the behaviours version changed since the previous one.
+        """
+        version = self.behaviours_version
+        if version == self._checked_behaviours_version:
+            return False
+        self._checked_behaviours_version = version
+        return True
+
+    def _update_behaviours_index(self) -> None:
+        """Rebuild the index of the behaviours of active skills, if the behaviours or the skills activity changed."""
+        version = self.behaviours_version
+        if version == self._behaviours_index_version:
+            return
+
+        self._active_skills_behaviours = [
+            b
+            for b in self.resources.behaviour_registry.fetch_all()
+            if b.context.is_active
+        ]
+        self._behaviours_index_version = version
 
     def handle_new_handlers_and_behaviours(self) -> None:
         """Handle the messages from the decision maker."""
@@ -47,6 +47,7 @@ class Resources:
         "_behaviour_registry",
         "_model_registry",
         "_registries",
+        "_skills_activity_version",
     )
 
     def __init__(self, agent_name: str = "standalone") -> None:
@@ -68,6 +69,7 @@ class Resources:
             self._behaviour_registry,
             self._model_registry,
         ]  # type: List[Registry]
+        self._skills_activity_version = 0
 
     @property
     def agent_name(self) -> str:
@@ -94,6 +96,15 @@ class Resources:
         """Get the model registry."""
         return self._model_registry
 
+    @property
+    def skills_activity_version(self) -> int:
+        """Get the version of the skills activity, incremented every time a skill of the resources is activated or deactivated."""
+        return self._skills_activity_version
+
+    def _on_skill_activity_change(self) -> None:
+        """Increment the version of the skills activity."""
+        self._skills_activity_version += 1
+
     def add_component(self, component: Component) -> None:
         """Add a component to resources."""
         if component.component_type == ComponentType.PROTOCOL:
@@ -261,6 +272,9 @@ class Resources:
         :param skill: a skill
         """
         self._component_registry.register(skill.component_id, skill)
+        skill.skill_context._on_activity_change = (  # pylint: disable=protected-access
+            self._on_skill_activity_change
+        )
         if skill.handlers is not None:
             for handler in skill.handlers.values():
                 self._handler_registry.register(
@@ -302,7 +316,12 @@ class Resources:
 
         :param skill_id: the skill id for the skill to be removed.
         """
+        skill = self.get_skill(skill_id)
         self._component_registry.unregister(ComponentId(ComponentType.SKILL, skill_id))
+        if skill is not None:
+            skill.skill_context._on_activity_change = (  # pylint: disable=protected-access
+                None
+            )
         with suppress(ValueError):
             self._handler_registry.unregister_by_skill(skill_id)
         with suppress(ValueError):
@@ -39,6 +39,7 @@ from aea.exceptions import _StopRuntime
 from aea.helpers.async_utils import Runnable
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import WithLogger, get_logger
+from aea.helpers.overflow_policy import OverflowPolicyEnum
 from aea.helpers.storage.generic_storage import Storage
 from aea.multiplexer import AsyncMultiplexer
 from aea.skills.tasks import ProcessTaskManager, TaskManager, ThreadedTaskManager
@@ -74,6 +75,8 @@ class BaseRuntime(Runnable, WithLogger):
         loop: Optional[AbstractEventLoop] = None,
         threaded: bool = False,
         task_manager_mode: Optional[str] = None,
+        agent_loop_options: Optional[Dict] = None,
+        task_manager_options: Optional[Dict] = None,
     ) -> None:
         """
         Init runtime.
@@ -84,6 +87,8 @@ class BaseRuntime(Runnable, WithLogger):
         :param loop: optional event loop. if not provided a new one will be created.
         :param threaded: if True, run in threaded mode, else async
         :param task_manager_mode: mode of the task manager.
+        :param agent_loop_options: options for the agent loop.
+        :param task_manager_options: options for the task manager.
         """
         Runnable.__init__(self, threaded=threaded, loop=loop if not threaded else None)
         logger = get_logger(__name__, agent.name)
@@ -96,11 +101,13 @@ class BaseRuntime(Runnable, WithLogger):
             multiplexer_options
         )
         self._task_manager_mode = task_manager_mode or self.DEFAULT_TASKMANAGER
+        self._task_manager_options: Dict = task_manager_options or {}
         self._task_manager = self._get_taskmanager_instance()
         self._decision_maker: Optional[DecisionMaker] = None
         self._storage: Optional[Storage] = self._get_storage(agent)
 
         self._loop_mode = loop_mode or self.DEFAULT_RUN_LOOP
+        self._agent_loop_options: Dict = agent_loop_options or {}
         self._agent_loop: BaseAgentLoop = self._get_agent_loop_instance(self._loop_mode)
 
     def _log_runtime_state(self, state: RuntimeStates) -> None:
@@ -114,7 +121,7 @@ class BaseRuntime(Runnable, WithLogger):
                 f"Task manager mode `{self._task_manager_mode} is not supported. valid are: `{list(self.TASKMANAGERS.keys())}`"
             )
         cls = self.TASKMANAGERS[self._task_manager_mode]
-        return cls()
+        return cls(**self._task_manager_options)
 
     def _get_multiplexer_instance(
         self, multiplexer_options: Dict, threaded: bool = False
@@ -134,6 +141,19 @@ class BaseRuntime(Runnable, WithLogger):
             default_routing=multiplexer_options.get("default_routing"),
             default_connection=multiplexer_options.get("default_connection"),
             protocols=multiplexer_options.get("protocols", []),
+            batch_size=multiplexer_options.get(
+                "batch_size", AsyncMultiplexer.DEFAULT_BATCH_SIZE
+            ),
+            routing_helper_max_size=multiplexer_options.get("routing_helper_max_size"),
+            routing_helper_ttl=multiplexer_options.get("routing_helper_ttl"),
+            in_queue_max_size=multiplexer_options.get("in_queue_max_size", 0),
+            in_queue_overflow_policy=multiplexer_options.get(
+                "in_queue_overflow_policy", OverflowPolicyEnum.block
+            ),
+            out_queue_max_size=multiplexer_options.get("out_queue_max_size", 0),
+            out_queue_overflow_policy=multiplexer_options.get(
+                "out_queue_overflow_policy", OverflowPolicyEnum.block
+            ),
         )
 
     @staticmethod
@@ -153,7 +173,7 @@ class BaseRuntime(Runnable, WithLogger):
         :return: AgentLoop instance
         """
         loop_cls = self._get_agent_loop_class(loop_mode)
-        return loop_cls(self._agent)
+        return loop_cls(self._agent, **self._agent_loop_options)
 
     def _get_agent_loop_class(self, loop_mode: str) -> Type[BaseAgentLoop]:
         """
@@ -271,6 +291,8 @@ class AsyncRuntime(BaseRuntime):
         loop: Optional[AbstractEventLoop] = None,
         threaded: bool = False,
         task_manager_mode: Optional[str] = None,
+        agent_loop_options: Optional[Dict] = None,
+        task_manager_options: Optional[Dict] = None,
     ) -> None:
         """
         Init runtime.
@@ -281,6 +303,8 @@ class AsyncRuntime(BaseRuntime):
         :param loop: optional event loop. if not provided a new one will be created.
         :param threaded: if True, run in threaded mode, else async
         :param task_manager_mode: mode of the task manager.
+        :param agent_loop_options: options for the agent loop.
+        :param task_manager_options: options for the task manager.
         """
         super().__init__(
             agent=agent,
@@ -289,6 +313,8 @@ class AsyncRuntime(BaseRuntime):
             loop=loop,
             threaded=threaded,
             task_manager_mode=task_manager_mode,
+            agent_loop_options=agent_loop_options,
+            task_manager_options=task_manager_options,
         )
         self._task: Optional[asyncio.Task] = None
 
@@ -30,7 +30,7 @@ from logging import Logger
 from pathlib import Path
 from queue import Queue
 from types import SimpleNamespace
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, cast
 
 from aea.common import Address
 from aea.components.base import Component, load_aea_package
@@ -85,6 +85,8 @@ class SkillContext:
         self._new_behaviours_queue = queue.Queue()  # type: Queue
         self._new_handlers_queue = queue.Queue()  # type: Queue
         self._logger: Optional[Logger] = None
+        # called every time the skill is activated or deactivated
+        self._on_activity_change: Optional[Callable[[], None]] = None
 
     @property
     def is_abstract_component(self) -> bool:
@@ -145,7 +147,10 @@ class SkillContext:
     @is_active.setter
     def is_active(self, value: bool) -> None:
         """Set the status of the skill (active/not active)."""
+        changed = value != self._is_active
         self._is_active = value
+        if changed and self._on_activity_change is not None:
+            self._on_activity_change()
         self.logger.debug(
             "New status of skill {}: is_active={}".format(
                 self.skill_id, self._is_active
@@ -547,6 +552,8 @@ class Model(SkillComponent, ABC):
         skill_context: SkillContext,
         configuration: Optional[SkillComponentConfiguration] = None,
         keep_terminal_state_dialogues: Optional[bool] = None,
+        dialogues_flush_interval: Optional[float] = None,
+        message_history_size: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -556,6 +563,8 @@ class Model(SkillComponent, ABC):
         :param configuration: the configuration for the component.
         :param skill_context: the skill context.
         :param keep_terminal_state_dialogues: specify do dialogues in terminal state should stay or not
+        :param dialogues_flush_interval: interval in seconds to write the dialogues changed to the generic storage
+        :param message_history_size: number of the last incoming and outgoing messages of a dialogue kept decoded
         :param kwargs: the keyword arguments.
         """
         super().__init__(name, skill_context, configuration=configuration, **kwargs)
@@ -563,6 +572,10 @@ class Model(SkillComponent, ABC):
         # used by dialogues if mixed with the Model
         if keep_terminal_state_dialogues is not None:
             self._keep_terminal_state_dialogues = keep_terminal_state_dialogues
+        if dialogues_flush_interval is not None:
+            self._dialogues_flush_interval = dialogues_flush_interval
+        if message_history_size is not None:
+            self._message_history_size = message_history_size
 
     def setup(self) -> None:
         """Set the class up."""
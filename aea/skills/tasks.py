@@ -18,20 +18,34 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the classes for tasks."""
+import asyncio
+import heapq
 import logging
+import multiprocessing
+import os
 import signal
 import threading
+import time
 from abc import abstractmethod
+from collections import OrderedDict
+from contextlib import suppress
+from functools import partial
+from multiprocessing import resource_tracker
 from multiprocessing.pool import AsyncResult, Pool, ThreadPool
-from typing import Any, Callable, Dict, List, Optional, Sequence, Type, cast
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, cast
 
 from aea.components.utils import _enlist_component_packages, _populate_packages
+from aea.exceptions import enforce
 from aea.helpers.logging import WithLogger
 
 
 THREAD_POOL_MODE = "multithread"
 PROCESS_POOL_MODE = "multiprocess"
 DEFAULT_WORKERS_AMOUNT = 2
+DEFAULT_RESULT_TTL = 600.0
+# modules imported once by the fork server, instead of by every worker
+FORKSERVER_PRELOAD_MODULES = ["aea.skills.tasks"]
 
 
 class Task(WithLogger):
@@ -105,6 +119,92 @@ class Task(WithLogger):
         """Implement the task teardown."""
 
 
+class SharedBuffer:
+    """
+    A buffer in shared memory, passed to the tasks of the multiprocess task manager without copying its content.
+
+    Only the name of the shared memory is pickled, the workers map the same memory.
+    Arrays can be built on the buffer without copies, e.g. numpy.ndarray(shape, dtype, buffer=shared_buffer.buf).
+    The process creating the buffer unlinks it once the tasks using it are done,
+    the tasks close it before returning.
+    On Windows the shared memory is released once the last process using it closes it,
+    so the buffer must be kept open by its creator until the tasks are done.
+    """
+
+    def __init__(self, size: int, name: Optional[str] = None) -> None:
+        """
+        Create a shared buffer, or attach to an existing one.
+
+        :param size: the size of the buffer, in bytes.
+        :param name: the name of the shared memory to attach to, None to create it.
+        """
+        enforce(size > 0, "Size must be positive.")
+        self._is_owner = name is None
+        self._shared_memory = SharedMemory(
+            name=name, create=self._is_owner, size=size if self._is_owner else 0
+        )
+        self._size = size
+        # the shared memory size can be rounded up to the page size
+        self._buf: Optional[memoryview] = self._shared_memory.buf[:size]
+
+    @classmethod
+    def from_buffer(cls, data: Any) -> "SharedBuffer":
+        """
+        Create a shared buffer with a copy of the data.
+
+        :param data: an object supporting the buffer protocol, e.g. bytes or a numpy array.
+        :return: the shared buffer.
+        """
+        data = memoryview(data).cast("B")
+        shared_buffer = cls(len(data))
+        shared_buffer.buf[:] = data
+        return shared_buffer
+
+    @property
+    def name(self) -> str:
+        """Get the name of the shared memory."""
+        return self._shared_memory.name
+
+    @property
+    def size(self) -> int:
+        """Get the size of the buffer, in bytes."""
+        return self._size
+
+    @property
+    def buf(self) -> memoryview:
+        """Get the buffer content."""
+        if self._buf is None:
+            raise ValueError("Shared buffer closed.")
+        return self._buf
+
+    def __reduce__(self) -> Tuple[Type["SharedBuffer"], Tuple[int, str]]:
+        """Pickle the shared buffer by the name of its shared memory."""
+        return self.__class__, (self._size, self.name)
+
+    def close(self) -> None:
+        """Unmap the buffer, the views on its content must be released before."""
+        if self._buf is None:
+            return
+        self._buf.release()
+        self._buf = None
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory, done by the process which created it."""
+        enforce(self._is_owner, "Only the creator of the shared buffer can unlink it.")
+        self._shared_memory.unlink()
+
+    def __enter__(self) -> "SharedBuffer":
+        """Enter the context of the shared buffer."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the shared buffer, and unlink it if created by this process."""
+        self.close()
+        if self._is_owner:
+            self.unlink()
+
+
 # for api compatability. to remove in the next release
 def init_worker() -> None:  # pragma: nocover
     """
@@ -133,8 +233,155 @@ def _init_worker(mode: str, packages: Dict[str, List[Dict[str, str]]]) -> None:
         _populate_packages(packages)
 
 
+class _CancellableTask:
+    """A task function skipped if the task is cancelled before it starts."""
+
+    __slots__ = ("func", "is_cancelled")
+
+    def __init__(self, func: Callable) -> None:
+        """
+        Initialize the cancellable task.
+
+        :param func: the task function.
+        """
+        self.func = func
+        self.is_cancelled = threading.Event()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run the task function, unless the task is cancelled.
+
+        :param args: the positional arguments of the function.
+        :param kwargs: the keyword arguments of the function.
+        :return: the result of the function, None if cancelled.
+        """
+        if self.is_cancelled.is_set():
+            return None
+        return self.func(*args, **kwargs)
+
+
+class _PendingTask:
+    """The state of a task not done yet."""
+
+    __slots__ = ("cancellable_task", "future")
+
+    def __init__(
+        self,
+        cancellable_task: Optional[_CancellableTask] = None,
+        future: Optional[asyncio.Future] = None,
+    ) -> None:
+        """
+        Initialize the pending task.
+
+        :param cancellable_task: the task function, if it can be skipped on cancellation.
+        :param future: the future set with the task result, if any.
+        """
+        self.cancellable_task = cancellable_task
+        self.future = future
+
+    def cancel(self) -> None:
+        """Skip the task if not started yet."""
+        if self.cancellable_task is not None:
+            self.cancellable_task.is_cancelled.set()
+
+    def set_future_result(
+        self, result: Any = None, exception: Optional[BaseException] = None
+    ) -> None:
+        """
+        Set the result of the future in its loop, from any thread.
+
+        :param result: the task result.
+        :param exception: the exception raised by the task, if any.
+        """
+        if self.future is None:
+            return
+        with suppress(RuntimeError):  # the loop is closed
+            self.future.get_loop().call_soon_threadsafe(
+                self._set_future_result, self.future, result, exception
+            )
+
+    @staticmethod
+    def _set_future_result(
+        future: asyncio.Future, result: Any, exception: Optional[BaseException]
+    ) -> None:
+        """Set the result of a future, unless already done."""
+        if future.done():
+            return
+        if isinstance(exception, asyncio.CancelledError):
+            future.cancel()
+        elif exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
+class _TaskTimeouts:
+    """A single thread timing out the tasks, in the order of their deadlines."""
+
+    def __init__(self, on_timeout: Callable[[int], None]) -> None:
+        """
+        Initialize the task timeouts.
+
+        :param on_timeout: the callback of a task timed out, called with the task id in the timeouts thread.
+        """
+        self._on_timeout = on_timeout
+        self._deadlines: List[Tuple[float, int]] = []
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def add(self, task_id: int, timeout: float) -> None:
+        """
+        Time out a task, starting the timeouts thread if needed.
+
+        The deadlines of the tasks done in time are not removed, the timeout callback ignores them.
+
+        :param task_id: the task id.
+        :param timeout: the time in seconds after which the task times out.
+        """
+        with self._condition:
+            heapq.heappush(self._deadlines, (time.monotonic() + timeout, task_id))
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def stop(self) -> None:
+        """Stop the timeouts thread, dropping the deadlines."""
+        with self._condition:
+            self._stopped = True
+            self._deadlines.clear()
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        """Wait for the next deadline and time out its task, until stopped."""
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if not self._deadlines:
+                        self._condition.wait()
+                        continue
+                    delay = self._deadlines[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._stopped:
+                    return
+                _, task_id = heapq.heappop(self._deadlines)
+            self._on_timeout(task_id)
+
+
 class TaskManager(WithLogger):
-    """A Task manager."""
+    """
+    A Task manager.
+
+    The results of the tasks are kept until they are got, by the futures of the tasks enqueued with
+    enqueue_task_async, or until result_ttl seconds after they are ready for the tasks enqueued with enqueue_task.
+    """
 
     POOL_MODES: Dict[str, Type[Pool]] = {
         THREAD_POOL_MODE: ThreadPool,
@@ -147,6 +394,8 @@ class TaskManager(WithLogger):
         is_lazy_pool_start: bool = True,
         logger: Optional[logging.Logger] = None,
         pool_mode: str = THREAD_POOL_MODE,
+        result_ttl: Optional[float] = DEFAULT_RESULT_TTL,
+        start_method: Optional[str] = None,
     ) -> None:
         """
         Initialize the task manager.
@@ -155,8 +404,24 @@ class TaskManager(WithLogger):
         :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
         :param logger: the logger.
         :param pool_mode: str. multithread or multiprocess
+        :param result_ttl: the time in seconds a task result is kept once ready, None to keep it forever.
+        :param start_method: the start method of the worker processes (fork, spawn or forkserver), None for the platform default.
         """
         WithLogger.__init__(self, logger)
+        enforce(
+            result_ttl is None or result_ttl > 0,
+            "Result time to live must be positive.",
+        )
+        enforce(
+            start_method is None or pool_mode == PROCESS_POOL_MODE,
+            "Start method is only supported by the multiprocess mode.",
+        )
+        enforce(
+            start_method is None
+            or start_method in multiprocessing.get_all_start_methods(),
+            f"Start method `{start_method}` is not supported. Supported are {multiprocessing.get_all_start_methods()}",
+        )
+        self._start_method = start_method
         self._nb_workers = nb_workers
         self._is_lazy_pool_start = is_lazy_pool_start
         self._pool = None  # type: Optional[Pool]
@@ -166,6 +431,13 @@ class TaskManager(WithLogger):
         self._task_enqueued_counter = 0
         self._results_by_task_id = {}  # type: Dict[int, Any]
         self._pool_mode = pool_mode
+        self._result_ttl = result_ttl
+        # not the pool lock, the pool result handler thread takes it, and it is joined on stop
+        self._results_lock = threading.Lock()
+        self._pending_tasks: Dict[int, _PendingTask] = {}
+        # ready times of the results to evict, in the order they became ready
+        self._ready_times_by_task_id: "OrderedDict[int, float]" = OrderedDict()
+        self._timeouts = _TaskTimeouts(self._on_task_timeout)
 
     @property
     def is_started(self) -> bool:
@@ -185,11 +457,17 @@ class TaskManager(WithLogger):
         """
         return self._nb_workers
 
+    @property
+    def result_ttl(self) -> Optional[float]:
+        """Get the time in seconds a task result is kept once ready."""
+        return self._result_ttl
+
     def enqueue_task(
         self,
         func: Callable,
         args: Sequence = (),
         kwargs: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> int:
         """
         Enqueue a task with the executor.
@@ -197,9 +475,50 @@ class TaskManager(WithLogger):
         :param func: the callable instance to be enqueued
         :param args: the positional arguments to be passed to the function.
         :param kwargs: the keyword arguments to be passed to the function.
+        :param timeout: the time in seconds after which the task is cancelled if not done.
         :return: the task id to get the the result.
         :raises ValueError: if the task manager is not running.
         """
+        return self._enqueue_task(func, args, kwargs, timeout)
+
+    def enqueue_task_async(
+        self,
+        func: Callable,
+        args: Sequence = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> asyncio.Future:
+        """
+        Enqueue a task with the executor, and get a future of its result.
+
+        The future is bound to the event loop of the calling thread, the agent loop for skills.
+        The result is not kept by the task manager, it is only set in the future.
+        Cancelling the future cancels the task.
+
+        :param func: the callable instance to be enqueued
+        :param args: the positional arguments to be passed to the function.
+        :param kwargs: the keyword arguments to be passed to the function.
+        :param timeout: the time in seconds after which the task is cancelled if not done, and the future raises asyncio.TimeoutError.
+        :return: the future of the task result.
+        :raises ValueError: if the task manager is not running.
+        """
+        future = asyncio.get_event_loop().create_future()
+        task_id = self._enqueue_task(func, args, kwargs, timeout, future)
+        future.add_done_callback(
+            lambda f: self.cancel_task(task_id) if f.cancelled() else None
+        )
+        return future
+
+    def _enqueue_task(
+        self,
+        func: Callable,
+        args: Sequence,
+        kwargs: Optional[Dict[str, Any]],
+        timeout: Optional[float],
+        future: Optional[asyncio.Future] = None,
+    ) -> int:
+        """Enqueue a task with the executor."""
+        enforce(timeout is None or timeout > 0, "Timeout must be positive.")
         with self._lock:
             if self._stopped:
                 raise ValueError("Task manager not running.")
@@ -210,15 +529,97 @@ class TaskManager(WithLogger):
             self._pool = cast(Pool, self._pool)
             task_id = self._task_enqueued_counter
             self._task_enqueued_counter += 1
-            async_result = self._pool.apply_async(
-                func, args=args, kwds=kwargs if kwargs is not None else {}
+            # the process workers can not get the cancellation
+            cancellable_task = (
+                _CancellableTask(func) if self._pool_mode == THREAD_POOL_MODE else None
             )
+            pending_task = _PendingTask(cancellable_task, future)
+            with self._results_lock:
+                self._remove_expired_results()
+                async_result = self._pool.apply_async(
+                    cancellable_task or func,
+                    args=args,
+                    kwds=kwargs if kwargs is not None else {},
+                    callback=partial(self._on_task_done, task_id),
+                    error_callback=partial(self._on_task_done, task_id, None),
+                )
+                # the task done callback waits for the lock to find it pending
+                self._pending_tasks[task_id] = pending_task
+                if timeout is not None:
+                    self._timeouts.add(task_id, timeout)
+                if future is None:
+                    self._results_by_task_id[task_id] = async_result
 
-            self._results_by_task_id[task_id] = async_result
             if self._logger:  # pragma: nocover
                 self._logger.info(f"Task <{func}{args}> set. Task id is {task_id}")
             return task_id
 
+    def _on_task_done(
+        self, task_id: int, result: Any, exception: Optional[BaseException] = None
+    ) -> None:
+        """
+        Handle a task done, called in the pool result handler thread.
+
+        :param task_id: the task id.
+        :param result: the task result.
+        :param exception: the exception raised by the task, if any.
+        """
+        with self._results_lock:
+            pending_task = self._pending_tasks.pop(task_id, None)
+            if pending_task is None:
+                # cancelled
+                return
+            pending_task.cancel()
+            if self._result_ttl is not None and task_id in self._results_by_task_id:
+                self._ready_times_by_task_id[task_id] = time.monotonic()
+        pending_task.set_future_result(result, exception)
+
+    def _on_task_timeout(self, task_id: int) -> None:
+        """
+        Cancel a task not done in time, called in the timeouts thread.
+
+        :param task_id: the task id.
+        """
+        if self._cancel_task(
+            task_id, asyncio.TimeoutError(f"Task {task_id} timed out.")
+        ):
+            self.logger.warning(f"Task {task_id} timed out, cancelled.")
+
+    def cancel_task(self, task_id: int) -> bool:
+        """
+        Cancel a task.
+
+        The task is not executed if it has not started yet, in the multithread mode.
+        A running task can not be interrupted, its result is dropped.
+
+        :param task_id: the task id.
+        :return: whether the task was cancelled, False if already done.
+        """
+        return self._cancel_task(task_id, asyncio.CancelledError())
+
+    def _cancel_task(self, task_id: int, exception: BaseException) -> bool:
+        """Cancel a task, and set the exception in its future."""
+        with self._results_lock:
+            pending_task = self._pending_tasks.pop(task_id, None)
+            if pending_task is None:
+                return False
+            pending_task.cancel()
+            self._results_by_task_id.pop(task_id, None)
+        pending_task.set_future_result(exception=exception)
+        return True
+
+    def _remove_expired_results(self) -> None:
+        """Remove the results ready for longer than the time to live."""
+        if self._result_ttl is None:
+            return
+        now = time.monotonic()
+        while self._ready_times_by_task_id:
+            task_id, ready_time = next(iter(self._ready_times_by_task_id.items()))
+            if now - ready_time <= self._result_ttl:
+                break
+            del self._ready_times_by_task_id[task_id]
+            self._results_by_task_id.pop(task_id, None)
+
     def get_task_result(self, task_id: int) -> AsyncResult:
         """
         Get the result from a task.
@@ -226,9 +627,11 @@ class TaskManager(WithLogger):
         :param task_id: the task id
         :return: async result for task_id
         """
-        task_result = self._results_by_task_id.get(
-            task_id, None
-        )  # type: Optional[AsyncResult]
+        with self._results_lock:
+            self._remove_expired_results()
+            task_result = self._results_by_task_id.get(
+                task_id, None
+            )  # type: Optional[AsyncResult]
         if task_result is None:
             raise ValueError("Task id {} not present.".format(task_id))
 
@@ -253,7 +656,10 @@ class TaskManager(WithLogger):
             else:
                 self.logger.debug("Stop the task manager.")
                 self._stopped = True
+                self._timeouts.stop()
                 self._stop_pool()
+                for task_id in list(self._pending_tasks):
+                    self.cancel_task(task_id)
 
     def _start_pool(self) -> None:
         """
@@ -271,8 +677,19 @@ class TaskManager(WithLogger):
             self._pool_mode,
             _enlist_component_packages(),
         )
+        kwargs = {}
+        if self._pool_mode == PROCESS_POOL_MODE:
+            context = multiprocessing.get_context(self._start_method)
+            if context.get_start_method() == "forkserver":
+                context.set_forkserver_preload(FORKSERVER_PRELOAD_MODULES)
+            kwargs["context"] = context
+            if os.name == "posix":
+                # workers share the resource tracker of the manager, so the shared buffers
+                # they attach are not unlinked by trackers of their own on exit.
+                # There is no resource tracker on Windows.
+                resource_tracker.ensure_running()
         self._pool = pool_cls(
-            self._nb_workers, initializer=_init_worker, initargs=init_args
+            self._nb_workers, initializer=_init_worker, initargs=init_args, **kwargs
         )
 
     def _stop_pool(self) -> None:
@@ -295,6 +712,7 @@ class ThreadedTaskManager(TaskManager):
         nb_workers: int = DEFAULT_WORKERS_AMOUNT,
         is_lazy_pool_start: bool = True,
         logger: Optional[logging.Logger] = None,
+        result_ttl: Optional[float] = DEFAULT_RESULT_TTL,
     ) -> None:
         """
         Initialize the task manager.
@@ -302,11 +720,13 @@ class ThreadedTaskManager(TaskManager):
         :param nb_workers: the number of worker processes.
         :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
         :param logger: the logger.
+        :param result_ttl: the time in seconds a task result is kept once ready, None to keep it forever.
         """
         super().__init__(
             nb_workers=nb_workers,
             is_lazy_pool_start=is_lazy_pool_start,
             logger=logger,
+            result_ttl=result_ttl,
             pool_mode=THREAD_POOL_MODE,
         )
 
@@ -319,17 +739,25 @@ class ProcessTaskManager(TaskManager):
         nb_workers: int = DEFAULT_WORKERS_AMOUNT,
         is_lazy_pool_start: bool = True,
         logger: Optional[logging.Logger] = None,
+        result_ttl: Optional[float] = DEFAULT_RESULT_TTL,
+        start_method: Optional[str] = None,
     ) -> None:
         """
         Initialize the task manager.
 
+        The forked workers inherit the component packages already loaded, and the fork server imports the framework once.
+
         :param nb_workers: the number of worker processes.
         :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
         :param logger: the logger.
+        :param result_ttl: the time in seconds a task result is kept once ready, None to keep it forever.
+        :param start_method: the start method of the worker processes (fork, spawn or forkserver), None for the platform default.
         """
         super().__init__(
             nb_workers=nb_workers,
             is_lazy_pool_start=is_lazy_pool_start,
             logger=logger,
+            result_ttl=result_ttl,
             pool_mode=PROCESS_POOL_MODE,
+            start_method=start_method,
         )
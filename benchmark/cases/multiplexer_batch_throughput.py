@@ -0,0 +1,143 @@
+#!/usr/bin/ev python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2022 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Example performance test using benchmark framework.
+
+Test envelopes throughput of the multiplexer send and receive loops,
+in normal (batch_size=1) and batched (batch_size>1) mode.
+Envelopes sent are echoed back by the connection, so the envelopes/sec rate
+is `envelopes_num / time passed`, e.g. run it with `1 64` to compare modes.
+"""
+import asyncio
+import time
+from typing import Any, List, Optional, Sequence
+from unittest.mock import MagicMock
+
+from aea.configurations.base import ConnectionConfig, PublicId
+from aea.connections.base import Connection, ConnectionStates
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.multiplexer import AsyncMultiplexer
+from benchmark.framework.aea_test_wrapper import AEATestWrapper
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+
+class EchoConnection(Connection):
+    """Connection echoing back every envelope sent."""
+
+    connection_id = PublicId.from_str("fetchai/echo:0.1.0")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Init connection."""
+        super().__init__(*args, **kwargs)
+        self._queue: Optional[asyncio.Queue] = None
+
+    async def connect(self) -> None:
+        """Connect."""
+        self._queue = asyncio.Queue()
+        self.state = ConnectionStates.connected
+
+    async def disconnect(self) -> None:
+        """Disconnect."""
+        self.state = ConnectionStates.disconnected
+
+    async def send(self, envelope: Envelope) -> None:
+        """
+        Echo an envelope.
+
+        :param envelope: envelope to send.
+        """
+        self._queue.put_nowait(envelope)  # type: ignore
+
+    async def send_batch(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Echo a batch of envelopes.
+
+        :param envelopes: envelopes to send.
+        """
+        self._queue.put_nowait(list(envelopes))  # type: ignore
+
+    async def receive(self, *args: Any, **kwargs: Any) -> Optional[Envelope]:
+        """
+        Receive an echoed envelope.
+
+        :param args: positional arguments
+        :param kwargs: keyword arguments
+        :return: incoming envelope
+        """
+        return await self._queue.get()  # type: ignore
+
+    async def receive_batch(
+        self, *args: Any, **kwargs: Any
+    ) -> Optional[List[Envelope]]:
+        """
+        Receive a batch of echoed envelopes.
+
+        :param args: positional arguments
+        :param kwargs: keyword arguments
+        :return: incoming envelopes
+        """
+        return await self._queue.get()  # type: ignore
+
+
+def multiplexer_batch_throughput(
+    benchmark: BenchmarkControl, batch_size: int = 1, envelopes_num: int = 10000
+) -> None:
+    """
+    Test envelopes throughput of the multiplexer.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param batch_size: multiplexer batch size, 1 disables the batched mode
+    :param envelopes_num: number of envelopes to send and receive
+    """
+    connection = EchoConnection(
+        configuration=ConnectionConfig(connection_id=EchoConnection.connection_id),
+        data_dir=MagicMock(),
+        identity=Identity("name", "address", "public_key"),
+    )
+    envelope = AEATestWrapper.dummy_envelope()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    multiplexer = AsyncMultiplexer(
+        [connection], loop=loop, protocols=[DefaultMessage], batch_size=batch_size
+    )
+
+    async def _run() -> None:
+        await multiplexer.connect()
+        try:
+            benchmark.start()
+            start_time = time.time()
+            for _ in range(envelopes_num):
+                multiplexer.put(envelope)
+            for _ in range(envelopes_num):
+                await multiplexer.async_get()
+            time_passed = time.time() - start_time
+            print(f"envelopes/sec: {envelopes_num / time_passed:.2f}")
+        finally:
+            await multiplexer.disconnect()
+
+    loop.run_until_complete(_run())
+
+
+if __name__ == "__main__":
+    TestCli(multiplexer_batch_throughput).run()
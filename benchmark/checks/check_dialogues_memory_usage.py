@@ -19,16 +19,17 @@
 # ------------------------------------------------------------------------------
 """Memory usage of dialogues across the time."""
 import os
+import random
 import sys
 import time
 import uuid
-from typing import Any, List, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import click
 
 from aea.common import Address
 from aea.protocols.base import Message
-from aea.protocols.dialogue.base import Dialogue
+from aea.protocols.dialogue.base import Dialogue, Dialogues
 from benchmark.checks.utils import get_mem_usage_in_mb  # noqa: I100
 from benchmark.checks.utils import (
     multi_run,
@@ -37,6 +38,11 @@ from benchmark.checks.utils import (
     print_results,
 )
 
+from packages.fetchai.protocols.state_update.dialogues import (
+    StateUpdateDialogue,
+    StateUpdateDialogues,
+)
+from packages.fetchai.protocols.state_update.message import StateUpdateMessage
 from packages.valory.protocols.http.dialogues import HttpDialogue, HttpDialogues
 from packages.valory.protocols.http.message import HttpMessage
 
@@ -48,15 +54,45 @@ sys.path.append(ROOT_PATH)
 class DialogueHandler:
     """Generate messages and process with dialogues."""
 
-    def __init__(self) -> None:
-        """Set dialogues."""
+    def __init__(
+        self,
+        counterparties: int = 0,
+        keep_terminal_state_dialogues: bool = False,
+        message_history_size: Optional[int] = None,
+    ) -> None:
+        """
+        Set dialogues.
+
+        :param counterparties: number of counterparties sending the messages, 0 for a new counterparty per message.
+        :param keep_terminal_state_dialogues: keep the dialogues in the storage once in terminal state.
+        :param message_history_size: number of the last messages of each direction kept decoded, None for all.
+        """
+        self.addr = self.random_string
+        self.dialogues = self.make_dialogues()
+        # pylint: disable=protected-access
+        self.dialogues._keep_terminal_state_dialogues = keep_terminal_state_dialogues
+        self.dialogues._message_history_size = message_history_size
+        self.counterparties: Optional[List[str]] = (
+            [self.random_string for _ in range(counterparties)]
+            if counterparties
+            else None
+        )
+
+    def make_dialogues(self) -> Dialogues:
+        """Make the dialogues."""
         # pylint: disable=unused-argument
 
         def role(m: Message, addr: Address) -> Dialogue.Role:
             return HttpDialogue.Role.CLIENT
 
-        self.addr = self.random_string
-        self.dialogues = HttpDialogues(self.addr, role_from_first_message=role)
+        return HttpDialogues(self.addr, role_from_first_message=role)
+
+    @property
+    def counterparty(self) -> str:
+        """Get the address of the counterparty sending the next message."""
+        if self.counterparties is None:
+            return self.random_string
+        return random.choice(self.counterparties)  # nosec
 
     @property
     def random_string(self) -> str:
@@ -97,39 +133,191 @@ class DialogueHandler:
             version="",
             body=b"",
         )
-        message.sender = self.random_string
+        message.sender = self.counterparty
         message.to = self.addr
         return message
 
+    def remove_all(self) -> None:
+        """Remove all the dialogues, one by one."""
+        # pylint: disable=protected-access
+        storage = self.dialogues._dialogues_storage
+        dialogues = storage.dialogues_in_active_state + (
+            storage.dialogues_in_terminal_state
+        )
+        for dialogue in dialogues:
+            storage.remove(dialogue.dialogue_label)
+
+
+class LongDialogueHandler(DialogueHandler):
+    """Generate messages exchanged in long dialogues and process with dialogues."""
+
+    GOODS = 10
+
+    def __init__(
+        self,
+        dialogue_length: int,
+        counterparties: int = 0,
+        keep_terminal_state_dialogues: bool = False,
+        message_history_size: Optional[int] = None,
+    ) -> None:
+        """
+        Set dialogues.
+
+        :param dialogue_length: number of messages received in a dialogue, every message is replied.
+        :param counterparties: number of counterparties sending the messages, 0 for a new counterparty per message.
+        :param keep_terminal_state_dialogues: keep the dialogues in the storage once in terminal state.
+        :param message_history_size: number of the last messages of each direction kept decoded, None for all.
+        """
+        super().__init__(
+            counterparties, keep_terminal_state_dialogues, message_history_size
+        )
+        self.dialogue_length = dialogue_length
+
+    def make_dialogues(self) -> Dialogues:
+        """Make the dialogues."""
+        # pylint: disable=unused-argument
+
+        def role(m: Message, addr: Address) -> Dialogue.Role:
+            return StateUpdateDialogue.Role.DECISION_MAKER
 
-def run(messages_amount: int) -> List[Tuple[str, Union[float, int]]]:
+        return StateUpdateDialogues(self.addr, role_from_first_message=role)
+
+    def random_amounts(self) -> Dict[str, int]:
+        """Get random amounts by id."""
+        return {
+            self.random_string[:8]: random.randint(0, 100)  # nosec
+            for _ in range(self.GOODS)
+        }
+
+    def process_message(self) -> None:
+        """Process the messages of a dialogue."""
+        message = self.create()
+        for message_id in range(1, self.dialogue_length + 1):
+            dialogue = self.update(message)
+            reply = dialogue.reply(
+                target_message=message,
+                performative=StateUpdateMessage.Performative.APPLY,
+                amount_by_currency_id=self.random_amounts(),
+                quantities_by_good_id=self.random_amounts(),
+            )
+            message = StateUpdateMessage(
+                dialogue_reference=dialogue.dialogue_label.dialogue_reference,
+                message_id=message_id + 1,
+                target=reply.message_id,
+                performative=StateUpdateMessage.Performative.APPLY,
+                amount_by_currency_id=self.random_amounts(),
+                quantities_by_good_id=self.random_amounts(),
+            )
+            message.sender = dialogue.dialogue_label.dialogue_opponent_addr
+            message.to = self.addr
+
+    def create(self) -> StateUpdateMessage:  # type: ignore
+        """Make initial message."""
+        message = StateUpdateMessage(
+            dialogue_reference=StateUpdateDialogues.new_self_initiated_dialogue_reference(),
+            performative=StateUpdateMessage.Performative.INITIALIZE,
+            exchange_params_by_currency_id={"FET": 1.0},
+            utility_params_by_good_id={"good": 1.0},
+            amount_by_currency_id=self.random_amounts(),
+            quantities_by_good_id=self.random_amounts(),
+        )
+        message.sender = self.counterparty
+        message.to = self.addr
+        return message
+
+
+def run(
+    messages_amount: int,
+    counterparties: int = 0,
+    keep_terminal_state_dialogues: bool = False,
+    dialogue_length: int = 1,
+    message_history_size: Optional[int] = None,
+) -> List[Tuple[str, Union[float, int]]]:
     """Test messages generation and memory consumption with dialogues."""
-    handler = DialogueHandler()
+    handler = (
+        DialogueHandler(
+            counterparties, keep_terminal_state_dialogues, message_history_size
+        )
+        if dialogue_length == 1
+        else LongDialogueHandler(
+            dialogue_length,
+            counterparties,
+            keep_terminal_state_dialogues,
+            message_history_size,
+        )
+    )
     mem_usage_on_start = get_mem_usage_in_mb()
     start_time = time.time()
     for _ in range(messages_amount):
         handler.process_message()
     mem_usage = get_mem_usage_in_mb()
+    time_passed = time.time() - start_time
+
+    start_time = time.time()
+    handler.remove_all()
 
     return [
         ("Mem usage(Mb)", mem_usage - mem_usage_on_start),
-        ("Time (seconds)", time.time() - start_time),
+        ("Time (seconds)", time_passed),
+        ("Removal time (seconds)", time.time() - start_time),
     ]
 
 
 @click.command()
 @click.option("--messages", default=1000, help="Run time in seconds.")
+@click.option(
+    "--counterparties",
+    default=0,
+    help="Number of counterparties sending the messages, 0 for a new counterparty per message.",
+)
+@click.option(
+    "--keep_terminal_state_dialogues",
+    is_flag=True,
+    default=False,
+    help="Keep the dialogues in the storage once in terminal state.",
+)
+@click.option(
+    "--dialogue_length",
+    default=1,
+    help="Number of messages received in a dialogue, a request/response dialogue is used if 1.",
+)
+@click.option(
+    "--message_history_size",
+    default=0,
+    help="Number of the last messages of each direction kept decoded in a dialogue, 0 for all.",
+)
 @number_of_runs_deco
 @output_format_deco
-def main(messages: str, number_of_runs: int, output_format: str) -> Any:
+def main(
+    messages: str,
+    counterparties: str,
+    keep_terminal_state_dialogues: bool,
+    dialogue_length: str,
+    message_history_size: str,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
     """Run test."""
-    parameters = {"Messages": messages, "Number of runs": number_of_runs}
+    parameters = {
+        "Messages": messages,
+        "Counterparties": counterparties,
+        "Keep terminal state dialogues": keep_terminal_state_dialogues,
+        "Dialogue length": dialogue_length,
+        "Message history size": message_history_size,
+        "Number of runs": number_of_runs,
+    }
 
     def result_fn() -> List[Tuple[str, Any, Any, Any]]:
         return multi_run(
             int(number_of_runs),
             run,
-            (int(messages),),
+            (
+                int(messages),
+                int(counterparties),
+                keep_terminal_state_dialogues,
+                int(dialogue_length),
+                int(message_history_size) or None,
+            ),
         )
 
     return print_results(output_format, parameters, result_fn)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Envelopes throughput of the inbox of a multiplexer."""
+import asyncio
+import os
+import sys
+import threading
+import time
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.mail.base import Envelope
+from aea.multiplexer import AsyncMultiplexer, InBox
+from benchmark.checks.utils import (  # noqa: I100
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+
+def make_envelope() -> Envelope:
+    """Make an envelope."""
+    message = DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES, content=b"hello"
+    )
+    message.to = "receiver"
+    message.sender = "sender"
+    return Envelope(to=message.to, sender=message.sender, message=message)
+
+
+async def _run(producer: str, envelopes: int, in_queue_max_size: int) -> float:
+    """Return the envelopes per second got from the inbox."""
+    multiplexer = AsyncMultiplexer(
+        loop=asyncio.get_event_loop(), in_queue_max_size=in_queue_max_size
+    )
+    inbox = InBox(multiplexer)
+    in_queue = multiplexer.in_queue
+    envelope = make_envelope()
+
+    async def produce_on_loop() -> None:
+        for _ in range(envelopes):
+            await in_queue.async_put(envelope)
+            # let the consumer run, as a connection would between two reads
+            await asyncio.sleep(0)
+
+    def produce_in_thread() -> None:
+        for _ in range(envelopes):
+            in_queue.put(envelope)
+
+    start_time = time.time()
+    if producer == "same_loop":
+        producing = asyncio.ensure_future(produce_on_loop())
+    else:
+        thread = threading.Thread(target=produce_in_thread, daemon=True)
+        thread.start()
+    for _ in range(envelopes):
+        await inbox.async_get()
+    elapsed = time.time() - start_time
+
+    if producer == "same_loop":
+        await producing
+    else:
+        thread.join()
+    return envelopes / elapsed
+
+
+def run(
+    producer: str, envelopes: int, in_queue_max_size: int
+) -> List[Tuple[str, Union[int, float]]]:
+    """Test the envelopes throughput of the inbox."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        envelopes_per_second = loop.run_until_complete(
+            _run(producer, envelopes, in_queue_max_size)
+        )
+    finally:
+        loop.close()
+
+    return [("Envelopes/sec", envelopes_per_second)]
+
+
+@click.command()
+@click.option(
+    "--producer",
+    type=click.Choice(["same_loop", "thread"]),
+    default="same_loop",
+    help="Where the envelopes are put, on the loop of the consumer or in another thread.",
+    show_default=True,
+)
+@click.option("--envelopes", default=10000, help="Number of envelopes.")
+@click.option(
+    "--in_queue_max_size",
+    default=0,
+    help="Maximum size of the in queue, 0 means unbounded.",
+)
+@number_of_runs_deco
+@output_format_deco
+def main(
+    producer: str,
+    envelopes: str,
+    in_queue_max_size: str,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Producer": producer,
+        "Envelopes": envelopes,
+        "In queue max size": in_queue_max_size,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (producer, int(envelopes), int(in_queue_max_size)),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
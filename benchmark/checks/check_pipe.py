@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Frames throughput and latency of the interprocess communication channels."""
+import asyncio
+import os
+import sys
+import time
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.helpers.pipe import (
+    IPCChannel,
+    IPCChannelClient,
+    PosixNamedPipeChannel,
+    PosixNamedPipeChannelClient,
+    TCPSocketChannel,
+    TCPSocketChannelClient,
+)
+from benchmark.checks.utils import (  # noqa: I100
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+
+def make_channels(channel_type: str) -> Tuple[IPCChannel, IPCChannelClient]:
+    """Make the two ends of a channel."""
+    if channel_type == "posix":
+        channel: IPCChannel = PosixNamedPipeChannel()
+        return channel, PosixNamedPipeChannelClient(channel.out_path, channel.in_path)
+    channel = TCPSocketChannel()
+    return channel, TCPSocketChannelClient(channel.out_path, channel.in_path)
+
+
+async def _run(
+    channel_type: str, frames: int, frame_size: int, round_trips: int
+) -> Tuple[float, float]:
+    """Return the frames per second written in a burst, and the mean latency of a frame."""
+    channel, client = make_channels(channel_type)
+    connected = await asyncio.gather(channel.connect(), client.connect())
+    if not all(connected):
+        raise ValueError("Failed to connect the channel.")
+    data = os.urandom(frame_size)
+
+    try:
+
+        async def write_frames() -> None:
+            for _ in range(frames):
+                await channel.write(data)
+
+        start_time = time.time()
+        writing = asyncio.ensure_future(write_frames())
+        for _ in range(frames):
+            await client.read()
+        await writing
+        burst_time = time.time() - start_time
+
+        start_time = time.time()
+        for _ in range(round_trips):
+            await channel.write(data)
+            await client.read()
+        latency = (time.time() - start_time) / round_trips
+    finally:
+        await client.close()
+        await channel.close()
+
+    return frames / burst_time, latency
+
+
+def run(
+    channel_type: str, frames: int, frame_size: int, round_trips: int
+) -> List[Tuple[str, Union[int, float]]]:
+    """Test the frames throughput and latency of a channel."""
+    loop = asyncio.new_event_loop()
+    try:
+        frames_per_second, latency = loop.run_until_complete(
+            _run(channel_type, frames, frame_size, round_trips)
+        )
+    finally:
+        loop.close()
+
+    return [
+        ("Frames/sec", frames_per_second),
+        ("Latency (ms)", latency * 1000),
+    ]
+
+
+@click.command()
+@click.option(
+    "--channel_type",
+    type=click.Choice(["posix", "tcp"]),
+    default="posix",
+    help="Channel type, posix named pipes or tcp socket.",
+    show_default=True,
+)
+@click.option("--frames", default=10000, help="Number of frames written in a burst.")
+@click.option("--frame_size", default=1024, help="Size of a frame in bytes.")
+@click.option(
+    "--round_trips", default=1000, help="Number of frames written one at a time."
+)
+@number_of_runs_deco
+@output_format_deco
+def main(
+    channel_type: str,
+    frames: str,
+    frame_size: str,
+    round_trips: str,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Channel type": channel_type,
+        "Frames": frames,
+        "Frame size": frame_size,
+        "Round trips": round_trips,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (channel_type, int(frames), int(frame_size), int(round_trips)),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
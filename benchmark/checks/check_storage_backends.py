@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Put, get and find throughput of the generic storage backends."""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.helpers.storage.generic_storage import Storage
+from benchmark.checks.utils import (  # noqa: I100
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+    wait_for_condition,
+)
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+COLLECTION_NAME = "benchmark"
+COUNTERPARTIES = 100
+
+
+def make_object(object_number: int) -> dict:
+    """Make an object body, like an offloaded dialogue."""
+    return {
+        "dialogue_label": {
+            "dialogue_opponent_addr": f"counterparty_{object_number % COUNTERPARTIES}",
+            "dialogue_reference": [str(object_number), ""],
+        },
+        "incoming_messages": [{"message_id": 1, "body": "x" * 200}],
+        "outgoing_messages": [{"message_id": 2, "body": "y" * 200}],
+    }
+
+
+def run(backend: str, objects: int, finds: int) -> List[Tuple[str, Union[int, float]]]:
+    """Test the put, get and find throughput of a storage backend."""
+    path = tempfile.mkdtemp()
+    uri = (
+        f"sqlite://{os.path.join(path, 'storage.db')}"
+        if backend == "sqlite"
+        else f"log://{path}"
+    )
+    storage = Storage(uri, threaded=True)
+    storage.start()
+    wait_for_condition(lambda: storage.is_connected, timeout=10)
+    try:
+        collection = storage.get_sync_collection(
+            COLLECTION_NAME, indexes=["dialogue_label.dialogue_opponent_addr"]
+        )
+        start_time = time.time()
+        for i in range(objects):
+            collection.put(str(i), make_object(i))
+        put_time = time.time() - start_time
+
+        start_time = time.time()
+        for i in range(objects):
+            collection.get(str(i))
+        get_time = time.time() - start_time
+
+        start_time = time.time()
+        for i in range(finds):
+            collection.find(
+                "dialogue_label.dialogue_opponent_addr",
+                f"counterparty_{i % COUNTERPARTIES}",
+            )
+        find_time = time.time() - start_time
+    finally:
+        storage.stop()
+        storage.wait_completed(sync=True, timeout=10)
+        shutil.rmtree(path)
+
+    return [
+        ("Puts/sec", objects / put_time),
+        ("Gets/sec", objects / get_time),
+        ("Finds/sec", finds / find_time),
+    ]
+
+
+@click.command()
+@click.option(
+    "--backend",
+    type=click.Choice(["sqlite", "log"]),
+    default="log",
+    help="Storage backend.",
+    show_default=True,
+)
+@click.option("--objects", default=10000, help="Number of objects put and got.")
+@click.option(
+    "--finds",
+    default=1000,
+    help=f"Number of finds, on a field shared by 1/{COUNTERPARTIES} of the objects.",
+)
+@number_of_runs_deco
+@output_format_deco
+def main(
+    backend: str, objects: str, finds: str, number_of_runs: int, output_format: str
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Backend": backend,
+        "Objects": objects,
+        "Finds": finds,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs),
+            run,
+            (backend, int(objects), int(finds)),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Throughput of the process task manager with pickled and shared memory arguments."""
+import os
+import sys
+import time
+from statistics import mean, stdev, variance
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.skills.tasks import ProcessTaskManager, SharedBuffer
+from benchmark.checks.utils import (  # noqa: I100
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+RESULT_TIMEOUT = 60.0
+
+
+def checksum(data: Union[bytes, SharedBuffer]) -> int:
+    """Get a cheap checksum of some data, so the task time is dominated by the argument passing."""
+    if isinstance(data, SharedBuffer):
+        with data:
+            return data.buf[0] + data.buf[-1]
+    return data[0] + data[-1]
+
+
+def run(
+    arguments: str, start_method: str, size: int, tasks: int, workers: int
+) -> List[Tuple[str, Union[int, float]]]:
+    """Test the throughput of tasks with large arguments."""
+    start_time = time.time()
+    task_manager = ProcessTaskManager(nb_workers=workers, start_method=start_method)
+    task_manager.start()
+    # run a task per worker, so the pool is warm before the measure
+    for task_id in [task_manager.enqueue_task(len, ("",)) for _ in range(workers)]:
+        task_manager.get_task_result(task_id).get(RESULT_TIMEOUT)
+    start_up_time = time.time() - start_time
+
+    data = os.urandom(size)
+    try:
+        start_time = time.time()
+        if arguments == "shared_memory":
+            with SharedBuffer.from_buffer(data) as shared_buffer:
+                task_ids = [
+                    task_manager.enqueue_task(checksum, (shared_buffer,))
+                    for _ in range(tasks)
+                ]
+                for task_id in task_ids:
+                    task_manager.get_task_result(task_id).get(RESULT_TIMEOUT)
+        else:
+            task_ids = [
+                task_manager.enqueue_task(checksum, (data,)) for _ in range(tasks)
+            ]
+            for task_id in task_ids:
+                task_manager.get_task_result(task_id).get(RESULT_TIMEOUT)
+        tasks_time = time.time() - start_time
+    finally:
+        task_manager.stop()
+
+    return [
+        ("Pool start up (sec)", start_up_time),
+        ("Tasks/sec", tasks / tasks_time),
+    ]
+
+
+@click.command()
+@click.option(
+    "--arguments",
+    type=click.Choice(["pickle", "shared_memory"]),
+    default="shared_memory",
+    help="How the data argument is passed to the tasks.",
+    show_default=True,
+)
+@click.option(
+    "--start_method",
+    type=click.Choice(["fork", "forkserver", "spawn"]),
+    default="fork",
+    help="Start method of the worker processes.",
+    show_default=True,
+)
+@click.option("--size", default=10**7, help="Size in bytes of the data argument.")
+@click.option("--tasks", default=100, help="Number of tasks run.")
+@click.option("--workers", default=4, help="Number of worker processes.")
+@number_of_runs_deco
+@output_format_deco
+def main(
+    arguments: str,
+    start_method: str,
+    size: str,
+    tasks: str,
+    workers: str,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Arguments": arguments,
+        "Start method": start_method,
+        "Size": size,
+        "Tasks": tasks,
+        "Workers": workers,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        # the runs are not isolated in pool processes like in multi_run,
+        # since daemonic processes cannot start the task manager workers
+        results = [
+            run(arguments, start_method, int(size), int(tasks), int(workers))
+            for _ in range(int(number_of_runs))
+        ]
+        names = [name for name, _ in results[0]]
+        values = zip(*([value for _, value in result] for result in results))
+        return [
+            (name, mean(value), stdev(value), variance(value))
+            for name, value in zip(names, values)
+        ]
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -21,17 +21,20 @@
 import asyncio
 import email
 import logging
+import os
 import ssl
+import tempfile
 from abc import ABC, abstractmethod
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.futures import Future
 from concurrent.futures._base import CancelledError as FuturesCancelledError
+from contextlib import suppress
 from traceback import format_exc
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Optional, Tuple, cast
 from urllib.parse import parse_qs, urlparse
 
-from aiohttp import web
+from aiohttp import StreamReader, web
 from aiohttp.web_request import BaseRequest
 from openapi_core import create_spec
 from openapi_core.validation.request.datatypes import OpenAPIRequest, RequestParameters
@@ -69,6 +72,11 @@ _default_logger = logging.getLogger("aea.packages.fetchai.connections.http_serve
 RequestId = DialogueLabel
 PUBLIC_ID = PublicId.from_str("fetchai/http_server:0.22.0")
 
+DEFAULT_MAX_BODY_SIZE = 1024**2
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# header holding the path of the file a body is spooled to, in place of the body
+BODY_FILE_HEADER = "X-Aea-Body-File"
+
 
 class HttpDialogues(BaseHttpDialogues):
     """The dialogues class keeps track of all http dialogues."""
@@ -115,9 +123,100 @@ def headers_to_string(headers: Dict) -> str:
     return msg.as_string()
 
 
+# pop_body_file and read_body are also defined by the valory/http_client connection:
+# packages are fetched independently, so they cannot import each other,
+# and the server rejects oversized bodies with an HTTP error instead of a ValueError.
+def pop_body_file(headers: Optional[dict]) -> Optional[str]:
+    """
+    Pop the path of the file holding the body from the headers.
+
+    :param headers: the headers.
+    :return: the path, or None if the body is not in a file.
+    """
+    for name in list(headers or {}):
+        if name.lower() == BODY_FILE_HEADER.lower():
+            return cast(dict, headers).pop(name)
+    return None
+
+
+async def read_body(
+    stream: StreamReader,
+    content_length: Optional[int],
+    max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE,
+    spool_threshold: Optional[int] = None,
+    spool_dir: Optional[str] = None,
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Read a body in chunks, spooling it to a temporary file once it exceeds the threshold.
+
+    The stream is only read as fast as the body is stored, so a slow consumer slows down the sender.
+
+    :param stream: the stream of the body.
+    :param content_length: the announced length of the body, if any.
+    :param max_body_size: the maximum size of the body, in bytes. None for no limit.
+    :param spool_threshold: the size above which the body is spooled, in bytes. None to never spool.
+    :param spool_dir: the directory of the spool files, the system temporary directory if None.
+    :return: the body, and the path of the file it was spooled to if any, in which case the body is empty.
+    """
+    if max_body_size is not None and (content_length or 0) > max_body_size:
+        raise web.HTTPRequestEntityTooLarge(
+            max_size=max_body_size, actual_size=cast(int, content_length)
+        )
+    body = bytearray()
+    size = 0
+    spool = None
+    try:
+        async for chunk in stream.iter_chunked(DEFAULT_CHUNK_SIZE):
+            size += len(chunk)
+            if max_body_size is not None and size > max_body_size:
+                raise web.HTTPRequestEntityTooLarge(
+                    max_size=max_body_size, actual_size=size
+                )
+            if spool is not None:
+                spool.write(chunk)
+                continue
+            body += chunk
+            if spool_threshold is not None and size > spool_threshold:
+                spool = (
+                    tempfile.NamedTemporaryFile(  # pylint: disable=consider-using-with
+                        dir=spool_dir, prefix="http_body_", delete=False
+                    )
+                )
+                spool.write(body)
+                body = bytearray()
+    except BaseException:
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+        raise
+    if spool is None:
+        return bytes(body), None
+    spool.close()
+    return b"", spool.name
+
+
 class Request(OpenAPIRequest):
     """Generic request object."""
 
+    _body_file: Optional[str] = None
+
+    @property
+    def body_file(self) -> Optional[str]:
+        """Get the path of the file the body is spooled to, if any."""
+        return self._body_file
+
+    def release_body_file(self) -> None:
+        """Hand over the file the body is spooled to, it is not removed by the request anymore."""
+        self._body_file = None
+
+    def remove_body_file(self) -> None:
+        """Remove the file the body is spooled to, if any."""
+        if self._body_file is None:
+            return
+        with suppress(FileNotFoundError):
+            os.remove(self._body_file)
+        self._body_file = None
+
     @property
     def is_id_set(self) -> bool:
         """Check if id is set."""
@@ -134,11 +233,22 @@ class Request(OpenAPIRequest):
         self._id = request_id
 
     @classmethod
-    async def create(cls, http_request: BaseRequest) -> "Request":
+    async def create(
+        cls,
+        http_request: BaseRequest,
+        max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE,
+        body_spool_threshold: Optional[int] = None,
+        body_spool_dir: Optional[str] = None,
+    ) -> "Request":
         """
         Create a request.
 
+        Bodies above the spool threshold are spooled to a file, whose path is set in the body file header.
+
         :param http_request: http_request
+        :param max_body_size: the maximum size of the body, in bytes. None for no limit.
+        :param body_spool_threshold: the size above which the body is spooled, in bytes. None to never spool.
+        :param body_spool_dir: the directory of the spool files, the system temporary directory if None.
         :return: a request
         """
         method = http_request.method.lower()
@@ -147,15 +257,26 @@ class Request(OpenAPIRequest):
 
         url = http_request.url
 
-        body = await http_request.read()
+        body, body_file = await read_body(
+            http_request.content,
+            http_request.content_length,
+            max_body_size,
+            body_spool_threshold,
+            body_spool_dir,
+        )
 
         mimetype = http_request.content_type
 
         query_params = parse_qs(parsed_path.query, keep_blank_values=True)
 
+        headers = dict(http_request.headers)
+        pop_body_file(headers)
+        if body_file is not None:
+            headers[BODY_FILE_HEADER] = body_file
+
         parameters = RequestParameters(
             query=ImmutableMultiDict(query_params),  # type: ignore
-            header=headers_to_string(dict(http_request.headers)),
+            header=headers_to_string(headers),
             path={},
         )
 
@@ -166,6 +287,7 @@ class Request(OpenAPIRequest):
             body=body,
             mimetype=mimetype,
         )
+        request._body_file = body_file  # pylint: disable=protected-access
         return request
 
     def to_envelope_and_set_id(
@@ -205,10 +327,12 @@ class Response(web.Response):
     """Generic response object."""
 
     @classmethod
-    def from_message(cls, http_message: HttpMessage) -> "Response":
+    def from_message(cls, http_message: HttpMessage) -> web.StreamResponse:
         """
         Turn an envelope into a response.
 
+        The body is streamed from the file in the body file header, if any.
+
         :param http_message: the http_message
         :return: the response
         """
@@ -220,6 +344,19 @@ class Response(web.Response):
             else:
                 headers = None
 
+            body_file = pop_body_file(headers)
+            if body_file is not None:
+                for name in list(cast(dict, headers)):
+                    if name.lower() == "content-length":
+                        cast(dict, headers).pop(name)
+                return web.FileResponse(
+                    body_file,
+                    chunk_size=DEFAULT_CHUNK_SIZE,
+                    status=http_message.status_code,
+                    reason=http_message.status_text,
+                    headers=headers,
+                )
+
             # if content length header provided, it should correspond to actuyal body length
             if headers and "Content-Length" in headers:
                 headers["Content-Length"] = str(len(http_message.body or ""))
@@ -366,6 +503,9 @@ class HTTPChannel(BaseAsyncChannel):
         logger: logging.Logger = _default_logger,
         ssl_cert_path: Optional[str] = None,
         ssl_key_path: Optional[str] = None,
+        max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE,
+        body_spool_threshold: Optional[int] = None,
+        body_spool_dir: Optional[str] = None,
     ):
         """
         Initialize a channel and process the initial API specification from the file path (if given).
@@ -380,6 +520,9 @@ class HTTPChannel(BaseAsyncChannel):
         :param logger: the logger
         :param ssl_cert_path:  optional path to ssl certificate
         :param ssl_key_path: optional path to ssl key
+        :param max_body_size: the maximum size of a request body, in bytes. None for no limit.
+        :param body_spool_threshold: the size above which request bodies are spooled to a file, in bytes. None to never spool.
+        :param body_spool_dir: the directory of the spool files, the system temporary directory if None.
         """
         super().__init__(address=address, connection_id=connection_id)
         self.host = host
@@ -387,6 +530,9 @@ class HTTPChannel(BaseAsyncChannel):
         self.ssl_cert_path = ssl_cert_path
         self.ssl_key_path = ssl_key_path
         self.target_skill_id = target_skill_id
+        self.max_body_size = max_body_size
+        self.body_spool_threshold = body_spool_threshold
+        self.body_spool_dir = body_spool_dir
         if self.ssl_cert_path and self.ssl_key_path:
             self.server_address = "https://{}:{}".format(self.host, self.port)
         else:
@@ -427,15 +573,35 @@ class HTTPChannel(BaseAsyncChannel):
                     "Failed to start server on {}:{}.".format(self.host, self.port)
                 )
 
-    async def _http_handler(self, http_request: BaseRequest) -> Response:
+    async def _http_handler(self, http_request: BaseRequest) -> web.StreamResponse:
         """
         Verify the request then send the request to Agent as an envelope.
 
+        The file the body is spooled to, if any, is removed unless a skill responded to the request.
+
         :param http_request: the request object
 
         :return: a tuple of response code and response description
         """
-        request = await Request.create(http_request)
+        request = await Request.create(
+            http_request,
+            self.max_body_size,
+            self.body_spool_threshold,
+            self.body_spool_dir,
+        )
+        try:
+            return await self._handle_request(request)
+        finally:
+            request.remove_body_file()
+
+    async def _handle_request(self, request: Request) -> web.StreamResponse:
+        """
+        Verify the request then send the request to Agent as an envelope.
+
+        :param request: the request
+
+        :return: the response
+        """
         if self._in_queue is None:  # pragma: nocover
             raise ValueError("Channel not connected!")
 
@@ -461,6 +627,8 @@ class HTTPChannel(BaseAsyncChannel):
                 self.pending_requests[request.id],
                 timeout=self.timeout_window,
             )
+            # a skill handled the request, it owns the body file
+            request.release_body_file()
             return Response.from_message(response_message)
 
         except asyncio.TimeoutError:
@@ -567,6 +735,16 @@ class HTTPServerConnection(Connection):
 
         if bool(ssl_cert_path) != bool(ssl_key_path):  # pragma: nocover
             raise ValueError("Please specify both ssl_cert and ssl_key or neither.")
+        max_body_size = cast(
+            Optional[int],
+            self.configuration.config.get("max_body_size", DEFAULT_MAX_BODY_SIZE),
+        )
+        body_spool_threshold = cast(
+            Optional[int], self.configuration.config.get("body_spool_threshold")
+        )
+        body_spool_dir = cast(
+            Optional[str], self.configuration.config.get("body_spool_dir")
+        )
 
         self.channel = HTTPChannel(
             self.address,
@@ -578,6 +756,9 @@ class HTTPServerConnection(Connection):
             logger=self.logger,
             ssl_cert_path=ssl_cert_path,
             ssl_key_path=ssl_key_path,
+            max_body_size=max_body_size,
+            body_spool_threshold=body_spool_threshold,
+            body_spool_dir=body_spool_dir,
         )
 
     async def connect(self) -> None:
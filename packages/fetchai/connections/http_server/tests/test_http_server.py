@@ -21,9 +21,11 @@
 # pylint: skip-file
 
 import asyncio
+import email
 import logging
 import os
 import ssl
+import tempfile
 from pathlib import Path
 from traceback import print_exc
 from typing import Tuple, cast
@@ -43,6 +45,7 @@ from aea.test_tools.network import get_host, get_unused_tcp_port
 
 from packages.fetchai.connections.http_server.connection import (
     APISpec,
+    BODY_FILE_HEADER,
     HTTPServerConnection,
     Response,
 )
@@ -484,6 +487,151 @@ class TestHTTPServer:
         self.http_connection.channel.timeout_window = self.original_timeout
 
 
+class TestHTTPServerBodyStreaming:
+    """Tests the streaming of large bodies by the HTTPServer connection."""
+
+    def setup(self):
+        """Initialise the test case."""
+        self.identity = Identity("name", address="my_key", public_key="my_public_key")
+        self.host = get_host()
+        self.port = get_unused_tcp_port()
+        self.target_skill_id = "some_author/some_skill:0.1.0"
+        self.spool_dir = tempfile.TemporaryDirectory()
+        self.configuration = ConnectionConfig(
+            host=self.host,
+            port=self.port,
+            target_skill_id=self.target_skill_id,
+            api_spec_path=None,
+            max_body_size=1000,
+            body_spool_threshold=10,
+            body_spool_dir=self.spool_dir.name,
+            connection_id=HTTPServerConnection.connection_id,
+            restricted_to_protocols={HttpMessage.protocol_id},
+        )
+        self.http_connection = HTTPServerConnection(
+            configuration=self.configuration,
+            data_dir=MagicMock(),
+            identity=self.identity,
+        )
+        self.loop = asyncio.get_event_loop()
+        self.loop.run_until_complete(self.http_connection.connect())
+        self._dialogues = HttpDialogues(self.target_skill_id)
+
+    async def request(self, method: str, path: str, **kwargs) -> Tuple[int, bytes]:
+        """Make a http request, and get the status and the body of the response."""
+        url = f"http://{self.host}:{self.port}{path}"
+        async with aiohttp.ClientSession() as session:
+            async with session.request(method, url, **kwargs) as resp:
+                return resp.status, await resp.read()
+
+    async def _receive(self) -> Tuple[HttpMessage, HttpDialogue, dict]:
+        """Receive a request, and get its message, dialogue and headers."""
+        envelope = await asyncio.wait_for(self.http_connection.receive(), timeout=20)
+        message = cast(HttpMessage, envelope.message)
+        dialogue = cast(HttpDialogue, self._dialogues.update(message))
+        headers = dict(email.message_from_string(message.headers).items())
+        return message, dialogue, headers
+
+    async def _reply(
+        self, message: HttpMessage, dialogue: HttpDialogue, headers: str, body: bytes
+    ) -> None:
+        """Reply to a request."""
+        response = dialogue.reply(
+            target_message=message,
+            performative=HttpMessage.Performative.RESPONSE,
+            version=message.version,
+            status_code=200,
+            status_text="Success",
+            headers=headers,
+            body=body,
+        )
+        await self.http_connection.send(
+            Envelope(to=response.to, sender=response.sender, message=response)
+        )
+
+    @pytest.mark.asyncio
+    async def test_spooled_request_and_streamed_response(self):
+        """Test a large request body is spooled and a response body is streamed from a file."""
+        request_body = os.urandom(500)
+        response_body = os.urandom(300000)
+        response_file = os.path.join(self.spool_dir.name, "response")
+        Path(response_file).write_bytes(response_body)
+
+        request_task = self.loop.create_task(
+            self.request("post", "/pets", data=request_body)
+        )
+        message, dialogue, headers = await self._receive()
+        assert message.body == b""
+        assert Path(headers[BODY_FILE_HEADER]).read_bytes() == request_body
+
+        await self._reply(
+            message, dialogue, f"{BODY_FILE_HEADER}: {response_file}", b""
+        )
+        status, body = await asyncio.wait_for(request_task, timeout=20)
+        assert status == 200
+        assert body == response_body
+
+    @pytest.mark.asyncio
+    async def test_small_request_not_spooled(self):
+        """Test a small request body is kept in the message, and the client cannot set the body file header."""
+        request_task = self.loop.create_task(
+            self.request(
+                "post",
+                "/pets",
+                data=b"small",
+                headers={BODY_FILE_HEADER: "/etc/passwd"},
+            )
+        )
+        message, dialogue, headers = await self._receive()
+        assert message.body == b"small"
+        assert BODY_FILE_HEADER not in headers
+        await self._reply(message, dialogue, "", b"Response body")
+        status, body = await asyncio.wait_for(request_task, timeout=20)
+        assert status == 200 and body == b"Response body"
+
+    @pytest.mark.asyncio
+    async def test_request_too_large(self):
+        """Test a request body above the maximum size is rejected."""
+        status, _ = await self.request("post", "/pets", data=os.urandom(2000))
+        assert status == 413
+
+        async def chunks():
+            for _ in range(20):
+                yield os.urandom(100)
+
+        status, _ = await self.request("post", "/pets", data=chunks())
+        assert status == 413
+        assert os.listdir(self.spool_dir.name) == []
+
+    @pytest.mark.asyncio
+    async def test_spooled_request_not_found(self):
+        """Test the spooled body of a request not valid is removed."""
+        with patch.object(
+            self.http_connection.channel.api_spec, "verify", return_value=False
+        ):
+            status, _ = await self.request("post", "/pets", data=os.urandom(500))
+        assert status == 404
+        assert os.listdir(self.spool_dir.name) == []
+
+    @pytest.mark.asyncio
+    async def test_spooled_request_timeout(self):
+        """Test the spooled body of a request not responded to in time is removed."""
+        self.http_connection.channel.timeout_window = 0.5
+        request_task = self.loop.create_task(
+            self.request("post", "/pets", data=os.urandom(500))
+        )
+        _, _, headers = await self._receive()
+        assert os.path.exists(headers[BODY_FILE_HEADER])
+        status, _ = await asyncio.wait_for(request_task, timeout=20)
+        assert status == 408
+        assert os.listdir(self.spool_dir.name) == []
+
+    def teardown(self):
+        """Teardown the test case."""
+        self.loop.run_until_complete(self.http_connection.disconnect())
+        self.spool_dir.cleanup()
+
+
 def test_bad_api_spec():
     """Test error on apispec file is invalid."""
     with pytest.raises(FileNotFoundError):
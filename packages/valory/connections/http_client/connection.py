@@ -21,12 +21,16 @@
 import asyncio
 import email
 import logging
+import os
 import ssl
+import tempfile
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.tasks import Task
+from contextlib import ExitStack
 from traceback import format_exc
-from typing import Any, Optional, Set, Tuple, Union, cast
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Set, Tuple, Union, cast
 
 import aiohttp
 import certifi  # pylint: disable=wrong-import-order
@@ -54,6 +58,15 @@ REQUEST_TIMEOUT = 408
 SERVER_ERROR = 500
 PUBLIC_ID = PublicId.from_str("valory/http_client:0.23.0")
 
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_DNS_CACHE_TTL = 10
+DEFAULT_MAX_CONCURRENT_REQUESTS = 100
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# header holding the path of the file a body is spooled to, in place of the body
+BODY_FILE_HEADER = "X-Aea-Body-File"
+
 _default_logger = logging.getLogger("aea.packages.valory.connections.http_client")
 
 RequestId = str
@@ -75,6 +88,78 @@ def headers_to_string(headers: CIMultiDictProxy) -> str:
     return msg.as_string()
 
 
+# pop_body_file and read_body are also defined by the fetchai/http_server connection:
+# packages are fetched independently, so they cannot import each other,
+# and the client rejects oversized bodies with a ValueError instead of an HTTP error.
+def pop_body_file(headers: Optional[dict]) -> Optional[str]:
+    """
+    Pop the path of the file holding the body from the headers.
+
+    :param headers: the headers.
+    :return: the path, or None if the body is not in a file.
+    """
+    for name in list(headers or {}):
+        if name.lower() == BODY_FILE_HEADER.lower():
+            return cast(dict, headers).pop(name)
+    return None
+
+
+async def read_body(
+    stream: aiohttp.StreamReader,
+    content_length: Optional[int],
+    max_body_size: Optional[int] = None,
+    spool_threshold: Optional[int] = None,
+    spool_dir: Optional[str] = None,
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Read a body in chunks, spooling it to a temporary file once it exceeds the threshold.
+
+    The stream is only read as fast as the body is stored, so a slow consumer slows down the sender.
+
+    :param stream: the stream of the body.
+    :param content_length: the announced length of the body, if any.
+    :param max_body_size: the maximum size of the body, in bytes. None for no limit.
+    :param spool_threshold: the size above which the body is spooled, in bytes. None to never spool.
+    :param spool_dir: the directory of the spool files, the system temporary directory if None.
+    :return: the body, and the path of the file it was spooled to if any, in which case the body is empty.
+    """
+    if max_body_size is not None and (content_length or 0) > max_body_size:
+        raise ValueError(
+            f"Body of {content_length} bytes exceeds the maximum body size of {max_body_size} bytes."
+        )
+    body = bytearray()
+    size = 0
+    spool = None
+    try:
+        async for chunk in stream.iter_chunked(DEFAULT_CHUNK_SIZE):
+            size += len(chunk)
+            if max_body_size is not None and size > max_body_size:
+                raise ValueError(
+                    f"Body exceeds the maximum body size of {max_body_size} bytes."
+                )
+            if spool is not None:
+                spool.write(chunk)
+                continue
+            body += chunk
+            if spool_threshold is not None and size > spool_threshold:
+                spool = (
+                    tempfile.NamedTemporaryFile(  # pylint: disable=consider-using-with
+                        dir=spool_dir, prefix="http_body_", delete=False
+                    )
+                )
+                spool.write(body)
+                body = bytearray()
+    except BaseException:
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+        raise
+    if spool is None:
+        return bytes(body), None
+    spool.close()
+    return b"", spool.name
+
+
 HttpDialogue = BaseHttpDialogue
 
 
@@ -118,6 +203,14 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
         address: str,
         port: int,
         connection_id: PublicId,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        max_body_size: Optional[int] = None,
+        body_spool_threshold: Optional[int] = None,
+        body_spool_dir: Optional[str] = None,
     ):
         """
         Initialize an http client channel.
@@ -126,12 +219,44 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
         :param address: server hostname / IP address
         :param port: server port number
         :param connection_id: the id of the connection
+        :param connection_limit: the maximum number of open connections, 0 for no limit.
+        :param connection_limit_per_host: the maximum number of open connections to the same host, 0 for no limit.
+        :param keepalive_timeout: the time idle connections are kept open for reuse, in seconds.
+        :param dns_cache_ttl: the time DNS resolutions are cached for, in seconds. None disables the cache.
+        :param max_concurrent_requests: the maximum number of requests in flight, the others wait in turn.
+        :param max_body_size: the maximum size of a response body, in bytes. None for no limit.
+        :param body_spool_threshold: the size above which response bodies are spooled to a file, in bytes. None to never spool.
+        :param body_spool_dir: the directory of the spool files, the system temporary directory if None.
         """
+        enforce(connection_limit >= 0, "Connection limit must not be negative.")
+        enforce(
+            connection_limit_per_host >= 0,
+            "Connection limit per host must not be negative.",
+        )
+        enforce(
+            max_concurrent_requests > 0, "Max concurrent requests must be positive."
+        )
         self.agent_address = agent_address
         self.address = address
         self.port = port
         self.connection_id = connection_id
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_body_size = max_body_size
+        self.body_spool_threshold = body_spool_threshold
+        self.body_spool_dir = body_spool_dir
         self._dialogues = HttpDialogues()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._requests = 0
+        self._failed_requests = 0
+        self._in_flight = 0
+        self._queued = 0
+        self._connections_created = 0
+        self._connections_reused = 0
 
         self._in_queue = None  # type: Optional[asyncio.Queue]  # pragma: no cover
         self._loop = (
@@ -151,8 +276,53 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
         """
         self._loop = loop
         self._in_queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self._session = self._make_session()
         self.is_stopped = False
 
+    def _make_session(self) -> aiohttp.ClientSession:
+        """
+        Make the session shared by the requests, pooling the connections.
+
+        :return: the session.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.dns_cache_ttl is not None,
+            ttl_dns_cache=self.dns_cache_ttl,
+            ssl=ssl_context,
+        )
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+    async def _on_connection_create_end(  # pylint: disable=unused-argument
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count a new connection."""
+        self._connections_created += 1
+
+    async def _on_connection_reuseconn(  # pylint: disable=unused-argument
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count a reused connection."""
+        self._connections_reused += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the request and connection statistics."""
+        return {
+            "requests": self._requests,
+            "failed_requests": self._failed_requests,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+        }
+
     def _get_message_and_dialogue(
         self, envelope: Envelope
     ) -> Tuple[HttpMessage, Optional[HttpDialogue]]:
@@ -173,7 +343,7 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
 
         :param request_envelope: request envelope
         """
-        if not self._loop:  # pragma: nocover
+        if not self._loop or not self._semaphore:  # pragma: nocover
             raise ValueError("Channel is not connected")
 
         request_http_message, dialogue = self._get_message_and_dialogue(
@@ -186,22 +356,32 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
             )
             return
 
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self._in_flight += 1
+        self._requests += 1
         try:
-            resp = await asyncio.wait_for(
+            resp, body, body_file = await asyncio.wait_for(
                 self._perform_http_request(request_http_message),
                 timeout=self.DEFAULT_TIMEOUT,
             )
+            headers = CIMultiDict(resp.headers)
+            headers.popall(BODY_FILE_HEADER, None)
+            if body_file is not None:
+                headers[BODY_FILE_HEADER] = body_file
             envelope = self.to_envelope(
                 request_http_message,
                 status_code=resp.status,
-                headers=resp.headers,
+                headers=CIMultiDictProxy(headers),
                 status_text=resp.reason,
-                body=resp._body  # pylint: disable=protected-access
-                if resp._body is not None  # pylint: disable=protected-access
-                else b"",
+                body=body,
                 dialogue=dialogue,
             )
         except Exception:  # pylint: disable=broad-except
+            self._failed_requests += 1
             envelope = self.to_envelope(
                 request_http_message,
                 status_code=self.DEFAULT_EXCEPTION_CODE,
@@ -210,20 +390,27 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
                 body=format_exc().encode("utf-8"),
                 dialogue=dialogue,
             )
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
 
         if self._in_queue is not None:
             await self._in_queue.put(envelope)
 
     async def _perform_http_request(
         self, request_http_message: HttpMessage
-    ) -> ClientResponse:
+    ) -> Tuple[ClientResponse, bytes, Optional[str]]:
         """
         Perform http request and return response.
 
+        The request body is streamed from the file in the body file header, if any.
+
         :param request_http_message: HttpMessage with http request constructed.
 
-        :return: aiohttp.ClientResponse
+        :return: aiohttp.ClientResponse, its body and the path of the file the body was spooled to, if any.
         """
+        if self._session is None:  # pragma: nocover
+            raise ValueError("Channel is not connected")
         try:
             if request_http_message.is_set("headers") and request_http_message.headers:
                 headers: Optional[dict] = dict(
@@ -231,22 +418,44 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
                 )
             else:
                 headers = None
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
+            request_body_file = pop_body_file(headers)
+            with ExitStack() as stack:
+                data: Any = request_http_message.body
+                if request_body_file is not None:
+                    data = stack.enter_context(open(request_body_file, "rb"))
+                async with self._session.request(
                     method=request_http_message.method,
                     url=request_http_message.url,
                     headers=headers,
-                    data=request_http_message.body,
-                    ssl=ssl_context,
+                    data=data,
                 ) as resp:
-                    await resp.read()
-                return resp
+                    body, body_file = await self._read_body(resp)
+            return resp, body, body_file
         except Exception as e:  # pragma: nocover # pylint: disable=broad-except
             self.logger.debug(
                 f"Exception raised during http call: {request_http_message.method} {request_http_message.url}, {e}"
             )
             raise
 
+    async def _read_body(self, resp: ClientResponse) -> Tuple[bytes, Optional[str]]:
+        """
+        Read the body of a response, streaming it if it is bounded or spooled.
+
+        :param resp: the response.
+        :return: the body, and the path of the file it was spooled to, if any.
+        """
+        if self.max_body_size is None and self.body_spool_threshold is None:
+            await resp.read()
+            body = resp._body  # pylint: disable=protected-access
+            return body if body is not None else b"", None
+        return await read_body(
+            resp.content,
+            resp.content_length,
+            self.max_body_size,
+            self.body_spool_threshold,
+            self.body_spool_dir,
+        )
+
     def send(self, request_envelope: Envelope) -> None:
         """
         Send an envelope with http request data to request.
@@ -368,6 +577,9 @@ class HTTPClientAsyncChannel:  # pylint: disable=too-many-instance-attributes
             self.is_stopped = True
 
             await self._cancel_tasks()
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
 
 
 class HTTPClientConnection(Connection):
@@ -386,11 +598,26 @@ class HTTPClientConnection(Connection):
         port = cast(int, self.configuration.config.get("port"))
         if host is None or port is None:  # pragma: nocover
             raise ValueError("host and port must be set!")
+        config = self.configuration.config
         self.channel = HTTPClientAsyncChannel(
             self.address,
             host,
             port,
             connection_id=self.connection_id,
+            connection_limit=config.get("connection_limit", DEFAULT_CONNECTION_LIMIT),
+            connection_limit_per_host=config.get(
+                "connection_limit_per_host", DEFAULT_CONNECTION_LIMIT_PER_HOST
+            ),
+            keepalive_timeout=config.get(
+                "keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT
+            ),
+            dns_cache_ttl=config.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL),
+            max_concurrent_requests=config.get(
+                "max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS
+            ),
+            max_body_size=config.get("max_body_size"),
+            body_spool_threshold=config.get("body_spool_threshold"),
+            body_spool_dir=config.get("body_spool_dir"),
         )
 
     async def connect(self) -> None:
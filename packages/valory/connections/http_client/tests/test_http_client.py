@@ -21,16 +21,22 @@
 # pylint: skip-file
 
 import asyncio
+import email
 import logging
+import os
+import tempfile
 from asyncio import CancelledError
-from typing import Any, cast
+from pathlib import Path
+from typing import Any, Tuple, cast
 from unittest.mock import MagicMock, Mock, patch
 
 import aiohttp
 import pytest
+from aiohttp import web
 
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig
+from aea.exceptions import AEAEnforceError
 from aea.identity.base import Identity
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
@@ -38,7 +44,10 @@ from aea.test_tools.constants import UNKNOWN_PROTOCOL_PUBLIC_ID
 from aea.test_tools.mocks import AnyStringWith
 from aea.test_tools.network import get_host, get_unused_tcp_port
 
-from packages.valory.connections.http_client.connection import HTTPClientConnection
+from packages.valory.connections.http_client.connection import (
+    BODY_FILE_HEADER,
+    HTTPClientConnection,
+)
 from packages.valory.protocols.http.dialogues import HttpDialogue
 from packages.valory.protocols.http.dialogues import HttpDialogues as BaseHttpDialogues
 from packages.valory.protocols.http.message import HttpMessage
@@ -360,3 +369,263 @@ class TestHTTPClientConnect:
         message = cast(HttpMessage, envelope.message)
         assert message.performative == HttpMessage.Performative.RESPONSE
         assert b"expected exception" in message.body
+
+
+class BaseHTTPClientConnectionTest:
+    """Base class for tests of the http client connection against a server."""
+
+    def setup(self) -> None:
+        """Initialise the class."""
+        self.address = get_host()
+        self.port = get_unused_tcp_port()
+        self.agent_identity = Identity(
+            "name", address="some string", public_key="some public_key"
+        )
+        self.client_skill_id = "some/skill:0.1.0"
+        self.connection_address = str(HTTPClientConnection.connection_id)
+        self.http_dialogs = HttpDialogues(self.client_skill_id)
+
+    def _make_connection(self, **config: Any) -> HTTPClientConnection:
+        """Make a connection."""
+        configuration = ConnectionConfig(
+            host=self.address,
+            port=self.port,
+            connection_id=HTTPClientConnection.connection_id,
+            **config,
+        )
+        return HTTPClientConnection(
+            configuration=configuration,
+            data_dir=MagicMock(),
+            identity=self.agent_identity,
+        )
+
+    def _make_request(
+        self, url: str, method: str = "get", headers: str = ""
+    ) -> Envelope:
+        """Make a request envelope."""
+        request_http_message, _ = self.http_dialogs.create(
+            counterparty=self.connection_address,
+            performative=HttpMessage.Performative.REQUEST,
+            method=method,
+            url=url,
+            headers=headers,
+            version="",
+            body=b"",
+        )
+        return Envelope(
+            to=self.connection_address,
+            sender=self.client_skill_id,
+            message=request_http_message,
+        )
+
+    async def _start_server(self, handler: Any) -> Tuple[web.AppRunner, str]:
+        """Start a server with a handler on the root path, and get its runner and url."""
+        app = web.Application(client_max_size=0)
+        app.router.add_route("*", "/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        server_port = get_unused_tcp_port()
+        await web.TCPSite(runner, self.address, server_port).start()
+        return runner, f"http://{self.address}:{server_port}/"
+
+
+class TestHTTPClientConnectionPool(BaseHTTPClientConnectionTest):
+    """Tests the pooling of the connections of the http client connection."""
+
+    def test_config(self) -> None:
+        """Test the pool is configured from the connection configuration."""
+        connection = self._make_connection(
+            connection_limit=10,
+            connection_limit_per_host=2,
+            keepalive_timeout=5.0,
+            dns_cache_ttl=None,
+            max_concurrent_requests=4,
+        )
+        channel = connection.channel
+        assert channel.connection_limit == 10
+        assert channel.connection_limit_per_host == 2
+        assert channel.keepalive_timeout == 5.0
+        assert channel.dns_cache_ttl is None
+        assert channel.max_concurrent_requests == 4
+
+    def test_bad_config(self) -> None:
+        """Test the validation of the configuration."""
+        with pytest.raises(AEAEnforceError, match="Connection limit"):
+            self._make_connection(connection_limit=-1)
+        with pytest.raises(AEAEnforceError, match="Max concurrent requests"):
+            self._make_connection(max_concurrent_requests=0)
+
+    @pytest.mark.asyncio
+    async def test_session_lifecycle(self) -> None:
+        """Test the session is opened on connect and closed on disconnect."""
+        connection = self._make_connection()
+        await connection.connect()
+        session = connection.channel._session
+        assert session is not None and not session.closed
+        await connection.disconnect()
+        assert session.closed
+        assert connection.channel._session is None
+
+    @pytest.mark.asyncio
+    async def test_connections_reused(self) -> None:
+        """Test subsequent requests to the same server reuse the connection."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.Response(body=b"ok")
+
+        runner, url = await self._start_server(handler)
+        connection = self._make_connection()
+        await connection.connect()
+        try:
+            for _ in range(3):
+                await connection.send(self._make_request(url))
+                envelope = await asyncio.wait_for(connection.receive(), timeout=10)
+                assert envelope is not None
+                message = cast(HttpMessage, envelope.message)
+                assert message.status_code == 200, message.body
+                assert message.body == b"ok"
+        finally:
+            await connection.disconnect()
+            await runner.cleanup()
+
+        stats = connection.channel.stats
+        assert stats["requests"] == 3
+        assert stats["failed_requests"] == 0
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_requests(self) -> None:
+        """Test the requests above the limit wait for their turn."""
+        connection = self._make_connection(max_concurrent_requests=1)
+        await connection.connect()
+
+        response_mock = Mock()
+        response_mock.status = 200
+        response_mock.headers = {}
+        response_mock.reason = "OK"
+        response_mock._body = b"Some content"
+        response_mock.read.return_value = asyncio.Future()
+
+        with patch.object(
+            aiohttp.ClientSession,
+            "request",
+            return_value=_MockRequest(response_mock),
+        ):
+            for _ in range(3):
+                await connection.send(self._make_request("https://not-a-google.com"))
+            await asyncio.sleep(0.1)
+            stats = connection.channel.stats
+            assert stats["in_flight"] == 1
+            assert stats["queued"] == 2
+
+            response_mock.read.return_value.set_result(b"")
+            for _ in range(3):
+                envelope = await asyncio.wait_for(connection.receive(), timeout=10)
+                assert envelope is not None
+
+        stats = connection.channel.stats
+        assert stats["requests"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["queued"] == 0
+        await connection.disconnect()
+
+
+class TestHTTPClientBodyStreaming(BaseHTTPClientConnectionTest):
+    """Tests the streaming of large bodies by the http client connection."""
+
+    def setup(self) -> None:
+        """Initialise the class."""
+        super().setup()
+        self.spool_dir = tempfile.TemporaryDirectory()
+
+    def teardown(self) -> None:
+        """Tear down the class."""
+        self.spool_dir.cleanup()
+
+    async def _get(
+        self, connection: HTTPClientConnection, url: str, headers: str = ""
+    ) -> HttpMessage:
+        """Send a request, and get the response message."""
+        await connection.connect()
+        try:
+            await connection.send(self._make_request(url, "post", headers))
+            envelope = await asyncio.wait_for(connection.receive(), timeout=10)
+        finally:
+            await connection.disconnect()
+        assert envelope is not None
+        return cast(HttpMessage, envelope.message)
+
+    @pytest.mark.asyncio
+    async def test_spooled_response_and_streamed_request(self) -> None:
+        """Test a request body is streamed from a file and a large response body is spooled."""
+        request_body = os.urandom(300000)
+        request_file = os.path.join(self.spool_dir.name, "request")
+        Path(request_file).write_bytes(request_body)
+
+        async def handler(request: web.Request) -> web.Response:
+            assert BODY_FILE_HEADER not in request.headers
+            return web.Response(body=await request.read())
+
+        runner, url = await self._start_server(handler)
+        connection = self._make_connection(
+            body_spool_threshold=1000, body_spool_dir=self.spool_dir.name
+        )
+        try:
+            message = await self._get(
+                connection, url, f"{BODY_FILE_HEADER}: {request_file}"
+            )
+        finally:
+            await runner.cleanup()
+
+        assert message.status_code == 200, message.body
+        assert message.body == b""
+        headers = dict(email.message_from_string(message.headers).items())
+        assert Path(headers[BODY_FILE_HEADER]).read_bytes() == request_body
+
+    @pytest.mark.asyncio
+    async def test_small_response_not_spooled(self) -> None:
+        """Test a small response body is kept in the message, and the server cannot set the body file header."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.Response(body=b"ok", headers={BODY_FILE_HEADER: "/etc/passwd"})
+
+        runner, url = await self._start_server(handler)
+        connection = self._make_connection(
+            body_spool_threshold=1000, body_spool_dir=self.spool_dir.name
+        )
+        try:
+            message = await self._get(connection, url)
+        finally:
+            await runner.cleanup()
+
+        assert message.status_code == 200, message.body
+        assert message.body == b"ok"
+        assert BODY_FILE_HEADER not in message.headers
+        assert os.listdir(self.spool_dir.name) == []
+
+    @pytest.mark.asyncio
+    async def test_response_too_large(self) -> None:
+        """Test a response body above the maximum size fails the request."""
+
+        async def handler(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for _ in range(20):
+                await response.write(os.urandom(1000))
+            return response
+
+        runner, url = await self._start_server(handler)
+        connection = self._make_connection(
+            max_body_size=10000,
+            body_spool_threshold=1000,
+            body_spool_dir=self.spool_dir.name,
+        )
+        try:
+            message = await self._get(connection, url)
+        finally:
+            await runner.cleanup()
+
+        assert message.status_code == 600
+        assert b"exceeds the maximum body size" in message.body
+        assert os.listdir(self.spool_dir.name) == []
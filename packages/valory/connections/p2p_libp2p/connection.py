@@ -25,10 +25,11 @@ import platform
 import subprocess  # nosec
 import sys
 from asyncio import AbstractEventLoop, CancelledError, events
+from collections import deque
 from ipaddress import ip_address
 from pathlib import Path
 from socket import gethostbyname
-from typing import Any, IO, List, Optional, Sequence, cast
+from typing import Any, Deque, IO, List, Optional, Sequence, Tuple, cast
 
 from aea.configurations.base import PublicId
 from aea.configurations.constants import DEFAULT_LEDGER
@@ -67,6 +68,8 @@ LIBP2P_SUCCESS_MESSAGE = "Peer running in "
 
 POR_DEFAULT_SERVICE_ID = "acn"
 
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+
 
 def _ip_all_private_or_all_public(addrs: List[str]) -> bool:
     if len(addrs) == 0:
@@ -124,6 +127,24 @@ def _golang_module_run(
     return proc
 
 
+# the protobuf framing helpers are also defined by the valory/p2p_libp2p_client connection:
+# packages are fetched independently, and must run on the released frameworks.
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _length_delimited_field_header(field_number: int, length: int) -> bytes:
+    """Get the key and the length of a protobuf length delimited field."""
+    key = _encode_varint((field_number << 3) | _WIRE_TYPE_LENGTH_DELIMITED)
+    return key + _encode_varint(length)
+
+
 class NodeClient:
     """Client to communicate with node using ipc channel(pipe)."""
 
@@ -134,6 +155,7 @@ class NodeClient:
         self.pipe = pipe
         self.agent_record = agent_record
         self._wait_status: Optional[asyncio.Future] = None
+        self._pending_statuses: Deque[asyncio.Future] = deque()
 
     async def connect(self) -> bool:
         """Connect to node with pipe."""
@@ -169,15 +191,77 @@ class NodeClient:
         finally:
             self._wait_status = None
 
+    async def write_envelope(self, envelope: Envelope) -> asyncio.Future:
+        """
+        Write an envelope to the node, without waiting for its status.
+
+        The node acknowledges the envelopes in the order it reads them,
+        so the statuses read are matched to the envelopes written in order.
+
+        :param envelope: the envelope.
+        :return: the future of the status of the envelope.
+        """
+        status: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._pending_statuses.append(status)
+        try:
+            await self._write(self.make_acn_envelope_message(envelope))
+        except BaseException:
+            self._pending_statuses.remove(status)
+            raise
+        return status
+
+    async def wait_for_envelope_status(self, status: asyncio.Future) -> None:
+        """
+        Wait for the status of an envelope written, and check it is a success.
+
+        :param status: the future of the status, as returned by write_envelope.
+        """
+        try:
+            body = await asyncio.wait_for(
+                asyncio.shield(status), timeout=self.ACN_ACK_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise ValueError("acn status await timeout!")
+        if body is None:
+            raise ValueError("envelope was not delivered to the node!")
+        if body.code != int(AcnMessage.StatusBody.StatusCode.SUCCESS):  # type: ignore  # pylint: disable=no-member
+            raise ValueError(
+                f"failed to send envelope. got error confirmation: {body.code}"
+            )
+
+    def reset_pending_statuses(self) -> None:
+        """Give up on the statuses of the envelopes written, when the connection to the node is reset."""
+        while self._pending_statuses:
+            status = self._pending_statuses.popleft()
+            if not status.done():
+                status.set_result(None)
+
     @staticmethod
     def make_acn_envelope_message(envelope: Envelope) -> bytes:
-        """Make acn message with envelope in."""
-        acn_msg = acn_pb2.AcnMessage()
-        performative = acn_pb2.AcnMessage.Aea_Envelope_Performative()  # type: ignore
-        performative.envelope = envelope.encode()
-        acn_msg.aea_envelope.CopyFrom(performative)  # pylint: disable=no-member
-        buf = acn_msg.SerializeToString()
-        return buf
+        """
+        Make acn message with envelope in.
+
+        The protobuf fields are written around the encoded envelope,
+        so it is not copied once per nested protobuf message.
+
+        :param envelope: the envelope
+        :return: the encoded acn message
+        """
+        envelope_bytes = envelope.encode()
+        envelope_size = len(envelope_bytes)
+        performative_header = (
+            _length_delimited_field_header(
+                acn_pb2.AcnMessage.Aea_Envelope_Performative.ENVELOPE_FIELD_NUMBER,  # type: ignore
+                envelope_size,
+            )
+            if envelope_size
+            else b""
+        )
+        header = _length_delimited_field_header(
+            acn_pb2.AcnMessage.AEA_ENVELOPE_FIELD_NUMBER,
+            len(performative_header) + envelope_size,
+        )
+        return b"".join([header, performative_header, envelope_bytes])
 
     async def read_envelope(self) -> Optional[Envelope]:
         """Read envelope from the node."""
@@ -217,6 +301,12 @@ class NodeClient:
                     self._wait_status.set_result(
                         acn_msg.status.body  # pylint: disable=no-member
                     )
+                elif self._pending_statuses:
+                    status = self._pending_statuses.popleft()
+                    if not status.done():
+                        status.set_result(
+                            acn_msg.status.body  # pylint: disable=no-member
+                        )
             else:  # pragma: nocover
                 await self.write_acn_status_error(
                     f"Bad acn message {performative}",
@@ -644,6 +734,7 @@ class P2PLibp2pConnection(Connection):
 
     connection_id = PUBLIC_ID
     DEFAULT_MAX_RESTARTS = 5
+    DEFAULT_SEND_WINDOW_SIZE = 1
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a p2p libp2p connection."""
@@ -678,6 +769,13 @@ class P2PLibp2pConnection(Connection):
         node_connection_timeout: Optional[float] = self.configuration.config.get(
             "node_connection_timeout", PIPE_CONN_TIMEOUT
         )
+        send_window_size = cast(
+            int,
+            self.configuration.config.get(
+                "send_window_size", self.DEFAULT_SEND_WINDOW_SIZE
+            ),
+        )
+        enforce(send_window_size > 0, "Send window size must be positive.")
         if (
             self.has_crypto_store
             and self.crypto_store.crypto_objects.get(ledger_id, None) is not None
@@ -794,6 +892,9 @@ class P2PLibp2pConnection(Connection):
 
         self._send_queue: Optional[asyncio.Queue] = None
         self._send_task: Optional[asyncio.Task] = None
+        # envelopes written to the node and not acknowledged yet, in order
+        self._send_window_size = send_window_size
+        self._in_flight: Deque[Tuple[Envelope, asyncio.Future]] = deque()
 
     def _check_node_built(self) -> str:
         """Check node built."""
@@ -820,6 +921,7 @@ class P2PLibp2pConnection(Connection):
             # starting receiving msgs
             self._in_queue = asyncio.Queue()
             self._send_queue = asyncio.Queue()
+            self._in_flight.clear()
             self._receive_from_node_task = asyncio.ensure_future(
                 self._receive_from_node(), loop=self.loop
             )
@@ -924,16 +1026,93 @@ class P2PLibp2pConnection(Connection):
             )
             raise
 
+    async def _write_envelope_in_window(self, envelope: Envelope) -> None:
+        """Write an envelope without waiting for its status, a write failure is handled when its status is awaited."""
+        if not self._node_client:  # pragma: nocover
+            raise ValueError(f"Node client not set! Can not send envelope: {envelope}")
+
+        try:
+            status = await self._node_client.write_envelope(envelope)
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise  # pragma: nocover
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(f"Failed to write envelope. Exception: {e}.")
+            status = self.loop.create_future()
+            status.set_result(None)
+        self._in_flight.append((envelope, status))
+
+    async def _write_in_flight_again(self, restart: bool) -> None:
+        """Recover the connection to the node, then write the envelopes in flight again, in order."""
+        if not self._node_client:  # pragma: nocover
+            raise ValueError("Node client not set!")
+
+        self._node_client.reset_pending_statuses()
+        if restart or not self.node.is_proccess_running():
+            await self._restart_node()
+        else:
+            try:
+                await cast(IPCChannel, self.node.pipe).connect()
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.exception(f"Failed to reconnect pipe. Exception: {e}.")
+                return
+
+        in_flight = list(self._in_flight)
+        self._in_flight.clear()
+        for envelope, _ in in_flight:
+            await self._write_envelope_in_window(envelope)
+
+    async def _ack_oldest_envelope(self) -> None:
+        """
+        Wait for the status of the oldest envelope in flight.
+
+        On failure, the connection to the node is recovered as when sending envelopes one at a time,
+        first reconnecting the pipe then restarting the node, and the envelopes in flight are written again.
+        """
+        if not self._node_client:  # pragma: nocover
+            raise ValueError("Node client not set!")
+
+        for restart in (False, True):
+            try:
+                await self._node_client.wait_for_envelope_status(self._in_flight[0][1])
+                self._in_flight.popleft()
+                return
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.exception(
+                    f"Failed to send. Exception: {e}. Try recover connection to node and send the {len(self._in_flight)} envelopes in flight again."
+                )
+            await self._write_in_flight_again(restart)
+
+        await self._node_client.wait_for_envelope_status(self._in_flight[0][1])
+        self._in_flight.popleft()
+
     async def _send_loop(self) -> None:
-        """Handle message in  the send queue."""
+        """
+        Handle message in  the send queue.
+
+        Up to send window size envelopes are written to the node before their statuses are awaited, in order.
+        """
 
         if not self._send_queue or not self._node_client:  # pragma: nocover
             self.logger.error("Send loop not started cause not connected properly.")
             return
         try:
             while self.is_connected:
-                envelope = await self._send_queue.get()
-                await self._send_envelope_with_node_client(envelope)
+                if self._send_window_size == 1:
+                    envelope = await self._send_queue.get()
+                    await self._send_envelope_with_node_client(envelope)
+                elif self._in_flight and (
+                    len(self._in_flight) >= self._send_window_size
+                    or self._send_queue.empty()
+                ):
+                    envelope = self._in_flight[0][0]
+                    await self._ack_oldest_envelope()
+                else:
+                    envelope = await self._send_queue.get()
+                    await self._write_envelope_in_window(envelope)
         except asyncio.CancelledError:  # pylint: disable=try-except-raise
             raise  # pragma: nocover
         except Exception:  # pylint: disable=broad-except # pragma: nocover
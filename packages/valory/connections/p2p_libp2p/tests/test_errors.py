@@ -22,11 +22,16 @@
 
 import asyncio
 from asyncio.futures import Future
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 
-from packages.valory.connections.p2p_libp2p.connection import Libp2pNode
+from aea.configurations.base import PublicId
+from aea.mail.base import Envelope
+
+from packages.valory.connections.p2p_libp2p.connection import Libp2pNode, NodeClient
+from packages.valory.protocols.acn import acn_pb2
 from packages.valory.protocols.acn.message import AcnMessage
 
 
@@ -127,3 +132,90 @@ async def test_write_acn_error() -> None:
         await node_client.write_acn_status_error("some error")
 
     write_mock.assert_called_once()
+
+
+def _make_status_message(status_code: AcnMessage.StatusBody.StatusCode) -> bytes:
+    """Make an ACN status message."""
+    acn_msg = acn_pb2.AcnMessage()
+    performative = acn_pb2.AcnMessage.Status_Performative()  # type: ignore
+    status = AcnMessage.StatusBody(status_code=status_code, msgs=[])
+    AcnMessage.StatusBody.encode(performative.body, status)
+    acn_msg.status.CopyFrom(performative)
+    return acn_msg.SerializeToString()
+
+
+@pytest.mark.asyncio
+async def test_write_envelopes_statuses_in_order() -> None:
+    """Test the statuses read are matched to the envelopes written in order."""
+
+    node = Libp2pNode(Mock(), Mock(), "tmp", "tmp")
+    node.pipe = Mock()
+    node_client = node.get_client()
+    node_client.ACN_ACK_TIMEOUT = 0.5
+    messages = [
+        _make_status_message(AcnMessage.StatusBody.StatusCode.SUCCESS),
+        _make_status_message(AcnMessage.StatusBody.StatusCode.ERROR_GENERIC),
+        None,
+    ]
+
+    async def read() -> Any:
+        return messages.pop(0)
+
+    with patch.object(
+        node_client, "make_acn_envelope_message", return_value=b"some_data"
+    ), patch.object(node_client, "_write") as write_mock, patch.object(
+        node_client, "_read", read
+    ):
+        statuses = [await node_client.write_envelope(Mock()) for _ in range(3)]
+        assert write_mock.call_count == 3
+        assert not any(status.done() for status in statuses)
+
+        assert await node_client.read_envelope() is None
+        await node_client.wait_for_envelope_status(statuses[0])
+        with pytest.raises(ValueError, match="got error confirmation"):
+            await node_client.wait_for_envelope_status(statuses[1])
+        with pytest.raises(ValueError, match="acn status await timeout!"):
+            await node_client.wait_for_envelope_status(statuses[2])
+
+        node_client.reset_pending_statuses()
+        with pytest.raises(ValueError, match="envelope was not delivered"):
+            await node_client.wait_for_envelope_status(statuses[2])
+
+
+@pytest.mark.asyncio
+async def test_write_envelope_failed() -> None:
+    """Test no status is awaited for an envelope which failed to be written."""
+
+    node = Libp2pNode(Mock(), Mock(), "tmp", "tmp")
+    node.pipe = Mock()
+    node_client = node.get_client()
+    with patch.object(
+        node_client, "make_acn_envelope_message", return_value=b"some_data"
+    ), patch.object(
+        node_client, "_write", side_effect=ConnectionError("expected")
+    ), pytest.raises(
+        ConnectionError, match="expected"
+    ):
+        await node_client.write_envelope(Mock())
+    assert not node_client._pending_statuses
+
+
+@pytest.mark.parametrize("message", [b"", b"message", b"m" * 100000])
+def test_make_acn_envelope_message(message: bytes) -> None:
+    """Test the acn envelope message is the one protobuf encodes."""
+    envelope = Envelope(
+        to="to",
+        sender="sender",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+        message=message,
+    )
+    acn_msg = acn_pb2.AcnMessage()
+    performative = acn_pb2.AcnMessage.Aea_Envelope_Performative()  # type: ignore
+    performative.envelope = envelope.encode()
+    acn_msg.aea_envelope.CopyFrom(performative)  # pylint: disable=no-member
+
+    buf = NodeClient.make_acn_envelope_message(envelope)
+    assert buf == acn_msg.SerializeToString()
+    decoded = acn_pb2.AcnMessage()
+    decoded.ParseFromString(buf)
+    assert Envelope.decode(decoded.aea_envelope.envelope) == envelope
@@ -28,8 +28,9 @@ import ssl
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.streams import StreamWriter
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from asn1crypto import x509  # type: ignore
 from ecdsa.curves import SECP256k1  # type: ignore
@@ -66,9 +67,29 @@ SUPPORTED_LEDGER_IDS = ["fetchai", "cosmos", "ethereum"]
 
 POR_DEFAULT_SERVICE_ID = "acn"
 
+_WIRE_TYPE_LENGTH_DELIMITED = 2
+
 ACN_CURRENT_VERSION = "0.1.0"
 
 
+# the protobuf framing helpers are also defined by the valory/p2p_libp2p connection:
+# packages are fetched independently, and must run on the released frameworks.
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _length_delimited_field_header(field_number: int, length: int) -> bytes:
+    """Get the key and the length of a protobuf length delimited field."""
+    key = _encode_varint((field_number << 3) | _WIRE_TYPE_LENGTH_DELIMITED)
+    return key + _encode_varint(length)
+
+
 class NodeClient:
     """Client to communicate with node using ipc channel(pipe)."""
 
@@ -78,6 +99,7 @@ class NodeClient:
         """Set node client with pipe."""
         self.pipe = pipe
         self._wait_status: Optional[asyncio.Future] = None
+        self._pending_statuses: Deque[asyncio.Future] = deque()
         self.agent_record = node_por
 
     async def wait_for_status(self) -> Any:
@@ -88,13 +110,30 @@ class NodeClient:
 
     @staticmethod
     def make_acn_envelope_message(envelope: Envelope) -> bytes:
-        """Make acn message with envelope in."""
-        acn_msg = acn_pb2.AcnMessage()
-        performative = acn_pb2.AcnMessage.Aea_Envelope_Performative()  # type: ignore
-        performative.envelope = envelope.encode()
-        acn_msg.aea_envelope.CopyFrom(performative)  # pylint: disable=no-member
-        buf = acn_msg.SerializeToString()
-        return buf
+        """
+        Make acn message with envelope in.
+
+        The protobuf fields are written around the encoded envelope,
+        so it is not copied once per nested protobuf message.
+
+        :param envelope: the envelope
+        :return: the encoded acn message
+        """
+        envelope_bytes = envelope.encode()
+        envelope_size = len(envelope_bytes)
+        performative_header = (
+            _length_delimited_field_header(
+                acn_pb2.AcnMessage.Aea_Envelope_Performative.ENVELOPE_FIELD_NUMBER,  # type: ignore
+                envelope_size,
+            )
+            if envelope_size
+            else b""
+        )
+        header = _length_delimited_field_header(
+            acn_pb2.AcnMessage.AEA_ENVELOPE_FIELD_NUMBER,
+            len(performative_header) + envelope_size,
+        )
+        return b"".join([header, performative_header, envelope_bytes])
 
     async def write_acn_status_ok(self) -> None:
         """Send acn status ok."""
@@ -151,6 +190,51 @@ class NodeClient:
         finally:
             self._wait_status = None
 
+    async def write_envelope(self, envelope: Envelope) -> asyncio.Future:
+        """
+        Write an envelope to the node, without waiting for its status.
+
+        The node acknowledges the envelopes in the order it reads them,
+        so the statuses read are matched to the envelopes written in order.
+
+        :param envelope: the envelope.
+        :return: the future of the status of the envelope.
+        """
+        status: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._pending_statuses.append(status)
+        try:
+            await self._write(self.make_acn_envelope_message(envelope))
+        except BaseException:
+            self._pending_statuses.remove(status)
+            raise
+        return status
+
+    async def wait_for_envelope_status(self, status: asyncio.Future) -> None:
+        """
+        Wait for the status of an envelope written, and check it is a success.
+
+        :param status: the future of the status, as returned by write_envelope.
+        """
+        try:
+            body = await asyncio.wait_for(
+                asyncio.shield(status), timeout=self.ACN_ACK_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise ValueError("acn status await timeout!")
+        if body is None:
+            raise ValueError("envelope was not delivered to the node!")
+        if body.code != int(AcnMessage.StatusBody.StatusCode.SUCCESS):  # type: ignore  # pylint: disable=no-member
+            raise ValueError(
+                f"failed to send envelope. got error confirmation: {body.code}"
+            )
+
+    def reset_pending_statuses(self) -> None:
+        """Give up on the statuses of the envelopes written, when the connection to the node is reset."""
+        while self._pending_statuses:
+            status = self._pending_statuses.popleft()
+            if not status.done():
+                status.set_result(None)
+
     def make_agent_record(self) -> AcnMessage.AgentRecord:  # type: ignore
         """Make acn agent record."""
         agent_record = AcnMessage.AgentRecord(
@@ -201,6 +285,12 @@ class NodeClient:
                     self._wait_status.set_result(
                         acn_msg.status.body  # pylint: disable=no-member
                     )
+                elif self._pending_statuses:
+                    status = self._pending_statuses.popleft()
+                    if not status.done():
+                        status.set_result(
+                            acn_msg.status.body  # pylint: disable=no-member
+                        )
             else:  # pragma: nocover
                 await self.write_acn_status_error(
                     f"Bad acn message {performative}",
@@ -280,6 +370,7 @@ class P2PLibp2pClientConnection(Connection):
 
     DEFAULT_CONNECT_RETRIES = 3
     DEFAULT_TLS_CONNECTION_SIGNATURE_TIMEOUT = 5.0
+    DEFAULT_SEND_WINDOW_SIZE = 1
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a libp2p client connection."""
@@ -292,6 +383,10 @@ class P2PLibp2pClientConnection(Connection):
         self.connect_retries = self.configuration.config.get(
             "connect_retries", self.DEFAULT_CONNECT_RETRIES
         )
+        self.send_window_size = self.configuration.config.get(
+            "send_window_size", self.DEFAULT_SEND_WINDOW_SIZE
+        )
+        enforce(self.send_window_size > 0, "Send window size must be positive.")
         ledger_id = self.configuration.config.get("ledger_id", DEFAULT_LEDGER)
         if ledger_id not in SUPPORTED_LEDGER_IDS:
             raise ValueError(  # pragma: nocover
@@ -367,17 +462,33 @@ class P2PLibp2pClientConnection(Connection):
 
         self._send_queue: Optional[asyncio.Queue] = None
         self._send_task: Optional[asyncio.Task] = None
+        # envelopes written to the node and not acknowledged yet, in order
+        self._in_flight: Deque[Tuple[Envelope, asyncio.Future]] = deque()
 
     async def _send_loop(self) -> None:
-        """Handle message in  the send queue."""
+        """
+        Handle message in  the send queue.
+
+        Up to send window size envelopes are written to the node before their statuses are awaited, in order.
+        """
 
         if not self._send_queue or not self._node_client:  # pragma: nocover
             self.logger.error("Send loop not started cause not connected properly.")
             return
         try:
             while self.is_connected:
-                envelope = await self._send_queue.get()
-                await self._send_envelope_with_node_client(envelope)
+                if self.send_window_size == 1:
+                    envelope = await self._send_queue.get()
+                    await self._send_envelope_with_node_client(envelope)
+                elif self._in_flight and (
+                    len(self._in_flight) >= self.send_window_size
+                    or self._send_queue.empty()
+                ):
+                    envelope = self._in_flight[0][0]
+                    await self._ack_oldest_envelope()
+                else:
+                    envelope = await self._send_queue.get()
+                    await self._write_envelope_in_window(envelope)
         except asyncio.CancelledError:  # pylint: disable=try-except-raise
             raise  # pragma: nocover
         except Exception:  # pylint: disable=broad-except # pragma: nocover
@@ -401,6 +512,50 @@ class P2PLibp2pClientConnection(Connection):
             await self._perform_connection_to_node()
             await self._node_client.send_envelope(envelope)
 
+    async def _write_envelope_in_window(self, envelope: Envelope) -> None:
+        """Write an envelope without waiting for its status, a write failure is handled when its status is awaited."""
+        if not self._node_client:  # pragma: nocover
+            raise ValueError("Connection not connected to node!")
+
+        self._ensure_valid_envelope_for_external_comms(envelope)
+        try:
+            status = await self._node_client.write_envelope(envelope)
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise  # pragma: nocover
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.warning(f"Failed to write envelope. Exception: {e}.")
+            status = self.loop.create_future()
+            status.set_result(None)
+        self._in_flight.append((envelope, status))
+
+    async def _ack_oldest_envelope(self) -> None:
+        """
+        Wait for the status of the oldest envelope in flight.
+
+        On failure, the connection to the node is performed again as when sending envelopes one at a time,
+        and the envelopes in flight are written again, in order.
+        """
+        if not self._node_client:  # pragma: nocover
+            raise ValueError("Connection not connected to node!")
+
+        try:
+            await self._node_client.wait_for_envelope_status(self._in_flight[0][1])
+            self._in_flight.popleft()
+            return
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception(
+                f"Exception raised on message send. Try reconnect and send the {len(self._in_flight)} envelopes in flight again."
+            )
+
+        self._node_client.reset_pending_statuses()
+        await self._perform_connection_to_node()
+        in_flight = list(self._in_flight)
+        self._in_flight.clear()
+        for envelope, _ in in_flight:
+            await self._write_envelope_in_window(envelope)
+        await self._node_client.wait_for_envelope_status(self._in_flight[0][1])
+        self._in_flight.popleft()
+
     async def connect(self) -> None:
         """Set up the connection."""
         if self.is_connected:  # pragma: nocover
@@ -416,6 +571,7 @@ class P2PLibp2pClientConnection(Connection):
                 self._process_messages(), loop=self.loop
             )
             self._send_queue = asyncio.Queue()
+            self._in_flight.clear()
             self._send_task = self.loop.create_task(self._send_loop())
 
     async def _perform_connection_to_node(self) -> None:
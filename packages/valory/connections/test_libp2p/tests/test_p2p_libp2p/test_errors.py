@@ -218,6 +218,50 @@ async def test_reconnect_on_write_failed_reconnect_pipe() -> None:
     assert node.pipe.connect.call_count == 1
 
 
+@pytest.mark.asyncio
+async def test_send_window_resend_in_order_on_timeout() -> None:
+    """Test the envelopes in flight are written again in order when a status is missing."""
+
+    con = _make_libp2p_connection()
+    node = Libp2pNode(Mock(), Mock(), "tmp", "tmp")
+    f = Future()
+    f.set_result(None)
+    con.node = node
+    node.pipe = Mock()
+    node.pipe.connect = Mock(return_value=f)
+    con._node_client = node.get_client()
+    con._node_client.ACN_ACK_TIMEOUT = 0.1
+    con._send_window_size = 3
+    status_ok = Mock()
+    status_ok.code = int(AcnMessage.StatusBody.StatusCode.SUCCESS)
+    envelopes = [b"envelope_1", b"envelope_2", b"envelope_3"]
+    written = []
+
+    def write(data: bytes) -> Future:
+        written.append(data)
+        if len(written) > len(envelopes):
+            # the node acknowledges the envelopes written again
+            asyncio.get_event_loop().call_soon(
+                lambda: con._node_client._pending_statuses.popleft().set_result(
+                    status_ok
+                )
+            )
+        return f
+
+    node.pipe.write = write
+    with patch.object(node, "is_proccess_running", return_value=True), patch.object(
+        con._node_client, "make_acn_envelope_message", side_effect=lambda e: e
+    ):
+        for envelope in envelopes:
+            await con._write_envelope_in_window(envelope)
+        for _ in envelopes:
+            await con._ack_oldest_envelope()
+
+    assert written == envelopes + envelopes
+    assert not con._in_flight
+    assert node.pipe.connect.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_reconnect_on_read_failed() -> None:
     """Test node restart on read fail."""
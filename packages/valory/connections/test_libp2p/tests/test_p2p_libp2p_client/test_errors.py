@@ -45,6 +45,7 @@ from packages.valory.connections.test_libp2p.tests.base import (
     make_cert_request,
     ports,
 )
+from packages.valory.protocols.acn.message import AcnMessage
 
 
 DONE_FUTURE: asyncio.Future = asyncio.Future()
@@ -115,6 +116,47 @@ class TestLibp2pClientConnectionFailureNodeNotConnected(BaseP2PLibp2pTest):
                 await self.connection._send_envelope_with_node_client(Mock())
             connect_mock.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_send_window_resend_in_order_on_failure(self):
+        """Test the envelopes in flight are written again in order on a failed status."""
+        status_ok = Mock()
+        status_ok.code = int(AcnMessage.StatusBody.StatusCode.SUCCESS)
+        envelopes = [b"envelope_1", b"envelope_2", b"envelope_3"]
+        written = []
+
+        def write(data: bytes) -> Future:
+            written.append(data)
+            if len(written) > len(envelopes):
+                # the node acknowledges the envelopes written again
+                asyncio.get_event_loop().call_soon(
+                    lambda: node_client._pending_statuses.popleft().set_result(
+                        status_ok
+                    )
+                )
+            return DONE_FUTURE
+
+        pipe = Mock()
+        pipe.write = write
+        node_client = NodeClient(pipe, Mock())
+        node_client.ACN_ACK_TIMEOUT = 0.1
+        self.connection._node_client = node_client
+        self.connection._in_flight.clear()
+        with patch.object(
+            self.connection, "_perform_connection_to_node", return_value=DONE_FUTURE
+        ) as connect_mock, patch.object(
+            self.connection, "_ensure_valid_envelope_for_external_comms"
+        ), patch.object(
+            node_client, "make_acn_envelope_message", side_effect=lambda e: e
+        ):
+            for envelope in envelopes:
+                await self.connection._write_envelope_in_window(envelope)
+            for _ in envelopes:
+                await self.connection._ack_oldest_envelope()
+
+        assert written == envelopes + envelopes
+        assert not self.connection._in_flight
+        connect_mock.assert_called_once()
+
 
 @pytest.mark.asyncio
 async def test_acn_decode_error_on_read():
@@ -77,8 +77,10 @@ def make_envelope(from_addr: str, to_addr: str) -> Envelope:
     return envelope
 
 
-async def _run(con_maker: Callable[..., Connection]) -> Tuple[float, float]:
-    """Run test case and return times for the first and the second messages sent over ACN."""
+async def _run(
+    con_maker: Callable[..., Connection], envelopes: int
+) -> Tuple[float, float, float]:
+    """Run test case and return times for the first and the second messages sent over ACN, and the throughput of a burst of messages."""
     try:
         connections = []
         genesis_node = _make_libp2p_connection(".", relay=True)
@@ -147,15 +149,28 @@ async def _run(con_maker: Callable[..., Connection]) -> Tuple[float, float]:
 
         second_time = tm.time
 
-        return first_time, second_time
+        with time_measure() as tm:
+            for _ in range(envelopes):
+                await con1.send(envelope)
+            for _ in range(envelopes):
+                await con2.receive()
+
+        throughput = envelopes / tm.time if envelopes else 0.0
+
+        return first_time, second_time, throughput
 
     finally:
         for con in reversed(connections):
             await con.disconnect()
 
 
-def run(connection: str, run_times: int = 10) -> List[Tuple[str, Union[int, float]]]:
-    """Check construction time and memory usage."""
+def run(
+    connection: str,
+    run_times: int = 10,
+    envelopes: int = 100,
+    send_window_size: int = 1,
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check the time to send the first messages, and the throughput of the sending connection with a send window."""
     logging.basicConfig(level=logging.CRITICAL)
     cwd = os.getcwd()
     try:
@@ -168,7 +183,12 @@ def run(connection: str, run_times: int = 10) -> List[Tuple[str, Union[int, floa
                 delegate_port: int,
                 pub_key: str,
             ):
-                return _make_libp2p_connection(".", port=port, entry_peers=[entry_peer])
+                return _make_libp2p_connection(
+                    ".",
+                    port=port,
+                    entry_peers=[entry_peer],
+                    send_window_size=send_window_size,
+                )
 
         elif connection == "client":
 
@@ -180,7 +200,10 @@ def run(connection: str, run_times: int = 10) -> List[Tuple[str, Union[int, floa
                 pub_key: str,
             ):
                 return _make_libp2p_client_connection(
-                    peer_public_key=pub_key, data_dir=".", node_port=delegate_port
+                    peer_public_key=pub_key,
+                    data_dir=".",
+                    node_port=delegate_port,
+                    send_window_size=send_window_size,
                 )
 
         elif connection == "mailbox":
@@ -201,12 +224,17 @@ def run(connection: str, run_times: int = 10) -> List[Tuple[str, Union[int, floa
 
         with TemporaryDirectory() as tmp_dir:
             os.chdir(tmp_dir)
-            coro = _run(con_maker)
-            first_time, second_time = asyncio.get_event_loop().run_until_complete(coro)
+            coro = _run(con_maker, envelopes)
+            (
+                first_time,
+                second_time,
+                throughput,
+            ) = asyncio.get_event_loop().run_until_complete(coro)
 
             return [
                 ("first time (seconds)", first_time),
                 ("second time (seconds)", second_time),
+                ("throughput (envelopes/second)", throughput),
             ]
     finally:
         os.chdir(cwd)
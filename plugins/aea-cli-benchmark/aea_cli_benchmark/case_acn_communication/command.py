@@ -54,10 +54,28 @@ PACKAGES = [
     help="How many connection attempts.",
     show_default=True,
 )
+@click.option(
+    "--envelopes",
+    default=100,
+    help="How many envelopes sent in a burst to measure the throughput.",
+    show_default=True,
+)
+@click.option(
+    "--send-window-size",
+    default=1,
+    help="How many envelopes the sending connection writes to the node before awaiting their acknowledgements. Not used by the mailbox connection.",
+    show_default=True,
+    type=click.IntRange(min=1),
+)
 @number_of_runs_deco
 @output_format_deco
 def main(
-    connection: str, connect_times: int, number_of_runs: int, output_format: str
+    connection: str,
+    connect_times: int,
+    envelopes: int,
+    send_window_size: int,
+    number_of_runs: int,
+    output_format: str,
 ) -> Any:
     """Check connection connect time."""
     with with_packages(PACKAGES):
@@ -66,6 +84,8 @@ def main(
         parameters = {
             "Connection": connection,
             "Number of connects": connect_times,
+            "Number of envelopes": envelopes,
+            "Send window size": send_window_size,
             "Number of runs": number_of_runs,
         }
 
@@ -76,6 +96,8 @@ def main(
                 (
                     connection,
                     connect_times,
+                    envelopes,
+                    send_window_size,
                 ),
             )
 
@@ -81,6 +81,7 @@ def _make_libp2p_connection(
     agent_key: Optional[Crypto] = None,
     build_directory: Optional[str] = None,
     peer_registration_delay: str = "0.0",
+    send_window_size: int = 1,
 ) -> P2PLibp2pConnection:
     if not os.path.isdir(data_dir) or not os.path.exists(data_dir):
         raise ValueError("Data dir must be directory and exist!")
@@ -152,6 +153,7 @@ def _make_libp2p_connection(
         configuration.config["mailbox_uri"] = f"{mailbox_host}:{mailbox_port}"
     else:
         configuration.config["mailbox_uri"] = ""
+    configuration.config["send_window_size"] = send_window_size
 
     if not os.path.exists(os.path.join(build_directory, LIBP2P_NODE_MODULE_NAME)):
         with patch("builtins.print"):
@@ -172,6 +174,7 @@ def _make_libp2p_client_connection(
     node_host: str = "127.0.0.1",
     uri: Optional[str] = None,
     ledger_api_id: Union[SimpleId, str] = DEFAULT_LEDGER,
+    send_window_size: int = 1,
 ) -> P2PLibp2pClientConnection:
     if not os.path.isdir(data_dir) or not os.path.exists(data_dir):
         raise ValueError("Data dir must be directory and exist!")
@@ -201,6 +204,7 @@ def _make_libp2p_client_connection(
         ],
         connection_id=P2PLibp2pClientConnection.connection_id,
         cert_requests=[cert_request],
+        send_window_size=send_window_size,
     )
     return P2PLibp2pClientConnection(
         configuration=configuration, data_dir=data_dir, identity=identity
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Encoding and decoding time of messages and envelopes."""
+import time
+from typing import Callable, Dict, List, Tuple, Union
+
+from aea.mail.base import Envelope
+from aea.protocols.base import Message
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+from packages.fetchai.protocols.fipa.message import FipaMessage
+from packages.valory.protocols.http.message import HttpMessage
+
+
+def make_default_message(payload_size: int) -> Message:
+    """Create a default message."""
+    return DefaultMessage(
+        dialogue_reference=("1", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"x" * payload_size,
+    )
+
+
+def make_fipa_message(payload_size: int) -> Message:
+    """Create a fipa message."""
+    return FipaMessage(
+        dialogue_reference=("1", ""),
+        message_id=1,
+        target=0,
+        performative=FipaMessage.Performative.INFORM,
+        info={"data": "x" * payload_size},
+    )
+
+
+def make_http_message(payload_size: int) -> Message:
+    """Create a http message."""
+    return HttpMessage(
+        dialogue_reference=("1", ""),
+        message_id=1,
+        target=0,
+        performative=HttpMessage.Performative.REQUEST,
+        method="POST",
+        url="http://127.0.0.1:8000/",
+        headers="Content-Type: application/octet-stream",
+        version="",
+        body=b"x" * payload_size,
+    )
+
+
+MESSAGE_MAKERS: Dict[str, Callable[[int], Message]] = {
+    "default": make_default_message,
+    "fipa": make_fipa_message,
+    "http": make_http_message,
+}
+
+
+def run(
+    protocol: str, messages_amount: int, payload_size: int
+) -> List[Tuple[str, Union[int, float]]]:
+    """Test the encoding and decoding rates of the messages of a protocol, and of their envelopes."""
+    message_maker = MESSAGE_MAKERS[protocol]
+    messages = [message_maker(payload_size) for _ in range(messages_amount)]
+    message_class = type(messages[0])
+
+    start_time = time.time()
+    for message in messages:
+        message.encode()
+    message_encode_time = time.time() - start_time
+
+    envelopes = [
+        Envelope(to="to", sender="sender", message=message) for message in messages
+    ]
+    start_time = time.time()
+    encoded_envelopes = [envelope.encode() for envelope in envelopes]
+    envelope_encode_time = time.time() - start_time
+
+    start_time = time.time()
+    for envelope in envelopes:
+        envelope.encode()
+    envelope_reencode_time = time.time() - start_time
+
+    start_time = time.time()
+    for encoded_envelope in encoded_envelopes:
+        message_class.decode(Envelope.decode(encoded_envelope).message_bytes)
+    envelope_decode_time = time.time() - start_time
+
+    return [
+        ("Message encodes/sec", messages_amount / message_encode_time),
+        ("Envelope encodes/sec", messages_amount / envelope_encode_time),
+        ("Envelope re-encodes/sec", messages_amount / envelope_reencode_time),
+        ("Envelope decodes/sec", messages_amount / envelope_decode_time),
+    ]
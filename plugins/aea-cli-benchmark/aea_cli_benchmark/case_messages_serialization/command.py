@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Encoding and decoding time of messages and envelopes."""
+from typing import Any, List, Tuple
+
+import click
+from aea_cli_benchmark.utils import (
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+    with_packages,
+)
+
+
+PACKAGES = [
+    ("protocol", "fetchai/default"),
+    ("protocol", "fetchai/fipa"),
+    ("protocol", "valory/http"),
+]
+
+
+@click.command(name="messages_serialization")
+@click.option(
+    "--protocol",
+    default="default",
+    help="Protocol of the messages.",
+    show_default=True,
+    type=click.Choice(["default", "fipa", "http"]),
+)
+@click.option(
+    "--messages",
+    default=10**5,
+    help="Amount of messages.",
+    show_default=True,
+)
+@click.option(
+    "--payload-size",
+    default=1024,
+    help="Size of the payload of a message in bytes.",
+    show_default=True,
+)
+@number_of_runs_deco
+@output_format_deco
+def main(
+    protocol: str,
+    messages: int,
+    payload_size: int,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Check messages and envelopes encoding and decoding time."""
+    with with_packages(PACKAGES):
+        from aea_cli_benchmark.case_messages_serialization.case import run
+
+        parameters = {
+            "Protocol": protocol,
+            "Messages": messages,
+            "Payload size": payload_size,
+            "Number of runs": number_of_runs,
+        }
+
+        def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+            return multi_run(
+                int(number_of_runs),
+                run,
+                (protocol, int(messages), int(payload_size)),
+            )
+
+        return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
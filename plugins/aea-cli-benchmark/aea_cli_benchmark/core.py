@@ -40,6 +40,9 @@ from aea_cli_benchmark.case_mem_usage.command import main as case_mem_usage
 from aea_cli_benchmark.case_messages_memory_usage.command import (
     main as case_messages_memory_usage,
 )
+from aea_cli_benchmark.case_messages_serialization.command import (
+    main as case_messages_serialization,
+)
 from aea_cli_benchmark.case_multiagent.command import main as case_mulltiagent
 from aea_cli_benchmark.case_multiagent_http_dialogues.command import (
     main as case_multiagent_http_dialogues,
@@ -67,6 +70,8 @@ benchmark.add_command(case_mem_usage)
 
 benchmark.add_command(case_messages_memory_usage)
 
+benchmark.add_command(case_messages_serialization)
+
 benchmark.add_command(case_multiagent_http_dialogues)
 
 benchmark.add_command(case_mulltiagent)
@@ -107,6 +107,7 @@ from aea.crypto.registries import ledger_apis_registry, make_crypto, make_ledger
 from aea.crypto.wallet import CryptoStore
 from aea.exceptions import enforce
 from aea.helpers.base import cd
+from aea.helpers.ipfs import cache as ipfs_cache_module
 from aea.identity.base import Identity
 from aea.test_tools.click_testing import CliRunner as ImportedCliRunner
 from aea.test_tools.constants import DEFAULT_AUTHOR
@@ -595,6 +596,16 @@ def increase_aea_builder_build_timeout(request) -> Generator:
         AEABuilder.BUILD_TIMEOUT = old_timeout
 
 
+@pytest.fixture(scope="session", autouse=True)
+def ipfs_hashes_cache_in_tmp_dir(tmp_path_factory) -> Generator:
+    """Keep the IPFS hashes cache shared by the process out of the user home directory."""
+    cache_file = tmp_path_factory.mktemp("ipfs_cache") / "ipfs_hashes.json"
+    with patch.object(
+        ipfs_cache_module, "DEFAULT_CACHE_FILE", cache_file
+    ), patch.object(ipfs_cache_module, "_default_cache", None):
+        yield
+
+
 @pytest.fixture(scope="session", autouse=True)
 def apply_aea_loop(request) -> None:
     """Patch AEA.DEFAULT_RUN_LOOP using pytest option `--aea-loop`."""
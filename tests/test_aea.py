@@ -114,6 +114,37 @@ def test_act():
         agent.stop()
 
 
+def test_act_skill_deactivated():
+    """Tests the behaviours of a skill are unscheduled while the skill is not active."""
+    agent_name = "my_agent"
+    private_key_path = os.path.join(CUR_PATH, "data", DEFAULT_PRIVATE_KEY_FILE)
+    builder = AEABuilder()
+    builder.set_name(agent_name)
+    builder.add_private_key(DEFAULT_LEDGER, private_key_path)
+    protocol = os.path.join(ROOT_DIR, "packages", "fetchai", "protocols", "default")
+    builder.add_component(ComponentType.PROTOCOL, protocol)
+    protocol = os.path.join(
+        ROOT_DIR, "packages", "fetchai", "protocols", "state_update"
+    )
+    builder.add_component(ComponentType.PROTOCOL, protocol)
+    builder.add_skill(Path(CUR_PATH, "data", "dummy_skill"))
+    agent = builder.build()
+
+    with run_in_thread(agent.start, timeout=20):
+        wait_for_condition(lambda: agent.is_running, timeout=20)
+        behaviour = agent.resources.get_behaviour(DUMMY_SKILL_PUBLIC_ID, "dummy")
+        periodic_tasks = agent.runtime.agent_loop._periodic_tasks
+        wait_for_condition(lambda: behaviour.act_wrapper in periodic_tasks, timeout=20)
+
+        behaviour.context.is_active = False
+        wait_for_condition(
+            lambda: behaviour.act_wrapper not in periodic_tasks, timeout=20
+        )
+        behaviour.context.is_active = True
+        wait_for_condition(lambda: behaviour.act_wrapper in periodic_tasks, timeout=20)
+        agent.stop()
+
+
 def test_start_stop():
     """Tests the act function of the AEA."""
     agent_name = "my_agent"
@@ -618,6 +649,46 @@ def test_no_handlers_registered():
         )
 
 
+def test_handle_envelopes_resolves_handlers_once():
+    """Test a batch of envelopes resolves the protocol and the handlers once per protocol and recipient."""
+    agent_name = "my_agent"
+    builder = AEABuilder()
+    private_key_path = os.path.join(CUR_PATH, "data", DEFAULT_PRIVATE_KEY_FILE)
+    builder.set_name(agent_name)
+    builder.add_private_key(DEFAULT_LEDGER, private_key_path)
+    protocol = os.path.join(ROOT_DIR, "packages", "fetchai", "protocols", "default")
+    builder.add_component(ComponentType.PROTOCOL, protocol)
+    builder.set_skill_exception_policy(ExceptionPolicyEnum.just_log)
+    an_aea = builder.build()
+
+    envelopes = []
+    for i in range(3):
+        msg = DefaultMessage(
+            dialogue_reference=("", ""),
+            message_id=1,
+            target=0,
+            performative=DefaultMessage.Performative.BYTES,
+            content=f"hello {i}".encode(),
+        )
+        msg.to = an_aea.identity.address
+        msg.sender = an_aea.identity.address
+        envelopes.append(Envelope(to=msg.to, sender=msg.sender, message=msg))
+
+    handler = MagicMock()
+    handler.handle_wrapper.side_effect = [ValueError("expected"), None, None]
+    with patch.object(
+        an_aea.filter, "get_active_handlers", return_value=[handler]
+    ) as get_active_handlers_mock:
+        an_aea.handle_envelopes(envelopes)
+
+    get_active_handlers_mock.assert_called_once()
+    # the exception policy is applied to each envelope
+    assert handler.handle_wrapper.call_count == 3
+    assert [c.args[0] for c in handler.handle_wrapper.call_args_list] == [
+        e.message for e in envelopes
+    ]
+
+
 class TestContextNamespace:
     """Test that the keyword arguments to AEA constructor can be accessible from the skill context."""
 
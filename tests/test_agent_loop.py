@@ -21,6 +21,7 @@
 import asyncio
 import datetime
 import logging
+import time
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
 from unittest.mock import MagicMock, Mock, patch
 
@@ -28,7 +29,7 @@ import pytest
 
 from aea.aea import AEA
 from aea.agent_loop import AgentLoopStates, AsyncAgentLoop, BaseAgentLoop, SyncAgentLoop
-from aea.exceptions import AEAActException
+from aea.exceptions import AEAActException, AEAEnforceError
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.mail.base import Envelope, EnvelopeContext
@@ -83,6 +84,14 @@ class CountBehaviour(TickerBehaviour):
         )
 
 
+class DoneBehaviour(CountBehaviour):
+    """Simple behaviour done after its first act."""
+
+    def is_done(self) -> bool:
+        """Return True if the behaviour is terminated, False otherwise."""
+        return self.counter >= 1
+
+
 class FailBehaviour(TickerBehaviour):
     """Simple behaviour to raise an exception."""
 
@@ -132,8 +141,8 @@ class AsyncFakeAgent(AEA):
 
     @property
     def active_behaviours(self) -> List[Behaviour]:
-        """Return all behaviours."""
-        return self.behaviours
+        """Return all behaviours not done."""
+        return [behaviour for behaviour in self.behaviours if not behaviour.is_done()]
 
     def _handle(self, envelope: Envelope) -> None:
         """
@@ -154,7 +163,7 @@ class AsyncFakeAgent(AEA):
         self.runtime.decision_maker.message_out_queue.put_nowait(msg)
 
     def _get_msg_and_handlers_for_envelope(
-        self, envelope: Envelope
+        self, envelope: Envelope, lookups: Optional[Dict] = None
     ) -> Tuple[Optional[Message], List[Handler]]:
         return envelope, self.handlers  # type: ignore
 
@@ -244,6 +253,77 @@ class TestAsyncAgentLoop:
         agent_loop.stop()
         agent_loop.wait_completed(sync=True)
 
+    def test_batch_size_must_be_positive(self):
+        """Test the batch size is validated."""
+        with pytest.raises(
+            AEAEnforceError, match="Batch size must be a positive integer."
+        ):
+            self.AGENT_LOOP_CLASS(self.FAKE_AGENT_CLASS(), batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_handle_envelopes_batched(self):
+        """Test the envelopes available are handled in one batch."""
+        handler = CountHandler.make()
+        handler.setup()
+        agent = self.FAKE_AGENT_CLASS(handlers=[handler])
+        agent_loop = self.AGENT_LOOP_CLASS(agent, batch_size=3)
+        agent.runtime.agent_loop = agent_loop
+        assert agent_loop.is_batched
+        for _ in range(5):
+            agent.put_inbox("msg")
+
+        with patch.object(
+            agent_loop,
+            "_execution_control_batch",
+            wraps=agent_loop._execution_control_batch,
+        ) as execution_control_mock:
+            agent_loop.start()
+            await wait_for_condition_async(lambda: handler.counter == 5, timeout=5)
+            agent_loop.stop()
+            await agent_loop.wait_completed()
+
+        inbox_batches = [
+            c.args[1]
+            for c in execution_control_mock.call_args_list
+            if c.args[0] == agent.handle_envelopes
+        ]
+        assert inbox_batches == [["msg"] * 3, ["msg"] * 2]
+
+    @pytest.mark.asyncio
+    async def test_handle_envelopes_batched_timeout(self):
+        """Test an execution timeout in a batch terminates the handling of one message only."""
+
+        class SlowHandler(CountHandler):
+            def handle(self, message: Message) -> None:
+                if message == "slow":
+                    time.sleep(1)
+                super().handle(message)
+
+        handler = SlowHandler.make()
+        handler.setup()
+        agent = self.FAKE_AGENT_CLASS(handlers=[handler])
+        agent._execution_timeout = 0.1
+        agent_loop = self.AGENT_LOOP_CLASS(agent, batch_size=3)
+        agent.runtime.agent_loop = agent_loop
+        for message in ["slow", "msg", "msg"]:
+            agent.put_inbox(message)
+
+        with patch.object(
+            agent,
+            "_get_msg_and_handlers_for_envelope",
+            wraps=agent._get_msg_and_handlers_for_envelope,
+        ) as lookup_mock, patch.object(agent.logger, "warning") as warning_mock:
+            agent_loop.start()
+            await wait_for_condition_async(lambda: handler.counter == 2, timeout=5)
+            agent_loop.stop()
+            await agent_loop.wait_completed()
+
+        warning_mock.assert_called_once()
+        assert "exceeded the timeout of 0.1 seconds" in warning_mock.call_args[0][0]
+        # the handlers are resolved with the lookups of the whole batch
+        lookups = {id(call.args[1]) for call in lookup_mock.call_args_list}
+        assert lookup_mock.call_count == 3 and len(lookups) == 1
+
     def test_behaviour_act(self):
         """Test behaviour act called by schedule."""
         tick_interval = 0.1
@@ -260,6 +340,38 @@ class TestAsyncAgentLoop:
         agent_loop.stop()
         agent_loop.wait_completed(sync=True)
 
+    def test_behaviour_act_coalescing_scheduler(self):
+        """Test behaviour act called by the coalescing scheduler."""
+        tick_interval = 0.1
+
+        behaviour = CountBehaviour.make(tick_interval=tick_interval)
+        behaviour.setup()
+        agent = self.FAKE_AGENT_CLASS(behaviours=[behaviour])
+        agent_loop = self.AGENT_LOOP_CLASS(
+            agent, threaded=True, periodic_tasks_resolution=0.01
+        )
+        agent.runtime.agent_loop = agent_loop
+        agent_loop.start()
+        wait_for_condition(lambda: agent_loop.is_running, timeout=10)
+
+        wait_for_condition(lambda: behaviour.counter >= 2, timeout=tick_interval * 4)
+        assert agent_loop._periodic_tasks_scheduler is not None
+        assert len(agent_loop._periodic_tasks_scheduler) == 2
+        agent_loop.stop()
+        agent_loop.wait_completed(sync=True)
+
+    def test_periodic_tasks_scheduler_bad_parameters(self):
+        """Test the periodic tasks scheduler parameters are checked."""
+        agent = self.FAKE_AGENT_CLASS()
+        with pytest.raises(
+            AEAEnforceError, match="Periodic tasks resolution must be positive."
+        ):
+            self.AGENT_LOOP_CLASS(agent, periodic_tasks_resolution=0)
+        with pytest.raises(
+            AEAEnforceError, match="Periodic tasks jitter must be between 0 and 1."
+        ):
+            self.AGENT_LOOP_CLASS(agent, periodic_tasks_jitter=-1)
+
     @pytest.mark.asyncio
     async def test_internal_messages(self):
         """Test internal meesages are processed."""
@@ -282,17 +394,47 @@ class TestAsyncAgentLoop:
         """Test new behaviours are added."""
         agent = self.FAKE_AGENT_CLASS()
         agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
-        agent_loop.NEW_BEHAVIOURS_PROCESS_SLEEP = 0.5
         agent.runtime.agent_loop = agent_loop
 
         agent_loop.start()
         wait_for_condition(lambda: agent_loop.is_running, timeout=10)
         wait_for_condition(
             lambda: agent.filter.handle_new_handlers_and_behaviours.call_count >= 2,
-            timeout=agent_loop.NEW_BEHAVIOURS_PROCESS_SLEEP * 3,
+            timeout=1,
+        )
+
+        behaviour = CountBehaviour.make(tick_interval=0.1)
+        behaviour.setup()
+        agent.behaviours.append(behaviour)
+        agent_loop.notify_periodic_tasks_changed()
+        wait_for_condition(lambda: behaviour.counter >= 1, timeout=1)
+
+        agent.behaviours.remove(behaviour)
+        agent_loop.notify_periodic_tasks_changed()
+        wait_for_condition(
+            lambda: behaviour.act_wrapper not in agent_loop._periodic_tasks, timeout=1
+        )
+        agent_loop.stop()
+        agent_loop.wait_completed(sync=True)
+
+    def test_completed_behaviours(self):
+        """Test behaviours are unregistered once done."""
+        behaviour = DoneBehaviour.make(tick_interval=0.1)
+        behaviour.setup()
+        agent = self.FAKE_AGENT_CLASS(behaviours=[behaviour])
+        agent_loop = self.AGENT_LOOP_CLASS(agent, threaded=True)
+        agent.runtime.agent_loop = agent_loop
+
+        agent_loop.start()
+        wait_for_condition(lambda: agent_loop.is_running, timeout=10)
+        wait_for_condition(lambda: behaviour.counter >= 1, timeout=1)
+        wait_for_condition(
+            lambda: behaviour.act_wrapper not in agent_loop._periodic_tasks, timeout=1
         )
+        assert agent.act in agent_loop._periodic_tasks
         agent_loop.stop()
         agent_loop.wait_completed(sync=True)
+        assert behaviour.counter == 1
 
     @pytest.mark.asyncio
     async def test_behaviour_exception(self):
@@ -360,6 +502,33 @@ class TestAsyncAgentLoop:
                 agent_loop._state.wait(AgentLoopStates.stopped), timeout=10
             )
 
+    def test_skill2skill_queue_overflow(self):
+        """Test envelopes sent to a full skill to skill queue are rejected."""
+        agent = self.FAKE_AGENT_CLASS()
+        agent_loop = self.AGENT_LOOP_CLASS(
+            agent,
+            skill2skill_queue_max_size=1,
+            skill2skill_queue_overflow_policy="reject",
+        )
+        rejection_callback = Mock()
+        agent_loop.set_rejection_callback(rejection_callback)
+        agent_loop._setup()
+
+        msg = DefaultMessage(performative=DefaultMessage.Performative.BYTES)
+        msg.to = "to"
+        msg.sender = "sender"
+        agent_loop.send_to_skill(msg)
+        agent_loop.send_to_skill(msg)
+
+        assert agent_loop.skill2skill_queue_stats == {
+            "depth": 1,
+            "max_size": 1,
+            "dropped": 0,
+            "rejected": 1,
+        }
+        rejection_callback.assert_called_once()
+        assert rejection_callback.call_args[0][1] == "skill2skill_queue"
+
 
 class TestSyncAgentLoop:
     """Tests for synchronous loop."""
@@ -56,6 +56,37 @@ class TestHashAll(BaseAEATestCase):
             for package_id in packages
         )
 
+    def test_jobs(
+        self,
+    ) -> None:
+        """Test the package files hashed in parallel get the same hashes."""
+
+        result = self.run_cli_command(
+            "--no-cache", "hash", "all", "--packages-dir", str(self.packages_dir_path)
+        )
+        assert result.exit_code == 0, result.output
+        expected_output = result.output
+        expected_files = {
+            path: path.read_bytes() for path in self.packages_dir_path.rglob("*.yaml")
+        }
+
+        result = self.run_cli_command(
+            "--no-cache",
+            "hash",
+            "all",
+            "--packages-dir",
+            str(self.packages_dir_path),
+            "--jobs",
+            "2",
+        )
+        assert result.exit_code == 0, result.output
+        assert sorted(result.output.splitlines()) == sorted(
+            expected_output.splitlines()
+        )
+        assert {
+            path: path.read_bytes() for path in self.packages_dir_path.rglob("*.yaml")
+        } == expected_files
+
     def test_empty_packages_dir(
         self,
     ) -> None:
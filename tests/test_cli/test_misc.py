@@ -56,6 +56,8 @@ Options:
                                 CRITICAL, OFF
   -s, --skip-consistency-check  Skip consistency checks of agent during command
                                 execution.
+  --no-cache                    Hash all the package files, instead of only the
+                                ones changed since they were last hashed.
   --registry-path DIRECTORY     Provide a local registry directory full path.
   --help                        Show this message and exit.
 
@@ -17,10 +17,15 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains tests for aea/components/utils.py"""
+import sys
 from itertools import chain
 from unittest.mock import patch
 
-from aea.components.utils import _enlist_component_packages, _populate_packages
+from aea.components.utils import (
+    PACKAGES_RE,
+    _enlist_component_packages,
+    _populate_packages,
+)
 
 from tests.test_aea import test_act
 
@@ -35,5 +40,12 @@ def test_modules_enlisted_and_loaded():
     assert num_of_packages > 0, "No packages present"
 
     with patch("aea.components.utils.perform_load_aea_package") as mock_package_load:
+        # the packages loaded, e.g. inherited by a forked worker, are not loaded again
         _populate_packages(packages)
+        assert mock_package_load.call_count == 0
+
+        with patch.dict(sys.modules):
+            for name in [name for name in sys.modules if PACKAGES_RE.match(name)]:
+                del sys.modules[name]
+            _populate_packages(packages)
         assert mock_package_load.call_count == num_of_packages, packages
@@ -42,6 +42,7 @@ from aea.configurations.loader import ConfigLoader, ConfigLoaders
 from aea.exceptions import AEAValidationError
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.yaml_utils import yaml_load_all
+from aea.skills.tasks import DEFAULT_RESULT_TTL
 
 from tests.conftest import CUR_PATH, ROOT_DIR
 
@@ -271,6 +272,145 @@ class TestStorageUriConfigVariable(BaseConfigTestVariable):
     AEA_DEFAULT_VALUE = None
 
 
+class TestMultiplexerConfigConfigVariable(BaseConfigTestVariable):
+    """Test `multiplexer_config` aea config option."""
+
+    OPTION_NAME = "multiplexer_config"
+    CONFIG_ATTR_NAME = "multiplexer_config"
+    GOOD_VALUES = [
+        {
+            "batch_size": 10,
+            "routing_helper_max_size": 100,
+            "routing_helper_ttl": 60,
+            "in_queue_max_size": 1000,
+            "in_queue_overflow_policy": "reject",
+            "out_queue_max_size": 100,
+            "out_queue_overflow_policy": "drop_oldest",
+        },
+        {
+            "batch_size": 1,
+            "routing_helper_max_size": None,
+            "routing_helper_ttl": 0.5,
+            "in_queue_max_size": 0,
+            "in_queue_overflow_policy": "block",
+            "out_queue_max_size": 10,
+            "out_queue_overflow_policy": "drop_newest",
+        },
+    ]
+    INCORRECT_VALUES = [
+        None,
+        -1,
+        {"batch_size": 0},
+        {"routing_helper_ttl": 0},
+        {"in_queue_max_size": -1},
+        {"out_queue_overflow_policy": "unknown"},
+    ]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = {
+        "batch_size": 1,
+        "routing_helper_max_size": None,
+        "routing_helper_ttl": None,
+        "in_queue_max_size": 0,
+        "in_queue_overflow_policy": "block",
+        "out_queue_max_size": 0,
+        "out_queue_overflow_policy": "block",
+    }
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get AEA attribute value.
+
+        :param aea: AEA isntance to get atribute value from.
+
+        :return: value of attribute.
+        """
+        multiplexer = aea.runtime.multiplexer
+        return {
+            "batch_size": multiplexer.batch_size,
+            "routing_helper_max_size": multiplexer._routing_helper.max_size,
+            "routing_helper_ttl": multiplexer._routing_helper.ttl,
+            "in_queue_max_size": multiplexer.in_queue.maxsize,
+            "in_queue_overflow_policy": multiplexer._in_queue_overflow_policy.value,
+            "out_queue_max_size": multiplexer._out_queue_max_size,
+            "out_queue_overflow_policy": multiplexer._out_queue_overflow_policy.value,
+        }
+
+
+class TestAgentLoopConfigConfigVariable(BaseConfigTestVariable):
+    """Test `agent_loop_config` aea config option."""
+
+    OPTION_NAME = "agent_loop_config"
+    CONFIG_ATTR_NAME = "agent_loop_config"
+    GOOD_VALUES = [
+        {
+            "skill2skill_queue_max_size": 100,
+            "skill2skill_queue_overflow_policy": "reject",
+            "batch_size": 20,
+            "periodic_tasks_resolution": 0.05,
+            "periodic_tasks_jitter": 0.5,
+        },
+        {
+            "skill2skill_queue_max_size": 0,
+            "skill2skill_queue_overflow_policy": "block",
+            "batch_size": 1,
+            "periodic_tasks_resolution": None,
+            "periodic_tasks_jitter": 0.0,
+        },
+    ]
+    INCORRECT_VALUES = [
+        None,
+        -1,
+        {"skill2skill_queue_max_size": -1},
+        {"skill2skill_queue_overflow_policy": "unknown"},
+        {"batch_size": 0},
+        {"periodic_tasks_resolution": 0},
+        {"periodic_tasks_jitter": 1.5},
+    ]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = {
+        "skill2skill_queue_max_size": 0,
+        "skill2skill_queue_overflow_policy": "block",
+        "batch_size": 1,
+        "periodic_tasks_resolution": None,
+        "periodic_tasks_jitter": 0.0,
+    }
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get AEA attribute value.
+
+        :param aea: AEA isntance to get atribute value from.
+
+        :return: value of attribute.
+        """
+        agent_loop = aea.runtime.agent_loop
+        return {
+            "skill2skill_queue_max_size": agent_loop._skill2skill_queue_max_size,
+            "skill2skill_queue_overflow_policy": agent_loop._skill2skill_queue_overflow_policy.value,
+            "batch_size": agent_loop.batch_size,
+            "periodic_tasks_resolution": agent_loop._periodic_tasks_resolution,
+            "periodic_tasks_jitter": agent_loop._periodic_tasks_jitter,
+        }
+
+
+class TestTaskManagerConfigVariable(BaseConfigTestVariable):
+    """Test `task_manager_config` aea config option."""
+
+    OPTION_NAME = "task_manager_config"
+    CONFIG_ATTR_NAME = "task_manager_config"
+    GOOD_VALUES = [{"result_ttl": 60}, {"result_ttl": None}]
+    INCORRECT_VALUES = [None, -1, {"result_ttl": 0}, {"result_ttl": "1"}]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = {"result_ttl": DEFAULT_RESULT_TTL}
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get AEA attribute value.
+
+        :param aea: AEA isntance to get atribute value from.
+
+        :return: value of attribute.
+        """
+        return {"result_ttl": aea.runtime.task_manager.result_ttl}
+
+
 class TestConnectionExceptionPolicyConfigVariable(BaseConfigTestVariable):
     """Test `skill_exception_policy` aea config option."""
 
@@ -65,6 +65,7 @@ from aea.configurations.constants import (
     DEFAULT_PYPI_INDEX_URL,
     DEFAULT_SKILL_CONFIG_FILE,
 )
+from aea.configurations.data_types import PUBLIC_ID_CACHE_SIZE
 from aea.configurations.loader import ConfigLoaders, load_component_configuration
 from aea.helpers.yaml_utils import yaml_dump, yaml_load
 
@@ -459,11 +460,29 @@ def test__get_default_configuration_file_name_from_type_positive(package_type):
 class PublicIdTestCase(TestCase):
     """Test case for PublicId class."""
 
-    @mock.patch("aea.configurations.data_types.re.match", return_value=None)
-    def test_public_id_from_str_not_matching(self, *mocks):
+    def test_public_id_from_str_not_matching(self):
         """Test case for from_str method regex not matching."""
-        with self.assertRaises(ValueError):
-            PublicId.from_str("public_id_str")
+        PublicId._from_str_cached.cache_clear()
+        with mock.patch.object(PublicId, "_PUBLIC_ID_PATTERN") as pattern_mock:
+            pattern_mock.match.return_value = None
+            with self.assertRaises(ValueError):
+                PublicId.from_str("author/name:0.1.0")
+        PublicId._from_str_cached.cache_clear()
+
+    def test_public_id_from_str_interned(self):
+        """Test from_str returns the same object for the same string."""
+        public_id = PublicId.from_str("author/name:0.1.0")
+        assert PublicId.from_str("author/name:0.1.0") is public_id
+        assert PublicId.try_from_str("author/name:0.1.0") is public_id
+        assert PublicId.from_str("author/name:0.2.0") is not public_id
+
+    def test_public_id_from_str_cache_bounded(self):
+        """Test the cache of from_str is bounded."""
+        PublicId._from_str_cached.cache_clear()
+        for i in range(PUBLIC_ID_CACHE_SIZE + 10):
+            PublicId.from_str(f"author/name_{i}:0.1.0")
+        assert PublicId._from_str_cached.cache_info().currsize == PUBLIC_ID_CACHE_SIZE
+        PublicId._from_str_cached.cache_clear()
 
     def test_public_id_from_json_positive(self):
         """Test case for from_json method positive result."""
@@ -492,6 +511,12 @@ class PublicIdTestCase(TestCase):
         assert PublicId.is_valid_str("author/name:0.1.0")
         assert not PublicId.is_valid_str("author!name:0.1.0")
 
+    def test_is_valid_str_rejected_components(self):
+        """Test is_valid_str agrees with try_from_str on well formatted strings rejected by the components."""
+        with mock.patch.object(PublicId, "_from_str_cached", side_effect=ValueError):
+            assert not PublicId.is_valid_str("author/name:0.1.0")
+            assert PublicId.try_from_str("author/name:0.1.0") is None
+
     def test_try_from_str(self):
         """Test is_valid_str method."""
         assert PublicId.try_from_str("author/name:0.1.0")
@@ -52,14 +52,14 @@ class TestGenericStorage(BaseTestMarkdownDocs):
         """
         Test storage abstract methods.
 
-        Note: the block index of the abstract methods is 0.
+        Note: the block index of the abstract methods is 2.
         Please check generic-storage.md
         """
-        block_index = 1
+        block_index = 2
         assert self.code_blocks[block_index]["text"] in self.content
 
     def test_test_behaviour(self):
         """Test that the 'TestBehaviour' code is compilable."""
-        block_index = 2
+        block_index = 3
         code = self.code_blocks[block_index]["text"]
         exec(code, {}, dict(TickerBehaviour=TickerBehaviour))  # nosec
@@ -102,3 +102,19 @@ def test_send_no_active_handler_2():
             f"Cannot handle envelope: {reason}. Sender={envelope_mock.sender}, to={envelope_mock.sender}."
         )
     assert count + 1 == handler.no_active_handler_count
+
+
+def test_send_queue_overflow():
+    """Test the send_queue_overflow method."""
+    handler = ErrorHandler()
+    envelope_mock = Mock()
+    envelope_mock.protocol_specification_id = "1"
+    envelope_mock.sender = "2"
+    envelope_mock.to = "3"
+    count = handler.queue_overflow_count
+    with patch.object(_default_logger, "warning") as mock_logger:
+        handler.send_queue_overflow(envelope_mock, "in_queue", _default_logger)
+        mock_logger.assert_any_call(
+            f"Envelope rejected, in_queue is full: protocol_specification_id={envelope_mock.protocol_specification_id}. Sender={envelope_mock.sender}, to={envelope_mock.to}."
+        )
+    assert count + 1 == handler.queue_overflow_count
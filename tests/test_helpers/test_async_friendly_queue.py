@@ -23,9 +23,11 @@ import asyncio
 import time
 from queue import Empty
 from threading import Thread
+from unittest import mock
 
 import pytest
 
+from aea.exceptions import AEAEnforceError
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 
 
@@ -82,3 +84,135 @@ def test_many_threads_with_asyncio() -> None:
         t.join()
 
     assert len(results) == num_threads
+
+
+@pytest.mark.asyncio
+async def test_async_put() -> None:
+    """Test AsyncFriendlyQueue.async_put waits for room in a bounded queue."""
+    sq = AsyncFriendlyQueue(maxsize=1)
+    await sq.async_put("item1")
+    task = asyncio.ensure_future(sq.async_put("item2"))
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    assert sq.get() == "item1"
+    await asyncio.wait_for(task, timeout=1)
+    assert sq.get_nowait() == "item2"
+
+
+def test_async_put_many_threads() -> None:
+    """Test AsyncFriendlyQueue.async_put is woken up by a consumer in another thread."""
+    sq = AsyncFriendlyQueue(maxsize=1)
+    items_num = 10
+    loop = asyncio.new_event_loop()
+
+    async def produce() -> None:
+        for i in range(items_num):
+            await asyncio.wait_for(sq.async_put(i), timeout=5)
+
+    results = []
+
+    def consume() -> None:
+        for _ in range(items_num):
+            results.append(sq.get(timeout=5))
+
+    t = Thread(target=consume)
+    t.daemon = True
+    t.start()
+    loop.run_until_complete(produce())
+    t.join()
+    loop.close()
+
+    assert results == list(range(items_num))
+
+
+@pytest.mark.asyncio
+async def test_same_loop_wake_up() -> None:
+    """Test a waiter on the running loop is woken up without thread safe signalling."""
+    sq = AsyncFriendlyQueue()
+    loop = asyncio.get_event_loop()
+    task = asyncio.ensure_future(sq.async_get())
+    await asyncio.sleep(0.01)
+
+    with mock.patch.object(
+        loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe
+    ) as call_soon_threadsafe_mock:
+        sq.put("item")
+    call_soon_threadsafe_mock.assert_not_called()
+    assert await asyncio.wait_for(task, timeout=1) == "item"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_skipped() -> None:
+    """Test a cancelled waiter does not swallow the wake up of the others."""
+    sq = AsyncFriendlyQueue()
+    cancelled = asyncio.ensure_future(sq.async_get())
+    task = asyncio.ensure_future(sq.async_get())
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+
+    sq.put("item")
+    assert await asyncio.wait_for(task, timeout=1) == "item"
+
+
+def test_waiter_registered_during_put() -> None:
+    """Test a waiter registered while an item is put from another thread is woken up."""
+    sq = AsyncFriendlyQueue()
+    loop = asyncio.new_event_loop()
+    waiter = loop.create_future()
+    try:
+        with sq._lock:
+            # the consumer found the queue empty and is registering its waiter
+            thread = Thread(target=sq.put, args=("item",))
+            thread.start()
+            thread.join(0.1)
+            sq._non_empty_waiters.append(waiter)
+        thread.join()
+        loop.run_until_complete(asyncio.wait_for(waiter, timeout=1))
+    finally:
+        loop.close()
+
+
+def test_get_many_put_many() -> None:
+    """Test AsyncFriendlyQueue.get_many and AsyncFriendlyQueue.put_many."""
+    sq = AsyncFriendlyQueue()
+    assert sq.get_many() == []
+
+    sq.put_many(range(5))
+    assert sq.qsize() == 5
+    assert sq.get_many(max_items=2) == [0, 1]
+    assert sq.get_many() == [2, 3, 4]
+    assert sq.empty()
+
+    with pytest.raises(AEAEnforceError, match="Max items must be positive."):
+        sq.get_many(max_items=0)
+
+
+@pytest.mark.asyncio
+async def test_async_get_many() -> None:
+    """Test AsyncFriendlyQueue.async_get_many gets all the items available."""
+    sq = AsyncFriendlyQueue()
+    tasks = [asyncio.ensure_future(sq.async_get_many()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    sq.put_many(["item1", "item2"])
+    done, pending = await asyncio.wait(tasks, timeout=0.1)
+    assert len(done) == 1
+    assert done.pop().result() == ["item1", "item2"]
+
+    sq.put("item3")
+    assert await asyncio.wait_for(pending.pop(), timeout=1) == ["item3"]
+
+
+@pytest.mark.asyncio
+async def test_get_many_wakes_up_producers() -> None:
+    """Test AsyncFriendlyQueue.get_many wakes up the producers waiting for room."""
+    sq = AsyncFriendlyQueue(maxsize=2)
+    sq.put_many(["item1", "item2"])
+    tasks = [asyncio.ensure_future(sq.async_put(f"item{i}")) for i in (3, 4)]
+    await asyncio.sleep(0.01)
+    assert not any(task.done() for task in tasks)
+
+    assert sq.get_many() == ["item1", "item2"]
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+    assert sorted(sq.get_many()) == ["item3", "item4"]
@@ -29,6 +29,7 @@ import pytest
 
 from aea.helpers.async_utils import (
     AsyncState,
+    CoalescingScheduler,
     PeriodicCaller,
     Runnable,
     ThreadedAsyncRunner,
@@ -171,6 +172,118 @@ async def test_periodic_caller_exception():
     periodic_caller.stop()
 
 
+@pytest.mark.asyncio
+async def test_coalescing_scheduler_start_stop():
+    """Test start stop calls scheduled by a CoalescingScheduler."""
+    scheduler = CoalescingScheduler(resolution=0.05)
+    called = [0] * 100
+
+    def make_callback(i):
+        def callback():
+            called[i] += 1
+
+        return callback
+
+    calls = [
+        scheduler.periodic_caller(make_callback(i), period=0.1) for i in range(100)
+    ]
+    for call in calls:
+        call.start()
+    assert len(scheduler) == 100
+    # the calls are coalesced in the slot of their start time (or the next one, if started across two slots)
+    assert len(scheduler._calls_by_slot) <= 2
+
+    await asyncio.sleep(0.15)
+    assert all(c >= 1 for c in called)
+
+    for call in calls[1:]:
+        call.stop()
+    assert len(scheduler) == 1
+    old_called = list(called)
+    await asyncio.sleep(0.15)
+    assert called[1:] == old_called[1:]
+    assert called[0] > old_called[0]
+
+    calls[0].stop()
+    assert len(scheduler) == 0
+    assert scheduler._timerhandle is None
+
+
+@pytest.mark.asyncio
+async def test_coalescing_scheduler_drift_free():
+    """Test calls scheduled by a CoalescingScheduler do not drift and skip the calls missed."""
+    scheduler = CoalescingScheduler(resolution=0.01)
+    called = 0
+
+    def callback():
+        nonlocal called
+        called += 1
+        if called == 1:
+            time.sleep(0.35)  # block the loop for more than 3 periods
+
+    call = scheduler.periodic_caller(callback, period=0.1)
+    call.start()
+    first_call_time = call.next_call_time
+    await wait_for_condition_async(lambda: called >= 2, timeout=1)
+    # the calls missed while the loop was blocked run once, not in a burst,
+    # and the next call is still on the grid of the periods since the first call
+    assert called == 2
+    assert call.next_call_time == pytest.approx(first_call_time + 0.4)
+    call.stop()
+
+
+@pytest.mark.asyncio
+async def test_coalescing_scheduler_jitter():
+    """Test the first call scheduled by a CoalescingScheduler is delayed by the jitter."""
+    loop = asyncio.get_event_loop()
+    scheduler = CoalescingScheduler(resolution=0.01, jitter=0.5)
+    now = loop.time()
+    calls = [scheduler.periodic_caller(lambda: None, period=10) for _ in range(20)]
+    for call in calls:
+        call.start()
+    call_times = [call.next_call_time for call in calls]
+    assert all(now <= t <= loop.time() + 5 for t in call_times)
+    assert len(set(call_times)) > 1
+    scheduler.stop()
+    assert not any(call.is_started for call in calls)
+
+
+@pytest.mark.asyncio
+async def test_coalescing_scheduler_exception():
+    """Test exception raises for a call scheduled by a CoalescingScheduler."""
+    exception_called = False
+
+    def exception_callback(*args, **kwargs):
+        nonlocal exception_called
+        exception_called = True
+
+    def callback():
+        raise Exception("expected")
+
+    scheduler = CoalescingScheduler()
+    call = scheduler.periodic_caller(
+        callback, period=0.1, exception_callback=exception_callback
+    )
+    call.start()
+
+    await asyncio.sleep(0.15)
+    assert exception_called
+    assert not call.is_started
+
+
+def test_coalescing_scheduler_bad_parameters():
+    """Test CoalescingScheduler parameters are checked."""
+    loop = asyncio.new_event_loop()
+    with pytest.raises(ValueError, match="Resolution must be positive."):
+        CoalescingScheduler(loop=loop, resolution=0)
+    with pytest.raises(ValueError, match="Jitter must be between 0 and 1."):
+        CoalescingScheduler(loop=loop, jitter=2)
+    scheduler = CoalescingScheduler(loop=loop)
+    with pytest.raises(ValueError, match="Period must be positive."):
+        scheduler.periodic_caller(lambda: None, period=0)
+    loop.close()
+
+
 @pytest.mark.asyncio
 async def test_threaded_async_run():
     """Test threaded async runner."""
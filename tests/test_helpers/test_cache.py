@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for LRUCache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aea.exceptions import AEAEnforceError
+from aea.helpers.cache import LRUCache
+
+
+def test_unbounded() -> None:
+    """Test the cache behaves like a dict when not bounded."""
+    cache: LRUCache[str, int] = LRUCache()
+    for i in range(100):
+        cache[str(i)] = i
+    assert len(cache) == 100
+    assert cache["42"] == 42
+    assert cache.get("missing") is None
+    del cache["42"]
+    assert "42" not in cache
+    assert cache.evictions == 0
+    assert cache.stats == {"size": 99, "hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_max_size_evicts_least_recently_used() -> None:
+    """Test the least recently used entry is evicted when the cache is full."""
+    on_evict = MagicMock()
+    cache: LRUCache[str, int] = LRUCache(max_size=2, on_evict=on_evict)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert cache.evictions == 1
+    on_evict.assert_called_once_with("b", 2)
+
+
+def test_ttl_expires_entries() -> None:
+    """Test entries not accessed within the time to live are evicted."""
+    on_evict = MagicMock()
+    cache: LRUCache[str, int] = LRUCache(ttl=10, on_evict=on_evict)
+    with patch("time.monotonic", return_value=0):
+        cache["a"] = 1
+        cache["b"] = 2
+    with patch("time.monotonic", return_value=8):
+        assert cache["b"] == 2
+    with patch("time.monotonic", return_value=15):
+        assert "a" not in cache
+        assert "b" in cache
+        with pytest.raises(KeyError):
+            cache["a"]  # pylint: disable=pointless-statement
+    on_evict.assert_called_once_with("a", 1)
+
+    with patch("time.monotonic", return_value=30):
+        cache.expire()
+    assert len(cache) == 0
+    assert cache.evictions == 2
+
+
+def test_bad_bounds() -> None:
+    """Test bounds must be positive."""
+    with pytest.raises(AEAEnforceError, match="Max size must be positive."):
+        LRUCache(max_size=0)
+    with pytest.raises(AEAEnforceError, match="Time to live must be positive."):
+        LRUCache(ttl=0)
+
+
+def test_clear() -> None:
+    """Test clear does not count evictions."""
+    cache: LRUCache[str, int] = LRUCache(max_size=10)
+    cache["a"] = 1
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.evictions == 0
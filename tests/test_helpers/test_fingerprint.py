@@ -19,10 +19,13 @@
 
 """Tests for fingerprinting packages."""
 
+import os
 import random
 import shutil
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -35,6 +38,7 @@ from aea.helpers.fingerprint import (
     compute_fingerprint,
     update_fingerprint,
 )
+from aea.helpers.ipfs.cache import FileHashCache
 
 from tests.conftest import PACKAGES_DIR
 
@@ -58,6 +62,37 @@ def test_compute_fingerprint():
     assert all(map(lambda multihash: CID.is_cid(multihash), fingerprints.values()))
 
 
+def test_compute_fingerprint_cached():
+    """Test compute_fingerprint only hashes the files changed since the last time."""
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        package_path = Path(tmp_dir, "package")
+        shutil.copytree(Path(PACKAGES_DIR, "fetchai", "skills", "echo"), package_path)
+        files = [path for path in package_path.rglob("*") if path.is_file()]
+        timestamp = time.time() - 60
+        for path in files:
+            os.utime(path, (timestamp, timestamp))
+
+        cache = FileHashCache(Path(tmp_dir, "cache.json"))
+        with patch(
+            "aea.configurations.base.get_default_cache", return_value=cache
+        ), patch("aea.helpers.ipfs.cache.RACY_INTERVAL", -1):
+            fingerprints = compute_fingerprint(package_path, None)
+            assert (cache.hits, cache.misses) == (0, len(fingerprints))
+            assert compute_fingerprint(package_path, None) == fingerprints
+            assert (cache.hits, cache.misses) == (len(fingerprints), len(fingerprints))
+
+            # a file changed within the same second is hashed again
+            Path(package_path, "__init__.py").write_text("# changed")
+            os.utime(Path(package_path, "__init__.py"), (timestamp, timestamp))
+            changed_fingerprints = compute_fingerprint(package_path, None)
+            assert changed_fingerprints["__init__.py"] != fingerprints["__init__.py"]
+            assert cache.misses == len(fingerprints) + 1
+
+        with patch("aea.configurations.base.get_default_cache", return_value=None):
+            assert compute_fingerprint(package_path, None) == changed_fingerprints
+
+
 @pytest.mark.parametrize("package_type, files", CONFIG_FILES.items())
 def test_update_fingerprint(package_type, files):
     """Test update fingerprint"""
@@ -20,6 +20,7 @@
 
 """This module contains the tests for the ipfs helper module."""
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
@@ -28,7 +29,8 @@ import pytest
 from aea_cli_ipfs.ipfs_utils import IPFSTool  # type: ignore
 
 from aea.helpers.cid import to_v1
-from aea.helpers.ipfs.base import IPFSHashOnly, _is_text
+from aea.helpers.ipfs.base import IPFSHashOnly, _dos2unix, _is_text
+from aea.helpers.ipfs.cache import FileHashCache
 
 
 def test_is_text_negative():
@@ -70,6 +72,62 @@ class TestFileHashing:
             computed_multihash = IPFSHashOnly.get(str(file), wrap=wrap, cid_v1=cid_v1)
             assert computed_multihash == expected_multihash
 
+    @pytest.mark.parametrize(
+        "data, is_text",
+        [
+            (b"", True),
+            (b"a\r\n" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE // 2), True),
+            (b"a" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE - 1) + b"\r\n" * 3, True),
+            (b"a" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE * 2) + b"\r", True),
+            (b"\r\n" * IPFSHashOnly.DEFAULT_CHUNK_SIZE + b"\xff", False),
+        ],
+    )
+    def test_hash_file_in_chunks(self, data, is_text):
+        """Test the files read chunk by chunk get the hash of their whole content."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / "dummy_file"
+            file.write_bytes(data)
+            expected_data = _dos2unix(data) if is_text else data
+            for wrap in (True, False):
+                assert IPFSHashOnly.hash_file(str(file), wrap=wrap) == (
+                    IPFSHashOnly.hash_bytes(
+                        expected_data, wrap=wrap, file_name_if_wrap=file.name
+                    )
+                )
+
+
+def test_hash_directories():
+    """Test directories hashed at once, in parallel and from the cache."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dir_paths = []
+        for i in range(3):
+            dir_path = Path(tmp_dir, f"package_{i}")
+            Path(dir_path, "nested").mkdir(parents=True)
+            Path(dir_path, "file.txt").write_text(f"Hello, World! {i}")
+            Path(dir_path, "nested", "file.txt").write_text("Foo, Bar!")
+            dir_paths.append(str(dir_path))
+        expected_hashes = [
+            IPFSHashOnly.hash_directory(dir_path) for dir_path in dir_paths
+        ]
+
+        assert IPFSHashOnly.hash_directories(dir_paths) == expected_hashes
+        with ThreadPoolExecutor(2) as executor:
+            assert (
+                IPFSHashOnly.hash_directories(dir_paths, executor=executor)
+                == expected_hashes
+            )
+
+        cache = FileHashCache(Path(tmp_dir, "cache.json"))
+        with patch("aea.helpers.ipfs.cache.RACY_INTERVAL", -1):
+            assert IPFSHashOnly.hash_directories(dir_paths, cache=cache) == (
+                expected_hashes
+            )
+            assert (cache.hits, cache.misses) == (0, 6)
+            assert IPFSHashOnly.hash_directories(dir_paths, cache=cache) == (
+                expected_hashes
+            )
+            assert (cache.hits, cache.misses) == (6, 6)
+
 
 @pytest.mark.usefixtures("use_ipfs_daemon")
 class TestDirectoryHashing:
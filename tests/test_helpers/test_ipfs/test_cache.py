@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tests for the cache of the IPFS nodes of files."""
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from aea.helpers.ipfs import cache as cache_module
+from aea.helpers.ipfs.cache import (
+    FileHashCache,
+    get_default_cache,
+    set_default_cache_enabled,
+)
+
+
+NODE = (b"\x12\x20" + b"\x01" * 32, 42)
+
+
+class TestFileHashCache:
+    """Test the cache of the IPFS nodes of files."""
+
+    def setup(self) -> None:
+        """Set up the test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmp_dir.name, "file.txt")
+        self.file.write_text("Hello, World!")
+        self._make_old()
+        self.cache_file = Path(self.tmp_dir.name, "cache", "cache.json")
+        # the change time of the file cannot be moved out of the racy interval
+        self.racy_interval_patch = patch.object(cache_module, "RACY_INTERVAL", -1)
+        self.racy_interval_patch.start()
+
+    def teardown(self) -> None:
+        """Tear down the test."""
+        self.racy_interval_patch.stop()
+        self.tmp_dir.cleanup()
+
+    def _make_old(self) -> None:
+        """Move the modification time of the file out of the racy interval."""
+        timestamp = time.time() - 60
+        os.utime(self.file, (timestamp, timestamp))
+
+    def test_get_and_set(self) -> None:
+        """Test the nodes are got until the files change."""
+        cache = FileHashCache(self.cache_file)
+        assert cache.get(str(self.file), self.file.stat()) is None
+        cache.set(str(self.file), self.file.stat(), NODE)
+        assert cache.get(str(self.file), self.file.stat()) == NODE
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+        self.file.write_text("Hello, World?")
+        self._make_old()
+        assert cache.get(str(self.file), self.file.stat()) is None
+
+    def test_racy_files_not_cached(self) -> None:
+        """Test the files modified just before being hashed are not cached."""
+        cache = FileHashCache(self.cache_file)
+        with patch.object(cache_module, "RACY_INTERVAL", 2.0):
+            self.file.write_text("Hello, World?")
+            cache.set(str(self.file), self.file.stat(), NODE)
+            assert len(cache) == 0
+
+            # copied or touched with an older modification time
+            self._make_old()
+            cache.set(str(self.file), self.file.stat(), NODE)
+            assert len(cache) == 0
+
+    def test_save_and_load(self) -> None:
+        """Test the cache is saved and loaded, without the entries of removed files."""
+        with FileHashCache(self.cache_file) as cache:
+            cache.set(str(self.file), self.file.stat(), NODE)
+            cache.set("removed_file", self.file.stat(), NODE)
+        assert FileHashCache(self.cache_file).get(str(self.file), self.file.stat()) == (
+            NODE
+        )
+        assert len(FileHashCache(self.cache_file)) == 1
+
+        content = json.loads(self.cache_file.read_text())
+        content["version"] = -1
+        self.cache_file.write_text(json.dumps(content))
+        assert len(FileHashCache(self.cache_file)) == 0
+
+        self.cache_file.write_text("{")
+        cache = FileHashCache(self.cache_file)
+        assert len(cache) == 0
+        cache.save()
+        assert self.cache_file.read_text() == "{"
+
+        cache.clear()
+        cache.save()
+        assert json.loads(self.cache_file.read_text())["entries"] == {}
+
+    def test_save_not_writable(self) -> None:
+        """Test the cache is not written, without failing, if its directory cannot be created."""
+        cache_file = Path(self.file, "cache.json")  # under a regular file
+        cache = FileHashCache(cache_file)
+        cache.set(str(self.file), self.file.stat(), NODE)
+        with patch.object(cache_module._default_logger, "debug") as debug_mock:
+            cache.save()
+        debug_mock.assert_called_once()
+        assert not cache_file.exists()
+
+
+def test_default_cache():
+    """Test the cache shared by the process is saved on exit, unless disabled."""
+    with patch.object(cache_module, "_default_cache", None), patch.object(
+        cache_module, "DEFAULT_CACHE_FILE", Path("cache.json")
+    ), patch("atexit.register") as register_mock:
+        cache = get_default_cache()
+        assert cache is not None
+        assert get_default_cache() is cache
+        register_mock.assert_called_once_with(cache.save)
+
+        set_default_cache_enabled(False)
+        try:
+            assert get_default_cache() is None
+        finally:
+            set_default_cache_enabled(True)
+        assert get_default_cache() is cache
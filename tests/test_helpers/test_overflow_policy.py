@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the queue overflow policies."""
+
+import asyncio
+import queue
+from unittest.mock import MagicMock
+
+import pytest
+
+from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
+from aea.helpers.overflow_policy import OverflowPolicyEnum, QueueOverflowControl
+
+
+def test_unbounded_queue() -> None:
+    """Test items are always put in an unbounded queue."""
+    control = QueueOverflowControl(queue.Queue(), OverflowPolicyEnum.reject)
+    for i in range(10):
+        assert control.put_nowait(i)
+    assert control.stats == {"depth": 10, "max_size": 0, "dropped": 0, "rejected": 0}
+
+
+def test_drop_oldest() -> None:
+    """Test the oldest item is dropped to make room."""
+    control = QueueOverflowControl(asyncio.Queue(maxsize=2), "drop_oldest")
+    for i in range(3):
+        assert control.put_nowait(i)
+    assert control.dropped == 1
+    assert control.depth == 2
+    assert control.queue.get_nowait() == 1
+
+
+def test_drop_newest() -> None:
+    """Test the item put in a full queue is dropped."""
+    on_reject = MagicMock()
+    control = QueueOverflowControl(
+        queue.Queue(maxsize=1), OverflowPolicyEnum.drop_newest, on_reject=on_reject
+    )
+    assert control.put_nowait(0)
+    assert not control.put_nowait(1)
+    assert control.dropped == 1
+    assert control.rejected == 0
+    on_reject.assert_not_called()
+    assert control.queue.get_nowait() == 0
+
+
+@pytest.mark.parametrize(
+    "policy", [OverflowPolicyEnum.reject, OverflowPolicyEnum.block]
+)
+def test_reject(policy: OverflowPolicyEnum) -> None:
+    """Test the item put in a full queue is rejected, also when blocking is not possible."""
+    on_reject = MagicMock()
+    control = QueueOverflowControl(
+        asyncio.Queue(maxsize=1), policy, on_reject=on_reject
+    )
+    assert control.put_nowait(0)
+    assert not control.put_nowait(1)
+    assert control.rejected == 1
+    on_reject.assert_called_once_with(1)
+
+
+def test_bad_policy() -> None:
+    """Test an unknown policy is not accepted."""
+    with pytest.raises(ValueError):
+        QueueOverflowControl(queue.Queue(), "unknown")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("queue_class", [asyncio.Queue, AsyncFriendlyQueue])
+async def test_block(queue_class) -> None:
+    """Test the producer waits for room in the queue."""
+    control = QueueOverflowControl(queue_class(maxsize=1), OverflowPolicyEnum.block)
+    await control.put(0)
+    task = asyncio.ensure_future(control.put(1))
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    assert control.queue.get_nowait() == 0
+    assert await asyncio.wait_for(task, timeout=1)
+    assert control.queue.get_nowait() == 1
+    assert control.rejected == control.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_put_not_blocking() -> None:
+    """Test put applies the policy without waiting for the other policies."""
+    control = QueueOverflowControl(
+        AsyncFriendlyQueue(maxsize=1), OverflowPolicyEnum.drop_newest
+    )
+    assert await control.put(0)
+    assert not await control.put(1)
+    assert control.dropped == 1
@@ -19,6 +19,8 @@
 # ------------------------------------------------------------------------------
 """Tests for the pipe module."""
 import asyncio
+import os
+import struct
 from threading import Thread
 from unittest import mock
 
@@ -26,6 +28,7 @@ import pytest
 
 from aea.helpers.pipe import (
     IPCChannelClient,
+    PipeWriter,
     PosixNamedPipeChannel,
     PosixNamedPipeChannelClient,
     TCPSocketChannel,
@@ -189,3 +192,83 @@ class TestAEAHelperPosixNamedPipeChannel:
         finally:
             await pipe.close()
             client.join()
+
+    @pytest.mark.asyncio
+    async def test_large_frames_communication(self):
+        """Test that frames larger than the pipe buffer are written without blocking the loop."""
+        pipe = PosixNamedPipeChannel()
+        connected = asyncio.ensure_future(pipe.connect())
+        client_pipe = PosixNamedPipeChannelClient(pipe.out_path, pipe.in_path)
+        client = Thread(target=_run_echo_service, args=[client_pipe])
+        client.start()
+
+        try:
+            assert await connected, "Failed to connect pipe"
+
+            messages = [os.urandom(1024 * 1024) for _ in range(4)]
+
+            async def write_messages() -> None:
+                for message in messages:
+                    await pipe.write(message)
+
+            writing = asyncio.ensure_future(write_messages())
+            for message in messages:
+                assert await pipe.read() == message, "Echoed message differs"
+            await writing
+        finally:
+            await pipe.close()
+            client.join()
+
+
+@skip_test_windows
+@pytest.mark.asyncio
+class TestPipeWriter:
+    """Test the non-blocking pipe writer."""
+
+    @staticmethod
+    def _read_frames(fd: int, number_of_frames: int) -> list:
+        """Read frames from the read end of a pipe, blocking."""
+        frames = []
+        with os.fdopen(fd, "rb") as file:
+            for _ in range(number_of_frames):
+                size = struct.unpack("!I", file.read(4))[0]
+                frames.append(file.read(size))
+        return frames
+
+    @pytest.mark.asyncio
+    async def test_buffered_frames_coalesced(self):
+        """Test that the frames buffered while the pipe is full are written in order with fewer writes."""
+        read_fd, write_fd = os.pipe()
+        writer = PipeWriter(write_fd, asyncio.get_event_loop())
+        try:
+            # the first frame fills the pipe, the next ones are buffered
+            frames = [os.urandom(256 * 1024)] + [os.urandom(100) for _ in range(100)]
+            for frame in frames:
+                writer.write_frame(frame)
+            assert writer.buffered_size > 0
+
+            reader = asyncio.get_event_loop().run_in_executor(
+                None, self._read_frames, read_fd, len(frames)
+            )
+            await asyncio.wait_for(writer.flush(), timeout=10)
+            assert await reader == frames
+            assert writer.buffered_size == 0
+            assert writer.stats["frames"] == len(frames)
+            assert writer.stats["writes"] < len(frames)
+        finally:
+            writer.close()
+
+    @pytest.mark.asyncio
+    async def test_broken_pipe(self):
+        """Test that the error of a write to a closed pipe is raised."""
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+        writer = PipeWriter(write_fd, asyncio.get_event_loop())
+        try:
+            writer.write_frame(b"hello")
+            with pytest.raises(BrokenPipeError):
+                await writer.drain()
+            with pytest.raises(BrokenPipeError):
+                writer.write_frame(b"hello")
+        finally:
+            writer.close()
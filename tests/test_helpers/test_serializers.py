@@ -19,8 +19,13 @@
 # ------------------------------------------------------------------------------
 """This module contains the tests for the helpers/serializers module."""
 import pytest
+from google.protobuf.struct_pb2 import Struct  # pylint: disable=no-name-in-module
 
-from aea.helpers.serializers import DictProtobufStructSerializer
+from aea.helpers.serializers import (
+    DictProtobufStructSerializer,
+    encode_varint,
+    length_delimited_field_header,
+)
 
 
 def test_encode_decode_i():
@@ -85,3 +90,35 @@ def test_encode_dict_is_deterministic():
     assert DictProtobufStructSerializer.encode(
         data
     ) == DictProtobufStructSerializer.encode(data)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (0, b"\x00"),
+        (1, b"\x01"),
+        (127, b"\x7f"),
+        (128, b"\x80\x01"),
+        (300, b"\xac\x02"),
+    ],
+)
+def test_encode_varint(value, expected):
+    """Test the encoding of varints."""
+    assert encode_varint(value) == expected
+
+
+def test_encode_varint_negative():
+    """Test negative values cannot be encoded as varints."""
+    with pytest.raises(ValueError, match="Cannot encode negative value"):
+        encode_varint(-1)
+
+
+def test_length_delimited_field_header():
+    """Test the header of a length delimited field matches the protobuf encoding."""
+    value = b"v" * 1000
+    struct_pb = Struct()
+    struct_pb.update({"k": value.decode()})
+    field_pb = struct_pb.fields["k"]
+    encoded = field_pb.SerializeToString()
+    # string_value is the field 3 of google.protobuf.Value
+    assert encoded == length_delimited_field_header(3, len(value)) + value
@@ -17,12 +17,21 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the tests for aea helpers storage code."""
+import asyncio
 import os
+import shutil
+import tempfile
 import time
+from unittest.mock import patch
 
 import pytest
 
-from aea.helpers.storage.generic_storage import Storage
+from aea.exceptions import AEAEnforceError
+from aea.helpers.storage.backends.base import AbstractStorageBackend
+from aea.helpers.storage.backends.sqlite import SqliteStorageBackend
+from aea.helpers.storage.generic_storage import BACKENDS, Storage
+
+from tests.common.utils import wait_for_condition
 
 
 class TestAsyncCollection:
@@ -52,6 +61,12 @@ class TestAsyncCollection:
         await col.remove(obj_id)
         assert await col.get(obj_id) is None
 
+        await col.put_many([("2", {"b": 1}), ("3", {"b": 2})])
+        assert sorted(await col.list()) == [("2", {"b": 1}), ("3", {"b": 2})]
+        assert await col.get_many(["3", "4", "2"]) == [("3", {"b": 2}), ("2", {"b": 1})]
+        await col.remove_many(["2", "3"])
+        assert await col.list() == []
+
         s.stop()
         await s.wait_completed()
 
@@ -83,10 +98,309 @@ class TestSyncCollection:
         col.remove(obj_id)
         assert col.get(obj_id) is None
 
+        col.put_many([("2", {"b": 1}), ("3", {"b": 2})])
+        assert sorted(col.list()) == [("2", {"b": 1}), ("3", {"b": 2})]
+        assert col.get_many(["3", "4", "2"]) == [("3", {"b": 2}), ("2", {"b": 1})]
+        col.remove_many(["2", "3"])
+        assert col.list() == []
+        col.put_many([])
+        col.remove_many([])
+
         s.stop()
         s.wait_completed(sync=True, timeout=5)
 
 
+class TestSqliteStorage:
+    """Test sqlite storage backend specific features."""
+
+    def setup(self):
+        """Set up the test."""
+        self.storage = Storage("sqlite://:memory:", threaded=True)
+        self.storage.start()
+        wait_for_condition(lambda: self.storage.is_connected, timeout=10)
+
+    def teardown(self):
+        """Tear down the test."""
+        self.storage.stop()
+        self.storage.wait_completed(sync=True, timeout=10)
+
+    def test_indexes(self):
+        """Test the find on an indexed field uses the index."""
+        col = self.storage.get_sync_collection("test_col", indexes=["a.b"])
+        col.put_many([(str(i), {"a": {"b": i % 10}}) for i in range(100)])
+        assert sorted(col.find("a.b", 3)) == sorted(
+            (str(i), {"a": {"b": 3}}) for i in range(3, 100, 10)
+        )
+        assert len(col.find("$.a.b", 3)) == 10
+        assert len(col.find("a[0]", 3)) == 0
+
+        backend = self.storage._backend
+        plan = asyncio.run_coroutine_threadsafe(
+            backend._executute_sql(
+                "EXPLAIN QUERY PLAN SELECT object_id FROM test_col WHERE json_extract(object_body, '$.a.b') = 3;"
+            ),
+            self.storage._loop,
+        ).result()
+        assert "test_col_a_b_idx" in str(plan)
+
+        with pytest.raises(ValueError, match="Invalid field name:"):
+            self.storage.get_sync_collection("test_col", indexes=["a'); --"])
+
+    def test_apply_changes(self):
+        """Test changes are applied to several collections."""
+        col = self.storage.get_sync_collection("test_col")
+        col2 = self.storage.get_sync_collection("test_col_2")
+        col.put("1", {"a": 1})
+        self.storage.apply_changes_sync(
+            [(col.name, [("2", {"a": 2})], ["1"]), (col2.name, [("3", {"a": 3})], [])]
+        )
+        assert col.list() == [("2", {"a": 2})]
+        assert col2.list() == [("3", {"a": 3})]
+        self.storage.apply_changes_sync([(col.name, [], [])])
+
+        with pytest.raises(ValueError, match="Invalid collection name:"):
+            self.storage.apply_changes_sync([("bad name", [("4", {})], [])])
+        with pytest.raises(Exception):
+            self.storage.apply_changes_sync(
+                [(col.name, [("4", {})], []), ("not_existing", [("5", {})], [])]
+            )
+        # the changes are applied in a single transaction
+        assert col.get("4") is None
+
+
+class TestLogStorage:
+    """Test append-only log storage backend."""
+
+    def setup(self):
+        """Set up the test."""
+        self.path = tempfile.mkdtemp()
+        self.storage = self.start_storage()
+
+    def start_storage(self, parameters: str = "segment_size=512") -> Storage:
+        """Start a storage on the test directory."""
+        storage = Storage(f"log://{self.path}?{parameters}", threaded=True)
+        storage.start()
+        wait_for_condition(lambda: storage.is_connected, timeout=10)
+        return storage
+
+    def restart_storage(self) -> None:
+        """Restart the storage, the collections are loaded back from the log."""
+        self.storage.stop()
+        self.storage.wait_completed(sync=True, timeout=10)
+        self.storage = self.start_storage()
+
+    def teardown(self):
+        """Tear down the test."""
+        self.storage.stop()
+        self.storage.wait_completed(sync=True, timeout=10)
+        shutil.rmtree(self.path)
+
+    def test_collection(self):
+        """Test collection methods, and the objects are loaded back on connect."""
+        col = self.storage.get_sync_collection("test_col", indexes=["a.b"])
+        col.put_many([(str(i), {"a": {"b": i % 10}, "c": i}) for i in range(100)])
+        col.remove_many(["3", "4"])
+        col.put("5", {"a": {"b": 0}, "c": 5})
+        assert col.get("3") is None
+        assert col.get("13") == {"a": {"b": 3}, "c": 13}
+        assert col.get_many(["2", "3", "1"]) == [
+            ("2", {"a": {"b": 2}, "c": 2}),
+            ("1", {"a": {"b": 1}, "c": 1}),
+        ]
+        assert len(col.list()) == 98
+        # objects are listed in the order they were last put
+        assert col.list()[-1] == ("5", {"a": {"b": 0}, "c": 5})
+        assert len(col.find("a.b", 3)) == 9
+        assert len(col.find("$.a.b", 0)) == 11
+        assert col.find("c", 13) == [("13", {"a": {"b": 3}, "c": 13})]
+        assert col.find("c.d", 13) == []
+
+        self.restart_storage()
+        col = self.storage.get_sync_collection("test_col", indexes=["a.b"])
+        assert len(col.list()) == 98
+        assert col.list()[-1] == ("5", {"a": {"b": 0}, "c": 5})
+        assert col.get("3") is None
+        assert len(col.find("a.b", 5)) == 9
+        assert len(col.find("a.b", 0)) == 11
+
+        with pytest.raises(ValueError, match="Invalid field name:"):
+            self.storage.get_sync_collection("test_col", indexes=["a'); --"])
+
+    def test_compaction(self):
+        """Test the garbage of the collection is compacted."""
+        col = self.storage.get_sync_collection("test_col")
+        for i in range(50):
+            col.put_many([(str(j), {"a": i}) for j in range(10)])
+        collection = self.storage._backend._collections["test_col"]
+        assert collection.garbage_bytes <= max(512, collection.size // 2)
+        assert len(os.listdir(os.path.join(self.path, "test_col"))) <= 3
+        assert col.list() == [(str(j), {"a": 49}) for j in range(10)]
+
+        col.remove_many([str(j) for j in range(5)])
+        asyncio.run_coroutine_threadsafe(
+            self.storage._backend.compact("test_col"), self.storage._loop
+        ).result()
+        assert collection.garbage_bytes == 0
+
+        self.restart_storage()
+        col = self.storage.get_sync_collection("test_col")
+        assert col.list() == [(str(j), {"a": 49}) for j in range(5, 10)]
+
+    def test_recovery(self):
+        """Test a record partially written on a crash is truncated."""
+        col = self.storage.get_sync_collection("test_col")
+        col.put("1", {"a": 1})
+        col.put("2", {"a": 2})
+        self.storage.stop()
+        self.storage.wait_completed(sync=True, timeout=10)
+        segment_path = os.path.join(self.path, "test_col", "0000000000.seg")
+        size = os.path.getsize(segment_path)
+        with open(segment_path, "r+b") as f:
+            f.truncate(size - 1)
+
+        self.storage = self.start_storage()
+        col = self.storage.get_sync_collection("test_col")
+        assert col.list() == [("1", {"a": 1})]
+        col.put("3", {"a": 3})
+        self.restart_storage()
+        col = self.storage.get_sync_collection("test_col")
+        assert col.list() == [("1", {"a": 1}), ("3", {"a": 3})]
+
+    def test_fsync(self):
+        """Test the writes forced on the disk are done in the executor."""
+        self.storage.stop()
+        self.storage.wait_completed(sync=True, timeout=10)
+        self.storage = self.start_storage("fsync=1")
+        col = self.storage.get_sync_collection("test_col")
+        with patch("os.fsync") as fsync_mock:
+            col.put("1", {"a": 1})
+        fsync_mock.assert_called_once()
+        assert col.get("1") == {"a": 1}
+
+        # the executor threads are stopped on disconnect
+        threads = set(self.storage._backend._executor._threads)
+        assert threads
+        self.storage.stop()
+        self.storage.wait_completed(sync=True, timeout=10)
+        assert not any(thread.is_alive() for thread in threads)
+        self.storage = self.start_storage("fsync=1")
+        col = self.storage.get_sync_collection("test_col")
+        assert col.get("1") == {"a": 1}
+
+    def test_bad_parameters(self):
+        """Test the bad parameters of the storage uri raise an exception."""
+        with pytest.raises(ValueError, match="Invalid segment_size in storage uri:"):
+            Storage("log://./data?segment_size=x")
+        with pytest.raises(ValueError, match="Segment size must be positive."):
+            Storage("log://./data?segment_size=0")
+
+
+class TestStorageCache:
+    """Test storage collections cache."""
+
+    def setup(self):
+        """Set up the test."""
+        self.storage = Storage("sqlite://:memory:?cache_size=2", threaded=True)
+        self.storage.start()
+        wait_for_condition(lambda: self.storage.is_connected, timeout=10)
+
+    def teardown(self):
+        """Tear down the test."""
+        self.storage.stop()
+        self.storage.wait_completed(sync=True, timeout=10)
+
+    def test_sync_collection(self):
+        """Test sync collection reads are cached and writes are written through."""
+        col = self.storage.get_sync_collection("test_col")
+        assert col.cache.max_size == 2
+        col.put("1", {"a": 1})
+        with patch.object(self.storage._backend, "get") as get_mock:
+            assert col.get("1") == {"a": 1}
+        get_mock.assert_not_called()
+        assert col.cache.stats["hits"] == 1
+
+        col.put_many([("2", {"a": 2}), ("3", {"a": 3})])
+        assert col.cache.stats["evictions"] == 1
+        assert col.get("1") == {"a": 1}
+        assert col.get("4") is None
+        assert col.cache.stats["misses"] == 2
+        assert col.get_many(["1", "3", "4"]) == [("1", {"a": 1}), ("3", {"a": 3})]
+        assert col.cache.hit_rate == 0.5
+
+        col.remove("1")
+        assert col.get("1") is None
+        col.remove_many(["3"])
+        assert col.get_many(["3"]) == []
+        self.storage.apply_changes_sync([(col.name, [("5", {"a": 5})], ["2"])])
+        with patch.object(self.storage._backend, "get") as get_mock:
+            assert col.get("5") == {"a": 5}
+        get_mock.assert_not_called()
+        assert col.get("2") is None
+
+        # collections with the same name share the cache
+        assert self.storage.get_sync_collection("test_col").cache is col.cache
+        assert self.storage.cache_stats["test_col"] == col.cache.stats
+        assert (
+            self.storage.get_sync_collection("not_cached", cache_size=0).cache is None
+        )
+
+    def test_cached_bodies_copied(self):
+        """Test the changes made to the bodies written are not cached."""
+        col = self.storage.get_sync_collection("test_col")
+        body = {"a": [1]}
+        col.put("1", body)
+        body["a"].append(2)
+        col.put_many([("2", body)])
+        body["a"].append(3)
+        self.storage.apply_changes_sync([(col.name, [("3", body)], [])])
+        body["a"].append(4)
+
+        assert col.get("1") == {"a": [1]}
+        assert col.get_many(["2", "3"]) == [
+            ("2", {"a": [1, 2]}),
+            ("3", {"a": [1, 2, 3]}),
+        ]
+
+    def test_cached_bodies_read_copied(self):
+        """Test the changes made to the bodies read are not cached."""
+        col = self.storage.get_sync_collection("test_col")
+        col.put("1", {"a": [1]})
+        col.cache.remove_many(["1"])
+
+        # read from the storage backend, then from the cache
+        for _ in range(2):
+            col.get("1")["a"].append(2)
+            col.get_many(["1"])[0][1]["a"].append(3)
+        assert col.get("1") == {"a": [1]}
+        assert col.cache.stats["hits"] > 0
+
+    @pytest.mark.asyncio
+    async def test_async_collection(self):
+        """Test async collection reads are cached."""
+        col = asyncio.run_coroutine_threadsafe(
+            self.storage.get_collection("test_col", cache_size=10), self.storage._loop
+        ).result()
+
+        async def _run():
+            await col.put("1", {"a": 1})
+            assert await col.get("1") == {"a": 1}
+            assert await col.get_many(["1", "2"]) == [("1", {"a": 1})]
+            await col.remove("1")
+            assert await col.get("1") is None
+
+        asyncio.run_coroutine_threadsafe(_run(), self.storage._loop).result()
+        assert col.cache.max_size == 10
+        assert col.cache.stats["hits"] == 2
+
+    def test_cache_size_validation(self):
+        """Test invalid cache sizes."""
+        with pytest.raises(ValueError, match="Invalid cache_size in storage uri: x"):
+            Storage("sqlite://:memory:?cache_size=x")
+        with pytest.raises(AEAEnforceError, match="Cache size must be positive."):
+            self.storage.get_sync_collection("test_col", cache_size=-1)
+        assert Storage("sqlite://:memory:?cache_size=0")._cache_size is None
+
+
 class TestMisc:
     """Various tests."""
 
@@ -101,6 +415,26 @@ class TestMisc:
             s.stop()
             s.wait_completed(sync=True, timeout=10)
 
+    def test_backend_without_indexes(self):
+        """Test the indexes are ignored by a backend implementing only the collection creation."""
+
+        class _Backend(SqliteStorageBackend):
+            async def ensure_collection(self, collection_name: str) -> None:
+                await super().ensure_collection(collection_name)
+
+            ensure_indexes = AbstractStorageBackend.ensure_indexes
+
+        with patch.dict(BACKENDS, {"custom": _Backend}):
+            s = Storage("custom://:memory:", threaded=True)
+        s.start()
+        try:
+            col = s.get_sync_collection("test_col", indexes=["a.b"])
+            col.put("1", {"a": {"b": 1}})
+            assert col.find("a.b", 1) == [("1", {"a": {"b": 1}})]
+        finally:
+            s.stop()
+            s.wait_completed(sync=True, timeout=10)
+
     def test_unsupoported_backend(self):
         """Test unsupported backed raises exception."""
         with pytest.raises(
@@ -310,6 +310,50 @@ def test_envelope_message_bytes():
     assert expected_message_bytes == actual_message_bytes
 
 
+def test_envelope_message_bytes_cached():
+    """Test the message is encoded once, until the message of the envelope is replaced."""
+    message = DefaultMessage(DefaultMessage.Performative.BYTES, content=b"message")
+    envelope = Envelope(to="to", sender="sender", message=message)
+
+    with unittest.mock.patch.object(
+        DefaultMessage, "encode", return_value=b"encoded"
+    ) as encode_mock:
+        assert envelope.message_bytes == b"encoded"
+        envelope.encode()
+        encode_mock.assert_called_once()
+
+        envelope.message = DefaultMessage(
+            DefaultMessage.Performative.BYTES, content=b"other"
+        )
+        assert envelope.message_bytes == b"encoded"
+        assert encode_mock.call_count == 2
+
+
+@pytest.mark.parametrize("message", [b"", b"message", b"m" * 100000])
+@pytest.mark.parametrize("uri", [None, URI("/uri")])
+@pytest.mark.parametrize("to", ["", "to", "t" * 200])
+def test_protobuf_envelope_serializer_matches_protobuf(to, uri, message):
+    """Test the fields written by the envelope serializer give the bytes of the protobuf envelope."""
+    envelope = Envelope(
+        to=to,
+        sender="sender",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+        message=message,
+        context=EnvelopeContext(uri=uri),
+    )
+    envelope_pb = base_pb2.Envelope()
+    envelope_pb.to = to
+    envelope_pb.sender = "sender"
+    envelope_pb.protocol_id = "author/name:0.1.0"
+    envelope_pb.message = message
+    if uri is not None:
+        envelope_pb.uri = str(uri)
+
+    serializer = ProtobufEnvelopeSerializer()
+    assert serializer.encode(envelope) == envelope_pb.SerializeToString()
+    assert b"".join(serializer.encode_parts(envelope)) == serializer.encode(envelope)
+
+
 def test_envelope_context_connection_id():
     """Test the property EnvelopeContext.connection_id."""
     connection_id = PublicId("author", "skill_name", "0.1.0")
@@ -348,6 +392,40 @@ def test_envelope_to_as_public_id():
     assert env.to_as_public_id is not None
 
 
+def test_envelope_addresses_classification():
+    """Test the classification of the addresses is updated with them."""
+    env = Envelope(
+        to="some_author/some_name:0.1.0",
+        sender="some_author/some_name:0.1.0",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+        message=b"message",
+    )
+    assert env.is_to_public_id
+    assert env.is_sender_public_id
+    assert env.is_component_to_component_message
+    assert env.to_as_public_id == PublicId("some_author", "some_name", "0.1.0")
+
+    env.to = "agent_address"
+    assert not env.is_to_public_id
+    assert env.to_as_public_id is None
+    assert not env.is_component_to_component_message
+
+    env.sender = "other_agent_address"
+    assert not env.is_sender_public_id
+
+    with unittest.mock.patch.object(
+        PublicId, "_from_str_cached", side_effect=ValueError
+    ):
+        env.sender = "some_author/some_name:0.1.0"
+        env.to = "some_author/some_name:0.1.0"
+    assert not env.is_sender_public_id
+    assert not env.is_to_public_id
+
+    env.to = "other_author/other_name:0.2.0"
+    assert env.is_to_public_id
+    assert env.to_as_public_id == PublicId("other_author", "other_name", "0.2.0")
+
+
 def test_envelope_constructor():
     """Test Envelope constructor checks."""
     Envelope(
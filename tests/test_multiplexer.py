@@ -27,7 +27,7 @@ import tempfile
 import time
 import unittest.mock
 from pathlib import Path
-from threading import Thread
+from threading import Event, Thread
 from typing import cast
 from unittest import mock
 from unittest.mock import MagicMock, Mock, call, patch
@@ -37,8 +37,10 @@ from pexpect.exceptions import EOF  # type: ignore
 
 import aea
 from aea.cli.core import cli
+from aea.configurations.base import ConnectionConfig, PublicId
 from aea.configurations.constants import DEFAULT_LEDGER
 from aea.connections.base import ConnectionStates
+from aea.exceptions import AEAEnforceError
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.identity.base import Identity
@@ -66,7 +68,7 @@ from .conftest import (
 )
 from .data.dummy_connection.connection import DummyConnection
 from tests.common.pexpect_popen import PexpectWrapper
-from tests.common.utils import wait_for_condition
+from tests.common.utils import wait_for_condition, wait_for_condition_async
 
 
 UnknownProtocolMock = Mock()
@@ -1229,3 +1231,373 @@ async def test_multiplexer_race_condition() -> None:
     # the message has been processed, no more active waiters should be present
     assert len(multiplexer.in_queue._non_empty_waiters) == 0
     thread.join(timeout=1)
+
+
+class OtherDummyConnection(DummyConnection):
+    """A dummy connection with a different connection id."""
+
+    connection_id = PublicId.from_str("fetchai/other_dummy:0.1.0")
+
+
+def _make_dummy_envelope(to: str = "to", sender: str = "sender") -> Envelope:
+    """Make a dummy envelope with a default protocol message."""
+    msg = DefaultMessage(
+        performative=DefaultMessage.Performative.BYTES,
+        content=b"",
+    )
+    msg.to = to
+    msg.sender = sender
+    return Envelope(to=to, sender=sender, message=msg)
+
+
+def test_batch_size_must_be_positive():
+    """Test the multiplexer refuses a non positive batch size."""
+    with pytest.raises(AEAEnforceError, match="Batch size must be a positive integer."):
+        AsyncMultiplexer([_make_dummy_connection()], batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_batched_mode_inbox_outbox():
+    """Test envelopes round trip through the multiplexer in batched mode."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1], loop=asyncio.get_event_loop(), batch_size=10
+    )
+    assert multiplexer.is_batched
+    envelopes = [_make_dummy_envelope(to=f"to_{i}") for i in range(25)]
+    try:
+        with patch.object(
+            connection_1, "send_batch", wraps=connection_1.send_batch
+        ) as send_batch_mock:
+            await multiplexer.connect()
+            inbox = InBox(multiplexer)
+            outbox = OutBox(multiplexer)
+            for envelope in envelopes:
+                outbox.put(envelope)
+
+            received = [await inbox.async_get() for _ in envelopes]
+            assert received == envelopes
+            assert inbox.empty()
+            # batches are bounded by the batch size
+            batches = [c.args[0] for c in send_batch_mock.call_args_list]
+            assert sum(len(batch) for batch in batches) == len(envelopes)
+            assert all(len(batch) <= multiplexer.batch_size for batch in batches)
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_send_batch_grouped_by_connection():
+    """Test a batch of envelopes is grouped per target connection."""
+    connection_1 = _make_dummy_connection()
+    connection_2 = OtherDummyConnection(
+        configuration=ConnectionConfig(
+            connection_id=OtherDummyConnection.connection_id
+        ),
+        data_dir=MagicMock(),
+        identity=Identity("name", "address", "public_key"),
+    )
+    multiplexer = AsyncMultiplexer(
+        [connection_1, connection_2], protocols=[DefaultProtocolMock], batch_size=10
+    )
+    envelope_1 = _make_dummy_envelope(to="to_1")
+    envelope_2 = _make_dummy_envelope(to="to_2")
+    envelope_3 = _make_dummy_envelope(to="to_3")
+    multiplexer._routing_helper["to_2"] = connection_2.connection_id
+
+    with patch.object(connection_1, "send_batch") as send_batch_1, patch.object(
+        connection_2, "send_batch"
+    ) as send_batch_2:
+        await multiplexer._send_batch([envelope_1, envelope_2, envelope_3])
+    send_batch_1.assert_called_once_with([envelope_1, envelope_3])
+    send_batch_2.assert_called_once_with([envelope_2])
+
+
+@pytest.mark.asyncio
+async def test_send_batch_stops_on_none_envelope():
+    """Test the batched sending loop sends drained envelopes then exits on None."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1], loop=asyncio.get_event_loop(), batch_size=10
+    )
+    try:
+        await multiplexer.connect()
+        envelope = _make_dummy_envelope()
+        multiplexer.put(envelope)
+        multiplexer.put(None)
+        received = await multiplexer.async_get()
+        assert received == envelope
+        await asyncio.sleep(0.1)
+        assert multiplexer._send_loop_task.done()
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_connection_default_batch_methods():
+    """Test the default batch methods of a connection fall back to send and receive."""
+    connection = _make_dummy_connection()
+    await connection.connect()
+    envelopes = [_make_dummy_envelope(to=f"to_{i}") for i in range(3)]
+
+    await connection.send_batch(envelopes)
+    for envelope in envelopes:
+        assert await connection.receive_batch() == [envelope]
+
+    await connection.disconnect()
+    assert await connection.receive_batch() is None
+
+
+@pytest.mark.asyncio
+async def test_routing_table_cache():
+    """Test the compiled routing table is used and invalidated."""
+    connection_1 = _make_dummy_connection()
+    connection_2 = OtherDummyConnection(
+        configuration=ConnectionConfig(
+            connection_id=OtherDummyConnection.connection_id
+        ),
+        data_dir=MagicMock(),
+        identity=Identity("name", "address", "public_key"),
+    )
+    multiplexer = AsyncMultiplexer(
+        [connection_1, connection_2], protocols=[DefaultProtocolMock]
+    )
+    multiplexer._set_default_connection_if_none()
+    envelope = _make_dummy_envelope(to="to_1")
+
+    assert multiplexer._get_connection_for_envelope(envelope) == connection_1
+    assert (multiplexer.routing_table_hits, multiplexer.routing_table_misses) == (0, 1)
+    with patch.object(multiplexer, "_route_envelope") as route_mock:
+        assert multiplexer._get_connection_for_envelope(envelope) == connection_1
+    route_mock.assert_not_called()
+    assert (multiplexer.routing_table_hits, multiplexer.routing_table_misses) == (1, 1)
+
+    # a new route learnt from an incoming envelope invalidates the cached one
+    multiplexer._update_routing_helper(
+        _make_dummy_envelope(to="sender", sender="to_1"), connection_2
+    )
+    assert multiplexer._get_connection_for_envelope(envelope) == connection_2
+    assert (multiplexer.routing_table_hits, multiplexer.routing_table_misses) == (1, 2)
+
+    # changing the default routing invalidates the whole table
+    multiplexer.default_routing = {}
+    assert multiplexer._routing_table == {}
+
+    # envelopes routed by their context are not cached
+    envelope_with_context = Envelope(
+        to="to_2",
+        sender="sender",
+        message=_make_dummy_envelope(to="to_2").message,
+        context=EnvelopeContext(connection_id=connection_2.connection_id),
+    )
+    assert (
+        multiplexer._get_connection_for_envelope(envelope_with_context) == connection_2
+    )
+    assert "to_2" not in multiplexer._routing_table
+
+
+def test_routing_table_bounded():
+    """Test the compiled routing table does not grow beyond its max size."""
+    with patch.object(AsyncMultiplexer, "ROUTING_TABLE_MAX_SIZE", 2):
+        multiplexer = AsyncMultiplexer([_make_dummy_connection()])
+    multiplexer._set_default_connection_if_none()
+    for to in ["to_0", "to_1", "to_0", "to_2"]:
+        multiplexer._get_connection_for_envelope(_make_dummy_envelope(to=to))
+    # the least recently used address is evicted
+    assert list(multiplexer._routing_table.keys()) == ["to_0", "to_2"]
+
+
+def test_routing_helper_bounded():
+    """Test the routing helper forgets the least recently seen senders."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer([connection_1], routing_helper_max_size=2)
+    multiplexer._set_default_connection_if_none()
+    for i in range(3):
+        multiplexer._update_routing_helper(
+            _make_dummy_envelope(to="me", sender=f"sender_{i}"), connection_1
+        )
+    assert multiplexer.routing_helper_size == 2
+    assert multiplexer.routing_helper_evictions == 1
+    assert "sender_0" not in multiplexer._routing_helper
+
+
+def test_routing_helper_eviction_invalidates_routes():
+    """Test the routes compiled for an evicted sender are invalidated."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer([connection_1], routing_helper_ttl=10)
+    multiplexer._set_default_connection_if_none()
+    with patch("time.monotonic", return_value=0):
+        multiplexer._update_routing_helper(
+            _make_dummy_envelope(to="me", sender="counterparty"), connection_1
+        )
+        multiplexer._get_connection_for_envelope(
+            _make_dummy_envelope(to="counterparty", sender="me")
+        )
+    assert "counterparty" in multiplexer._routing_table
+    with patch("time.monotonic", return_value=20):
+        multiplexer._update_routing_helper(
+            _make_dummy_envelope(to="me", sender="other"), connection_1
+        )
+    assert multiplexer.routing_helper_evictions == 1
+    assert "counterparty" not in multiplexer._routing_table
+
+
+def test_routing_table_hit_refreshes_routing_helper():
+    """Test the routing helper entry of an address routed with the routing table does not expire."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer([connection_1], routing_helper_ttl=10)
+    multiplexer._set_default_connection_if_none()
+    envelope = _make_dummy_envelope(to="counterparty", sender="me")
+    with patch("time.monotonic", return_value=0):
+        multiplexer._update_routing_helper(
+            _make_dummy_envelope(to="me", sender="counterparty"), connection_1
+        )
+        multiplexer._get_connection_for_envelope(envelope)
+    for now in (8, 16):
+        with patch("time.monotonic", return_value=now):
+            assert multiplexer._get_connection_for_envelope(envelope) == connection_1
+    assert multiplexer.routing_table_hits == 2
+    with patch("time.monotonic", return_value=24):
+        multiplexer._update_routing_helper(
+            _make_dummy_envelope(to="me", sender="other"), connection_1
+        )
+    assert multiplexer.routing_helper_evictions == 0
+    assert multiplexer.routing_helper_size == 2
+
+
+def test_queue_max_size_must_not_be_negative():
+    """Test the queues max size is validated."""
+    with pytest.raises(AEAEnforceError, match="Queue max size must not be negative."):
+        AsyncMultiplexer(in_queue_max_size=-1)
+    with pytest.raises(AEAEnforceError, match="Queue max size must not be negative."):
+        AsyncMultiplexer(out_queue_max_size=-1)
+
+
+@pytest.mark.asyncio
+async def test_in_queue_overflow_reject():
+    """Test incoming envelopes are rejected when the in queue is full."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1],
+        loop=asyncio.get_event_loop(),
+        in_queue_max_size=2,
+        in_queue_overflow_policy="reject",
+    )
+    rejection_callback = MagicMock()
+    multiplexer.set_rejection_callback(rejection_callback)
+    envelopes = [_make_dummy_envelope(to=f"to_{i}") for i in range(5)]
+    try:
+        await multiplexer.connect()
+        for envelope in envelopes:
+            connection_1.put(envelope)
+        await wait_for_condition_async(
+            lambda: multiplexer.queue_stats["in_queue"]["rejected"] == 3, timeout=5
+        )
+        assert multiplexer.in_queue_depth == 2
+        assert rejection_callback.call_count == 3
+        rejection_callback.assert_called_with(envelopes[-1], "in_queue")
+        inbox = InBox(multiplexer)
+        assert [inbox.get_nowait(), inbox.get_nowait()] == envelopes[:2]
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_in_queue_overflow_block():
+    """Test the receiving loop waits for room in a full in queue."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1], loop=asyncio.get_event_loop(), in_queue_max_size=1
+    )
+    envelopes = [_make_dummy_envelope(to=f"to_{i}") for i in range(5)]
+    try:
+        await multiplexer.connect()
+        for envelope in envelopes:
+            connection_1.put(envelope)
+        await asyncio.sleep(0.1)
+        assert multiplexer.in_queue_depth == 1
+
+        inbox = InBox(multiplexer)
+        received = [
+            await asyncio.wait_for(inbox.async_get(), timeout=5) for _ in envelopes
+        ]
+        assert received == envelopes
+        assert multiplexer.queue_stats["in_queue"] == {
+            "depth": 0,
+            "max_size": 1,
+            "dropped": 0,
+            "rejected": 0,
+        }
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_out_queue_overflow_drop_oldest():
+    """Test the oldest outgoing envelopes are dropped when the out queue is full."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1],
+        loop=asyncio.get_event_loop(),
+        out_queue_max_size=2,
+        out_queue_overflow_policy="drop_oldest",
+    )
+    assert multiplexer.out_queue_depth == 0
+    assert multiplexer.queue_stats["out_queue"] == {
+        "depth": 0,
+        "max_size": 2,
+        "dropped": 0,
+        "rejected": 0,
+    }
+    envelopes = [_make_dummy_envelope(to=f"to_{i}") for i in range(5)]
+    try:
+        await multiplexer.connect()
+        outbox = OutBox(multiplexer)
+        for envelope in envelopes:
+            outbox.put(envelope)
+        assert multiplexer.queue_stats["out_queue"] == {
+            "depth": 2,
+            "max_size": 2,
+            "dropped": 3,
+            "rejected": 0,
+        }
+
+        inbox = InBox(multiplexer)
+        received = [
+            await asyncio.wait_for(inbox.async_get(), timeout=5) for _ in range(2)
+        ]
+        assert received == envelopes[3:]
+    finally:
+        await multiplexer.disconnect()
+
+
+def test_out_queue_overflow_block_threaded():
+    """Test a producer in another thread waits for room in the out queue."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = Multiplexer([connection_1], out_queue_max_size=1)
+    release = Event()
+
+    async def slow_send(envelope: Envelope) -> None:
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        connection_1.put(envelope)
+
+    envelopes = [_make_dummy_envelope(to=f"to_{i}") for i in range(3)]
+    with patch.object(connection_1, "send", side_effect=slow_send):
+        multiplexer.connect()
+        try:
+            producer = Thread(target=lambda: [multiplexer.put(e) for e in envelopes])
+            producer.start()
+            # the first envelope is being sent, the second fills the queue
+            wait_for_condition(lambda: multiplexer.out_queue_depth == 1, timeout=5)
+            time.sleep(0.1)
+            assert producer.is_alive()
+
+            release.set()
+            producer.join(timeout=5)
+            assert not producer.is_alive()
+            received = [multiplexer.get(block=True, timeout=5) for _ in envelopes]
+            assert received == envelopes
+        finally:
+            release.set()
+            multiplexer.disconnect()
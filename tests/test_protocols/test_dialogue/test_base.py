@@ -34,6 +34,7 @@ from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import DialogueLabel, DialogueMessage, DialogueStats
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 from aea.protocols.dialogue.base import (
+    EncodedMessage,
     InvalidDialogueMessage,
     PersistDialoguesStorage,
     PersistDialoguesStorageWithOffloading,
@@ -109,6 +110,8 @@ class Dialogues(BaseDialogues):
         message_class=DefaultMessage,
         dialogue_class=Dialogue,
         keep_terminal_state_dialogues=None,
+        dialogues_flush_interval=None,
+        message_history_size=None,
     ) -> None:
         """
         Initialize dialogues.
@@ -136,6 +139,8 @@ class Dialogues(BaseDialogues):
             dialogue_class=dialogue_class,
             role_from_first_message=role_from_first_message,
             keep_terminal_state_dialogues=keep_terminal_state_dialogues,
+            dialogues_flush_interval=dialogues_flush_interval,
+            message_history_size=message_history_size,
         )
 
 
@@ -405,6 +410,43 @@ class TestDialogueBase:
 
         assert self.dialogue.last_message.message_id == 2
 
+    def test_message_history_size(self):
+        """Test the messages older than the message history size are kept encoded."""
+        self.dialogue.message_history_size = 1
+        self.dialogue._update(self.valid_message_1_by_self)
+        self.dialogue._update(self.valid_message_2_by_other)
+        self.dialogue._update(self.valid_message_3_by_self)
+
+        assert isinstance(self.dialogue._outgoing_messages[0], EncodedMessage)
+        assert self.dialogue._outgoing_messages[1] is self.valid_message_3_by_self
+        assert self.dialogue._incoming_messages[0] is self.valid_message_2_by_other
+        assert self.dialogue.get_message_by_id(1) == self.valid_message_1_by_self
+        assert self.dialogue.last_message is self.valid_message_3_by_self
+        assert "message_id=1" in str(self.dialogue)
+
+        data = self.dialogue.json()
+        restored = Dialogue.from_json(DefaultMessage, data)
+        assert not isinstance(restored._outgoing_messages[0], EncodedMessage)
+        assert restored == self.dialogue
+        restored = Dialogue.from_json(DefaultMessage, data, message_history_size=1)
+        assert isinstance(restored._outgoing_messages[0], EncodedMessage)
+        assert restored.json() == data
+        assert restored == self.dialogue
+
+        self.dialogue.message_history_size = None
+        self.dialogue.reply(
+            target_message=self.valid_message_2_by_other,
+            performative=DefaultMessage.Performative.BYTES,
+            content=b"Hello back 3",
+        )
+        assert isinstance(self.dialogue._outgoing_messages[0], EncodedMessage)
+        assert not isinstance(self.dialogue._outgoing_messages[1], EncodedMessage)
+
+        with pytest.raises(
+            AEAEnforceError, match="Message history size must be positive."
+        ):
+            self.dialogue.message_history_size = 0
+
     def test_terminal_state_callback(self):
         """Test dialogue terminal state callback works."""
         called = False
@@ -1077,6 +1119,21 @@ class TestDialoguesBase:
         assert self.own_dialogues.message_class == DefaultMessage
         assert self.own_dialogues.dialogue_class == Dialogue
 
+    def test_message_history_size(self):
+        """Test the message history size is set on the dialogues created."""
+        assert self.own_dialogues.message_history_size is None
+        dialogues = Dialogues(self.agent_address, message_history_size=2)
+        assert dialogues.message_history_size == 2
+        _, dialogue = dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        assert dialogue.message_history_size == 2
+
+        with pytest.raises(
+            AEAEnforceError, match="Message history size must be positive."
+        ):
+            Dialogues(self.agent_address, message_history_size=0)
+
     def test_counterparty_from_message(self):
         """Test the 'counterparty_from_message' method."""
         assert (
@@ -1835,6 +1892,208 @@ class TestPersistDialoguesStorage:
         assert not dialogues_storage._incomplete_to_complete_dialogue_labels
         assert not dialogues_storage._terminal_state_dialogues_labels
 
+    def test_write_behind(self):
+        """Test the dialogues changed are written to the generic storage on flush."""
+        self.dialogues._dialogues_flush_interval = 60
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        self.dialogues._dialogues_storage = dialogues_storage
+        dialogues_storage.setup()
+        try:
+            assert dialogues_storage.is_write_behind_enabled
+            active_collection = dialogues_storage._active_dialogues_collection
+            terminal_collection = dialogues_storage._terminal_dialogues_collection
+
+            _, active_dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello",
+            )
+            msg, dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello2",
+            )
+            active_label = str(active_dialogue.dialogue_label)
+            label = str(dialogue.dialogue_label)
+            assert active_collection.get(active_label) is None
+
+            dialogues_storage._snapshot_changed()
+            dialogues_storage.flush()
+            assert active_collection.get(active_label) == active_dialogue.json()
+            assert active_collection.get(label) == dialogue.json()
+            assert active_collection.get(
+                PersistDialoguesStorage.INCOMPLETE_DIALOGUES_OBJECT_NAME
+            )
+
+            dialogue.reply(
+                target_message=msg,
+                performative=DefaultMessage.Performative.ERROR,
+                error_code=ErrorCode.UNSUPPORTED_PROTOCOL,
+                error_msg="oops",
+                error_data={},
+            )
+            dialogues_storage._snapshot_changed()
+            dialogues_storage.flush()
+            assert active_collection.get(label) is None
+            assert terminal_collection.get(label) == dialogue.json()
+
+            dialogues_storage.remove(active_dialogue.dialogue_label)
+            assert active_collection.get(active_label) is not None
+            dialogues_storage.flush()
+            assert active_collection.get(active_label) is None
+        finally:
+            dialogues_storage.teardown()
+        assert not dialogues_storage.is_write_behind_enabled
+
+    def test_write_behind_periodic_flush(self):
+        """Test the dialogues changed are written in the background and on teardown."""
+        self.dialogues._dialogues_flush_interval = 0.1
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        self.dialogues._dialogues_storage = dialogues_storage
+        dialogues_storage.setup()
+        active_collection = dialogues_storage._active_dialogues_collection
+        try:
+            _, dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello",
+            )
+            wait_for_condition(
+                lambda: active_collection.get(str(dialogue.dialogue_label)) is not None,
+                timeout=5,
+            )
+            dialogues_storage._stop_write_behind()
+            _, dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello2",
+            )
+            assert active_collection.get(str(dialogue.dialogue_label)) is None
+        finally:
+            dialogues_storage.teardown()
+        assert active_collection.get(str(dialogue.dialogue_label)) == dialogue.json()
+
+        dialogues_storage_restored = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage_restored._skill_component = self.skill_component
+        dialogues_storage_restored.setup()
+        dialogues_storage_restored.teardown()
+        assert len(dialogues_storage_restored.dialogues_in_active_state) == 2
+
+    def test_write_behind_snapshots(self):
+        """Test the dialogues are snapshotted when changed, and a failed flush is retried."""
+        self.dialogues._dialogues_flush_interval = 60
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        self.dialogues._dialogues_storage = dialogues_storage
+        dialogues_storage.setup()
+        active_collection = dialogues_storage._active_dialogues_collection
+        try:
+            _, dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello",
+            )
+            label = str(dialogue.dialogue_label)
+            snapshot = dialogue.json()
+            assert dialogues_storage._pending_puts[label] == (False, snapshot)
+            assert dialogues_storage._pending_incomplete_labels is not None
+
+            # changes not notified are not seen by the flush
+            dialogue._ordered_message_ids.append(2)
+            assert snapshot["ordered_message_ids"] == [1]
+
+            with patch.object(
+                self.generic_storage,
+                "apply_changes_sync",
+                side_effect=ValueError("expected"),
+            ):
+                with pytest.raises(ValueError, match="expected"):
+                    dialogues_storage.flush()
+            assert dialogues_storage._pending_puts[label] == (False, snapshot)
+            assert dialogues_storage._pending_incomplete_labels is not None
+
+            dialogues_storage.flush()
+            assert active_collection.get(label) == snapshot
+            assert not dialogues_storage._pending_puts
+            assert dialogues_storage._pending_incomplete_labels is None
+        finally:
+            dialogues_storage.teardown()
+
+    def test_write_behind_snapshot_interval(self):
+        """Test the dialogues changed are snapshotted at most once per flush interval."""
+        self.dialogues._dialogues_flush_interval = 60
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        self.dialogues._dialogues_storage = dialogues_storage
+        dialogues_storage.setup()
+        try:
+            msg, dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello",
+            )
+            label = str(dialogue.dialogue_label)
+            snapshot = dialogue.json()
+            assert dialogues_storage._pending_puts[label] == (False, snapshot)
+
+            with patch.object(
+                type(dialogue), "json", side_effect=type(dialogue).json, autospec=True
+            ) as json_mock:
+                dialogue.reply(
+                    target_message=msg,
+                    performative=DefaultMessage.Performative.BYTES,
+                    content=b"Hello again",
+                )
+                json_mock.assert_not_called()
+            assert dialogue.dialogue_label in dialogues_storage._changed_labels
+            assert dialogues_storage._pending_puts[label] == (False, snapshot)
+
+            # the first change after the flush interval elapsed snapshots all the changes
+            dialogues_storage._next_snapshot_time = 0.0
+            _, other_dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello2",
+            )
+            assert not dialogues_storage._changed_labels
+            assert dialogues_storage._pending_puts[label] == (False, dialogue.json())
+            assert dialogues_storage._pending_puts[
+                str(other_dialogue.dialogue_label)
+            ] == (False, other_dialogue.json())
+        finally:
+            dialogues_storage.teardown()
+        active_collection = dialogues_storage._active_dialogues_collection
+        assert active_collection.get(label) == dialogue.json()
+
+    def test_failed_flush_superseded(self):
+        """Test the changes of a failed flush do not override the changes made since."""
+        self.dialogues._dialogues_flush_interval = 60
+        dialogues_storage = PersistDialoguesStorage(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        dialogues_storage._is_write_behind_enabled = True
+        dialogues_storage._pending_removals["removed_since"] = False
+
+        dialogues_storage._restore_pending(
+            {"removed_since": (False, {}), "failed": (False, {})},
+            {"failed_removal": True},
+            [],
+        )
+        assert dialogues_storage._pending_puts == {"failed": (False, {})}
+        assert dialogues_storage._pending_removals == {
+            "removed_since": False,
+            "failed_removal": True,
+        }
+        assert dialogues_storage._pending_incomplete_labels == []
+
+    def test_flush_interval_validation(self):
+        """Test the dialogues flush interval is validated."""
+        with pytest.raises(
+            AEAEnforceError, match="Dialogues flush interval must be positive."
+        ):
+            Dialogues(self.agent_address, dialogues_flush_interval=0)
+
 
 class TestPersistDialoguesStorageOffloading:
     """Test PersistDialoguesStorage."""
@@ -1959,6 +2218,40 @@ class TestPersistDialoguesStorageOffloading:
         )
         assert dialogues_storage_restored.get(dialogue_label) is None
 
+    def test_write_behind(self):
+        """Test the offloaded dialogues with write behind enabled."""
+        self.dialogues._dialogues_flush_interval = 60
+        dialogues_storage = PersistDialoguesStorageWithOffloading(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        self.dialogues._dialogues_storage = dialogues_storage
+        dialogues_storage.setup()
+        try:
+            msg, dialogue = self.dialogues.create(
+                self.opponent_address,
+                DefaultMessage.Performative.BYTES,
+                content=b"Hello",
+            )
+            dialogues_storage.flush()
+            dialogue.reply(
+                target_message=msg,
+                performative=DefaultMessage.Performative.ERROR,
+                error_code=ErrorCode.UNSUPPORTED_PROTOCOL,
+                error_msg="oops",
+                error_data={},
+            )
+            # offloaded, the removal from the active collection is not flushed yet
+            assert dialogues_storage.get_dialogues_with_counterparty(
+                self.opponent_address
+            ) == [dialogue]
+
+            dialogues_storage.flush()
+            # loading an offloaded dialogue does not write it back
+            assert dialogues_storage.get(dialogue.dialogue_label) == dialogue
+            assert not dialogues_storage._pending_puts
+            assert not dialogues_storage._pending_removals
+        finally:
+            dialogues_storage.teardown()
+
 
 class TestBaseDialoguesStorage:
     """Test PersistDialoguesStorage."""
@@ -2151,6 +2444,47 @@ class TestBaseDialoguesStorage:
             == 0
         )
 
+    def test_dialogues_with_counterparty_indexed_by_label(self):
+        """Test dialogues with the same counterparty are added and removed by label."""
+        dialogues = [
+            Dialogue(
+                dialogue_label=DialogueLabel(
+                    dialogue_reference=(str(i), ""),
+                    dialogue_opponent_addr=self.opponent_address,
+                    dialogue_starter_addr=self.agent_address,
+                )
+            )
+            for i in range(10)
+        ]
+        for dialogue in dialogues:
+            self.storage.add(dialogue)
+        assert [
+            dialogue.dialogue_label
+            for dialogue in self.storage.get_dialogues_with_counterparty(
+                self.opponent_address
+            )
+        ] == [dialogue.dialogue_label for dialogue in dialogues]
+        assert {
+            dialogue.dialogue_label
+            for dialogue in self.storage.dialogues_in_active_state
+        } == {dialogue.dialogue_label for dialogue in dialogues}
+
+        # dialogues are compared by messages, so all the dialogues here are equal
+        self.storage.remove(dialogues[5].dialogue_label)
+        assert [
+            dialogue.dialogue_label
+            for dialogue in self.storage.get_dialogues_with_counterparty(
+                self.opponent_address
+            )
+        ] == [dialogue.dialogue_label for dialogue in dialogues[:5] + dialogues[6:]]
+        assert len(self.storage.dialogues_in_active_state) == 9
+
+        for dialogue in dialogues[:5] + dialogues[6:]:
+            self.storage.remove(dialogue.dialogue_label)
+        assert not self.storage.dialogues_in_active_state
+        assert self.storage.get_dialogues_with_counterparty(self.opponent_address) == []
+        assert self.opponent_address not in self.storage._dialogue_by_address
+
     def teardown(self):
         """Tear down the environment to test BaseDialogueStorage."""
 
@@ -73,6 +73,79 @@ class TestFilter:
         active_behaviours = self.filter.get_active_behaviours()
         assert len(active_behaviours) == 0
 
+    def test_behaviours_changed(self):
+        """Test the check of the changes of the behaviours."""
+        filter_ = Filter(Resources(), AsyncFriendlyQueue())
+        assert filter_.behaviours_changed() is True
+        assert filter_.behaviours_changed() is False
+
+        skill = Skill(
+            SkillConfig("name", "author", "0.1.0"),
+            handlers={},
+            behaviours={},
+            models={},
+        )
+        filter_.resources.add_skill(skill)
+        behaviour = DummyBehaviour(name="dummy", skill_context=skill.skill_context)
+        skill.skill_context.new_behaviours.put(behaviour)
+        assert filter_.behaviours_changed() is False
+        filter_.handle_new_handlers_and_behaviours()
+        assert filter_.behaviours_changed() is True
+        assert filter_.behaviours_changed() is False
+
+        skill.skill_context.is_active = False
+        assert filter_.behaviours_changed() is True
+        skill.skill_context.is_active = False
+        assert filter_.behaviours_changed() is False
+
+    def test_active_handlers_and_behaviours_index(self):
+        """Test the index of active handlers and behaviours follows the registries and the skills activity."""
+        skill = Skill(
+            SkillConfig("name", "author", "0.1.0"),
+            handlers={},
+            behaviours={},
+            models={},
+        )
+        self.resources.add_skill(skill)
+        handler = DummyHandler(name="dummy", skill_context=skill.skill_context)
+        behaviour = DummyBehaviour(name="dummy", skill_context=skill.skill_context)
+        skill.skill_context.new_handlers.put(handler)
+        skill.skill_context.new_behaviours.put(behaviour)
+        self.filter.handle_new_handlers_and_behaviours()
+        protocol_id = DummyHandler.SUPPORTED_PROTOCOL
+        try:
+            assert self.filter.get_active_handlers(protocol_id) == [handler]
+            assert self.filter.get_active_handlers(protocol_id, skill.public_id) == [
+                handler
+            ]
+            assert self.filter.get_active_behaviours() == [behaviour]
+
+            # the index is not rebuilt if nothing changed
+            with unittest.mock.patch.object(
+                self.resources.handler_registry, "ids"
+            ) as mock_ids:
+                assert self.filter.get_active_handlers(protocol_id) == [handler]
+                mock_ids.assert_not_called()
+
+            # the activity version is kept per agent resources
+            version = self.resources.skills_activity_version
+            other_resources = Resources()
+            skill.skill_context.is_active = False
+            assert self.resources.skills_activity_version == version + 1
+            assert other_resources.skills_activity_version == 0
+            assert self.filter.get_active_handlers(protocol_id) == []
+            assert self.filter.get_active_handlers(protocol_id, skill.public_id) == []
+            assert self.filter.get_active_behaviours() == []
+
+            skill.skill_context.is_active = True
+            assert self.filter.get_active_handlers(protocol_id) == [handler]
+            assert self.filter.get_active_behaviours() == [behaviour]
+        finally:
+            # restore previous state
+            self.resources.remove_skill(skill.public_id)
+        assert self.filter.get_active_handlers(protocol_id) == []
+        assert self.filter.get_active_behaviours() == []
+
     def test_handle_internal_message_when_none(self):
         """Test handle internal message when the received message is None."""
         with unittest.mock.patch.object(
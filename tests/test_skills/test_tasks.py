@@ -19,17 +19,40 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the tests for the tasks module."""
-
+import asyncio
+import multiprocessing
+import pickle  # nosec
+import threading
+import time
 from unittest import TestCase, mock
 from unittest.mock import Mock, patch
 
-from aea.skills.tasks import Task, TaskManager
+import pytest
+
+from aea.exceptions import AEAEnforceError
+from aea.skills.tasks import (
+    DEFAULT_RESULT_TTL,
+    ProcessTaskManager,
+    SharedBuffer,
+    Task,
+    TaskManager,
+)
+
+from tests.common.utils import wait_for_condition
 
 
 def _raise_exception(self, *args, **kwargs):
     raise Exception()
 
 
+def _fill_shared_buffer(shared_buffer: SharedBuffer, value: int) -> int:
+    """Fill a shared buffer with a value, and get its previous sum."""
+    with shared_buffer:
+        total = sum(shared_buffer.buf)
+        shared_buffer.buf[:] = bytes([value]) * shared_buffer.size
+    return total
+
+
 class TaskTestCase(TestCase):
     """Test case for Task class."""
 
@@ -206,3 +229,191 @@ class TestTaskPoolManagementManager(TestCase):
         self.task_manager.enqueue_task(print)
 
         assert self.task_manager._pool is pool
+
+
+class TestTaskResultLifecycle:
+    """Tests for the task results eviction, cancellation and timeouts."""
+
+    def setup(self):
+        """Set up the test."""
+        self.task_manager = TaskManager(nb_workers=1, result_ttl=0.1)
+        self.task_manager.start()
+
+    def teardown(self):
+        """Tear down the test."""
+        self.task_manager.stop()
+
+    def test_result_ttl(self):
+        """Test the results are evicted once ready for longer than the time to live."""
+        task_id = self.task_manager.enqueue_task(sum, args=([1, 2],))
+        assert self.task_manager.get_task_result(task_id).get(timeout=5) == 3
+        time.sleep(0.2)
+        with pytest.raises(ValueError, match="not present"):
+            self.task_manager.get_task_result(task_id)
+        assert self.task_manager._results_by_task_id == {}
+        assert self.task_manager._pending_tasks == {}
+
+        with pytest.raises(
+            AEAEnforceError, match="Result time to live must be positive."
+        ):
+            TaskManager(result_ttl=0)
+
+    def test_cancel_task(self):
+        """Test a task cancelled before it starts is not executed."""
+        event = threading.Event()
+        func = Mock()
+        blocking_task_id = self.task_manager.enqueue_task(event.wait, args=(5,))
+        task_id = self.task_manager.enqueue_task(func)
+
+        assert self.task_manager.cancel_task(task_id)
+        assert not self.task_manager.cancel_task(task_id)
+        with pytest.raises(ValueError, match="not present"):
+            self.task_manager.get_task_result(task_id)
+
+        event.set()
+        self.task_manager.get_task_result(blocking_task_id).wait(5)
+        next_task_id = self.task_manager.enqueue_task(sum, args=([1],))
+        assert self.task_manager.get_task_result(next_task_id).get(timeout=5) == 1
+        func.assert_not_called()
+        assert not self.task_manager.cancel_task(next_task_id)
+
+    def test_task_timeout(self):
+        """Test a task not done in time is cancelled."""
+        event = threading.Event()
+        with patch.object(self.task_manager.logger, "warning") as warning_mock:
+            task_id = self.task_manager.enqueue_task(event.wait, args=(5,), timeout=0.1)
+            wait_for_condition(lambda: warning_mock.called, timeout=5)
+        warning_mock.assert_called_once_with(f"Task {task_id} timed out, cancelled.")
+        with pytest.raises(ValueError, match="not present"):
+            self.task_manager.get_task_result(task_id)
+        event.set()
+
+        with pytest.raises(AEAEnforceError, match="Timeout must be positive."):
+            self.task_manager.enqueue_task(print, timeout=0)
+
+    def test_task_timeouts_thread(self):
+        """Test the task timeouts share one thread, stopped with the task manager."""
+        event = threading.Event()
+        with patch.object(self.task_manager.logger, "warning") as warning_mock:
+            task_ids = [
+                self.task_manager.enqueue_task(event.wait, args=(5,), timeout=timeout)
+                for timeout in (0.3, 0.1, 0.2)
+            ]
+            assert not any(
+                isinstance(thread, threading.Timer) for thread in threading.enumerate()
+            )
+            wait_for_condition(lambda: warning_mock.call_count == 3, timeout=5)
+        assert [call.args[0] for call in warning_mock.call_args_list] == [
+            f"Task {task_ids[i]} timed out, cancelled." for i in (1, 2, 0)
+        ]
+        event.set()
+        timeouts_thread = self.task_manager._timeouts._thread
+        assert timeouts_thread is not None
+        self.task_manager.stop()
+        assert not timeouts_thread.is_alive()
+
+    def test_default_result_ttl(self):
+        """Test the results are kept for a finite time by default."""
+        assert TaskManager().result_ttl == DEFAULT_RESULT_TTL
+        assert TaskManager(result_ttl=None).result_ttl is None
+
+    @pytest.mark.asyncio
+    async def test_enqueue_task_async(self):
+        """Test the futures of the tasks results."""
+        assert await self.task_manager.enqueue_task_async(sum, args=([1, 2],)) == 3
+        with pytest.raises(ZeroDivisionError):
+            await self.task_manager.enqueue_task_async(divmod, args=(1, 0))
+
+        event = threading.Event()
+        future = self.task_manager.enqueue_task_async(
+            event.wait, args=(5,), timeout=0.1
+        )
+        with pytest.raises(asyncio.TimeoutError):
+            await future
+        event.set()
+
+        event = threading.Event()
+        future = self.task_manager.enqueue_task_async(event.wait, args=(5,))
+        future.cancel()
+        await asyncio.sleep(0)
+        event.set()
+        assert self.task_manager._pending_tasks == {}
+        # the results got with the futures are not kept
+        assert self.task_manager._results_by_task_id == {}
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_futures(self):
+        """Test the futures of the pending tasks are cancelled on stop."""
+        # the pool waits for the running tasks on stop
+        future = self.task_manager.enqueue_task_async(time.sleep, args=(0.1,))
+        self.task_manager.stop()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, timeout=5)
+
+
+class TestSharedBuffer:
+    """Tests for the shared buffers."""
+
+    def test_shared_buffer(self):
+        """Test the shared buffer is pickled by the name of its shared memory."""
+        with SharedBuffer.from_buffer(b"\x01\x02\x03") as shared_buffer:
+            assert shared_buffer.size == 3
+            assert bytes(shared_buffer.buf) == b"\x01\x02\x03"
+            data = pickle.dumps(shared_buffer)
+            assert len(data) < 100
+            assert _fill_shared_buffer(pickle.loads(data), 7) == 6  # nosec
+            assert bytes(shared_buffer.buf) == b"\x07\x07\x07"
+
+            attached = pickle.loads(data)  # nosec
+            with pytest.raises(AEAEnforceError, match="Only the creator"):
+                attached.unlink()
+            attached.close()
+            attached.close()
+            with pytest.raises(ValueError, match="Shared buffer closed."):
+                attached.buf
+
+        with pytest.raises(AEAEnforceError, match="Size must be positive."):
+            SharedBuffer(0)
+
+    @pytest.mark.parametrize(
+        "start_method",
+        [
+            method
+            for method in ("fork", "forkserver")
+            if method in multiprocessing.get_all_start_methods()
+        ],
+    )
+    def test_process_task_manager(self, start_method):
+        """Test the process tasks get the shared buffers without copies."""
+        task_manager = ProcessTaskManager(nb_workers=2, start_method=start_method)
+        task_manager.start()
+        try:
+            with SharedBuffer.from_buffer(bytes([1]) * 1000) as shared_buffer:
+                task_id = task_manager.enqueue_task(
+                    _fill_shared_buffer, args=(shared_buffer, 2)
+                )
+                assert task_manager.get_task_result(task_id).get(30) == 1000
+                assert bytes(shared_buffer.buf) == bytes([2]) * 1000
+        finally:
+            task_manager.stop()
+
+    @pytest.mark.parametrize(
+        "os_name,is_tracker_started", [("posix", True), ("nt", False)]
+    )
+    def test_resource_tracker_posix_only(self, os_name, is_tracker_started):
+        """Test the resource tracker is shared with the workers on posix only."""
+        task_manager = ProcessTaskManager(nb_workers=1)
+        with patch("aea.skills.tasks.os.name", os_name), patch(
+            "aea.skills.tasks.resource_tracker.ensure_running"
+        ) as ensure_running_mock, patch.dict(
+            task_manager.POOL_MODES, {task_manager._pool_mode: Mock()}
+        ):
+            task_manager._start_pool()
+        assert ensure_running_mock.called is is_tracker_started
+
+    def test_start_method_validation(self):
+        """Test the start method is validated."""
+        with pytest.raises(AEAEnforceError, match="only supported by the multiprocess"):
+            TaskManager(start_method="spawn")
+        with pytest.raises(AEAEnforceError, match="is not supported"):
+            ProcessTaskManager(start_method="unknown")